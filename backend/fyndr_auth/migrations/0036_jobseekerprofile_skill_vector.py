@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("fyndr_auth", "0035_chatconversation_chatmessage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobseekerprofile",
+            name="skill_ids",
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name="jobseekerprofile",
+            name="skill_version",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
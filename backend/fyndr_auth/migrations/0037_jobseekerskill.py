@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:22
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("fyndr_auth", "0036_jobseekerprofile_skill_vector"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobSeekerSkill",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("skill_id", models.PositiveIntegerField()),
+                ("skill_version", models.PositiveIntegerField()),
+                (
+                    "profile",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="skill_entries",
+                        to="fyndr_auth.jobseekerprofile",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["skill_version", "skill_id"],
+                        name="fyndr_auth__skill_v_5237ef_idx",
+                    )
+                ],
+            },
+        ),
+    ]
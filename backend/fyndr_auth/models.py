@@ -138,14 +138,67 @@ class JobSeekerProfile(BaseProfile):
     languages = models.JSONField(default=list, blank=True)
     timezone = models.CharField(max_length=50, blank=True)
     
+    # Canonical skills for matching, derived on save (see jobmatcher.skill_vectors)
+    skill_ids = models.JSONField(default=list, blank=True)
+    skill_version = models.PositiveIntegerField(default=0)
+    
     def __str__(self):
         return f"JobSeekerProfile({self.first_name} {self.last_name})"
 
+    def derive_skill_vector(self):
+        """Fill skill_ids and skill_version from skills, bio and job title."""
+        from jobmatcher.skill_vectors import derive_skill_vector
+
+        derive_skill_vector(self)
+
+    def save(self, *args, **kwargs):
+        """
+        Re-derive the skill vector when the fields it is derived from change,
+        and re-index and rescore the profile when it did.
+        """
+        from jobmatcher.candidates import index_profiles
+        from jobmatcher.rescoring import enqueue_profiles
+
+        update_fields = kwargs.get('update_fields')
+        changed = False
+        if update_fields is None or {'skills', 'bio', 'job_title'} & set(update_fields):
+            previous = (self.skill_ids, self.skill_version)
+            self.derive_skill_vector()
+            changed = self.pk is None or (self.skill_ids, self.skill_version) != previous
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'skill_ids', 'skill_version'}
+        super().save(*args, **kwargs)
+
+        if changed:
+            index_profiles([self])
+            enqueue_profiles([self.pk])
+
     @property
     def full_name(self):
         return f"{self.first_name} {self.last_name}".strip()
 
 
+class JobSeekerSkill(models.Model):
+    """
+    Inverted index entry: a canonical skill a job seeker has.
+
+    One row per skill of the profile's stored skill vector, so the job
+    seekers a job is relevant to come from one indexed lookup (see
+    jobmatcher.candidates).
+    """
+    profile = models.ForeignKey(JobSeekerProfile, on_delete=models.CASCADE, related_name='skill_entries')
+    skill_id = models.PositiveIntegerField()
+    skill_version = models.PositiveIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['skill_version', 'skill_id']),
+        ]
+
+    def __str__(self):
+        return f"{self.profile_id}:{self.skill_id}"
+
+
 # Recruiter Profile Model
 class RecruiterProfile(BaseProfile):
     """Profile model for recruiters with their professional information"""
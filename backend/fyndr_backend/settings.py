@@ -293,6 +293,99 @@ LOGGING['loggers']['jobapplier'] = {
     'propagate': True,
 }
 
+# ========================================
+# JOB SCRAPER SETTINGS
+# ========================================
+
+# Rows per lookup/write batch when scrapers save through the bulk upsert path
+JOBSCRAPER_BULK_BATCH_SIZE = int(os.getenv('JOBSCRAPER_BULK_BATCH_SIZE', '500'))
+
+# Concurrent fetching: requests in flight across all hosts, and requests per
+# second allowed to any single host
+JOBSCRAPER_ASYNC_FETCH = os.getenv('JOBSCRAPER_ASYNC_FETCH', 'False').lower() in ('1', 'true', 'yes')
+JOBSCRAPER_FETCH_CONCURRENCY = int(os.getenv('JOBSCRAPER_FETCH_CONCURRENCY', '10'))
+JOBSCRAPER_PER_HOST_RATE = float(os.getenv('JOBSCRAPER_PER_HOST_RATE', '1'))
+
+# Adaptive fetch policy: per-host concurrency that backs off on 429/5xx and
+# grows on success, Retry-After handling, and a circuit breaker that skips a
+# host for the cooldown (seconds) after that many consecutive failures
+JOBSCRAPER_FETCH_POLICY = os.getenv('JOBSCRAPER_FETCH_POLICY', 'True').lower() in ('1', 'true', 'yes')
+JOBSCRAPER_FETCH_RETRIES = int(os.getenv('JOBSCRAPER_FETCH_RETRIES', '3'))
+JOBSCRAPER_CIRCUIT_FAILURES = int(os.getenv('JOBSCRAPER_CIRCUIT_FAILURES', '5'))
+JOBSCRAPER_CIRCUIT_COOLDOWN = float(os.getenv('JOBSCRAPER_CIRCUIT_COOLDOWN', '60'))
+JOBSCRAPER_MAX_RETRY_AFTER = float(os.getenv('JOBSCRAPER_MAX_RETRY_AFTER', '300'))
+
+# Company logos: each company is looked up once and cached (found logos for
+# the TTL, misses for the shorter negative TTL, in days); uncached companies
+# are resolved this many at a time
+JOBSCRAPER_LOGO_TTL_DAYS = float(os.getenv('JOBSCRAPER_LOGO_TTL_DAYS', '30'))
+JOBSCRAPER_LOGO_NEGATIVE_TTL_DAYS = float(os.getenv('JOBSCRAPER_LOGO_NEGATIVE_TTL_DAYS', '7'))
+JOBSCRAPER_LOGO_WORKERS = int(os.getenv('JOBSCRAPER_LOGO_WORKERS', '8'))
+
+# Conditional-request cache: stores ETag/Last-Modified and body hashes per URL
+# so unchanged responses skip parsing and saving
+JOBSCRAPER_HTTP_CACHE = os.getenv('JOBSCRAPER_HTTP_CACHE', 'False').lower() in ('1', 'true', 'yes')
+JOBSCRAPER_HTTP_CACHE_DIR = os.getenv('JOBSCRAPER_HTTP_CACHE_DIR', os.path.join(BASE_DIR, '.cache', 'jobscraper_http'))
+# Entries not refetched for this many days are pruned, and the oldest past
+# the entry limit (0 disables either limit)
+JOBSCRAPER_HTTP_CACHE_MAX_AGE_DAYS = float(os.getenv('JOBSCRAPER_HTTP_CACHE_MAX_AGE_DAYS', '30'))
+JOBSCRAPER_HTTP_CACHE_MAX_ENTRIES = int(os.getenv('JOBSCRAPER_HTTP_CACHE_MAX_ENTRIES', '100000'))
+
+# Streaming pipeline: normalize and save jobs in chunks while later pages are
+# still being fetched, instead of after the whole crawl
+JOBSCRAPER_STREAM = os.getenv('JOBSCRAPER_STREAM', 'False').lower() in ('1', 'true', 'yes')
+JOBSCRAPER_STREAM_CHUNK_SIZE = int(os.getenv('JOBSCRAPER_STREAM_CHUNK_SIZE', '100'))
+
+# Enrichment: parse structured fields out of job descriptions while
+# normalizing, on this many worker processes (0 or 1 parses inline)
+JOBSCRAPER_PARSE_CONTENT = os.getenv('JOBSCRAPER_PARSE_CONTENT', 'True').lower() in ('1', 'true', 'yes')
+JOBSCRAPER_NORMALIZE_WORKERS = int(os.getenv('JOBSCRAPER_NORMALIZE_WORKERS', '0'))
+
+# Parse result cache: reuse parser output for descriptions parsed before.
+# Backend is 'local' (in-process LRU), 'django' (default Django cache) or
+# 'sqlite' (file shared across processes and runs); empty disables it
+JOBSCRAPER_PARSE_CACHE = os.getenv('JOBSCRAPER_PARSE_CACHE', 'local')
+JOBSCRAPER_PARSE_CACHE_SIZE = int(os.getenv('JOBSCRAPER_PARSE_CACHE_SIZE', '10000'))
+JOBSCRAPER_PARSE_CACHE_PATH = os.getenv('JOBSCRAPER_PARSE_CACHE_PATH', os.path.join(BASE_DIR, '.cache', 'jobscraper_parse.sqlite3'))
+
+# Near-duplicate detection: link postings whose MinHash similarity to an
+# earlier posting reaches the threshold to it, so listings and scoring only
+# see one copy of a job listed on several boards
+JOBSCRAPER_DEDUP = os.getenv('JOBSCRAPER_DEDUP', 'True').lower() in ('1', 'true', 'yes')
+JOBSCRAPER_DEDUP_THRESHOLD = float(os.getenv('JOBSCRAPER_DEDUP_THRESHOLD', '0.8'))
+
+# Incremental scraping: remember the jobs and pages each board/search has
+# already produced, stop paginating at known territory and only save deltas
+JOBSCRAPER_INCREMENTAL = os.getenv('JOBSCRAPER_INCREMENTAL', 'False').lower() in ('1', 'true', 'yes')
+JOBSCRAPER_WATERMARK_MAX_IDS = int(os.getenv('JOBSCRAPER_WATERMARK_MAX_IDS', '5000'))
+
+# Scrape work queue (enqueue_scrapes / scrape_worker): lease length that
+# workers heartbeat to keep, attempts per unit, and the first retry delay in
+# seconds (doubled on each further attempt)
+JOBSCRAPER_QUEUE_LEASE_SECONDS = int(os.getenv('JOBSCRAPER_QUEUE_LEASE_SECONDS', '300'))
+JOBSCRAPER_QUEUE_MAX_ATTEMPTS = int(os.getenv('JOBSCRAPER_QUEUE_MAX_ATTEMPTS', '5'))
+JOBSCRAPER_QUEUE_RETRY_DELAY = float(os.getenv('JOBSCRAPER_QUEUE_RETRY_DELAY', '30'))
+
+# Job listing API count: 'exact' (COUNT(*)), 'estimate' (query planner
+# estimate on PostgreSQL) or 'none'; clients can override with ?count=
+JOBSCRAPER_FEED_COUNT = os.getenv('JOBSCRAPER_FEED_COUNT', 'exact')
+
+# Seconds job stats/filter payloads built from the facet counters stay
+# cached; counter changes invalidate them sooner (see jobscraper.facets)
+JOBSCRAPER_FACET_CACHE_TIMEOUT = int(os.getenv('JOBSCRAPER_FACET_CACHE_TIMEOUT', '300'))
+
+# Jobs per transaction when expiring (deactivating) and archiving old
+# postings (see jobscraper.expiry)
+JOBSCRAPER_EXPIRY_CHUNK_SIZE = int(os.getenv('JOBSCRAPER_EXPIRY_CHUNK_SIZE', '1000'))
+
+# Skill taxonomy shared by the job parsers and the matching engine (see
+# jobscraper.skill_taxonomy): an optional JSON file of extra synonyms and
+# terms, whether to add the active fyndr_auth.Skill rows, and seconds
+# between checks for a changed file or a reload_skill_taxonomy run
+JOBSCRAPER_SKILL_TAXONOMY_FILE = os.getenv('JOBSCRAPER_SKILL_TAXONOMY_FILE', '')
+JOBSCRAPER_SKILL_TAXONOMY_USE_SKILL_TABLE = os.getenv('JOBSCRAPER_SKILL_TAXONOMY_USE_SKILL_TABLE', 'False').lower() == 'true'
+JOBSCRAPER_SKILL_TAXONOMY_CHECK_INTERVAL = int(os.getenv('JOBSCRAPER_SKILL_TAXONOMY_CHECK_INTERVAL', '60'))
+
 # Google OAuth (set via environment)
 # GOOGLE_OAUTH_CLIENT_ID
 # GOOGLE_OAUTH_CLIENT_SECRET
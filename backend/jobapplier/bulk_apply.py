@@ -188,7 +188,7 @@ def quick_apply_with_matching(request):
     criteria = request.data
     
     # Build query based on criteria
-    query = JobPosting.objects.filter(is_active=True)
+    query = JobPosting.objects.canonical().filter(is_active=True)
     
     # Filter by skills
     skills = criteria.get('skills', [])
@@ -346,7 +346,7 @@ def get_application_suggestions(request):
     
     if not applied_jobs.exists():
         # New user - get popular jobs
-        suggested_jobs = JobPosting.objects.filter(
+        suggested_jobs = JobPosting.objects.canonical().filter(
             is_active=True
         ).order_by('-date_posted')[:20]
     else:
@@ -363,7 +363,7 @@ def get_application_suggestions(request):
                 applied_locations.add(app.job.location)
         
         # Find similar jobs
-        query = JobPosting.objects.filter(is_active=True)
+        query = JobPosting.objects.canonical().filter(is_active=True)
         
         # Exclude already applied jobs
         applied_job_ids = applied_jobs.values_list('job_id', flat=True)
@@ -0,0 +1,188 @@
+"""
+Batch Job Scoring
+
+Scores one user against many jobs, or many users against one job, with the
+same results as DynamicJobMatchingEngine.score_job but without repeating
+the per-pair work:
+
+- Skills come from the stored skill vectors (jobmatcher.skill_vectors),
+  ids of canonical skills; stale vectors of a batch are re-derived and
+  saved together.
+- A profile's skills are a bitset (a Python int, bit i set for skill id
+  i). A job's requirements are one bitset per occurrence level, so a
+  requirement listed twice after normalization (sql and mysql) counts
+  twice as in the scalar match. Skill overlap is the popcount of the
+  ANDed bitsets.
+- Location, salary and role sub-scores are computed once per distinct
+  location, salary range and title when scoring one user against many
+  jobs.
+
+Python ints serve as the bit-packed vectors; the backend does not depend on
+NumPy, and the popcount of an int is computed in C all the same.
+"""
+
+import logging
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from fyndr_auth.models import JobSeekerProfile
+from jobscraper.models import JobPosting
+
+from . import skill_vectors
+from .engine import DynamicJobMatchingEngine, job_matching_engine
+
+
+logger = logging.getLogger(__name__)
+
+
+try:
+    _popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def _popcount(bits: int) -> int:
+        return bin(bits).count('1')
+
+
+class JobVector(NamedTuple):
+    job: JobPosting
+    requirements: List[int]   # sorted skill ids, repeats kept
+    levels: List[int]         # levels[k]: bitset of skills required more than k times
+
+
+class ProfileVector(NamedTuple):
+    profile: JobSeekerProfile
+    preferences: Optional[object]  # UserPreferences, if set
+    skills: int                    # bitset of the profile's skills
+
+
+class BatchScorer:
+    """Scores jobs and profiles in batches from their stored skill vectors."""
+
+    def __init__(self, engine: Optional[DynamicJobMatchingEngine] = None):
+        self.engine = engine or job_matching_engine
+
+    def encode_job(self, job: JobPosting) -> JobVector:
+        requirements = skill_vectors.skill_ids(job)
+        levels: List[int] = []
+        occurrences: Dict[int, int] = {}
+        for skill_id in requirements:
+            level = occurrences.get(skill_id, 0)
+            occurrences[skill_id] = level + 1
+            if level == len(levels):
+                levels.append(0)
+            levels[level] |= 1 << skill_id
+        return JobVector(job, requirements, levels)
+
+    def encode_profile(self, user_profile: JobSeekerProfile) -> ProfileVector:
+        skills = 0
+        for skill_id in skill_vectors.skill_ids(user_profile):
+            skills |= 1 << skill_id
+        return ProfileVector(user_profile, getattr(user_profile, 'preferences', None), skills)
+
+    def skill_names(self, job_vectors: Iterable[JobVector]) -> Dict[int, str]:
+        """Names of the skills the jobs require, loaded together."""
+        ids = sorted({skill_id for job_vector in job_vectors for skill_id in job_vector.requirements})
+        return dict(zip(ids, skill_vectors.skill_names(ids)))
+
+    def skill_scores(self, job_vector: JobVector, profile_vector: ProfileVector, names: Dict[int, str]):
+        """(matched_skills, missing_skills, match_percentage) as calculate_skill_match returns them."""
+        if not job_vector.requirements:
+            return [], [], 100.0
+
+        matched = sum(_popcount(level & profile_vector.skills) for level in job_vector.levels)
+        match_percentage = (matched / len(job_vector.requirements)) * 100
+
+        matched_skills, missing_skills = [], []
+        for skill_id in job_vector.requirements:
+            if profile_vector.skills >> skill_id & 1:
+                matched_skills.append(names[skill_id])
+            else:
+                missing_skills.append(names[skill_id])
+        return matched_skills, missing_skills, match_percentage
+
+    def score_jobs(self, user_profile: JobSeekerProfile, jobs: Iterable[JobPosting]) -> List[Dict]:
+        """
+        Score many jobs for one user.
+
+        Returns:
+            One score_job result dict per job, in order
+        """
+        jobs = list(jobs)
+        engine = self.engine
+        skill_vectors.refresh_skill_vectors(jobs)
+        skill_vectors.refresh_skill_vectors([user_profile])
+        try:
+            profile_vector = self.encode_profile(user_profile)
+        except Exception as e:
+            logger.error(f"Error encoding profile {user_profile.id} for batch scoring: {str(e)}")
+            return [engine.failed_score(e) for _ in jobs]
+
+        # Encoding errors are reported with the job's result below
+        job_vectors = []
+        for job in jobs:
+            try:
+                job_vectors.append(self.encode_job(job))
+            except Exception as e:
+                job_vectors.append(e)
+        names = self.skill_names(vector for vector in job_vectors if isinstance(vector, JobVector))
+
+        preferences = profile_vector.preferences
+        location_scores: Dict[str, float] = {}
+        salary_scores: Dict[tuple, float] = {}
+        role_scores: Dict[str, float] = {}
+
+        results = []
+        for job, job_vector in zip(jobs, job_vectors):
+            try:
+                if isinstance(job_vector, Exception):
+                    raise job_vector
+                location = job.location or ''
+                if location not in location_scores:
+                    location_scores[location] = engine.calculate_location_match(preferences, location)
+                salary_range = (job.salary_min, job.salary_max)
+                if salary_range not in salary_scores:
+                    salary_scores[salary_range] = engine.calculate_salary_match(preferences, job)
+                if job.title not in role_scores:
+                    role_scores[job.title] = engine.calculate_role_match(preferences, job.title)
+
+                results.append(engine.combine_scores(
+                    *self.skill_scores(job_vector, profile_vector, names),
+                    location_scores[location], salary_scores[salary_range], role_scores[job.title],
+                ))
+            except Exception as e:
+                logger.error(f"Error scoring job {job.id} for user {user_profile.id}: {str(e)}")
+                results.append(engine.failed_score(e))
+        return results
+
+    def score_profiles(self, job: JobPosting, user_profiles: Iterable[JobSeekerProfile]) -> List[Dict]:
+        """
+        Score one job for many users, e.g. a newly scraped posting.
+
+        Returns:
+            One score_job result dict per profile, in order
+        """
+        user_profiles = list(user_profiles)
+        engine = self.engine
+        skill_vectors.refresh_skill_vectors(user_profiles)
+        skill_vectors.refresh_skill_vectors([job])
+        try:
+            job_vector = self.encode_job(job)
+        except Exception as e:
+            logger.error(f"Error encoding job {job.id} for batch scoring: {str(e)}")
+            return [engine.failed_score(e) for _ in user_profiles]
+
+        names = self.skill_names([job_vector])
+        location = job.location or ''
+        results = []
+        for user_profile in user_profiles:
+            try:
+                profile_vector = self.encode_profile(user_profile)
+                preferences = profile_vector.preferences
+                results.append(engine.combine_scores(
+                    *self.skill_scores(job_vector, profile_vector, names),
+                    engine.calculate_location_match(preferences, location),
+                    engine.calculate_salary_match(preferences, job),
+                    engine.calculate_role_match(preferences, job.title),
+                ))
+            except Exception as e:
+                logger.error(f"Error scoring job {job.id} for user {user_profile.id}: {str(e)}")
+                results.append(engine.failed_score(e))
+        return results
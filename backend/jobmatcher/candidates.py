@@ -0,0 +1,263 @@
+"""
+Job Candidate Generation
+
+Picks the jobs worth scoring for a user from the whole catalog, so ranking
+does not depend on which jobs a query happens to return first, and only the
+picked jobs go through the full score_job.
+
+JobSkill is an inverted index from canonical skill id to the jobs requiring
+the skill: one row per distinct skill of a job's stored skill vector,
+weighted by the skill's share of the job's requirements. Summing the weights
+of a profile's skills per job gives the skill match fraction score_job
+computes, reading only the index entries of those skills.
+
+Candidates are ranked by that sum plus two buckets checked against the
+user's preferences, weighted like the final score:
+
+- location: the job is remote and the user accepts remote work, or its
+  normalized city, region or country is one of the preferred locations;
+- salary band: the job pays at least SALARY_BAND of the expected salary
+  (calculate_salary_match's top bands), or half credit when it lists no
+  salary.
+
+Jobs without any recognized skill are never candidates.
+
+JobSeekerSkill is the same index over profiles (skill id to the job
+seekers having it): profiles_for_job() finds the users a job is relevant
+to, for rescoring when it changes (jobmatcher.rescoring).
+
+Entries are written when a job or profile is saved, when JobScrapingService
+bulk-writes jobs and when stale skill vectors are re-derived. Each entry carries the
+taxonomy version of its skill id and other versions are ignored, so a
+taxonomy change empties the index until jobs are re-indexed (rebuild_index,
+the rebuild_skill_index command), which also fixes drift from queryset
+updates.
+"""
+
+import logging
+from collections import Counter
+from datetime import date
+from typing import Iterable, List, Optional
+
+from django.db.models import Case, F, FloatField, Max, Q, Sum, Value, When
+from django.db.models.functions import Coalesce
+
+from fyndr_auth.models import JobSeekerProfile, JobSeekerSkill
+from jobscraper.locations import get_gazetteer
+from jobscraper.models import JobPosting, JobSkill
+
+from . import skill_vectors
+
+
+logger = logging.getLogger(__name__)
+
+
+# Jobs a background rescore considers per user
+CANDIDATE_LIMIT = 200
+
+# Share of the expected salary a job must pay to fall in the user's band
+SALARY_BAND = 0.9
+
+_BATCH = 500
+
+
+def job_entries(job: JobPosting) -> List[JobSkill]:
+    """Index entries of a job's stored (current) skill vector."""
+    requirements = job.skill_ids
+    counts = Counter(requirements)
+    return [
+        JobSkill(job_id=job.id, skill_id=skill_id, weight=count / len(requirements), skill_version=job.skill_version)
+        for skill_id, count in counts.items()
+    ]
+
+
+def index_jobs(jobs: Iterable[JobPosting]) -> int:
+    """
+    Replace the index entries of saved jobs with ones from their current skill vectors.
+
+    Jobs with a stale vector lose their entries until it is re-derived.
+
+    Returns:
+        Number of entries written
+    """
+    jobs = [job for job in jobs if job.pk]
+    if not jobs:
+        return 0
+
+    entries = []
+    for job in jobs:
+        if skill_vectors.is_current(job):
+            entries.extend(job_entries(job))
+
+    JobSkill.objects.filter(job_id__in=[job.pk for job in jobs]).delete()
+    JobSkill.objects.bulk_create(entries, batch_size=_BATCH)
+    return len(entries)
+
+
+def index_profiles(user_profiles: Iterable[JobSeekerProfile]) -> int:
+    """
+    Replace the index entries of saved profiles with ones from their current skill vectors.
+
+    Returns:
+        Number of entries written
+    """
+    user_profiles = [user_profile for user_profile in user_profiles if user_profile.pk]
+    if not user_profiles:
+        return 0
+
+    entries = [
+        JobSeekerSkill(profile_id=user_profile.pk, skill_id=skill_id, skill_version=user_profile.skill_version)
+        for user_profile in user_profiles if skill_vectors.is_current(user_profile)
+        for skill_id in user_profile.skill_ids
+    ]
+
+    JobSeekerSkill.objects.filter(profile_id__in=[user_profile.pk for user_profile in user_profiles]).delete()
+    JobSeekerSkill.objects.bulk_create(entries, batch_size=_BATCH)
+    return len(entries)
+
+
+def rebuild_index(batch_size: int = 1000, progress=None) -> int:
+    """
+    Re-index every job and profile, re-deriving stale skill vectors on the way.
+
+    Args:
+        batch_size: Rows per batch
+        progress: Optional callable taking the model and the number of its rows indexed so far
+
+    Returns:
+        Number of jobs and profiles indexed
+    """
+    total = 0
+    for model, fields, index in (
+        (JobPosting, ['id', 'title', 'description', 'skill_ids', 'skill_version'], index_jobs),
+        (JobSeekerProfile, ['id', 'skills', 'bio', 'job_title', 'skill_ids', 'skill_version'], index_profiles),
+    ):
+        indexed = 0
+        last_id = 0
+        while True:
+            rows = list(model.objects.filter(id__gt=last_id).order_by('id').only(*fields)[:batch_size])
+            if not rows:
+                break
+            # Re-derived rows are indexed as they are saved
+            skill_vectors.refresh_skill_vectors(rows)
+            index(rows)
+            indexed += len(rows)
+            last_id = rows[-1].id
+            if progress:
+                progress(model, indexed)
+        total += indexed
+
+    version = skill_vectors.skill_vector_version()
+    JobSkill.objects.exclude(skill_version=version).delete()
+    JobSeekerSkill.objects.exclude(skill_version=version).delete()
+    return total
+
+
+def profiles_for_job(job: JobPosting) -> List[int]:
+    """Ids of the profiles sharing at least one skill with a job."""
+    skill_ids = skill_vectors.skill_ids(job)
+    if not skill_ids:
+        return []
+    return list(
+        JobSeekerSkill.objects.filter(
+            skill_version=skill_vectors.skill_vector_version(),
+            skill_id__in=set(skill_ids),
+        ).values_list('profile_id', flat=True).distinct()
+    )
+
+
+def _location_bucket(preferences) -> Optional[Q]:
+    """Condition on index entries' jobs for the user's location buckets."""
+    if not preferences:
+        return None
+
+    condition = Q()
+    if preferences.remote_preference in ('REMOTE', 'HYBRID', 'FLEXIBLE'):
+        condition |= Q(job__is_remote=True)
+
+    gazetteer = get_gazetteer()
+    for preferred in preferences.preferred_locations or []:
+        place = gazetteer.normalize(preferred)
+        if place.is_remote and not (place.city or place.region or place.country_code):
+            condition |= Q(job__is_remote=True)
+        elif place.city:
+            condition |= Q(job__city=place.city, job__country_code=place.country_code)
+        elif place.region:
+            condition |= Q(job__region=place.region, job__country_code=place.country_code)
+        elif place.country_code:
+            condition |= Q(job__country_code=place.country_code)
+    return condition or None
+
+
+def _salary_band(preferences):
+    """Expression scoring an index entry's job against the user's salary band."""
+    if not preferences or not preferences.salary_expectation:
+        return Value(0.0)
+
+    return Case(
+        When(job__salary_min__isnull=True, job__salary_max__isnull=True, then=Value(0.5)),
+        When(job__salary_max__gte=preferences.salary_expectation * SALARY_BAND, then=Value(1.0)),
+        When(
+            job__salary_max__isnull=True,
+            job__salary_min__gte=preferences.salary_expectation * SALARY_BAND,
+            then=Value(1.0),
+        ),
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+
+
+def candidate_jobs(user_profile: JobSeekerProfile, limit: int = CANDIDATE_LIMIT,
+                   posted_since: Optional[date] = None) -> List[JobPosting]:
+    """
+    Listed jobs most likely to score well for a user, best first.
+
+    Args:
+        user_profile: Profile to find jobs for
+        limit: Number of jobs to return
+        posted_since: Only consider jobs posted on or after this date
+
+    Returns:
+        Up to limit active canonical jobs sharing at least one skill with the profile
+    """
+    from .engine import DynamicJobMatchingEngine
+
+    profile_skills = skill_vectors.skill_ids(user_profile)
+    if not profile_skills or limit <= 0:
+        return []
+
+    preferences = getattr(user_profile, 'preferences', None)
+    weights = DynamicJobMatchingEngine.SCORE_WEIGHTS
+
+    entries = JobSkill.objects.filter(
+        skill_version=skill_vectors.skill_vector_version(),
+        skill_id__in=profile_skills,
+        job__is_active=True,
+        job__canonical_job__isnull=True,
+    )
+    if posted_since:
+        entries = entries.filter(job__date_posted__gte=posted_since)
+
+    location = _location_bucket(preferences)
+    location_score = Value(0.0) if location is None else Case(
+        When(location, then=Value(1.0)), default=Value(0.0), output_field=FloatField()
+    )
+
+    ranked = (
+        entries.values('job_id')
+        .annotate(
+            skills=Sum('weight'),
+            location=Coalesce(Max(location_score), Value(0.0)),
+            salary=Coalesce(Max(_salary_band(preferences)), Value(0.0)),
+        )
+        .annotate(rank=(
+            F('skills') * weights['skills']
+            + F('location') * weights['location']
+            + F('salary') * weights['salary']
+        ))
+        .order_by('-rank', '-job_id')
+    )
+    job_ids = [row['job_id'] for row in ranked[:limit]]
+
+    jobs = JobPosting.objects.in_bulk(job_ids)
+    return [jobs[job_id] for job_id in job_ids if job_id in jobs]
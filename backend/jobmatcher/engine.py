@@ -13,7 +13,6 @@ Enhanced AI Features:
 
 import re
 import logging
-import asyncio
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
 from django.db import transaction
@@ -21,10 +20,12 @@ from django.utils import timezone
 from django.core.cache import cache
 from asgiref.sync import sync_to_async
 from jobscraper.models import JobPosting
+from jobscraper.skill_taxonomy import get_taxonomy
 from fyndr_auth.models import JobSeekerProfile
 from fyndr_auth.utils.profile_utils import normalize_skills_field
 from .models import JobScore, UserPreferences
 from .ai_service import AIEnhancementService
+from . import skill_vectors
 
 logger = logging.getLogger(__name__)
 
@@ -34,127 +35,35 @@ class DynamicJobMatchingEngine:
     Real-time dynamic engine for intelligent job-to-candidate matching
     """
     
+    # Share of each sub-score in the final score
+    SCORE_WEIGHTS = {
+        'skills': 0.4,      # 40% - Most important
+        'location': 0.25,   # 25% - Very important
+        'salary': 0.20,     # 20% - Important
+        'role': 0.15,       # 15% - Moderately important
+    }
+    
     def __init__(self):
         self.ai_service = AIEnhancementService()
         self.cache_ttl = 300  # 5 minutes cache
-        self.active_matchers = {}  # Track active real-time matchers
-        
-        self.skill_synonyms = {
-            # Programming Languages
-            'javascript': ['js', 'ecmascript', 'node.js', 'nodejs', 'typescript', 'ts'],
-            'python': ['py', 'python3', 'django', 'flask', 'fastapi', 'pandas', 'numpy'],
-            'java': ['jvm', 'spring', 'spring boot', 'kotlin', 'scala'],
-            'react': ['reactjs', 'react.js', 'next.js', 'gatsby'],
-            'angular': ['angularjs', 'angular.js', 'ng'],
-            'vue': ['vuejs', 'vue.js', 'nuxt.js'],
-            
-            # Databases
-            'postgresql': ['postgres', 'psql', 'pg'],
-            'mysql': ['sql', 'mariadb'],
-            'mongodb': ['mongo', 'nosql', 'document db'],
-            'redis': ['in-memory', 'cache'],
-            'elasticsearch': ['elastic', 'search engine'],
-            
-            # Cloud & DevOps
-            'aws': ['amazon web services', 'ec2', 's3', 'lambda', 'cloudfront', 'rds'],
-            'azure': ['microsoft azure', 'azure functions', 'cosmos db'],
-            'gcp': ['google cloud', 'google cloud platform', 'firebase'],
-            'docker': ['containerization', 'containers'],
-            'kubernetes': ['k8s', 'container orchestration', 'helm'],
-            'terraform': ['iac', 'infrastructure as code'],
-            'jenkins': ['ci/cd', 'continuous integration'],
-            
-            # AI/ML
-            'machine learning': ['ml', 'artificial intelligence', 'ai', 'deep learning'],
-            'tensorflow': ['tf', 'keras'],
-            'pytorch': ['torch'],
-            'scikit-learn': ['sklearn'],
-            
-            # Frontend
-            'css': ['scss', 'sass', 'less', 'tailwind'],
-            'html': ['html5', 'markup'],
-            'bootstrap': ['css framework'],
-            
-            # Backend
-            'rest api': ['restful', 'api', 'microservices'],
-            'graphql': ['graph api'],
-            'websocket': ['real-time', 'socket.io'],
-            
-            # Common synonyms
-            'machine learning': ['ml', 'artificial intelligence', 'ai', 'deep learning'],
-            'data science': ['data analysis', 'analytics', 'data scientist'],
-            'frontend': ['front-end', 'ui', 'user interface'],
-            'backend': ['back-end', 'server-side'],
-            'fullstack': ['full-stack', 'full stack'],
-        }
     
     async def start_real_time_matching(self, user_id: int) -> None:
-        """Start real-time job matching for a user"""
-        if user_id in self.active_matchers:
-            return  # Already running
-            
-        self.active_matchers[user_id] = True
-        asyncio.create_task(self._real_time_matching_loop(user_id))
-    
-    async def _real_time_matching_loop(self, user_id: int) -> None:
-        """Background loop for continuous job matching"""
-        try:
-            while self.active_matchers.get(user_id, False):
-                await self._update_user_job_scores(user_id)
-                await asyncio.sleep(300)  # Update every 5 minutes
-        except Exception as e:
-            logger.error(f"Real-time matching failed for user {user_id}: {e}")
-        finally:
-            self.active_matchers.pop(user_id, None)
-    
-    async def _update_user_job_scores(self, user_id: int) -> None:
-        """Update job scores for a user with latest jobs"""
+        """
+        Rescore a user's candidate jobs in the background
+        
+        Queues a profile rescore (jobmatcher.rescoring) run by rescore_worker;
+        later job and profile changes queue their own rescores.
+        """
+        from .rescoring import enqueue_profiles
+        
         try:
-            # Get new jobs from last 24 hours
-            recent_jobs = await sync_to_async(list)(
-                JobPosting.objects.filter(
-                    date_posted__gte=timezone.now() - timedelta(hours=24),
-                    is_active=True
-                )
-            )
-            
-            user_profile = await sync_to_async(JobSeekerProfile.objects.get)(user_id=user_id)
-            
-            for job in recent_jobs:
-                # Check if already scored
-                existing_score = await sync_to_async(
-                    lambda: JobScore.objects.filter(
-                        user_profile=user_profile, job=job
-                    ).first()
-                )()
-                
-                if not existing_score:
-                    # Calculate and save new score
-                    await self._calculate_and_save_job_score(user_profile, job)
-                    
+            profile_id = await sync_to_async(
+                JobSeekerProfile.objects.filter(user_id=user_id).values_list('id', flat=True).first
+            )()
+            if profile_id:
+                await sync_to_async(enqueue_profiles)([profile_id])
         except Exception as e:
-            logger.error(f"Failed to update job scores for user {user_id}: {e}")
-    
-    async def _calculate_and_save_job_score(self, user_profile, job) -> None:
-        """Calculate and save job score asynchronously"""
-        try:
-            score_data = await sync_to_async(self.calculate_job_score)(user_profile, job)
-            
-            await sync_to_async(JobScore.objects.create)(
-                user_profile=user_profile,
-                job=job,
-                overall_score=score_data['overall_score'],
-                skill_match_score=score_data['skill_match_score'],
-                location_score=score_data['location_score'],
-                salary_score=score_data['salary_score'],
-                company_score=score_data['company_score'],
-                matched_skills=score_data['matched_skills'],
-                missing_skills=score_data['missing_skills'],
-                score_breakdown=score_data['score_breakdown']
-            )
-            
-        except Exception as e:
-            logger.error(f"Failed to calculate job score: {e}")
+            logger.error(f"Failed to queue rescoring for user {user_id}: {e}")
     
     def extract_skills_from_text(self, text: str) -> List[str]:
         """
@@ -165,55 +74,14 @@ class DynamicJobMatchingEngine:
         - GPT/Claude API for intelligent skill identification
         - Industry-specific skill taxonomies
         """
-        if not text:
-            return []
-        
-        text_lower = text.lower()
-        skills = []
-        
-        # Common technical skills and keywords
-        skill_patterns = [
-            # Programming Languages
-            r'\b(?:python|java|javascript|typescript|c\+\+|c#|php|ruby|go|rust|kotlin|swift)\b',
-            r'\b(?:react|angular|vue|svelte|ember)\b',
-            r'\b(?:node\.?js|express|django|flask|spring|rails)\b',
-            
-            # Databases
-            r'\b(?:postgresql|mysql|mongodb|redis|elasticsearch|dynamodb)\b',
-            r'\b(?:sql|nosql|database)\b',
-            
-            # Cloud & DevOps
-            r'\b(?:aws|azure|gcp|google cloud|docker|kubernetes|terraform)\b',
-            r'\b(?:ci/cd|jenkins|github actions|gitlab)\b',
-            
-            # Frameworks & Tools
-            r'\b(?:git|linux|unix|agile|scrum|jira)\b',
-            r'\b(?:machine learning|ai|data science|analytics)\b',
-            
-            # Soft Skills
-            r'\b(?:leadership|communication|problem[- ]solving|teamwork)\b',
-        ]
-        
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, text_lower)
-            skills.extend(matches)
-        
-        # Clean and deduplicate
-        skills = list(set([skill.strip() for skill in skills if len(skill.strip()) > 2]))
-        
-        return skills
+        # Terms of the shared skill taxonomy, in one pass over the text
+        return sorted(skill for skill in get_taxonomy().extract(text) if len(skill) > 2)
     
     def normalize_skill(self, skill: str) -> str:
         """
         Normalize skill names using synonyms
         """
-        skill_lower = skill.lower().strip()
-        
-        for main_skill, synonyms in self.skill_synonyms.items():
-            if skill_lower == main_skill or skill_lower in synonyms:
-                return main_skill
-        
-        return skill_lower
+        return get_taxonomy().normalize(skill)
     
     def calculate_skill_match(self, user_skills: List[str], job_requirements: List[str]) -> Tuple[List[str], List[str], float]:
         """
@@ -300,7 +168,7 @@ class DynamicJobMatchingEngine:
         # If job has salary information
         if hasattr(job, 'salary_min') and job.salary_min:
             job_min = job.salary_min
-            job_max = getattr(job, 'salary_max', job_min)
+            job_max = getattr(job, 'salary_max', None) or job_min
             
             # Check if expected salary falls within range
             if job_min <= expected_salary <= job_max:
@@ -320,6 +188,100 @@ class DynamicJobMatchingEngine:
         
         return 70.0  # Default when no salary info available
     
+    def calculate_role_match(self, user_preferences: Optional[UserPreferences], job_title: str) -> float:
+        """
+        Calculate role preference score
+        """
+        if user_preferences and user_preferences.preferred_roles:
+            job_title_lower = job_title.lower()
+            for preferred_role in user_preferences.preferred_roles:
+                if preferred_role.lower() in job_title_lower:
+                    return 90.0
+        
+        return 50.0  # Default
+    
+    def job_skill_requirements(self, job: JobPosting) -> List[str]:
+        """
+        Canonical skills required by a job, from its stored skill vector
+        """
+        return skill_vectors.skill_names(skill_vectors.skill_ids(job))
+    
+    def profile_skills(self, user_profile: JobSeekerProfile) -> List[str]:
+        """
+        Canonical skills of a user, from the profile's stored skill vector
+        """
+        return skill_vectors.skill_names(skill_vectors.skill_ids(user_profile))
+    
+    def extract_job_requirements(self, job: JobPosting) -> List[str]:
+        """
+        Skills required by a job, extracted from its title and description
+        """
+        job_text = f"{job.title} {job.description or ''}"
+        return self.extract_skills_from_text(job_text)
+    
+    def extract_profile_skills(self, user_profile: JobSeekerProfile) -> List[str]:
+        """
+        Skills of a user, extracted from the profile skills field, bio and job title
+        """
+        user_skills_list = []
+        if isinstance(user_profile.skills, list):
+            user_skills_list = normalize_skills_field(user_profile.skills)[0]
+        user_skills_text = " ".join(user_skills_list) + f" {user_profile.bio or ''}"
+        if hasattr(user_profile, 'job_title') and user_profile.job_title:
+            user_skills_text += f" {user_profile.job_title}"
+        
+        user_skills = self.extract_skills_from_text(user_skills_text)
+        # Add skills from JSON field directly
+        user_skills.extend(user_skills_list)
+        return user_skills
+    
+    def combine_scores(self, matched_skills: List[str], missing_skills: List[str], skill_match_score: float,
+                       location_score: float, salary_score: float, role_score: float) -> Dict:
+        """
+        Weighted final score and result dict from the sub-scores
+        """
+        weights = dict(self.SCORE_WEIGHTS)
+        
+        final_score = (
+            skill_match_score * weights['skills'] +
+            location_score * weights['location'] +
+            salary_score * weights['salary'] +
+            role_score * weights['role']
+        )
+        
+        # Ensure score is within bounds
+        final_score = max(0.0, min(100.0, final_score))
+        
+        return {
+            'score': round(final_score, 2),
+            'skills_matched': matched_skills,
+            'keywords_missed': missing_skills,
+            'breakdown': {
+                'skills_score': skill_match_score,
+                'location_score': location_score,
+                'salary_score': salary_score,
+                'role_score': role_score,
+            },
+            'weights': weights,
+            # Future AI fields
+            'embedding_similarity': None,  # TODO: Add semantic similarity
+            'ai_reasoning': '',  # TODO: Add AI explanation
+        }
+    
+    def failed_score(self, error: Exception) -> Dict:
+        """
+        Result dict for a job that could not be scored
+        """
+        return {
+            'score': 0.0,
+            'skills_matched': [],
+            'keywords_missed': [],
+            'breakdown': {},
+            'weights': {},
+            'embedding_similarity': None,
+            'ai_reasoning': f"Error during scoring: {str(error)}",
+        }
+    
     def score_job(self, job: JobPosting, user_profile: JobSeekerProfile) -> Dict:
         """
         Main scoring function - calculates comprehensive job match score
@@ -334,21 +296,9 @@ class DynamicJobMatchingEngine:
             # Get user preferences
             user_preferences = getattr(user_profile, 'preferences', None)
             
-            # Extract skills from job description
-            job_text = f"{job.title} {job.description or ''}"
-            job_requirements = self.extract_skills_from_text(job_text)
-            
-            # Extract user skills from profile
-            user_skills_list = []
-            if isinstance(user_profile.skills, list):
-                user_skills_list = normalize_skills_field(user_profile.skills)[0]
-            user_skills_text = " ".join(user_skills_list) + f" {user_profile.bio or ''}"
-            if hasattr(user_profile, 'job_title') and user_profile.job_title:
-                user_skills_text += f" {user_profile.job_title}"
-            
-            user_skills = self.extract_skills_from_text(user_skills_text)
-            # Add skills from JSON field directly
-            user_skills.extend(user_skills_list)
+            # Extract skills from job description and user profile
+            job_requirements = self.job_skill_requirements(job)
+            user_skills = self.profile_skills(user_profile)
             
             # Calculate skill matching
             matched_skills, missing_skills, skill_match_score = self.calculate_skill_match(
@@ -362,59 +312,15 @@ class DynamicJobMatchingEngine:
             salary_score = self.calculate_salary_match(user_preferences, job)
             
             # Calculate role preference match
-            role_score = 50.0  # Default
-            if user_preferences and user_preferences.preferred_roles:
-                job_title_lower = job.title.lower()
-                for preferred_role in user_preferences.preferred_roles:
-                    if preferred_role.lower() in job_title_lower:
-                        role_score = 90.0
-                        break
+            role_score = self.calculate_role_match(user_preferences, job.title)
             
-            # Weighted final score calculation
-            weights = {
-                'skills': 0.4,      # 40% - Most important
-                'location': 0.25,   # 25% - Very important
-                'salary': 0.20,     # 20% - Important
-                'role': 0.15,       # 15% - Moderately important
-            }
-            
-            final_score = (
-                skill_match_score * weights['skills'] +
-                location_score * weights['location'] +
-                salary_score * weights['salary'] +
-                role_score * weights['role']
+            return self.combine_scores(
+                matched_skills, missing_skills, skill_match_score, location_score, salary_score, role_score
             )
             
-            # Ensure score is within bounds
-            final_score = max(0.0, min(100.0, final_score))
-            
-            return {
-                'score': round(final_score, 2),
-                'skills_matched': matched_skills,
-                'keywords_missed': missing_skills,
-                'breakdown': {
-                    'skills_score': skill_match_score,
-                    'location_score': location_score,
-                    'salary_score': salary_score,
-                    'role_score': role_score,
-                },
-                'weights': weights,
-                # Future AI fields
-                'embedding_similarity': None,  # TODO: Add semantic similarity
-                'ai_reasoning': '',  # TODO: Add AI explanation
-            }
-            
         except Exception as e:
             logger.error(f"Error scoring job {job.id} for user {user_profile.id}: {str(e)}")
-            return {
-                'score': 0.0,
-                'skills_matched': [],
-                'keywords_missed': [],
-                'breakdown': {},
-                'weights': {},
-                'embedding_similarity': None,
-                'ai_reasoning': f"Error during scoring: {str(e)}",
-            }
+            return self.failed_score(e)
     
     @transaction.atomic
     def bulk_score_jobs(self, jobs: List[JobPosting], user_profile: JobSeekerProfile, 
@@ -430,22 +336,32 @@ class DynamicJobMatchingEngine:
         Returns:
             List of created/updated JobScore objects
         """
+        from .batch_scoring import BatchScorer
+        
+        jobs = list(jobs)
+        existing_scores = {
+            score.job_id: score
+            for score in JobScore.objects.filter(job__in=jobs, user_profile=user_profile)
+        }
+        to_score = [job for job in jobs if update_existing or job.id not in existing_scores]
+        
+        # Score all new jobs against the profile in one batch
+        score_data_by_job = dict(zip(
+            [job.id for job in to_score],
+            BatchScorer(self).score_jobs(user_profile, to_score),
+        ))
+        
         job_scores = []
         
         for job in jobs:
             try:
-                # Check if score already exists
-                existing_score = JobScore.objects.filter(
-                    job=job, 
-                    user_profile=user_profile
-                ).first()
+                existing_score = existing_scores.get(job.id)
                 
-                if existing_score and not update_existing:
+                if job.id not in score_data_by_job:
                     job_scores.append(existing_score)
                     continue
                 
-                # Calculate score
-                score_data = self.score_job(job, user_profile)
+                score_data = score_data_by_job[job.id]
                 
                 # Create or update JobScore
                 if existing_score:
@@ -476,6 +392,44 @@ class DynamicJobMatchingEngine:
         
         return job_scores
     
+    @transaction.atomic
+    def bulk_score_profiles(self, job: JobPosting, user_profiles: List[JobSeekerProfile]) -> List[JobScore]:
+        """
+        Score one job for many users and store results, replacing existing scores
+        
+        Args:
+            job: JobPosting to score
+            user_profiles: JobSeekerProfiles to compare against
+        
+        Returns:
+            List of created/updated JobScore objects
+        """
+        from .batch_scoring import BatchScorer
+        
+        user_profiles = list(user_profiles)
+        existing_scores = {
+            score.user_profile_id: score
+            for score in JobScore.objects.filter(job=job, user_profile__in=user_profiles)
+        }
+        
+        job_scores = []
+        for user_profile, score_data in zip(user_profiles, BatchScorer(self).score_profiles(job, user_profiles)):
+            try:
+                job_score = existing_scores.get(user_profile.id) or JobScore(job=job, user_profile=user_profile)
+                job_score.score = score_data['score']
+                job_score.skills_matched = score_data['skills_matched']
+                job_score.keywords_missed = score_data['keywords_missed']
+                job_score.embedding_similarity = score_data['embedding_similarity']
+                job_score.ai_reasoning = score_data['ai_reasoning']
+                job_score.save()
+                job_scores.append(job_score)
+            except Exception as e:
+                logger.error(f"Failed to score job {job.id} for user {user_profile.id}: {str(e)}")
+                continue
+        
+        logger.info(f"Scored job '{job.title}' for {len(job_scores)} users")
+        return job_scores
+    
     def get_top_matches(self, user_profile: JobSeekerProfile, limit: int = 10) -> List[JobScore]:
         """
         Get top matching jobs for a user
@@ -496,7 +450,7 @@ job_matching_engine = DynamicJobMatchingEngine()
 # Convenience functions
 def score_job(job: JobPosting, user_profile: JobSeekerProfile) -> Dict:
     """Score a single job for a user"""
-    return job_matching_engine.calculate_job_score(user_profile, job)
+    return job_matching_engine.score_job(job, user_profile)
 
 
 def bulk_score_jobs(jobs: List[JobPosting], user_profile: JobSeekerProfile, 
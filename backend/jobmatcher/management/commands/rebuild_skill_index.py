@@ -0,0 +1,39 @@
+import logging
+from django.core.management.base import BaseCommand
+from jobmatcher.candidates import rebuild_index
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the skill indexes of jobs and profiles used for candidate generation.
+    
+    Jobs and profiles are indexed as they are saved; run this once for
+    rows saved before the index existed, after a skill taxonomy change (entries of
+    other taxonomy versions are ignored), and periodically to fix drift
+    from queryset updates.
+    
+    Usage:
+        python manage.py rebuild_skill_index
+        python manage.py rebuild_skill_index --batch-size 2000
+    """
+    
+    help = 'Re-index the skills of every job and profile for candidate generation'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows processed per batch (default: 1000)'
+        )
+    
+    def handle(self, *args, **options):
+        indexed = rebuild_index(
+            batch_size=options['batch_size'],
+            progress=lambda model, count: self.stdout.write(
+                f'{model._meta.verbose_name_plural}: {count} indexed so far'
+            ),
+        )
+        self.stdout.write(self.style.SUCCESS(f'Done: {indexed} jobs and profiles indexed'))
@@ -0,0 +1,58 @@
+import logging
+from django.core.management.base import BaseCommand
+from fyndr_auth.models import JobSeekerProfile
+from jobmatcher.skill_vectors import refresh_skill_vectors, skill_vector_version
+from jobscraper.models import JobPosting
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Derive stored skill vectors of jobs and job seeker profiles.
+    
+    Vectors are derived on save and stale ones on first use; this fills
+    rows saved before the vectors existed, or after the skill rules changed,
+    ahead of scoring.
+    
+    Usage:
+        python manage.py refresh_skill_vectors
+        python manage.py refresh_skill_vectors --batch-size 2000
+    """
+    
+    help = 'Derive missing or stale skill vectors of jobs and profiles'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows processed per batch (default: 1000)'
+        )
+    
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        version = skill_vector_version()
+        
+        for model, fields in (
+            (JobPosting, ['id', 'title', 'description', 'skill_ids', 'skill_version']),
+            (JobSeekerProfile, ['id', 'skills', 'bio', 'job_title', 'skill_ids', 'skill_version']),
+        ):
+            refreshed = 0
+            last_id = 0
+            while True:
+                rows = list(
+                    model.objects.filter(id__gt=last_id)
+                    .exclude(skill_version=version)
+                    .order_by('id')
+                    .only(*fields)[:batch_size]
+                )
+                if not rows:
+                    break
+                refreshed += refresh_skill_vectors(rows)
+                last_id = rows[-1].id
+                self.stdout.write(f'{model._meta.verbose_name_plural}: {refreshed} refreshed so far')
+            
+            self.stdout.write(
+                self.style.SUCCESS(f'Done: {refreshed} {model._meta.verbose_name_plural} refreshed')
+            )
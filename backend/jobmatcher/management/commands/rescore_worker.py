@@ -0,0 +1,66 @@
+import logging
+from django.core.management.base import BaseCommand
+from jobscraper.work_queue import WorkQueue
+from jobmatcher.rescoring import RescoreWorker
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Drain the rescore units of the work queue.
+    
+    Job, profile and preference changes queue rescores
+    (jobmatcher.rescoring); run as many workers as needed to keep up, on one
+    host or several sharing the database.
+    
+    Usage:
+        python manage.py rescore_worker                       # Run until no rescores are queued
+        python manage.py rescore_worker --idle-timeout 600    # Keep polling for 10 minutes
+        python manage.py rescore_worker --max-units 100
+    """
+    
+    help = 'Rescore jobs and profiles queued by changes to them'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-units',
+            type=int,
+            default=None,
+            help='Exit after processing this many units'
+        )
+        
+        parser.add_argument(
+            '--idle-timeout',
+            type=float,
+            default=0,
+            help='Seconds to keep polling an empty queue before exiting (default: exit when empty)'
+        )
+        
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=5,
+            help='Seconds between polls of an empty queue (default: 5)'
+        )
+        
+        parser.add_argument(
+            '--worker-id',
+            type=str,
+            default=None,
+            help='Name recorded on leased units (default: host:pid)'
+        )
+    
+    def handle(self, *args, **options):
+        worker = RescoreWorker(WorkQueue(worker_id=options['worker_id']))
+        self.stdout.write(f'Worker {worker.queue.worker_id} started')
+        
+        counts = worker.run(
+            max_units=options['max_units'],
+            idle_timeout=options['idle_timeout'],
+            poll_interval=options['poll_interval'],
+        )
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'Processed {counts["completed"]} units ({counts["failed"]} failed)')
+        )
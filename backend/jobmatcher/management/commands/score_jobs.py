@@ -56,7 +56,7 @@ class Command(BaseCommand):
             self.stdout.write(f"Processing {users.count()} users")
         
         # Get jobs to score
-        jobs = JobPosting.objects.filter(is_active=True)[:limit]
+        jobs = JobPosting.objects.canonical().filter(is_active=True)[:limit]
         self.stdout.write(f"Scoring {jobs.count()} jobs")
         
         total_scores = 0
@@ -297,3 +297,9 @@ class UserPreferences(models.Model):
     
     def __str__(self):
         return f"Preferences for {self.user_profile.user.get_full_name()}"
+    
+    def save(self, *args, **kwargs):
+        # Scores depend on preferences: rescore the user's candidate jobs
+        from .rescoring import enqueue_profiles
+        super().save(*args, **kwargs)
+        enqueue_profiles([self.user_profile_id])
@@ -312,7 +312,7 @@ class JobPacketBuilder:
             # If we don't have enough scores, score some new jobs
             if len(job_scores) < job_limit:
                 logger.info("Scoring additional jobs for packet building...")
-                available_jobs = JobPosting.objects.filter(is_active=True)[:job_limit * 2]
+                available_jobs = JobPosting.objects.canonical().filter(is_active=True)[:job_limit * 2]
                 bulk_score_jobs(list(available_jobs), user_profile, update_existing=False)
                 
                 # Re-query for job scores
@@ -0,0 +1,140 @@
+"""
+Incremental Rescoring
+
+Keeps stored JobScores in step with the jobs and profiles they were computed
+from. Changes queue work instead of being polled for:
+
+- a new or changed job is scored for the users it is relevant to: profiles
+  sharing a skill with it (the JobSeekerSkill index, see
+  jobmatcher.candidates) and users who already have a score for it;
+- a changed profile (its skill vector) or UserPreferences rescores the
+  user's candidate jobs and the jobs the user already has scores for.
+
+Rescores are units of the durable scrape work queue
+(jobscraper.work_queue) under their own source, one unit per job or
+profile, so changes are deduplicated and coalesced: a job saved ten times
+before a worker gets to it is scored once. A change arriving while its
+unit runs re-opens the unit when the run completes, so the next run sees
+it. Units are run by RescoreWorker (the rescore_worker command).
+"""
+
+import logging
+from typing import Any, Dict, Iterable, Optional
+
+from fyndr_auth.models import JobSeekerProfile
+from jobscraper.models import JobPosting
+from jobscraper.work_queue import ScrapeWorker, WorkQueue
+
+from .candidates import candidate_jobs, profiles_for_job
+from .models import JobScore
+
+
+logger = logging.getLogger(__name__)
+
+
+# Work queue source of rescore units
+SOURCE = 'jobmatcher'
+
+# Unit kinds
+JOB = 'job'
+PROFILE = 'profile'
+
+# JobPosting fields scoring reads; saving others does not rescore
+JOB_SCORE_FIELDS = {
+    'title', 'description', 'location', 'salary_min', 'salary_max',
+    'is_active', 'canonical_job', 'skill_ids',
+}
+
+_BATCH = 500
+
+
+def _enqueue(kind: str, ids: Iterable[int]) -> int:
+    payloads = [{'id': id_} for id_ in sorted(set(ids)) if id_]
+    if not payloads:
+        return 0
+    return WorkQueue().enqueue(SOURCE, kind, payloads, rerun_leased=True)
+
+
+def enqueue_jobs(job_ids: Iterable[int]) -> int:
+    """
+    Queue rescoring of jobs for the users they are relevant to.
+
+    Returns:
+        Number of units created, re-opened or marked to run again
+    """
+    return _enqueue(JOB, job_ids)
+
+
+def enqueue_profiles(profile_ids: Iterable[int]) -> int:
+    """
+    Queue rescoring of profiles' candidate jobs.
+
+    Returns:
+        Number of units created, re-opened or marked to run again
+    """
+    return _enqueue(PROFILE, profile_ids)
+
+
+def rescore_job(job_id: int) -> Dict[str, int]:
+    """
+    Score a job for the users it is relevant to.
+
+    Inactive jobs and duplicates of another listing are not scored.
+
+    Returns:
+        Number of users 'scored'
+    """
+    job = JobPosting.objects.filter(id=job_id).first()
+    if not job or not job.is_active or job.canonical_job_id:
+        return {'scored': 0}
+
+    profile_ids = set(profiles_for_job(job))
+    profile_ids.update(JobScore.objects.filter(job=job).values_list('user_profile_id', flat=True))
+
+    from .engine import job_matching_engine
+
+    scored = 0
+    profile_ids = sorted(profile_ids)
+    for start in range(0, len(profile_ids), _BATCH):
+        user_profiles = JobSeekerProfile.objects.select_related('preferences', 'user').filter(
+            id__in=profile_ids[start:start + _BATCH]
+        )
+        scored += len(job_matching_engine.bulk_score_profiles(job, user_profiles))
+    return {'scored': scored}
+
+
+def rescore_profile(profile_id: int) -> Dict[str, int]:
+    """
+    Rescore a user's candidate jobs and the listed jobs the user already has scores for.
+
+    Returns:
+        Number of jobs 'scored'
+    """
+    user_profile = JobSeekerProfile.objects.select_related('preferences', 'user').filter(id=profile_id).first()
+    if not user_profile:
+        return {'scored': 0}
+
+    jobs = candidate_jobs(user_profile)
+    candidate_ids = {job.id for job in jobs}
+    jobs.extend(
+        JobPosting.objects.canonical().filter(is_active=True, job_scores__user_profile=user_profile)
+        .exclude(id__in=candidate_ids)
+    )
+
+    from .engine import job_matching_engine
+
+    return {'scored': len(job_matching_engine.bulk_score_jobs(jobs, user_profile, update_existing=True))}
+
+
+class RescoreWorker(ScrapeWorker):
+    """Drains the rescore units of the work queue."""
+
+    def __init__(self, queue: Optional[WorkQueue] = None):
+        super().__init__(queue, sources=[SOURCE])
+
+    def run_unit(self, unit) -> Optional[Dict[str, Any]]:
+        if unit.kind == JOB:
+            return rescore_job(unit.payload['id'])
+        if unit.kind == PROFILE:
+            return rescore_profile(unit.payload['id'])
+        raise ValueError(f"Unknown rescore unit kind: {unit.kind}")
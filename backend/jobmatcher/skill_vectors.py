@@ -0,0 +1,116 @@
+"""
+Skill Vectors
+
+Canonical skill sets of jobs and job seekers, derived once and stored on the
+rows so scoring does not extract skills from text on every call.
+
+JobPosting.skill_ids and JobSeekerProfile.skill_ids hold sorted ids of
+canonical skills in the shared skill taxonomy (jobscraper.skill_taxonomy):
+a job's requirements with repeats kept (two synonyms of one skill count
+twice, as in calculate_skill_match), a profile's skills without.
+skill_version records the taxonomy version the ids were derived with; 0
+means never derived. Ids are only meaningful for their version.
+
+Vectors are derived when a job is saved or ingested and when a profile is
+saved. Rows written around save() (queryset updates, rows older than the
+current taxonomy) are stale: skill_ids() re-derives them in memory without
+writing, and refresh_skill_vectors() stores and re-indexes them
+(jobmatcher.candidates) in bulk. Batch scoring and rescoring call it once
+per batch; the refresh_skill_vectors command catches up the rest after a
+taxonomy change.
+"""
+
+from typing import Iterable, List
+
+from fyndr_auth.models import JobSeekerProfile
+from jobscraper.models import JobPosting
+from jobscraper.skill_taxonomy import get_taxonomy
+
+
+VECTOR_FIELDS = ['skill_ids', 'skill_version']
+
+_BATCH = 500
+
+
+def _engine():
+    from .engine import job_matching_engine
+
+    return job_matching_engine
+
+
+def _reindex(instances: List) -> None:
+    """Re-index the skills of re-derived jobs or profiles."""
+    from .candidates import index_jobs, index_profiles
+
+    if isinstance(instances[0], JobPosting):
+        index_jobs(instances)
+    else:
+        index_profiles(instances)
+
+
+def skill_vector_version() -> int:
+    """Version of the skill taxonomy, never 0."""
+    return get_taxonomy().version
+
+
+def derive_job_skill_ids(job: JobPosting) -> List[int]:
+    """Sorted ids of the skills a job requires, one per mention after normalization."""
+    taxonomy = get_taxonomy()
+    ids = (taxonomy.id(skill) for skill in _engine().extract_job_requirements(job))
+    return sorted(skill_id for skill_id in ids if skill_id is not None)
+
+
+def derive_profile_skill_ids(user_profile: JobSeekerProfile) -> List[int]:
+    """Sorted ids of a profile's distinct skills."""
+    taxonomy = get_taxonomy()
+    # Skills outside the taxonomy cannot match a requirement
+    ids = {taxonomy.id(skill) for skill in _engine().extract_profile_skills(user_profile)}
+    ids.discard(None)
+    return sorted(ids)
+
+
+def derive_skill_vector(instance) -> None:
+    """Set skill_ids and skill_version of a JobPosting or JobSeekerProfile."""
+    if isinstance(instance, JobPosting):
+        instance.skill_ids = derive_job_skill_ids(instance)
+    else:
+        instance.skill_ids = derive_profile_skill_ids(instance)
+    instance.skill_version = skill_vector_version()
+
+
+def is_current(instance) -> bool:
+    return instance.skill_version == skill_vector_version()
+
+
+def skill_ids(instance) -> List[int]:
+    """
+    Skill ids of a job or profile.
+
+    A stale vector is re-derived on the instance but not saved, so read
+    paths never write; refresh_skill_vectors() stores it.
+    """
+    if not is_current(instance):
+        derive_skill_vector(instance)
+    return instance.skill_ids
+
+
+def skill_names(ids: Iterable[int]) -> List[str]:
+    taxonomy = get_taxonomy()
+    return [taxonomy.name(skill_id) for skill_id in ids]
+
+
+def refresh_skill_vectors(instances: Iterable) -> int:
+    """
+    Re-derive the stale vectors among jobs or profiles of one model and save them in bulk.
+
+    Returns:
+        Number of vectors re-derived
+    """
+    stale = [instance for instance in instances if not is_current(instance)]
+    for instance in stale:
+        derive_skill_vector(instance)
+    saved = [instance for instance in stale if instance.pk]
+    if saved:
+        type(saved[0]).objects.bulk_update(saved, VECTOR_FIELDS, batch_size=_BATCH)
+        _reindex(saved)
+    return len(stale)
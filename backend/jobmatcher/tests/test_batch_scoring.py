@@ -0,0 +1,86 @@
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from fyndr_auth.models import JobSeekerProfile
+from jobmatcher.batch_scoring import BatchScorer
+from jobmatcher.engine import bulk_score_jobs, job_matching_engine
+from jobmatcher.models import JobScore, UserPreferences
+from jobscraper.models import JobPosting
+
+
+def _job(i, title, description, location='Remote', **fields):
+    return JobPosting.objects.create(
+        external_id=str(i), title=title, company='Acme', location=location, description=description,
+        url=f'https://jobs.example.com/{i}', source='greenhouse', date_scraped=timezone.now(), **fields,
+    )
+
+
+def _profile(name, skills, bio='', job_title='', **preferences):
+    user = get_user_model().objects.create(username=name, email=f'{name}@example.com')
+    profile = JobSeekerProfile.objects.create(user=user, skills=skills, bio=bio, job_title=job_title)
+    if preferences:
+        UserPreferences.objects.create(user_profile=profile, **preferences)
+    return JobSeekerProfile.objects.get(id=profile.id)
+
+
+@pytest.fixture
+def jobs():
+    return [
+        # sql and mysql both normalize to mysql, so it is required twice
+        _job(1, 'Backend Engineer', 'Python, Django, SQL and MySQL on AWS with Docker.',
+             salary_min=Decimal('90000'), salary_max=Decimal('120000')),
+        _job(2, 'Frontend Developer', 'React, TypeScript and CSS.', location='Berlin, Germany',
+             salary_min=Decimal('60000')),
+        _job(3, 'Data Scientist', 'Machine learning and analytics in Python.', location='London, UK',
+             salary_min=Decimal('150000'), salary_max=Decimal('170000')),
+        _job(4, 'Office Manager', 'Keep the office running.', location=''),
+    ]
+
+
+@pytest.fixture
+def profiles():
+    return [
+        _profile('backend', ['Python', {'name': 'Postgres'}, 'sql'], bio='Docker and AWS.',
+                 preferred_roles=['backend'], preferred_locations=['Berlin'],
+                 remote_preference='REMOTE', salary_expectation=100000),
+        _profile('frontend', ['react', 'node.js', 'tailwind'], job_title='Frontend Developer',
+                 remote_preference='ONSITE', salary_expectation=65000),
+        _profile('fresh', [], bio='Curious about machine learning.'),
+    ]
+
+
+@pytest.mark.django_db
+def test_batch_scores_match_scalar_scores(jobs, profiles):
+    scorer = BatchScorer()
+    for profile in profiles:
+        expected = [job_matching_engine.score_job(job, profile) for job in jobs]
+        assert scorer.score_jobs(profile, jobs) == expected
+
+    for job in jobs:
+        expected = [job_matching_engine.score_job(job, profile) for profile in profiles]
+        assert scorer.score_profiles(job, profiles) == expected
+
+    backend = scorer.score_jobs(profiles[0], jobs[:1])[0]
+    assert backend['breakdown']['skills_score'] == 100.0
+    assert backend['skills_matched'].count('mysql') == 2
+
+    # A job without a maximum salary is compared against its minimum
+    assert scorer.score_jobs(profiles[1], jobs[1:2])[0]['breakdown']['salary_score'] == 80.0
+
+
+@pytest.mark.django_db
+def test_bulk_score_jobs_scores_only_new_jobs(jobs, profiles):
+    profile = profiles[0]
+    bulk_score_jobs(jobs[:2], profile)
+    JobScore.objects.filter(job=jobs[0]).update(score=1)
+
+    scores = bulk_score_jobs(jobs, profile)
+    assert [score.job_id for score in scores] == [job.id for job in jobs]
+    assert scores[0].score == 1
+    assert float(scores[2].score) == job_matching_engine.score_job(jobs[2], profile)['score']
+
+    scores = bulk_score_jobs(jobs, profile, update_existing=True)
+    assert float(scores[0].score) == job_matching_engine.score_job(jobs[0], profile)['score']
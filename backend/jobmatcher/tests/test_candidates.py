@@ -0,0 +1,69 @@
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+
+from fyndr_auth.models import JobSeekerProfile
+from jobmatcher.candidates import candidate_jobs
+from jobmatcher.engine import job_matching_engine
+from jobmatcher.models import UserPreferences
+from jobscraper.models import JobPosting, JobSkill
+from jobscraper.services import JobScrapingService
+
+
+def _job(i, description, location='Remote', **fields):
+    return JobPosting.objects.create(
+        external_id=str(i), title='Engineer', company=f'Company {i}', location=location, description=description,
+        url=f'https://jobs.example.com/{i}', source='greenhouse', date_scraped=timezone.now(), **fields,
+    )
+
+
+def _profile(skills, **preferences):
+    user = get_user_model().objects.create(username='seeker', email='seeker@example.com')
+    profile = JobSeekerProfile.objects.create(user=user, skills=skills)
+    if preferences:
+        UserPreferences.objects.create(user_profile=profile, **preferences)
+    return JobSeekerProfile.objects.get(id=profile.id)
+
+
+@pytest.mark.django_db
+def test_candidates_come_from_the_skill_index_ranked_like_scores():
+    full = _job(1, 'Python and Django.', salary_max=Decimal('120000'))
+    onsite = _job(2, 'Python and Django.', location='Berlin, Germany', salary_max=Decimal('120000'))
+    half = _job(3, 'Python and Kubernetes.', salary_max=Decimal('50000'))
+    _job(4, 'Rust and Kubernetes.')
+    _job(5, 'Python and Django.', is_active=False)
+    JobScrapingService(dedup=False).save_jobs([{
+        'external_id': '6', 'title': 'Engineer', 'company': 'Company 6', 'location': 'Remote',
+        'description': 'Django, Python and Go.', 'url': 'https://jobs.example.com/6', 'source': 'lever',
+        'date_scraped': timezone.now(),
+    }], bulk=True)
+    bulk = JobPosting.objects.get(source='lever')
+
+    profile = _profile(['python', 'django'], remote_preference='REMOTE', salary_expectation=100000)
+    candidates = candidate_jobs(profile, limit=10)
+
+    assert candidates == [full, bulk, onsite, half]
+    scores = [job_matching_engine.score_job(job, profile)['score'] for job in candidates]
+    assert scores == sorted(scores, reverse=True)
+    assert candidate_jobs(profile, limit=2) == [full, bulk]
+
+    # Edits re-index the job
+    half.description = 'Rust only.'
+    half.save()
+    assert half not in candidate_jobs(profile, limit=10)
+
+
+@pytest.mark.django_db
+def test_stale_index_is_ignored_until_rebuilt():
+    job = _job(1, 'Python and Django.')
+    profile = _profile(['python'])
+    JobSkill.objects.update(skill_version=1)
+    assert candidate_jobs(profile) == []
+
+    JobSkill.objects.all().delete()
+    call_command('rebuild_skill_index')
+    assert candidate_jobs(profile) == [job]
+
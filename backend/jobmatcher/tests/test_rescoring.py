@@ -0,0 +1,98 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+
+from fyndr_auth.models import JobSeekerProfile
+from jobmatcher.models import JobScore, UserPreferences
+from jobmatcher.rescoring import JOB, PROFILE, SOURCE, RescoreWorker, enqueue_jobs
+from jobscraper.models import JobPosting, JobSkill, ScrapeWorkUnit
+from jobscraper.work_queue import WorkQueue
+
+
+def _job(i, description):
+    return JobPosting.objects.create(
+        external_id=str(i), title='Engineer', company=f'Company {i}', location='Remote', description=description,
+        url=f'https://jobs.example.com/{i}', source='greenhouse', date_scraped=timezone.now(),
+    )
+
+
+def _profile(name, skills):
+    user = get_user_model().objects.create(username=name, email=f'{name}@example.com')
+    return JobSeekerProfile.objects.create(user=user, skills=skills)
+
+
+def _pending(kind):
+    return ScrapeWorkUnit.objects.filter(source=SOURCE, kind=kind, status=ScrapeWorkUnit.PENDING).count()
+
+
+def _scores(profile):
+    return dict(JobScore.objects.filter(user_profile=profile).values_list('job__external_id', 'score'))
+
+
+@pytest.mark.django_db
+def test_changes_are_coalesced_and_rerun_when_they_arrive_during_a_run():
+    job = _job(1, 'Python and Django.')
+    job.save()
+    job.description = 'Python, Django and Go.'
+    job.save(update_fields=['description'])
+    job.save(update_fields=['url'])
+    assert _pending(JOB) == 1
+
+    unit = WorkQueue().lease(1, sources=[SOURCE])[0]
+    enqueue_jobs([job.id])
+    assert WorkQueue().complete(unit)
+    assert _pending(JOB) == 1
+
+    unit = WorkQueue().lease(1, sources=[SOURCE])[0]
+    assert WorkQueue().complete(unit)
+    assert _pending(JOB) == 0
+
+
+@pytest.mark.django_db
+def test_job_and_profile_changes_rescore_affected_users():
+    python = _profile('py', ['python'])
+    rust = _profile('rs', ['rust'])
+    RescoreWorker().run()
+
+    job = _job(1, 'Python and Kubernetes.')
+    assert RescoreWorker().run() == {'completed': 1, 'failed': 0}
+    assert list(_scores(python)) == ['1'] and _scores(rust) == {}
+    before = _scores(python)['1']
+
+    # Profile changes rescore the user's candidates
+    python.skills = ['python', 'kubernetes']
+    python.save()
+    assert _pending(PROFILE) == 1
+    RescoreWorker().run()
+    assert _scores(python)['1'] > before
+
+    # Preference changes too
+    UserPreferences.objects.create(user_profile=rust, remote_preference='REMOTE')
+    assert _pending(PROFILE) == 1
+
+    # A job losing its skills is rescored for the users who had a score
+    job.description = 'Rust only.'
+    job.save()
+    call_command('rescore_worker')
+    assert _scores(python)['1'] < before
+    assert list(_scores(rust)) == ['1']
+
+
+@pytest.mark.django_db
+def test_saving_an_unchanged_job_does_not_reindex_or_rescore():
+    job = _job(1, 'Python and Kubernetes.')
+    ScrapeWorkUnit.objects.filter(source=SOURCE).delete()
+    entries = set(JobSkill.objects.filter(job=job).values_list('id', flat=True))
+    assert entries
+
+    job = JobPosting.objects.get(id=job.id)
+    job.date_scraped = timezone.now()
+    job.save()
+    assert _pending(JOB) == 0
+    assert set(JobSkill.objects.filter(job=job).values_list('id', flat=True)) == entries
+
+    job.salary_min = 100000
+    job.save()
+    assert _pending(JOB) == 1
+    assert set(JobSkill.objects.filter(job=job).values_list('id', flat=True)) == entries
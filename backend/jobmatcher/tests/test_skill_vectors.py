@@ -0,0 +1,96 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+
+from fyndr_auth.models import JobSeekerProfile
+from jobmatcher.engine import job_matching_engine
+from jobmatcher.skill_vectors import skill_names, skill_vector_version
+from jobscraper.models import JobPosting
+from jobscraper.services import JobScrapingService
+
+
+def _job_data(i, description, title='Backend Engineer'):
+    return {
+        'external_id': str(i), 'title': title, 'company': 'Acme', 'location': 'Remote',
+        'description': description, 'url': f'https://jobs.example.com/{i}', 'source': 'greenhouse',
+        'date_scraped': timezone.now(),
+    }
+
+
+def _profile(**fields):
+    user = get_user_model().objects.create(username='seeker', email='seeker@example.com')
+    return JobSeekerProfile.objects.create(user=user, **fields)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('bulk', [False, True])
+def test_vectors_are_stored_at_ingest(bulk):
+    service = JobScrapingService(dedup=False)
+    service.save_jobs([_job_data(1, 'Python and SQL, some MySQL.')], bulk=bulk)
+
+    job = JobPosting.objects.get(external_id='1')
+    assert job.skill_version == skill_vector_version()
+    assert sorted(skill_names(job.skill_ids)) == ['mysql', 'mysql', 'python']
+
+    service.save_jobs([_job_data(1, 'Docker on AWS.')], bulk=bulk)
+    job.refresh_from_db()
+    assert sorted(skill_names(job.skill_ids)) == ['aws', 'docker']
+
+
+@pytest.mark.django_db
+def test_saving_a_loaded_job_only_rederives_changed_text(monkeypatch):
+    JobScrapingService(dedup=False).save_jobs([_job_data(1, 'Python and SQL.')])
+    job = JobPosting.objects.get()
+
+    def no_derivation(*args):
+        raise AssertionError('derived from unchanged fields')
+
+    monkeypatch.setattr('jobmatcher.skill_vectors.derive_skill_vector', no_derivation)
+    monkeypatch.setattr('jobscraper.listing_fields.derive_listing_fields', no_derivation)
+    monkeypatch.setattr('jobscraper.locations.normalize_location', no_derivation)
+    job.date_scraped = timezone.now()
+    job.save()
+    monkeypatch.undo()
+
+    job.description = 'Docker on AWS.'
+    job.save()
+    assert sorted(skill_names(JobPosting.objects.get().skill_ids)) == ['aws', 'docker']
+
+
+@pytest.mark.django_db
+def test_profile_vectors_follow_saves():
+    profile = _profile(skills=['Postgres', {'name': 'React'}], bio='Some Docker.')
+    assert sorted(skill_names(profile.skill_ids)) == ['docker', 'postgresql', 'react']
+
+    profile.bio = 'Kubernetes these days.'
+    profile.save(update_fields=['bio'])
+    profile.refresh_from_db()
+    assert sorted(skill_names(profile.skill_ids)) == ['kubernetes', 'postgresql', 'react']
+
+
+@pytest.mark.django_db
+def test_scoring_reads_stored_vectors(monkeypatch):
+    JobScrapingService(dedup=False).save_jobs([_job_data(1, 'Python and Docker.')], bulk=True)
+    profile = _profile(skills=['python'])
+    job = JobPosting.objects.get()
+
+    def no_extraction(text):
+        raise AssertionError('skills extracted while scoring')
+
+    monkeypatch.setattr(job_matching_engine, 'extract_skills_from_text', no_extraction)
+    result = job_matching_engine.score_job(job, profile)
+    assert (result['skills_matched'], result['keywords_missed']) == (['python'], ['docker'])
+    monkeypatch.undo()
+
+    # Vectors written around save() are re-derived on use, but only stored by batch scoring
+    JobPosting.objects.update(description='Python and Go.', skill_version=0)
+    job = JobPosting.objects.get()
+    assert job_matching_engine.score_job(job, profile)['skills_matched'] == ['python']
+    assert JobPosting.objects.get().skill_version == 0
+    job_matching_engine.bulk_score_jobs([JobPosting.objects.get()], profile)
+    assert JobPosting.objects.get().skill_version == skill_vector_version()
+
+    JobSeekerProfile.objects.update(skill_version=0)
+    call_command('refresh_skill_vectors')
+    assert JobSeekerProfile.objects.get().skill_version == skill_vector_version()
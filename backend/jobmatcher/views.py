@@ -10,6 +10,7 @@ from django.shortcuts import get_object_or_404
 from jobscraper.models import JobPosting
 from fyndr_auth.models import JobSeekerProfile
 from .engine import score_job, bulk_score_jobs, get_top_matches
+from .candidates import candidate_jobs
 from .models import JobScore, UserPreferences, PreparedJob
 from .serializers import JobScoreSerializer, UserPreferencesSerializer, PreparedJobSerializer
 from .packet_builder import build_job_packet, build_bulk_packets, get_user_packets_summary
@@ -72,11 +73,15 @@ def score_multiple_jobs(request):
         limit = request.data.get('limit', 50)
         update_existing = request.data.get('update_existing', False)
         
-        # Get jobs
+        # Get jobs: the best candidates from the skill index, or the latest
+        # listed jobs for profiles without indexed skills
         if job_ids:
             jobs = JobPosting.objects.filter(id__in=job_ids, is_active=True)
         else:
-            jobs = JobPosting.objects.filter(is_active=True)[:limit]
+            jobs = (
+                candidate_jobs(user_profile, int(limit))
+                or JobPosting.objects.canonical().filter(is_active=True)[:limit]
+            )
         
         # Score jobs
         job_scores = bulk_score_jobs(
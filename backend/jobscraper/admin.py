@@ -2,7 +2,9 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
-from .models import JobPosting
+from .dedup import promote_duplicates
+from .facets import track_facets
+from .models import CompanyLogo, FacetCount, JobArchive, JobPosting, ScrapeWatermark, ScrapeWorkUnit, ScrapingLog
 
 
 @admin.register(JobPosting)
@@ -27,6 +29,8 @@ class JobPostingAdmin(admin.ModelAdmin):
     list_filter = [
         'source',
         'is_active',
+        'country_code',
+        'is_remote',
         'date_scraped',
         'date_posted',
         'company'
@@ -47,7 +51,11 @@ class JobPostingAdmin(admin.ModelAdmin):
         'created_at',
         'updated_at',
         'view_job_link',
-        'description_preview'
+        'description_preview',
+        'country_code',
+        'region',
+        'city',
+        'is_remote'
     ]
     
     fieldsets = (
@@ -60,6 +68,14 @@ class JobPostingAdmin(admin.ModelAdmin):
                 'description_preview'
             )
         }),
+        ('Normalized Location', {
+            'fields': (
+                'country_code',
+                'region',
+                'city',
+                'is_remote'
+            )
+        }),
         ('Source Information', {
             'fields': (
                 'external_id',
@@ -118,7 +134,8 @@ class JobPostingAdmin(admin.ModelAdmin):
     
     def activate_jobs(self, request, queryset):
         """Admin action to activate selected jobs."""
-        updated = queryset.update(is_active=True)
+        with track_facets(queryset):
+            updated = queryset.update(is_active=True)
         self.message_user(
             request,
             f"Successfully activated {updated} job posting(s)."
@@ -127,7 +144,10 @@ class JobPostingAdmin(admin.ModelAdmin):
     
     def deactivate_jobs(self, request, queryset):
         """Admin action to deactivate selected jobs."""
-        updated = queryset.update(is_active=False)
+        job_ids = list(queryset.values_list('id', flat=True))
+        with track_facets(queryset):
+            updated = queryset.update(is_active=False)
+        promote_duplicates(job_ids)
         self.message_user(
             request,
             f"Successfully deactivated {updated} job posting(s)."
@@ -166,3 +186,124 @@ class JobPostingAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         """Optimize queryset for admin list view."""
         return super().get_queryset(request).select_related()
+
+
+@admin.register(ScrapingLog)
+class ScrapingLogAdmin(admin.ModelAdmin):
+    """
+    Admin interface for ScrapingLog model.
+    
+    Read-only history of scraper runs with job counts, HTTP/parse cache hit
+    rates and per-host fetch stats.
+    """
+    
+    list_display = [
+        'source',
+        'status',
+        'started_at',
+        'completed_at',
+        'jobs_found',
+        'jobs_created',
+        'jobs_updated',
+        'jobs_unchanged',
+        'cache_hits',
+        'cache_misses',
+        'parse_cache_hits',
+        'parse_cache_misses',
+        'errors_count'
+    ]
+    
+    list_filter = ['source', 'status', 'started_at']
+    
+    date_hierarchy = 'started_at'
+    
+    ordering = ['-started_at']
+    
+    def has_add_permission(self, request):
+        """Logs are written by scrapers only."""
+        return False
+
+
+@admin.register(ScrapeWatermark)
+class ScrapeWatermarkAdmin(admin.ModelAdmin):
+    """
+    Admin interface for ScrapeWatermark model.
+    
+    Deleting a watermark makes the next incremental run crawl that scope in full.
+    """
+    
+    list_display = ['source', 'scope', 'last_posted_at', 'cursor', 'last_success_at']
+    
+    list_filter = ['source']
+    
+    search_fields = ['scope']
+    
+    readonly_fields = ['seen_ids', 'updated_at']
+
+
+@admin.register(ScrapeWorkUnit)
+class ScrapeWorkUnitAdmin(admin.ModelAdmin):
+    """
+    Admin interface for ScrapeWorkUnit model.
+    
+    Shows queue progress, leases and retry errors for distributed crawls.
+    """
+    
+    list_display = ['source', 'kind', 'status', 'attempts', 'leased_by', 'lease_expires_at', 'available_at', 'completed_at']
+    
+    list_filter = ['source', 'kind', 'status']
+    
+    search_fields = ['key', 'leased_by', 'last_error']
+    
+    readonly_fields = ['key', 'lease_token', 'heartbeat_at', 'result', 'created_at', 'updated_at']
+
+
+@admin.register(CompanyLogo)
+class CompanyLogoAdmin(admin.ModelAdmin):
+    """
+    Admin interface for CompanyLogo model.
+    
+    Deleting an entry makes the next lookup for that company resolve it again.
+    """
+    
+    list_display = ['company', 'domain', 'logo_url', 'strategy', 'resolved_at', 'expires_at']
+    
+    list_filter = ['strategy']
+    
+    search_fields = ['company', 'company_key', 'domain']
+
+
+@admin.register(FacetCount)
+class FacetCountAdmin(admin.ModelAdmin):
+    """
+    Admin interface for FacetCount model.
+    
+    Counters are maintained by the scrapers; run reconcile_facets to recount.
+    """
+    
+    list_display = ['facet', 'value', 'source', 'count', 'revision']
+    
+    list_filter = ['facet', 'source']
+    
+    search_fields = ['value']
+    
+    readonly_fields = ['source', 'facet', 'value', 'count', 'revision']
+
+
+@admin.register(JobArchive)
+class JobArchiveAdmin(admin.ModelAdmin):
+    """
+    Admin interface for JobArchive model.
+    
+    Postings removed by clear_expired_jobs; the full row is kept compressed.
+    """
+    
+    list_display = ['title', 'company', 'source', 'date_posted', 'date_scraped', 'archived_at']
+    
+    list_filter = ['source']
+    
+    search_fields = ['title', 'company', 'external_id']
+    
+    exclude = ['data']
+    
+    readonly_fields = ['job_id', 'external_id', 'source', 'title', 'company', 'date_posted', 'date_scraped', 'archived_at']
@@ -16,6 +16,7 @@ from bs4 import BeautifulSoup
 import hashlib
 
 from django.utils import timezone
+from .fetch_policy import HostUnavailable, get_fetch_policy, is_retryable, parse_retry_after
 from .models import JobPosting, ScrapingLog
 from .simple_job_parser import parse_job_content
 
@@ -69,10 +70,18 @@ class BaseScraper(ABC):
         else:
             session_headers = self.session.headers
         
+        policy = get_fetch_policy()
         max_retries = 3
-        retry_delay = 1
         
         for attempt in range(max_retries):
+            try:
+                slot = policy.acquire(url)
+            except HostUnavailable as e:
+                logger.warning(str(e))
+                self.errors.append(str(e))
+                return None
+            
+            status, retry_after = None, None
             try:
                 logger.info(f"Fetching data from {url} (attempt {attempt + 1}/{max_retries})")
                 
@@ -82,10 +91,9 @@ class BaseScraper(ABC):
                     headers=session_headers,
                     timeout=30
                 )
+                status = response.status_code
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
                 response.raise_for_status()
-                
-                # Add delay to be respectful to the server
-                time.sleep(1)
                 return response
                 
             except requests.exceptions.RequestException as e:
@@ -93,11 +101,16 @@ class BaseScraper(ABC):
                 logger.warning(error_msg)
                 self.errors.append(error_msg)
                 
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
+                if attempt < max_retries - 1 and is_retryable(status):
+                    # The next acquire waits out Retry-After
+                    if retry_after is None:
+                        time.sleep(policy.backoff(attempt))
                 else:
-                    logger.error(f"Failed to fetch {url} after {max_retries} attempts")
+                    logger.error(f"Failed to fetch {url} after {attempt + 1} attempts")
                     return None
+            
+            finally:
+                policy.release(slot, status, retry_after)
     
     def parse_html(self, html_content: str) -> BeautifulSoup:
         """
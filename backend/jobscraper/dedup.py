@@ -0,0 +1,382 @@
+"""
+Near-Duplicate Detection
+
+The same job is often listed on several boards, or reposted on one, under a
+different external id each time. Every posting gets a MinHash signature over
+word shingles of its title, company and description. The signature is cut
+into LSH bands stored in JobSignatureBand, so candidates for a new posting
+come from one indexed lookup instead of a comparison against every job.
+
+A posting whose estimated similarity to a candidate reaches the threshold
+joins that candidate's cluster: canonical_job points at the cluster's
+canonical (first indexed) posting. Listings and scoring only see canonical
+postings (JobPosting.objects.canonical()).
+
+Postings expire per source, so a canonical posting can be deactivated while
+its duplicates elsewhere are still listed. promote_duplicates() then makes
+the oldest active duplicate canonical and links the rest of the cluster to
+it, so the opening stays listed while any of its postings is. A canonical
+posting about to be deleted hands its cluster over the same way
+(hand_over_clusters()), so its duplicates are not all listed at once.
+"""
+
+import hashlib
+import logging
+import re
+import struct
+from typing import Dict, Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+
+
+logger = logging.getLogger(__name__)
+
+
+# Signature shape: BANDS * ROWS hash functions. Two postings become
+# candidates when all ROWS values of any band agree, which happens with
+# probability 1 - (1 - s**ROWS)**BANDS for Jaccard similarity s: ~99.98% at
+# 0.8, ~64% at 0.5. Candidates are then checked against the threshold.
+BANDS = 16
+ROWS = 4
+NUM_PERM = BANDS * ROWS
+
+# Words per shingle
+SHINGLE_SIZE = 3
+
+# Default estimated Jaccard similarity for two postings to be duplicates
+SIMILARITY_THRESHOLD = 0.8
+
+# One extendable-output digest per shingle supplies all NUM_PERM 32-bit hash
+# values, so the per-shingle cost is a single C call rather than NUM_PERM
+# multiply-mod steps in Python. Signatures are persisted: never change this.
+_UNPACK_HASHES = struct.Struct(f'>{NUM_PERM}I').unpack
+
+_TAGS = re.compile(r'<[^>]+>')
+_WORDS = re.compile(r'[a-z0-9]+')
+
+# Keeps IN (...) lists under the SQLite bound parameter limit
+_LOOKUP_BATCH = 900
+
+
+def shingles(title: str, company: str, description: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """
+    Word shingles of a posting's title, company and description.
+
+    Markup is stripped and text is lowercased, so formatting differences
+    between boards do not count as content differences.
+
+    Args:
+        title: Job title
+        company: Company name
+        description: Description text or HTML
+        size: Words per shingle
+
+    Returns:
+        Set of space-joined word n-grams (empty when there are no words)
+    """
+    text = ' '.join(part for part in (title, company, description) if part)
+    words = _WORDS.findall(_TAGS.sub(' ', text).lower())
+    if len(words) <= size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash(shingle_set: Iterable[str]) -> List[int]:
+    """
+    MinHash signature of a shingle set.
+
+    Args:
+        shingle_set: Shingles from shingles()
+
+    Returns:
+        NUM_PERM 32-bit values, or an empty list for an empty set
+    """
+    hashes = [
+        _UNPACK_HASHES(hashlib.shake_128(shingle.encode('utf-8')).digest(NUM_PERM * 4))
+        for shingle in shingle_set
+    ]
+    if not hashes:
+        return []
+    return list(map(min, zip(*hashes)))
+
+
+def job_signature(job) -> List[int]:
+    """MinHash signature of a JobPosting (or anything with its text attributes)."""
+    return minhash(shingles(job.title or '', job.company or '', job.description or ''))
+
+
+def band_keys(signature: List[int]) -> List[int]:
+    """
+    LSH bucket keys for a signature, one per band.
+
+    The band number is hashed in, so keys from different bands never
+    collide and one indexed column serves every band.
+
+    Args:
+        signature: Signature from minhash()
+
+    Returns:
+        BANDS signed 64-bit keys (empty for an empty signature)
+    """
+    if len(signature) != NUM_PERM:
+        return []
+    keys = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS:(band + 1) * ROWS]
+        digest = hashlib.blake2b(struct.pack(f'>H{ROWS}I', band, *rows), digest_size=8).digest()
+        keys.append(int.from_bytes(digest, 'big', signed=True))
+    return keys
+
+
+def similarity(first: List[int], second: List[int]) -> float:
+    """Estimated Jaccard similarity of two signatures (0.0 if either is missing)."""
+    if not first or len(first) != len(second):
+        return 0.0
+    return sum(1 for a, b in zip(first, second) if a == b) / len(first)
+
+
+def _relink_cluster(old_canonical: int, new_canonical: int) -> None:
+    """Make new_canonical the canonical posting of old_canonical's cluster, old_canonical included."""
+    from .models import JobPosting
+
+    JobPosting.objects.filter(
+        Q(id=old_canonical) | Q(canonical_job_id=old_canonical)
+    ).exclude(id=new_canonical).update(canonical_job_id=new_canonical)
+    JobPosting.objects.filter(id=new_canonical).update(canonical_job_id=None)
+
+
+def hand_over_clusters(canonical_ids: Iterable[int], excluded_ids: Iterable[int] = ()) -> Dict[int, int]:
+    """
+    Hand the clusters of canonical postings over to one of their duplicates.
+
+    Call before deleting canonical postings. The lowest-id duplicate not in
+    excluded_ids, active ones first, becomes canonical and the rest of the
+    cluster is linked to it. Writes are not counted in the facet counters:
+    call inside a track_facets() block selecting the clusters.
+
+    Args:
+        canonical_ids: Ids of canonical postings
+        excluded_ids: Duplicates that must not take over (e.g. deleted with them)
+
+    Returns:
+        {old canonical id: new canonical id}
+    """
+    from .models import JobPosting
+
+    canonical_ids = list(set(canonical_ids))
+    excluded = set(excluded_ids)
+    successors: Dict[int, int] = {}
+    for start in range(0, len(canonical_ids), _LOOKUP_BATCH):
+        rows = JobPosting.objects.filter(
+            canonical_job_id__in=canonical_ids[start:start + _LOOKUP_BATCH]
+        ).order_by('-is_active', 'id').values_list('canonical_job_id', 'id')
+        for canonical_id, job_id in rows:
+            if job_id not in excluded:
+                successors.setdefault(canonical_id, job_id)
+
+    for old_canonical, new_canonical in successors.items():
+        _relink_cluster(old_canonical, new_canonical)
+    return successors
+
+
+def promote_duplicates(canonical_ids: Iterable[int]) -> int:
+    """
+    Hand the clusters of inactive canonical postings over to an active duplicate.
+
+    Call after deactivating postings. The lowest-id active duplicate of each
+    cluster becomes canonical and the rest of the cluster, the inactive
+    posting included, is linked to it. Clusters without an active duplicate
+    are left alone.
+
+    Args:
+        canonical_ids: Ids of postings that may be inactive canonical postings
+
+    Returns:
+        Number of postings promoted
+    """
+    from .facets import track_facets
+    from .models import JobPosting
+
+    canonical_ids = list(set(canonical_ids))
+    promoted: Dict[int, int] = {}
+    for start in range(0, len(canonical_ids), _LOOKUP_BATCH):
+        inactive = JobPosting.objects.filter(
+            id__in=canonical_ids[start:start + _LOOKUP_BATCH], is_active=False, canonical_job__isnull=True
+        )
+        rows = JobPosting.objects.filter(
+            canonical_job__in=inactive, is_active=True
+        ).order_by('id').values_list('canonical_job_id', 'id')
+        for canonical_id, job_id in rows:
+            promoted.setdefault(canonical_id, job_id)
+
+    for old_canonical, new_canonical in promoted.items():
+        cluster = JobPosting.objects.filter(id__in=list(
+            JobPosting.objects.filter(Q(id=old_canonical) | Q(canonical_job_id=old_canonical)).values_list('id', flat=True)
+        ))
+        with track_facets(cluster), transaction.atomic():
+            _relink_cluster(old_canonical, new_canonical)
+
+    if promoted:
+        from jobmatcher.rescoring import enqueue_jobs
+
+        # Promoted postings are scored from now on
+        enqueue_jobs(promoted.values())
+        logger.info(f"Promoted {len(promoted)} duplicates of inactive canonical postings")
+    return len(promoted)
+
+
+class DuplicateIndex:
+    """
+    Assigns signatures and canonical postings at ingest.
+
+    Jobs are processed in id order, so the first posting of a cluster to be
+    indexed stays its canonical one. Postings saved together are matched
+    against each other as well as against the stored index.
+    """
+
+    def __init__(self, threshold: Optional[float] = None):
+        """
+        Initialize the index.
+
+        Args:
+            threshold: Minimum estimated similarity for a duplicate
+                       (defaults to settings.JOBSCRAPER_DEDUP_THRESHOLD)
+        """
+        self.threshold = threshold or getattr(settings, 'JOBSCRAPER_DEDUP_THRESHOLD', SIMILARITY_THRESHOLD)
+
+    def clear(self) -> None:
+        """Delete every stored LSH band."""
+        from .models import JobSignatureBand
+
+        JobSignatureBand.objects.all().delete()
+
+    def _stored_candidates(self, keys_by_job: Dict[int, List[int]]):
+        """
+        Indexed postings sharing a bucket with the jobs being indexed.
+
+        Args:
+            keys_by_job: Band keys of each job being indexed, by job id
+
+        Returns:
+            (job ids by bucket, {job id: (canonical_job_id, dedup_signature)})
+            for stored postings other than the jobs themselves
+        """
+        from .models import JobPosting, JobSignatureBand
+
+        stored: Dict[int, Set[int]] = {}
+        all_keys = list({key for keys in keys_by_job.values() for key in keys})
+        for start in range(0, len(all_keys), _LOOKUP_BATCH):
+            rows = JobSignatureBand.objects.filter(
+                bucket__in=all_keys[start:start + _LOOKUP_BATCH]
+            ).values_list('bucket', 'job_id')
+            for bucket, job_id in rows:
+                if job_id not in keys_by_job:
+                    stored.setdefault(bucket, set()).add(job_id)
+
+        candidate_ids = list({job_id for job_ids in stored.values() for job_id in job_ids})
+        candidates = {}
+        for start in range(0, len(candidate_ids), _LOOKUP_BATCH):
+            rows = JobPosting.objects.filter(
+                id__in=candidate_ids[start:start + _LOOKUP_BATCH]
+            ).values_list('id', 'canonical_job_id', 'dedup_signature')
+            for job_id, canonical_id, signature in rows:
+                candidates[job_id] = (canonical_id, signature)
+        return stored, candidates
+
+    def _best_canonical(self, signature: List[int], keys: List[int], stored: Dict[int, Set[int]],
+                        batch: Dict[int, List[int]], candidates: Dict) -> Optional[int]:
+        """Canonical posting of the most similar candidate at or above the threshold, if any."""
+        best_score, best_canonical = 0.0, None
+        seen = set()
+        for key in keys:
+            for other_id in list(stored.get(key, ())) + batch.get(key, []):
+                if other_id in seen:
+                    continue
+                seen.add(other_id)
+                canonical_id, other_signature = candidates[other_id]
+                score = similarity(signature, other_signature)
+                if score >= self.threshold and score > best_score:
+                    best_score, best_canonical = score, canonical_id or other_id
+        return best_canonical
+
+    def index_jobs(self, jobs: List) -> int:
+        """
+        Sign jobs, store their LSH bands and link duplicates.
+
+        Jobs whose signature is unchanged are left alone. Jobs need id,
+        title, company, description, dedup_signature and canonical_job_id
+        loaded. Links are counted in the facet counters here, so call this
+        outside the caller's track_facets() block for the same jobs.
+
+        Args:
+            jobs: Saved JobPosting instances
+
+        Returns:
+            Number of jobs linked to a canonical posting
+        """
+        from .facets import track_facets
+        from .models import JobPosting, JobSignatureBand
+
+        pending = []
+        for job in sorted(jobs, key=lambda job: job.id):
+            signature = job_signature(job)
+            if signature != job.dedup_signature:
+                pending.append((job, signature, bool(job.dedup_signature)))
+        if not pending:
+            return 0
+
+        keys_by_job = {job.id: band_keys(signature) for job, signature, _ in pending}
+        stored, candidates = self._stored_candidates(keys_by_job)
+
+        # Jobs from this call, by bucket, once processed
+        batch: Dict[int, List[int]] = {}
+        bands = []
+        relinked = {}
+        duplicates = 0
+
+        for job, signature, was_indexed in pending:
+            keys = keys_by_job[job.id]
+            best_canonical = self._best_canonical(signature, keys, stored, batch, candidates)
+
+            if best_canonical == job.id:
+                # Matched one of its own duplicates; it stays canonical
+                best_canonical = None
+            if was_indexed and best_canonical and job.canonical_job_id is None:
+                relinked[job.id] = best_canonical
+
+            job.dedup_signature = signature
+            job.canonical_job_id = best_canonical
+            if best_canonical:
+                duplicates += 1
+
+            candidates[job.id] = (best_canonical, signature)
+            for key in keys:
+                batch.setdefault(key, []).append(job.id)
+                bands.append(JobSignatureBand(job_id=job.id, bucket=key))
+
+        # Duplicates handed over to another canonical posting are written too
+        tracked_ids = [job.id for job, _, _ in pending]
+        if relinked:
+            tracked_ids += JobPosting.objects.filter(canonical_job_id__in=list(relinked)).values_list('id', flat=True)
+        tracked = JobPosting.objects.filter(id__in=tracked_ids)
+        with track_facets(tracked), transaction.atomic():
+            JobSignatureBand.objects.filter(
+                job_id__in=[job.id for job, _, was_indexed in pending if was_indexed]
+            ).delete()
+            JobPosting.objects.bulk_update(
+                [job for job, _, _ in pending],
+                ['dedup_signature', 'canonical_job'],
+                batch_size=_LOOKUP_BATCH,
+            )
+            JobSignatureBand.objects.bulk_create(bands, batch_size=_LOOKUP_BATCH)
+            # A former canonical posting that joined another cluster hands its duplicates over
+            for old_canonical, new_canonical in relinked.items():
+                JobPosting.objects.filter(canonical_job_id=old_canonical).update(canonical_job_id=new_canonical)
+
+        # Jobs that joined the cluster of an inactive posting take it over
+        promote_duplicates(job.canonical_job_id for job, _, _ in pending if job.canonical_job_id)
+
+        logger.info(f"Indexed {len(pending)} job signatures, {duplicates} near-duplicates")
+        return duplicates
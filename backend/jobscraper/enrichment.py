@@ -0,0 +1,211 @@
+"""
+Job Enrichment
+
+Structured field extraction (job type, skills, salary, experience level, ...)
+for normalized jobs using the job content parser.
+
+Parsing is CPU-bound, so JobEnricher can fan jobs out to a process pool whose
+workers build the parser once at startup. Results come back in input order.
+Parse results are looked up in and stored to the parse cache by the parent
+process, so only uncached descriptions reach the parser. Workers only run
+parse_job, which does not touch Django, so they need no Django setup.
+"""
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+# JobPosting fields filled from parse_job_content() output
+PARSED_FIELDS = [
+    'job_type',
+    'employment_mode',
+    'experience_level',
+    'education_level',
+    'responsibilities',
+    'requirements',
+    'skills_required',
+    'skills_preferred',
+    'tools_technologies',
+    'certifications',
+    'salary_min',
+    'salary_max',
+    'currency',
+    'compensation_type',
+    'benefits',
+    'bonus_equity',
+    'company_size',
+    'industry',
+    'company_website',
+    'application_deadline',
+    'hiring_manager',
+    'number_of_openings',
+    'visa_sponsorship',
+    'relocation_assistance',
+    'travel_requirements',
+    'languages_required',
+    'job_category',
+    'seniority_score',
+    'keywords',
+    'projects_portfolio_examples',
+    'parse_confidence',
+]
+
+# Parsed booleans are meaningful when False, so they are copied unless None
+BOOLEAN_FIELDS = {'visa_sponsorship', 'relocation_assistance'}
+
+
+def init_worker() -> None:
+    """Build the parser singleton (patterns, skill tables, keyword matcher) once per worker process."""
+    from .warmup import warm_up
+    warm_up(scrapers=False)
+
+
+def parse_job(job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Run the content parser over a normalized job.
+
+    Args:
+        job: Normalized job dictionary
+
+    Returns:
+        Parser output, or None if parsing failed
+    """
+    from .simple_job_parser import parse_job_content
+
+    try:
+        return parse_job_content(
+            html_content=job.get('html_content') or '',
+            text_content=job.get('description') or '',
+            url=job.get('url', '')
+        )
+    except Exception as e:
+        logger.warning(f"Parsing failed for job {job.get('title')}: {str(e)}")
+        return None
+
+
+def merge_parsed(job: Dict[str, Any], parsed: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Add parsed fields to a normalized job.
+
+    Fields the scraper already set are kept. html_content is dropped from the
+    result since it is only needed as parser input.
+
+    Args:
+        job: Normalized job dictionary
+        parsed: parse_job() output (None leaves the job unenriched)
+
+    Returns:
+        New job dictionary with parsed fields added
+    """
+    enriched = dict(job)
+    enriched.pop('html_content', None)
+
+    if parsed is None:
+        return enriched
+
+    for field in PARSED_FIELDS:
+        if field in enriched:
+            continue
+        value = parsed.get(field)
+        if field in BOOLEAN_FIELDS:
+            if value is not None:
+                enriched[field] = value
+        elif value:
+            enriched[field] = value
+
+    return enriched
+
+
+def enrich_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parse a normalized job and add the parsed fields to it.
+
+    Args:
+        job: Normalized job dictionary
+
+    Returns:
+        New job dictionary with parsed fields added
+    """
+    return merge_parsed(job, parse_job(job))
+
+
+class JobEnricher:
+    """
+    Runs enrich_job over batches of jobs, inline or on a process pool.
+
+    With workers <= 1 jobs are parsed in the calling process. Otherwise a
+    ProcessPoolExecutor is started on first use and reused until close().
+    With a parse cache, descriptions parsed before are served from it and
+    cache_hits/cache_misses count lookups made by this enricher.
+    """
+
+    def __init__(self, workers: int = 0, chunksize: int = 8, cache=None):
+        """
+        Initialize the enricher.
+
+        Args:
+            workers: Worker processes (<= 1 parses inline)
+            chunksize: Jobs sent to a worker per task
+            cache: Parse result cache (see parse_cache), or None
+        """
+        self.workers = workers
+        self.chunksize = chunksize
+        self.cache = cache
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def enrich(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Enrich jobs, preserving input order.
+
+        Args:
+            jobs: Normalized job dictionaries
+
+        Returns:
+            Enriched job dictionaries, one per input job
+        """
+        parsed: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+        pending = list(range(len(jobs)))
+
+        if self.cache is not None:
+            pending = []
+            for index, job in enumerate(jobs):
+                parsed[index] = self.cache.get(job.get('description') or '')
+                if parsed[index] is None:
+                    pending.append(index)
+            self.cache_misses += len(pending)
+            self.cache_hits += len(jobs) - len(pending)
+
+        for index, result in zip(pending, self._parse([jobs[index] for index in pending])):
+            parsed[index] = result
+            if result is not None and self.cache is not None:
+                self.cache.set(jobs[index].get('description') or '', result)
+
+        return [merge_parsed(job, result) for job, result in zip(jobs, parsed)]
+
+    def _parse(self, jobs: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Parse jobs inline or on the worker pool, preserving order."""
+        if self.workers <= 1 or len(jobs) <= 1:
+            return [parse_job(job) for job in jobs]
+
+        if self._executor is None:
+            # spawn: scrapers run fetch threads, which fork does not copy safely
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=init_worker,
+            )
+
+        return list(self._executor.map(parse_job, jobs, chunksize=self.chunksize))
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
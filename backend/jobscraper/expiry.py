@@ -0,0 +1,160 @@
+"""
+Job Expiry
+
+Deactivation and archival of old job postings in bounded chunks.
+
+Both steps walk the matching jobs in ascending id order, a chunk of ids at
+a time (JOBSCRAPER_EXPIRY_CHUNK_SIZE), and commit each chunk in its own
+short transaction instead of one statement over the whole table:
+
+- deactivate() marks active jobs not seen since a cutoff inactive; an
+  active duplicate of a deactivated canonical posting takes its place
+  (dedup.promote_duplicates).
+- archive() copies cold postings into JobArchive (their columns as
+  zlib-compressed JSON) and deletes them along with their scores,
+  prepared packets and LSH bands. Jobs with applications are kept by
+  default, excluded with a NOT EXISTS subquery. A deleted canonical
+  posting's cluster is handed over to a surviving duplicate first
+  (dedup.hand_over_clusters).
+
+A chunk is archived and deleted in the same transaction and archive rows
+are keyed by job id, so an interrupted run leaves no half-expired job and
+can simply be started again: jobs already handled no longer match.
+"""
+
+import json
+import logging
+import zlib
+from datetime import datetime
+from typing import Dict, Iterator, Tuple
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+
+from .dedup import hand_over_clusters, promote_duplicates
+from .facets import track_facets
+from .models import JobArchive, JobPosting
+
+
+logger = logging.getLogger(__name__)
+
+
+def compress_posting(row: Dict) -> bytes:
+    """Compressed JSON of a job's column values."""
+    return zlib.compress(json.dumps(row, cls=DjangoJSONEncoder, separators=(',', ':')).encode())
+
+
+def decompress_posting(data: bytes) -> Dict:
+    """Column values stored by compress_posting."""
+    return json.loads(zlib.decompress(bytes(data)))
+
+
+class JobExpiry:
+    """Chunked, resumable deactivation and archival of job postings."""
+
+    def __init__(self, chunk_size: int = None):
+        """
+        Args:
+            chunk_size: Jobs per chunk/transaction
+                        (defaults to settings.JOBSCRAPER_EXPIRY_CHUNK_SIZE)
+        """
+        self.chunk_size = chunk_size or getattr(settings, 'JOBSCRAPER_EXPIRY_CHUNK_SIZE', 1000)
+
+    def id_ranges(self, queryset) -> Iterator[Tuple[int, int]]:
+        """
+        (first_id, last_id) ranges covering chunk_size matching jobs each.
+
+        Each range is read after the previous one was processed, so rows
+        changed or deleted by a chunk are not visited again.
+        """
+        last_id = 0
+        while True:
+            ids = list(
+                queryset.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:self.chunk_size]
+            )
+            if not ids:
+                return
+            yield ids[0], ids[-1]
+            last_id = ids[-1]
+
+    def deactivate(self, queryset, cutoff: datetime) -> int:
+        """
+        Deactivate jobs not scraped since cutoff.
+
+        Args:
+            queryset: Jobs to consider (e.g. one source)
+            cutoff: Jobs last scraped before this are deactivated
+
+        Returns:
+            Number of jobs deactivated
+        """
+        stale = queryset.filter(date_scraped__lt=cutoff)
+        expired = stale.filter(is_active=True)
+
+        deactivated = 0
+        for first_id, last_id in self.id_ranges(expired):
+            chunk = expired.filter(id__gte=first_id, id__lte=last_id)
+            canonical_ids = list(chunk.filter(canonical_job__isnull=True).values_list('id', flat=True))
+            with track_facets(stale.filter(id__gte=first_id, id__lte=last_id)):
+                deactivated += chunk.update(is_active=False)
+            promote_duplicates(canonical_ids)
+        return deactivated
+
+    def cold_jobs(self, queryset, keep_applications: bool = True):
+        """Jobs of queryset that archive() would remove."""
+        if keep_applications:
+            from jobapplier.models import JobApplication
+
+            queryset = queryset.filter(~Exists(JobApplication.objects.filter(job_id=OuterRef('pk'))))
+        return queryset
+
+    def archive(self, queryset, keep_applications: bool = True, archive: bool = True) -> Dict:
+        """
+        Move jobs into the archive table and delete them.
+
+        Args:
+            queryset: Jobs to remove
+            keep_applications: Leave jobs that have applications in place
+            archive: Copy jobs into JobArchive before deleting (False only deletes)
+
+        Returns:
+            {'archived': n, 'deleted': n, 'related': {model label: rows deleted}}
+        """
+        cold = self.cold_jobs(queryset, keep_applications)
+        results = {'archived': 0, 'deleted': 0, 'related': {}}
+
+        for first_id, last_id in self.id_ranges(cold):
+            # Duplicates of deleted postings are linked to a new canonical posting
+            duplicate_ids = list(JobPosting.objects.filter(
+                canonical_job_id__gte=first_id, canonical_job_id__lte=last_id
+            ).values_list('id', flat=True))
+            affected = JobPosting.objects.filter(Q(id__gte=first_id, id__lte=last_id) | Q(id__in=duplicate_ids))
+            with track_facets(affected), transaction.atomic():
+                rows = list(cold.filter(id__gte=first_id, id__lte=last_id).select_for_update().values())
+                if not rows:
+                    continue
+                deleted_ids = [row['id'] for row in rows]
+                promoted = hand_over_clusters(
+                    [row['id'] for row in rows if row['canonical_job_id'] is None], excluded_ids=deleted_ids
+                )
+                if archive:
+                    JobArchive.objects.bulk_create(
+                        [JobArchive.from_posting(row) for row in rows],
+                        ignore_conflicts=True,
+                    )
+                    results['archived'] += len(rows)
+                _, details = JobPosting.objects.filter(id__in=deleted_ids).delete()
+
+            if promoted:
+                from jobmatcher.rescoring import enqueue_jobs
+
+                enqueue_jobs(promoted.values())
+
+            results['deleted'] += details.pop(JobPosting._meta.label, 0)
+            for label, count in details.items():
+                results['related'][label] = results['related'].get(label, 0) + count
+            logger.info(f"Expired jobs {first_id}-{last_id}: {len(rows)} removed")
+
+        return results
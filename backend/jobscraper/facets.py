@@ -0,0 +1,312 @@
+"""
+Job Facet Counts
+
+Per-source job counts for each value of the facet fields -- company,
+location, country, job type, employment mode, experience level -- stored in
+FacetCount and kept current as jobs are saved, re-activated and
+deactivated. Facets count listed jobs (active, canonical postings); the
+'status' facet counts every job as listed, duplicate or inactive. The stats
+and filter-option endpoints read these rows, one per facet value, instead
+of aggregating the job table on every call.
+
+Writes that can change a facet column, is_active or canonical_job run
+inside track_facets(queryset): the rows the queryset selects are tallied
+(grouped in the database) before and after the write, and the difference is
+added to the counters. The queryset must select the same rows before and
+after, so filter on columns the write leaves alone. Untracked writes (admin
+edits, ad-hoc scripts, two writers saving the same jobs at once) can leave
+the counters off; reconcile_facets() recounts everything and should run
+periodically (the reconcile_facets command).
+
+Payloads built from the counters are cached under a version taken from the
+counter rows, so any counter change is seen by the next read in every
+process.
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import BooleanField, Case, Count, Sum, Value, When
+
+
+logger = logging.getLogger(__name__)
+
+
+# Facet name -> JobPosting field, counted over listed jobs
+FACET_FIELDS = {
+    'company': 'company',
+    'location': 'location',
+    'country': 'country_code',
+    'job_type': 'job_type',
+    'employment_mode': 'employment_mode',
+    'experience_level': 'experience_level',
+}
+
+# Every job counts once under 'status'
+STATUS_FACET = 'status'
+LISTED = 'listed'
+DUPLICATE = 'duplicate'
+INACTIVE = 'inactive'
+
+CACHE_PREFIX = 'jobscraper:facets'
+
+_BATCH = 500
+
+# (source, facet, value) -> jobs
+Tally = Dict[Tuple[str, str, str], int]
+
+
+def tally(queryset) -> Tally:
+    """
+    Facet counts of the jobs a queryset selects, grouped in the database.
+    """
+    rows = (
+        queryset.order_by()
+        .annotate(facet_canonical=Case(
+            When(canonical_job__isnull=True, then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        ))
+        .values('source', 'is_active', 'facet_canonical', *FACET_FIELDS.values())
+        .annotate(facet_jobs=Count('id'))
+    )
+    counts: Tally = {}
+    for row in rows:
+        source, jobs = row['source'], row['facet_jobs']
+        if not row['is_active']:
+            status = INACTIVE
+        elif row['facet_canonical']:
+            status = LISTED
+        else:
+            status = DUPLICATE
+        key = (source, STATUS_FACET, status)
+        counts[key] = counts.get(key, 0) + jobs
+        if status != LISTED:
+            continue
+        for facet, field in FACET_FIELDS.items():
+            key = (source, facet, row[field] or '')
+            counts[key] = counts.get(key, 0) + jobs
+    return counts
+
+
+def apply_facet_delta(delta: Tally) -> None:
+    """Add per-key job count changes to the stored counters."""
+    from .models import FacetCount
+
+    delta = {key: change for key, change in delta.items() if change}
+    keys = list(delta)
+    for start in range(0, len(keys), _BATCH):
+        batch = keys[start:start + _BATCH]
+        with transaction.atomic():
+            rows = FacetCount.objects.select_for_update().filter(
+                source__in={source for source, _, _ in batch},
+                facet__in={facet for _, facet, _ in batch},
+                value__in={value for _, _, value in batch},
+            )
+            existing = {(row.source, row.facet, row.value): row for row in rows}
+            to_update, to_create = [], []
+            for key in batch:
+                row = existing.get(key)
+                if row is not None:
+                    row.count = max(row.count + delta[key], 0)
+                    row.revision += 1
+                    to_update.append(row)
+                elif delta[key] > 0:
+                    source, facet, value = key
+                    to_create.append(FacetCount(source=source, facet=facet, value=value, count=delta[key]))
+            if to_update:
+                FacetCount.objects.bulk_update(to_update, ['count', 'revision'])
+            if to_create:
+                # A concurrent writer creating the same key wins; reconcile corrects the count
+                FacetCount.objects.bulk_create(to_create, ignore_conflicts=True)
+
+
+@contextmanager
+def track_facets(queryset):
+    """
+    Update the facet counters for a write to the jobs a queryset selects.
+
+    Failures to count are logged rather than raised; the write itself is
+    unaffected and the counters are corrected by the next reconcile.
+    """
+    try:
+        before = tally(queryset)
+    except Exception as e:
+        logger.error(f"Facet tally failed, counters not updated: {str(e)}")
+        yield
+        return
+
+    yield
+
+    try:
+        after = tally(queryset)
+        apply_facet_delta({key: after.get(key, 0) - before.get(key, 0) for key in before.keys() | after.keys()})
+    except Exception as e:
+        logger.error(f"Facet counter update failed: {str(e)}")
+
+
+def count_new_jobs(queryset) -> None:
+    """Add jobs created without track_facets (the queryset selects only them) to the counters."""
+    try:
+        apply_facet_delta(tally(queryset))
+    except Exception as e:
+        logger.error(f"Facet counter update failed: {str(e)}")
+
+
+def reconcile_facets(using: Optional[str] = None) -> Dict[str, int]:
+    """
+    Recount every facet from the job table and rewrite the counters.
+
+    Returns:
+        Counts of counter rows created, updated (count changed) and deleted
+    """
+    from .models import FacetCount, JobPosting
+
+    using = using or 'default'
+    counts = tally(JobPosting.objects.using(using).all())
+    results = {'created': 0, 'updated': 0, 'deleted': 0}
+
+    with transaction.atomic(using=using):
+        to_update = []
+        stale = []
+        for row in FacetCount.objects.using(using).select_for_update():
+            count = counts.pop((row.source, row.facet, row.value), 0)
+            if not count:
+                stale.append(row.id)
+                continue
+            if count != row.count:
+                results['updated'] += 1
+            # Every row changes revision so cached payloads are rebuilt
+            row.count = count
+            row.revision += 1
+            to_update.append(row)
+        for start in range(0, len(stale), _BATCH):
+            FacetCount.objects.using(using).filter(id__in=stale[start:start + _BATCH]).delete()
+        FacetCount.objects.using(using).bulk_update(to_update, ['count', 'revision'], batch_size=_BATCH)
+        FacetCount.objects.using(using).bulk_create(
+            [
+                FacetCount(source=source, facet=facet, value=value, count=count)
+                for (source, facet, value), count in counts.items()
+            ],
+            batch_size=_BATCH,
+        )
+        results['created'] = len(counts)
+        results['deleted'] = len(stale)
+
+    logger.info(f"Reconciled facet counts: {results}")
+    return results
+
+
+def facet_version() -> str:
+    """Version of the stored counters; changes whenever any counter does."""
+    from .models import FacetCount
+
+    version = FacetCount.objects.aggregate(rows=Count('id'), revisions=Sum('revision'))
+    return f"{version['rows']}.{version['revisions'] or 0}"
+
+
+def cached_facets(name: str, build: Callable[[], dict]) -> dict:
+    """
+    Payload built from the counters, cached for the current counter version.
+    """
+    key = f'{CACHE_PREFIX}:{name}:{facet_version()}'
+    timeout = getattr(settings, 'JOBSCRAPER_FACET_CACHE_TIMEOUT', 300)
+    return cache.get_or_set(key, build, timeout)
+
+
+def facet_counts(facet: str, source: Optional[str] = None) -> Dict[str, int]:
+    """
+    Job count per value of a facet, over all sources or one.
+
+    Returns:
+        Value -> jobs, for values with at least one job
+    """
+    from .models import FacetCount
+
+    rows = FacetCount.objects.filter(facet=facet, count__gt=0)
+    if source:
+        rows = rows.filter(source=source)
+    counts: Dict[str, int] = {}
+    for value, count in rows.values_list('value', 'count'):
+        counts[value] = counts.get(value, 0) + count
+    return counts
+
+
+def facet_counts_by_source(facet: str, value: str) -> Dict[str, int]:
+    """Job count per source for one facet value."""
+    from .models import FacetCount
+
+    return dict(
+        FacetCount.objects.filter(facet=facet, value=value, count__gt=0).values_list('source', 'count')
+    )
+
+
+def _top(counts: Dict[str, int], field: str, limit: int = 10):
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return [{field: value, 'count': count} for value, count in ranked]
+
+
+def listing_stats() -> dict:
+    """Stats of the listed jobs, in the shape of the stats endpoint."""
+    def build():
+        by_source = facet_counts_by_source(STATUS_FACET, LISTED)
+        companies = facet_counts('company')
+        locations = facet_counts('location')
+        return {
+            'total_jobs': sum(by_source.values()),
+            'companies': len(companies),
+            'locations': len(locations),
+            'sources': len(by_source),
+            'by_source': [{'source': source, 'count': count} for source, count in sorted(by_source.items())],
+            'by_company': _top(companies, 'company'),
+            'by_location': _top(locations, 'location'),
+        }
+
+    return cached_facets('stats', build)
+
+
+def filter_options() -> dict:
+    """Values with listed jobs, in the shape of the filters endpoint."""
+    def build():
+        return {
+            'companies': sorted(value for value in facet_counts('company') if value),
+            'locations': sorted(value for value in facet_counts('location') if value),
+            'sources': sorted(facet_counts_by_source(STATUS_FACET, LISTED)),
+        }
+
+    return cached_facets('filters', build)
+
+
+def source_stats(source: Optional[str] = None) -> dict:
+    """
+    Job totals over all sources or one.
+
+    Returns:
+        total_jobs, active_jobs, unique_companies (with listed jobs) and
+        sources (with any jobs)
+    """
+    def build():
+        from .models import FacetCount
+
+        statuses = FacetCount.objects.filter(facet=STATUS_FACET, count__gt=0)
+        if source:
+            statuses = statuses.filter(source=source)
+        total = active = 0
+        sources = set()
+        for row_source, status, count in statuses.values_list('source', 'value', 'count'):
+            total += count
+            if status != INACTIVE:
+                active += count
+            sources.add(row_source)
+        return {
+            'total_jobs': total,
+            'active_jobs': active,
+            'unique_companies': len(facet_counts('company', source)),
+            'sources': sorted(sources),
+        }
+
+    return cached_facets(f'sources:{source or "*"}', build)
@@ -0,0 +1,369 @@
+"""
+Fetch Policy
+
+Per-host feedback control shared by every HTTP path of the scrapers: the
+synchronous BaseScraper.fetch_data, the AsyncFetcher and logo lookups.
+
+- AIMD concurrency: each host may have `limit` requests in flight. The
+  limit grows by about one per window of successful requests and is cut by
+  decrease_factor on a 429, a 5xx or a connection error -- once per window,
+  so a burst of failures from requests already in flight counts as one
+  signal.
+- Retry-After: a response carrying Retry-After blocks the host until then
+  (capped at max_retry_after).
+- Circuit breaker: after failure_threshold consecutive failures the host
+  is skipped for cooldown seconds, then a single probe request is let
+  through; its outcome closes or re-opens the circuit. Skipped requests
+  raise HostUnavailable immediately instead of waiting.
+- Stats: per-host latency histograms and outcome counts.
+
+The policy is process-wide (get_fetch_policy()), so what one scraper run
+learns about a host applies to every other fetch of that host.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import urlparse
+
+
+logger = logging.getLogger(__name__)
+
+
+# Upper bounds (seconds) of the latency histogram buckets; slower requests
+# land in a final overflow bucket
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+LATENCY_LABELS = [f'<={bound}s' for bound in LATENCY_BUCKETS] + [f'>{LATENCY_BUCKETS[-1]}s']
+
+# How often a request waiting for a concurrency slot checks again
+POLL_INTERVAL = 0.05
+
+
+class HostUnavailable(Exception):
+    """A request was not sent because its host's circuit is open or it asked us to wait too long."""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"{host} is unavailable for another {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class Slot(NamedTuple):
+    """A request slot taken with acquire(); pass it back to release()."""
+
+    host: str
+    seq: int
+    started_at: float
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value: Delay in seconds or an HTTP date
+
+    Returns:
+        Seconds to wait (>= 0), or None if missing or unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def is_retryable(status: Optional[int]) -> bool:
+    """Whether a failed request is worth retrying (connection errors, 429 and 5xx)."""
+    return status is None or status == 429 or status >= 500
+
+
+class HostState:
+    """Concurrency, breaker and stats state for one host."""
+
+    def __init__(self, limit: float):
+        self.limit = limit
+        self.in_flight = 0
+        # Requests issued so far, and the count when the limit was last cut:
+        # failures of requests issued before that are part of the same signal
+        self.issued = 0
+        self.decreased_at = 0
+        self.blocked_until = 0.0
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.probing = False
+        self.outcomes: Dict[str, int] = {}
+        self.latency = [0] * len(LATENCY_LABELS)
+        self.latency_sum = 0.0
+
+    @property
+    def circuit(self) -> str:
+        if not self.open_until:
+            return 'closed'
+        return 'half_open' if self.probing else 'open'
+
+    def count(self, outcome: str) -> None:
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+
+
+class FetchPolicy:
+    """
+    Per-host AIMD concurrency, Retry-After handling and circuit breaking.
+
+    Thread-safe: the synchronous scrapers and the AsyncFetcher's event loop
+    thread share one instance. Every acquire() must be paired with a
+    release() reporting the outcome.
+    """
+
+    def __init__(
+        self,
+        initial_limit: float = 2,
+        min_limit: float = 1,
+        max_limit: float = 10,
+        decrease_factor: float = 0.5,
+        failure_threshold: int = 5,
+        cooldown: float = 60,
+        max_retry_after: float = 300,
+        retry_delay: float = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            initial_limit: Concurrent requests a host starts with
+            min_limit: Floor for the per-host limit
+            max_limit: Ceiling for the per-host limit
+            decrease_factor: Multiplier applied to the limit on congestion
+            failure_threshold: Consecutive failures that open a host's circuit
+            cooldown: Seconds an open circuit skips its host before probing
+            max_retry_after: Longest Retry-After honored, in seconds
+            retry_delay: Base delay for exponential backoff between retries
+            clock: Monotonic clock (tests pass a fake one)
+        """
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_retry_after = max_retry_after
+        self.retry_delay = retry_delay
+        self.clock = clock
+        self._hosts: Dict[str, HostState] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_for(url: str) -> str:
+        """Host key for a URL."""
+        return urlparse(url).netloc.lower()
+
+    def _state(self, host: str) -> HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = HostState(self.initial_limit)
+        return state
+
+    def try_acquire(self, url: str) -> Tuple[Optional[Slot], float]:
+        """
+        Take a request slot for url's host without waiting.
+
+        Returns:
+            (slot, 0) when a slot was taken, else (None, seconds to wait
+            before asking again)
+
+        Raises:
+            HostUnavailable: If the host's circuit is open
+        """
+        host = self.host_for(url)
+        with self._lock:
+            now = self.clock()
+            state = self._state(host)
+
+            if state.open_until:
+                if now < state.open_until or state.probing:
+                    state.count('skipped')
+                    raise HostUnavailable(host, max(0.0, state.open_until - now))
+                # Cool-off over: this request is the probe
+                state.probing = True
+            elif now < state.blocked_until:
+                return None, state.blocked_until - now
+            elif state.in_flight >= int(state.limit):
+                return None, POLL_INTERVAL
+
+            state.in_flight += 1
+            state.issued += 1
+            return Slot(host, state.issued, now), 0.0
+
+    def acquire(self, url: str, max_wait: Optional[float] = None) -> Slot:
+        """
+        Wait for a request slot for url's host.
+
+        Args:
+            url: URL about to be requested
+            max_wait: Give up instead of waiting longer than this many seconds
+
+        Raises:
+            HostUnavailable: If the circuit is open or the wait would exceed max_wait
+        """
+        waited = 0.0
+        while True:
+            slot, wait = self.try_acquire(url)
+            if slot is not None:
+                return slot
+            if max_wait is not None and waited + wait > max_wait:
+                raise HostUnavailable(self.host_for(url), wait)
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(self, url: str, max_wait: Optional[float] = None) -> Slot:
+        """acquire() for coroutines."""
+        waited = 0.0
+        while True:
+            slot, wait = self.try_acquire(url)
+            if slot is not None:
+                return slot
+            if max_wait is not None and waited + wait > max_wait:
+                raise HostUnavailable(self.host_for(url), wait)
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def release(self, slot: Slot, status: Optional[int] = None, retry_after: Optional[float] = None) -> None:
+        """
+        Return a slot and report how the request went.
+
+        Args:
+            slot: Slot from acquire()
+            status: HTTP status, or None if no response arrived
+            retry_after: Parsed Retry-After of the response, if any
+        """
+        with self._lock:
+            now = self.clock()
+            state = self._state(slot.host)
+            state.in_flight = max(0, state.in_flight - 1)
+
+            latency = now - slot.started_at
+            state.latency_sum += latency
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if latency <= bound:
+                    break
+            else:
+                index = len(LATENCY_BUCKETS)
+            state.latency[index] += 1
+
+            if status is None:
+                state.count('error')
+            elif status == 429:
+                state.count('429')
+            else:
+                state.count(f'{status // 100}xx')
+
+            if retry_after is not None:
+                state.blocked_until = max(state.blocked_until, now + min(retry_after, self.max_retry_after))
+
+            if is_retryable(status):
+                if slot.seq > state.decreased_at:
+                    state.limit = max(self.min_limit, state.limit * self.decrease_factor)
+                    state.decreased_at = state.issued
+                # A host that rate-limits us is alive: only errors and 5xx trip the breaker
+                if status != 429:
+                    state.consecutive_failures += 1
+                    if state.probing or state.consecutive_failures >= self.failure_threshold:
+                        self._open(slot.host, state, now)
+                elif state.probing:
+                    self._open(slot.host, state, now)
+                return
+
+            state.limit = min(self.max_limit, state.limit + 1 / state.limit)
+            state.consecutive_failures = 0
+            if state.open_until:
+                logger.info(f"Circuit for {slot.host} closed")
+                state.open_until = 0.0
+                state.probing = False
+
+    def _open(self, host: str, state: HostState, now: float) -> None:
+        if not state.probing:
+            logger.warning(
+                f"Circuit for {host} opened after {state.consecutive_failures} failures; "
+                f"skipping it for {self.cooldown:.0f}s"
+            )
+        state.open_until = now + self.cooldown
+        state.probing = False
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number attempt + 1: exponential with up to 10% jitter."""
+        return self.retry_delay * (2 ** attempt) * (1 + random.random() * 0.1)
+
+    def stats(self, since: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-host limits, circuit state, outcome counts and latency histograms.
+
+        Args:
+            since: An earlier stats() result; counts are reported relative
+                   to it and hosts without requests since are left out
+
+        Returns:
+            Mapping of host to its stats
+        """
+        with self._lock:
+            result = {}
+            for host, state in self._hosts.items():
+                previous = (since or {}).get(host, {})
+                previous_outcomes = previous.get('outcomes', {})
+                previous_latency = previous.get('latency', {})
+
+                outcomes = {
+                    outcome: count - previous_outcomes.get(outcome, 0)
+                    for outcome, count in state.outcomes.items()
+                    if count - previous_outcomes.get(outcome, 0)
+                }
+                latency = {
+                    label: count - previous_latency.get(label, 0)
+                    for label, count in zip(LATENCY_LABELS, state.latency)
+                    if count - previous_latency.get(label, 0)
+                }
+                requests = sum(latency.values())
+                if since is not None and not outcomes:
+                    continue
+
+                latency_sum = state.latency_sum - previous.get('latency_sum', 0.0)
+                result[host] = {
+                    'limit': round(state.limit, 2),
+                    'circuit': state.circuit,
+                    'requests': requests,
+                    'outcomes': outcomes,
+                    'latency': latency,
+                    'latency_sum': round(latency_sum, 3),
+                    'mean_latency': round(latency_sum / requests, 3) if requests else None,
+                }
+            return result
+
+
+_policy: Optional[FetchPolicy] = None
+_policy_lock = threading.Lock()
+
+
+def get_fetch_policy() -> FetchPolicy:
+    """Get the process-wide FetchPolicy, configured from settings on first use."""
+    global _policy
+
+    with _policy_lock:
+        if _policy is None:
+            from django.conf import settings
+
+            _policy = FetchPolicy(
+                max_limit=getattr(settings, 'JOBSCRAPER_FETCH_CONCURRENCY', 10),
+                failure_threshold=getattr(settings, 'JOBSCRAPER_CIRCUIT_FAILURES', 5),
+                cooldown=getattr(settings, 'JOBSCRAPER_CIRCUIT_COOLDOWN', 60),
+                max_retry_after=getattr(settings, 'JOBSCRAPER_MAX_RETRY_AFTER', 300),
+            )
+        return _policy
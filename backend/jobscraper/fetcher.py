@@ -0,0 +1,264 @@
+"""
+Async Fetch Engine
+
+Concurrent HTTP fetching for scrapers. All requests made through a fetcher
+share one connection pool, are bounded by a global concurrency limit, and are
+paced per host with a token bucket, so a crawl is limited by per-host
+politeness instead of by the sum of all request latencies. With a
+FetchPolicy, per-host concurrency also adapts to how each host responds and
+hosts that are down are skipped (see fetch_policy).
+
+The fetcher runs its own event loop on a background thread, which lets the
+synchronous scrapers call it without caring whether the caller already has a
+running loop.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from .fetch_policy import is_retryable, parse_retry_after
+
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket that paces requests to a single host.
+
+    Waiters are served in arrival order: the lock is held while sleeping
+    for the next token.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second (requests per second); <= 0 disables pacing
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = None
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        if self.rate <= 0:
+            return
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncFetcher:
+    """
+    Concurrent HTTP fetcher with a global concurrency limit and per-host rate limits.
+
+    Results follow the BaseScraper.fetch_data contract: parsed JSON when the
+    body is JSON, otherwise the response object (which exposes .text,
+    .status_code and .headers like a requests.Response).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        per_host_rate: float = 1.0,
+        per_host_burst: int = 1,
+        headers: Dict[str, str] = None,
+        timeout: float = 30,
+        max_retries: int = 1,
+        retry_delay: float = 1,
+        transport: httpx.AsyncBaseTransport = None,
+        cache=None,
+        policy=None,
+    ):
+        """
+        Initialize the fetcher.
+
+        Args:
+            max_concurrency: Maximum requests in flight across all hosts
+            per_host_rate: Requests per second allowed to each host (<= 0 disables pacing)
+            per_host_burst: Requests a host may receive back to back before pacing applies
+            headers: Default headers sent with every request
+            timeout: Request timeout in seconds
+            max_retries: Attempts per URL before the error is returned
+            retry_delay: Base delay for exponential backoff between attempts
+            transport: Optional httpx transport (used by tests)
+            cache: Optional ResponseCache for conditional requests
+            policy: Optional FetchPolicy for adaptive per-host concurrency,
+                    Retry-After and circuit breaking
+        """
+        self.max_concurrency = max_concurrency
+        self.per_host_rate = per_host_rate
+        self.per_host_burst = per_host_burst
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self.max_retries = max(1, max_retries)
+        self.retry_delay = retry_delay
+        self.transport = transport
+        self.cache = cache
+        self.policy = policy
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # Synchronous API (used by scrapers)
+
+    def fetch_many(self, urls: List[str], **kwargs) -> List[Any]:
+        """
+        Fetch URLs concurrently and return results in input order.
+
+        Args:
+            urls: URLs to fetch
+            **kwargs: Additional arguments for httpx (params, headers, ...)
+
+        Returns:
+            One entry per URL: the fetch result, or the exception raised for that URL
+        """
+        if not urls:
+            return []
+        return self._run(self.gather(urls, **kwargs))
+
+    def close(self) -> None:
+        """Close the connection pool and stop the background event loop."""
+        if self._loop is None:
+            return
+
+        if self._client is not None:
+            self._run(self._client.aclose())
+            self._client = None
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+        self._semaphore = None
+        # Bucket locks belong to the stopped loop; keep pacing state only
+        for bucket in self._buckets.values():
+            bucket._lock = None
+
+    def _run(self, coro):
+        """Run a coroutine on the fetcher's event loop and wait for the result."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._loop.run_forever,
+                name='jobscraper-fetcher',
+                daemon=True
+            )
+            self._thread.start()
+
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    # Async API
+
+    async def gather(self, urls: List[str], **kwargs) -> List[Any]:
+        """Fetch URLs concurrently, returning exceptions in place of failed results."""
+        return await asyncio.gather(
+            *(self.fetch(url, **kwargs) for url in urls),
+            return_exceptions=True
+        )
+
+    async def fetch(self, url: str, **kwargs) -> Any:
+        """
+        Fetch a single URL, honoring the host's rate limit and the global concurrency limit.
+
+        Args:
+            url: URL to fetch
+            **kwargs: Additional arguments for httpx
+
+        Returns:
+            Parsed JSON data or the response object
+
+        Raises:
+            httpx.HTTPError: If every attempt failed, or the response was a
+                non-retryable client error
+            HostUnavailable: If the policy skipped the host
+        """
+        client = self._get_client()
+        bucket = self._get_bucket(url)
+
+        if self.cache is not None:
+            kwargs['headers'] = {**self.cache.conditional_headers(url), **(kwargs.get('headers') or {})}
+
+        for attempt in range(self.max_retries):
+            # Wait for the host's token before taking a concurrency slot so
+            # slow hosts don't hold slots other hosts could use
+            await bucket.acquire()
+            slot = await self.policy.acquire_async(url) if self.policy is not None else None
+            status, retry_after = None, None
+
+            try:
+                async with self._semaphore:
+                    logger.info(f"Fetching data from: {url}")
+                    response = await client.get(url, **kwargs)
+                    status = response.status_code
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    if self.cache is not None:
+                        response = self.cache.resolve(url, response)
+                    response.raise_for_status()
+            except httpx.HTTPError as e:
+                logger.warning(f"Error fetching {url} (attempt {attempt + 1}/{self.max_retries}): {str(e)}")
+                if attempt == self.max_retries - 1 or not is_retryable(status):
+                    raise
+                if retry_after is None or self.policy is None:
+                    # With a policy, the next acquire waits out Retry-After instead
+                    await asyncio.sleep(self.retry_delay * (2 ** attempt))
+                continue
+            finally:
+                if slot is not None:
+                    self.policy.release(slot, status, retry_after)
+
+            try:
+                return response.json()
+            except ValueError:
+                return response
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Create the shared client and concurrency semaphore on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                ),
+                transport=self.transport,
+            )
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    def _get_bucket(self, url: str) -> TokenBucket:
+        """Return the token bucket for the URL's host."""
+        host = urlparse(url).netloc.lower()
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.per_host_rate, self.per_host_burst)
+        return self._buckets[host]
@@ -0,0 +1,25 @@
+from rest_framework.filters import BaseFilterBackend
+
+from .search import search_jobs
+
+
+class FullTextSearchFilter(BaseFilterBackend):
+    """
+    Full-text job search on the ?q= query parameter (see jobscraper.search).
+
+    Matching jobs are annotated with search_rank. Unless the request asks
+    for an explicit ?ordering=, results are ordered by relevance, so this
+    backend goes after OrderingFilter.
+    """
+
+    search_param = 'q'
+
+    def filter_queryset(self, request, queryset, view):
+        text = request.query_params.get(self.search_param, '').strip()
+        if not text:
+            return queryset
+
+        queryset = search_jobs(queryset, text)
+        if not request.query_params.get('ordering'):
+            queryset = queryset.order_by('-search_rank', *queryset.query.order_by)
+        return queryset
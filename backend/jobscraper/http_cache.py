@@ -0,0 +1,286 @@
+"""
+HTTP Response Cache
+
+Persistent on-disk cache of scraper responses used to make conditional
+requests. For each URL it stores the validators the server sent (ETag,
+Last-Modified), a hash of the body and the body itself, so a repeat fetch can:
+
+- send If-None-Match / If-Modified-Since and accept a 304 Not Modified, or
+- detect an identical body when the server sends no validators,
+
+and report the URL as unchanged so the pipeline can skip parse/normalize/save
+for it. Works with both requests and httpx responses.
+
+New entries are held in memory until the jobs from their response are
+stored: the scraper commits them after a run (or work unit) succeeds, and
+forgets the entries of responses whose jobs failed to save, so a crash or a
+failed save never leaves a URL reported unchanged while its jobs are
+missing. Validators sent with conditional requests come from committed
+entries only.
+
+Entries are rewritten each time their URL is fetched again; prune() deletes
+entries not written for max_age_days and, past max_entries, the oldest
+ones. Scrapers prune after each completed run, and the prune_http_cache
+command prunes on a schedule.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Dict, Iterable, Optional, Set
+
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+
+class CachedResponse:
+    """
+    Response-like object built from a cache entry after a 304 Not Modified.
+
+    Exposes the subset of the requests/httpx Response API the scrapers use.
+    """
+
+    status_code = 200
+    from_cache = True
+
+    def __init__(self, url: str, entry: Dict[str, Any]):
+        self.url = url
+        self.text = entry.get('body', '')
+        self.content = self.text.encode('utf-8')
+        self.headers = {'Content-Type': entry.get('content_type', '')}
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class ResponseCache:
+    """
+    On-disk store of response validators and bodies, one JSON file per URL.
+
+    Also counts hits (responses that were unchanged) and misses for the
+    current run, remembers which URLs were unchanged and holds the entries
+    of this run's responses until commit().
+    """
+
+    # Leftover temporary files of interrupted writes are removed after this many seconds
+    TMP_MAX_AGE = 3600
+
+    def __init__(self, cache_dir: str, max_age_days: Optional[float] = None, max_entries: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (created if missing)
+            max_age_days: prune() deletes entries not written for this long (None keeps them)
+            max_entries: prune() keeps at most this many entries (None for no limit)
+        """
+        self.cache_dir = cache_dir
+        self.max_age_days = max_age_days
+        self.max_entries = max_entries
+        os.makedirs(cache_dir, exist_ok=True)
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Clear hit/miss counters, unchanged URLs and uncommitted entries for a new run."""
+        self.hits = 0
+        self.misses = 0
+        self.unchanged_urls: Set[str] = set()
+        self.rollback()
+
+    def commit(self) -> int:
+        """
+        Write the entries of this run's responses, except forgotten ones.
+
+        Call once the jobs parsed from the responses are stored.
+
+        Returns:
+            Number of entries written
+        """
+        pending = {url: entry for url, entry in self._pending.items() if url not in self._forgotten}
+        for url, entry in pending.items():
+            self._write(url, entry)
+        self.rollback()
+        return len(pending)
+
+    def rollback(self) -> None:
+        """Drop this run's uncommitted entries."""
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._forgotten: Set[str] = set()
+
+    def forget(self, urls: Iterable[str]) -> None:
+        """
+        Drop the entries of urls, committed or not, so their next fetch is unconditional.
+
+        For responses whose jobs could not be stored: reporting them
+        unchanged later would keep those jobs from ever being saved.
+        """
+        for url in urls:
+            self._forgotten.add(url)
+            self._pending.pop(url, None)
+            try:
+                os.remove(self._path(url))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not remove cache entry for {url}: {e}")
+
+    def prune(self, max_age_days: Optional[float] = None, max_entries: Optional[int] = None) -> int:
+        """
+        Delete old entries, then the oldest ones past the entry limit.
+
+        Args:
+            max_age_days: Maximum days since an entry was written (defaults to self.max_age_days)
+            max_entries: Maximum entries kept (defaults to self.max_entries)
+
+        Returns:
+            Number of files removed
+        """
+        max_age_days = self.max_age_days if max_age_days is None else max_age_days
+        max_entries = self.max_entries if max_entries is None else max_entries
+        now = time.time()
+        cutoff = now - max_age_days * 86400 if max_age_days else None
+
+        expired, kept = [], []
+        try:
+            with os.scandir(self.cache_dir) as files:
+                for file in files:
+                    if not file.name.endswith(('.json', '.tmp')):
+                        continue
+                    try:
+                        written = file.stat().st_mtime
+                    except OSError:
+                        continue
+                    if file.name.endswith('.tmp'):
+                        if written < now - self.TMP_MAX_AGE:
+                            expired.append(file.path)
+                    elif cutoff is not None and written < cutoff:
+                        expired.append(file.path)
+                    else:
+                        kept.append((written, file.path))
+        except OSError as e:
+            logger.warning(f"Could not list cache directory {self.cache_dir}: {e}")
+            return 0
+
+        if max_entries and len(kept) > max_entries:
+            kept.sort()
+            expired += [path for _, path in kept[:len(kept) - max_entries]]
+
+        removed = 0
+        for path in expired:
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not remove cache file {path}: {e}")
+        if removed:
+            logger.info(f"Pruned {removed} HTTP cache files from {self.cache_dir}")
+        return removed
+
+    def is_unchanged(self, url: str) -> bool:
+        """Whether the last fetch of url in this run returned an unchanged body."""
+        return url in self.unchanged_urls
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Build conditional request headers from the stored validators.
+
+        Args:
+            url: URL about to be fetched
+
+        Returns:
+            Dictionary with If-None-Match and/or If-Modified-Since (may be empty)
+        """
+        entry = self.get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def resolve(self, url: str, response: Any) -> Any:
+        """
+        Reconcile a fetched response with the cache.
+
+        A 304 is answered from the stored body; a 200 is compared against the
+        stored body hash and held for commit(). Other statuses pass through
+        untouched.
+
+        Args:
+            url: URL that was fetched
+            response: requests.Response or httpx.Response
+
+        Returns:
+            The response, or a CachedResponse when the server answered 304
+        """
+        if response.status_code == 304:
+            entry = self.get(url)
+            if entry is None:
+                return response
+            self._record(url, unchanged=True)
+            return CachedResponse(url, entry)
+
+        if response.status_code != 200:
+            return response
+
+        body = response.text
+        body_hash = hashlib.sha256(body.encode('utf-8')).hexdigest()
+        entry = self.get(url)
+        unchanged = entry is not None and entry.get('body_hash') == body_hash
+
+        self._record(url, unchanged=unchanged)
+        self._pending[url] = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_type': response.headers.get('Content-Type', ''),
+            'body_hash': body_hash,
+            'body': body,
+            'stored_at': timezone.now().isoformat(),
+        }
+        return response
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Load the committed cache entry for url, or None if missing or unreadable."""
+        try:
+            with open(self._path(url), encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry for {url}: {e}")
+            return None
+
+    def _record(self, url: str, unchanged: bool) -> None:
+        if unchanged:
+            self.hits += 1
+            self.unchanged_urls.add(url)
+        else:
+            self.misses += 1
+            self.unchanged_urls.discard(url)
+
+    def _write(self, url: str, entry: Dict[str, Any]) -> None:
+        """Write an entry atomically so concurrent runs never read a partial file."""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(url))
+        except OSError as e:
+            logger.warning(f"Could not write cache entry for {url}: {e}")
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json')
@@ -3,25 +3,48 @@ Enhanced Job Parser
 
 Intelligent parsing system to extract comprehensive job information
 from job posting HTML and text content using NLP and pattern matching.
+
+NLTK, its corpora and the parser singleton are loaded on first use rather
+than at import, so importing this module is cheap. Long-lived workers can
+call warm_up() at startup to pay that cost before the first job.
 """
 
-import re
 import json
 import logging
+import threading
 from typing import Dict, List, Optional, Union
 from datetime import datetime, date
 from decimal import Decimal
-import nltk
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.corpus import stopwords
-from nltk.chunk import ne_chunk
-from nltk.tag import pos_tag
+
+from . import parser_patterns
+from .keyword_matcher import KeywordMatch, KeywordMatcher, match_context
+from .skill_taxonomy import get_taxonomy
 
 logger = logging.getLogger(__name__)
 
-# Download required NLTK data (run once)
+# Fallback stop words when the NLTK corpus is unavailable
+FALLBACK_STOP_WORDS = {
+    'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', 
+    'your', 'yours', 'yourself', 'yourselves', 'he', 'him', 'his', 'himself', 
+    'she', 'her', 'hers', 'herself', 'it', 'its', 'itself', 'they', 'them', 
+    'their', 'theirs', 'themselves', 'what', 'which', 'who', 'whom', 'this', 
+    'that', 'these', 'those', 'am', 'is', 'are', 'was', 'were', 'be', 'been', 
+    'being', 'have', 'has', 'had', 'having', 'do', 'does', 'did', 'doing', 
+    'a', 'an', 'the', 'and', 'but', 'if', 'or', 'because', 'as', 'until', 
+    'while', 'of', 'at', 'by', 'for', 'with', 'through', 'during', 'before', 
+    'after', 'above', 'below', 'up', 'down', 'in', 'out', 'on', 'off', 'over', 
+    'under', 'again', 'further', 'then', 'once'
+}
+
+_nltk_ready = False
+_nltk_error: Optional[ImportError] = None
+_nltk_lock = threading.Lock()
+
+
 def _ensure_nltk_data():
     """Ensure NLTK data is available"""
+    import nltk
+    
     required_data = [
         ('tokenizers/punkt', 'punkt'),
         ('tokenizers/punkt_tab', 'punkt_tab'),
@@ -40,8 +63,22 @@ def _ensure_nltk_data():
             except Exception as e:
                 logger.warning(f"Failed to download NLTK data {data_name}: {e}")
 
-# Initialize NLTK data
-_ensure_nltk_data()
+
+def _load_nltk():
+    """Import NLTK and check/download its data once per process"""
+    global _nltk_ready, _nltk_error
+    
+    with _nltk_lock:
+        # Remember a missing NLTK install instead of retrying the import per job
+        if _nltk_error is not None:
+            raise _nltk_error
+        if not _nltk_ready:
+            try:
+                _ensure_nltk_data()
+            except ImportError as e:
+                _nltk_error = e
+                raise
+            _nltk_ready = True
 
 
 class JobParser:
@@ -51,143 +88,53 @@ class JobParser:
     """
     
     def __init__(self):
-        # Initialize stop words with fallback
-        try:
-            self.stop_words = set(stopwords.words('english'))
-        except Exception as e:
-            logger.warning(f"Failed to load NLTK stopwords, using fallback: {e}")
-            # Fallback stop words list
-            self.stop_words = {
-                'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', 
-                'your', 'yours', 'yourself', 'yourselves', 'he', 'him', 'his', 'himself', 
-                'she', 'her', 'hers', 'herself', 'it', 'its', 'itself', 'they', 'them', 
-                'their', 'theirs', 'themselves', 'what', 'which', 'who', 'whom', 'this', 
-                'that', 'these', 'those', 'am', 'is', 'are', 'was', 'were', 'be', 'been', 
-                'being', 'have', 'has', 'had', 'having', 'do', 'does', 'did', 'doing', 
-                'a', 'an', 'the', 'and', 'but', 'if', 'or', 'because', 'as', 'until', 
-                'while', 'of', 'at', 'by', 'for', 'with', 'through', 'during', 'before', 
-                'after', 'above', 'below', 'up', 'down', 'in', 'out', 'on', 'off', 'over', 
-                'under', 'again', 'further', 'then', 'once'
-            }
+        # Stop words come from NLTK, loaded on first use (see stop_words)
+        self._stop_words = None
         
         # Load predefined skill sets and patterns
         self._load_patterns()
         self._load_skill_databases()
         self._load_company_data()
+        self._build_keyword_matcher()
     
-    def _load_patterns(self):
-        """Load regex patterns for various job attributes"""
-        
-        # Salary patterns
-        self.salary_patterns = [
-            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*-\s*\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',  # $80,000 - $120,000
-            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*to\s*\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',  # $80,000 to $120,000
-            r'(\d{1,3}(?:,\d{3})*)\s*-\s*(\d{1,3}(?:,\d{3})*)\s*(?:USD|dollars?|per\s+year)',  # 80,000 - 120,000 USD
-            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*/\s*(?:hour|hr)',  # $25.00/hour
-            r'(\d{1,2})\s*-\s*(\d{1,2})\s*(?:LPA|lakhs?)',  # 8 - 12 LPA (Indian salary)
-        ]
+    @property
+    def stop_words(self) -> set:
+        """English stop words from NLTK, or a fallback list if it is unavailable"""
         
-        # Experience level patterns
-        self.experience_patterns = {
-            'entry': r'(?:entry|junior|graduate|fresher|0-2\s+years?|new\s+grad)',
-            'junior': r'(?:junior|1-3\s+years?|early\s+career)',
-            'mid': r'(?:mid|middle|3-5\s+years?|4-6\s+years?|intermediate)',
-            'senior': r'(?:senior|5\+\s+years?|6\+\s+years?|experienced|lead)',
-            'lead': r'(?:lead|principal|staff|architect|team\s+lead)',
-            'executive': r'(?:director|vp|vice\s+president|head\s+of|chief|executive)',
-        }
-        
-        # Job type patterns
-        self.job_type_patterns = {
-            'full-time': r'(?:full.?time|permanent|fte)',
-            'part-time': r'(?:part.?time|pte)',
-            'contract': r'(?:contract|contractor|freelance|consulting)',
-            'internship': r'(?:intern|internship|co.?op)',
-            'temporary': r'(?:temp|temporary|seasonal)',
-        }
-        
-        # Employment mode patterns
-        self.employment_mode_patterns = {
-            'remote': r'(?:remote|work\s+from\s+home|wfh|distributed)',
-            'hybrid': r'(?:hybrid|flexible|mix|combination)',
-            'on-site': r'(?:on.?site|office|in.?person|onsite)',
-        }
-        
-        # Education patterns
-        self.education_patterns = {
-            'high-school': r'(?:high\s+school|hs|secondary)',
-            'associate': r'(?:associate|aa|as)\s+degree',
-            'bachelor': r'(?:bachelor|ba|bs|btech|be)\s+degree',
-            'master': r'(?:master|ma|ms|mtech|mba|me)\s+degree',
-            'phd': r'(?:phd|doctorate|doctoral)',
-        }
-        
-        # Benefit patterns
-        self.benefit_patterns = [
-            r'health\s+insurance', r'medical\s+coverage', r'dental',
-            r'401\(k\)', r'retirement', r'pension',
-            r'paid\s+time\s+off', r'pto', r'vacation',
-            r'stock\s+options', r'equity', r'rsu',
-            r'life\s+insurance', r'disability',
-            r'parental\s+leave', r'maternity', r'paternity',
-            r'tuition\s+reimbursement', r'education',
-            r'gym\s+membership', r'wellness',
-            r'flexible\s+hours', r'work.life\s+balance',
-        ]
+        if self._stop_words is None:
+            try:
+                _load_nltk()
+                from nltk.corpus import stopwords
+                self._stop_words = set(stopwords.words('english'))
+            except Exception as e:
+                logger.warning(f"Failed to load NLTK stopwords, using fallback: {e}")
+                self._stop_words = FALLBACK_STOP_WORDS
+        return self._stop_words
+    
+    def _load_patterns(self):
+        """Load regex patterns for various job attributes (compiled once in parser_patterns)"""
+        
+        self.salary_patterns = parser_patterns.SALARY_PATTERNS
+        self.experience_patterns = parser_patterns.EXPERIENCE_LEVELS
+        self.job_type_patterns = parser_patterns.JOB_TYPES
+        self.employment_mode_patterns = parser_patterns.EMPLOYMENT_MODES
+        self.education_patterns = parser_patterns.EDUCATION_LEVELS
+        self.benefit_patterns = parser_patterns.BENEFITS
     
     def _load_skill_databases(self):
-        """Load comprehensive skill databases"""
-        
-        # Programming languages
-        self.programming_languages = {
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php',
-            'ruby', 'go', 'rust', 'kotlin', 'swift', 'scala', 'r', 'matlab',
-            'sql', 'html', 'css', 'sass', 'less', 'coffeescript'
-        }
-        
-        # Frameworks and libraries
-        self.frameworks = {
-            'react', 'angular', 'vue', 'nodejs', 'express', 'django', 'flask',
-            'spring', 'hibernate', 'laravel', 'symfony', 'rails', 'gin',
-            'fastapi', 'pandas', 'numpy', 'tensorflow', 'pytorch', 'keras',
-            'scikit-learn', 'opencv', 'matplotlib', 'seaborn'
-        }
-        
-        # Cloud platforms
-        self.cloud_platforms = {
-            'aws', 'azure', 'gcp', 'google cloud', 'digitalocean', 'heroku',
-            'vercel', 'netlify', 'cloudflare'
-        }
-        
-        # Databases
-        self.databases = {
-            'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch',
-            'sqlite', 'oracle', 'sql server', 'cassandra', 'dynamodb',
-            'firebase', 'supabase'
-        }
-        
-        # Tools and technologies
-        self.tools = {
-            'docker', 'kubernetes', 'jenkins', 'github', 'gitlab', 'bitbucket',
-            'jira', 'confluence', 'slack', 'figma', 'sketch', 'photoshop',
-            'illustrator', 'tableau', 'power bi', 'excel', 'git', 'svn',
-            'webpack', 'vite', 'babel', 'eslint', 'jest', 'cypress',
-            'selenium', 'postman', 'insomnia'
-        }
-        
-        # Soft skills
-        self.soft_skills = {
-            'leadership', 'communication', 'teamwork', 'problem solving',
-            'analytical thinking', 'creativity', 'adaptability', 'time management',
-            'project management', 'mentoring', 'collaboration', 'initiative'
-        }
-        
-        # Certifications
-        self.certifications = {
-            'aws certified', 'azure certified', 'gcp certified', 'pmp',
-            'scrum master', 'agile', 'cissp', 'cisa', 'comptia', 'cisco',
-            'oracle certified', 'microsoft certified', 'google certified'
-        }
+        """Load skill vocabularies from the shared skill taxonomy"""
+        
+        self.skill_taxonomy = get_taxonomy()
+        self.programming_languages = self.skill_taxonomy.terms('programming_languages')
+        self.frameworks = self.skill_taxonomy.terms('frameworks')
+        self.cloud_platforms = self.skill_taxonomy.terms('cloud_platforms')
+        self.databases = self.skill_taxonomy.terms('databases')
+        self.tools = self.skill_taxonomy.terms('tools')
+        self.soft_skills = self.skill_taxonomy.terms('soft_skills')
+        self.certifications = self.skill_taxonomy.terms('certifications')
+        
+        # Every category but certifications, including ones added to the taxonomy
+        self.skills = self.skill_taxonomy.skill_terms()
     
     def _load_company_data(self):
         """Load company size and industry mappings"""
@@ -210,6 +157,47 @@ class JobParser:
             'large': ['fortune 500', 'enterprise', '1000+', 'multinational'],
             'enterprise': ['global', 'worldwide', '5000+', 'fortune 100'],
         }
+        
+        # Checked in order; the first category with a keyword hit wins
+        self.job_categories = {
+            'software-engineering': ['software', 'developer', 'engineer', 'programming'],
+            'data-science': ['data scientist', 'machine learning', 'ai', 'analytics'],
+            'product-management': ['product manager', 'product owner', 'pm'],
+            'design': ['designer', 'ux', 'ui', 'design'],
+            'marketing': ['marketing', 'growth', 'digital marketing'],
+            'sales': ['sales', 'business development', 'account manager'],
+            'operations': ['operations', 'ops', 'devops', 'infrastructure'],
+            'finance': ['finance', 'accounting', 'financial analyst'],
+            'hr': ['hr', 'human resources', 'recruiter', 'people'],
+        }
+    
+    def _build_keyword_matcher(self):
+        """Compile skill, tool, certification and category vocabularies into one automaton"""
+        
+        self.keyword_matcher = KeywordMatcher()
+        self.keyword_matcher.add('skills', self.skills)
+        self.keyword_matcher.add('tools', self.tools)
+        self.keyword_matcher.add('certifications', self.certifications)
+        
+        # Category keywords keep substring matching ('developer' in 'developers')
+        for category, keywords in self.job_categories.items():
+            self.keyword_matcher.add(f'category:{category}', keywords, whole_words=False)
+        
+        self._last_scan = (None, [])
+    
+    def _scan_keywords(self, text: str) -> List[KeywordMatch]:
+        """Match all vocabularies against text, reusing the last scan of the same text"""
+        
+        if get_taxonomy() is not self.skill_taxonomy:
+            # The taxonomy was reloaded
+            self._load_skill_databases()
+            self._build_keyword_matcher()
+        
+        last_text, matches = self._last_scan
+        if last_text != text:
+            matches = self.keyword_matcher.find_all(text.lower())
+            self._last_scan = (text, matches)
+        return matches
     
     def parse_job_posting(self, html_content: str, text_content: str, url: str) -> Dict:
         """
@@ -288,28 +276,24 @@ class JobParser:
         text_lower = text.lower()
         
         # Job type
-        for job_type, pattern in self.job_type_patterns.items():
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                result['job_type'] = job_type
-                break
+        job_type = self.job_type_patterns.classify(text_lower)
+        if job_type:
+            result['job_type'] = job_type
         
         # Employment mode
-        for mode, pattern in self.employment_mode_patterns.items():
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                result['employment_mode'] = mode
-                break
+        mode = self.employment_mode_patterns.classify(text_lower)
+        if mode:
+            result['employment_mode'] = mode
         
         # Experience level
-        for level, pattern in self.experience_patterns.items():
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                result['experience_level'] = level
-                break
+        level = self.experience_patterns.classify(text_lower)
+        if level:
+            result['experience_level'] = level
         
         # Education level
-        for edu, pattern in self.education_patterns.items():
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                result['education_level'] = edu
-                break
+        edu = self.education_patterns.classify(text_lower)
+        if edu:
+            result['education_level'] = edu
         
         return result
     
@@ -355,15 +339,9 @@ class JobParser:
         result['benefits'] = self._extract_benefits(text)
         
         # Extract bonus/equity information
-        bonus_patterns = [
-            r'bonus', r'equity', r'stock\s+options', r'rsu',
-            r'commission', r'profit\s+sharing'
-        ]
-        
         bonus_text = []
-        for pattern in bonus_patterns:
-            matches = re.findall(rf'.{{0,50}}{pattern}.{{0,50}}', text, re.IGNORECASE)
-            bonus_text.extend(matches)
+        for pattern in parser_patterns.BONUS_CONTEXTS:
+            bonus_text.extend(pattern.findall(text))
         
         if bonus_text:
             result['bonus_equity'] = '; '.join(bonus_text[:3])  # Limit to 3 matches
@@ -395,8 +373,7 @@ class JobParser:
                 break
         
         # Look for company website
-        website_pattern = r'https?://(?:www\.)?([a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}'
-        websites = re.findall(website_pattern, text)
+        websites = parser_patterns.WEBSITE.findall(text)
         if websites:
             result['company_website'] = websites[0]
         
@@ -408,14 +385,8 @@ class JobParser:
         result = {}
         
         # Application deadline
-        deadline_patterns = [
-            r'deadline[:\s]+(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
-            r'apply\s+by[:\s]+(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
-            r'closing\s+date[:\s]+(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
-        ]
-        
-        for pattern in deadline_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in parser_patterns.DEADLINES:
+            match = pattern.search(text)
             if match:
                 try:
                     # Parse date (simplified)
@@ -426,27 +397,15 @@ class JobParser:
                     pass
         
         # Number of openings
-        opening_patterns = [
-            r'(\d+)\s+openings?',
-            r'(\d+)\s+positions?',
-            r'hiring\s+(\d+)',
-        ]
-        
-        for pattern in opening_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in parser_patterns.OPENINGS:
+            match = pattern.search(text)
             if match:
                 result['number_of_openings'] = int(match.group(1))
                 break
         
         # Hiring manager
-        manager_patterns = [
-            r'contact[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
-            r'recruiter[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
-            r'hiring\s+manager[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
-        ]
-        
-        for pattern in manager_patterns:
-            match = re.search(pattern, text)
+        for pattern in parser_patterns.HIRING_MANAGERS:
+            match = pattern.search(text)
             if match:
                 result['hiring_manager'] = match.group(1)
                 break
@@ -473,16 +432,8 @@ class JobParser:
         result['relocation_assistance'] = any(pattern in text_lower for pattern in relocation_patterns)
         
         # Travel requirements
-        travel_patterns = [
-            r'(\d{1,2})%\s+travel',
-            r'travel\s+(\d{1,2})%',
-            r'minimal\s+travel',
-            r'extensive\s+travel',
-            r'no\s+travel',
-        ]
-        
-        for pattern in travel_patterns:
-            match = re.search(pattern, text_lower)
+        for pattern in parser_patterns.TRAVEL:
+            match = pattern.search(text_lower)
             if match:
                 if match.groups():
                     result['travel_requirements'] = f"{match.group(1)}% travel"
@@ -491,16 +442,9 @@ class JobParser:
                 break
         
         # Language requirements
-        language_patterns = [
-            r'fluent\s+in\s+(\w+)',
-            r'(\w+)\s+language\s+required',
-            r'bilingual\s+(\w+)',
-        ]
-        
         languages = []
-        for pattern in language_patterns:
-            matches = re.findall(pattern, text_lower)
-            languages.extend(matches)
+        for pattern in parser_patterns.LANGUAGES:
+            languages.extend(pattern.findall(text_lower))
         
         if languages:
             result['languages_required'] = list(set(languages))
@@ -522,15 +466,9 @@ class JobParser:
         result['keywords'] = self._extract_keywords(text)
         
         # Portfolio requirements
-        portfolio_patterns = [
-            r'portfolio', r'github', r'code\s+samples',
-            r'work\s+samples', r'examples\s+of\s+work'
-        ]
-        
         portfolio_matches = []
-        for pattern in portfolio_patterns:
-            matches = re.findall(rf'.{{0,50}}{pattern}.{{0,50}}', text, re.IGNORECASE)
-            portfolio_matches.extend(matches)
+        for pattern in parser_patterns.PORTFOLIO_CONTEXTS:
+            portfolio_matches.extend(pattern.findall(text))
         
         if portfolio_matches:
             result['projects_portfolio_examples'] = '; '.join(portfolio_matches[:2])
@@ -542,20 +480,12 @@ class JobParser:
         
         sections = {}
         
-        # Common section headers
-        section_patterns = {
-            'responsibilities': r'(?:responsibilities|duties|what\s+you.ll\s+do|role\s+description)',
-            'requirements': r'(?:requirements|qualifications|what\s+we.re\s+looking\s+for|skills)',
-            'benefits': r'(?:benefits|perks|what\s+we\s+offer|compensation)',
-            'about': r'(?:about\s+us|company\s+overview|who\s+we\s+are)',
-        }
-        
         # Split text into paragraphs
         paragraphs = text.split('\n\n')
         
-        for section, pattern in section_patterns.items():
+        for section, pattern in parser_patterns.SECTION_HEADERS.items():
             for i, paragraph in enumerate(paragraphs):
-                if re.search(pattern, paragraph, re.IGNORECASE):
+                if pattern.search(paragraph):
                     # Take this paragraph and potentially the next few
                     section_text = []
                     for j in range(i, min(i + 3, len(paragraphs))):
@@ -573,55 +503,40 @@ class JobParser:
         required_skills = set()
         preferred_skills = set()
         
-        # Check all skill databases
-        all_skills = (
-            self.programming_languages | self.frameworks | 
-            self.cloud_platforms | self.databases | 
-            self.tools | self.soft_skills
-        )
-        
-        for skill in all_skills:
-            if skill in text_lower:
-                # Determine if required or preferred based on context
-                skill_context = self._get_skill_context(text_lower, skill)
-                if 'preferred' in skill_context or 'nice' in skill_context:
-                    preferred_skills.add(skill)
-                else:
-                    required_skills.add(skill)
+        for match in self._scan_keywords(text):
+            if match.group != 'skills' or match.term in required_skills or match.term in preferred_skills:
+                continue
+            # Determine if required or preferred from the first mention's context
+            skill_context = match_context(text_lower, match)
+            if 'preferred' in skill_context or 'nice' in skill_context:
+                preferred_skills.add(match.term)
+            else:
+                required_skills.add(match.term)
         
         return {
             'required': list(required_skills),
             'preferred': list(preferred_skills)
         }
     
-    def _get_skill_context(self, text: str, skill: str) -> str:
-        """Get the context around a skill mention"""
-        
-        pattern = rf'.{{0,100}}{re.escape(skill)}.{{0,100}}'
-        match = re.search(pattern, text, re.IGNORECASE)
-        return match.group(0) if match else ""
-    
     def _extract_tools(self, text: str) -> List[str]:
         """Extract tools and technologies"""
         
-        text_lower = text.lower()
         found_tools = []
         
-        for tool in self.tools:
-            if tool in text_lower:
-                found_tools.append(tool)
+        for match in self._scan_keywords(text):
+            if match.group == 'tools' and match.term not in found_tools:
+                found_tools.append(match.term)
         
         return found_tools
     
     def _extract_certifications(self, text: str) -> List[str]:
         """Extract certifications"""
         
-        text_lower = text.lower()
         found_certs = []
         
-        for cert in self.certifications:
-            if cert in text_lower:
-                found_certs.append(cert)
+        for match in self._scan_keywords(text):
+            if match.group == 'certifications' and match.term not in found_certs:
+                found_certs.append(match.term)
         
         return found_certs
     
@@ -631,7 +546,7 @@ class JobParser:
         result = {}
         
         for pattern in self.salary_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 try:
                     if len(match.groups()) >= 2:
@@ -673,10 +588,8 @@ class JobParser:
         found_benefits = []
         text_lower = text.lower()
         
-        for pattern in self.benefit_patterns:
-            if re.search(pattern, text_lower):
-                # Clean up the pattern for display
-                benefit = pattern.replace(r'\s+', ' ').replace(r'\(', '(').replace(r'\)', ')')
+        for pattern, benefit in self.benefit_patterns:
+            if pattern.search(text_lower):
                 found_benefits.append(benefit)
         
         return found_benefits
@@ -684,22 +597,10 @@ class JobParser:
     def _classify_job_category(self, text: str) -> Optional[str]:
         """Classify job into a category"""
         
-        text_lower = text.lower()
+        found_groups = {match.group for match in self._scan_keywords(text)}
         
-        categories = {
-            'software-engineering': ['software', 'developer', 'engineer', 'programming'],
-            'data-science': ['data scientist', 'machine learning', 'ai', 'analytics'],
-            'product-management': ['product manager', 'product owner', 'pm'],
-            'design': ['designer', 'ux', 'ui', 'design'],
-            'marketing': ['marketing', 'growth', 'digital marketing'],
-            'sales': ['sales', 'business development', 'account manager'],
-            'operations': ['operations', 'ops', 'devops', 'infrastructure'],
-            'finance': ['finance', 'accounting', 'financial analyst'],
-            'hr': ['hr', 'human resources', 'recruiter', 'people'],
-        }
-        
-        for category, keywords in categories.items():
-            if any(keyword in text_lower for keyword in keywords):
+        for category in self.job_categories:
+            if f'category:{category}' in found_groups:
                 return category
         
         return None
@@ -725,8 +626,7 @@ class JobParser:
                 break
         
         # Experience years
-        exp_pattern = r'(\d+)\+?\s*years?\s+(?:of\s+)?experience'
-        match = re.search(exp_pattern, text_lower)
+        match = parser_patterns.EXPERIENCE_YEARS.search(text_lower)
         if match:
             years = int(match.group(1))
             if years >= 8:
@@ -743,6 +643,8 @@ class JobParser:
         
         try:
             # Try NLTK tokenization
+            _load_nltk()
+            from nltk.tokenize import word_tokenize
             tokens = word_tokenize(text.lower())
             
             # Remove stop words and short words
@@ -765,8 +667,7 @@ class JobParser:
             logger.warning(f"NLTK keyword extraction failed, using fallback: {e}")
             
             # Fallback: simple regex-based keyword extraction
-            import re
-            words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
+            words = parser_patterns.KEYWORD_WORDS.findall(text.lower())
             
             # Remove common words manually
             common_words = {
@@ -804,8 +705,47 @@ class JobParser:
         return round(final_confidence, 2)
 
 
-# Singleton instance
-job_parser = JobParser()
+_job_parser: Optional[JobParser] = None
+_job_parser_lock = threading.Lock()
+
+
+def get_job_parser() -> JobParser:
+    """
+    Get the shared JobParser, building it on first use
+    
+    Returns:
+        JobParser singleton
+    """
+    global _job_parser
+    
+    if _job_parser is None:
+        with _job_parser_lock:
+            if _job_parser is None:
+                _job_parser = JobParser()
+    return _job_parser
+
+
+def __getattr__(name):
+    # Keep `from .job_parser import job_parser` working without building it at import
+    if name == 'job_parser':
+        return get_job_parser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def warm_up() -> JobParser:
+    """
+    Build the parser and load NLTK data, stop words and the tokenizer now
+    
+    Call from long-lived workers at startup so the first parsed job does
+    not pay for corpus loading (or download attempts).
+    
+    Returns:
+        JobParser singleton
+    """
+    parser = get_job_parser()
+    parser.stop_words
+    parser._extract_keywords('warm up')
+    return parser
 
 
 def parse_job_content(html_content: str, text_content: str, url: str) -> Dict:
@@ -820,4 +760,4 @@ def parse_job_content(html_content: str, text_content: str, url: str) -> Dict:
     Returns:
         Parsed job data dictionary
     """
-    return job_parser.parse_job_posting(html_content, text_content, url)
+    return get_job_parser().parse_job_posting(html_content, text_content, url)
@@ -0,0 +1,143 @@
+"""
+Keyword Matcher
+
+Multi-pattern keyword search for the job parsers. All vocabularies (skills,
+tools, certifications, category keywords) are compiled from a trie into a
+single regular expression, so a description is scanned once no matter how
+many terms there are, and every hit comes back with its offsets.
+
+The trie is compiled for the regex engine rather than walked in Python: a
+per-character Python loop costs more than the substring checks it replaces.
+"""
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Pattern, Tuple
+
+
+class KeywordMatch(NamedTuple):
+    term: str
+    group: str
+    start: int
+    end: int
+
+
+def _trie_pattern(node: Dict[str, dict]) -> str:
+    """Build a regex from a trie, trying longer terms before shorter ones."""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        pattern = '(?:' + pattern + ')?'
+    return pattern
+
+
+class KeywordMatcher:
+    """
+    Single-pass matcher over groups of lowercase terms.
+
+    Terms added with whole_words=True only match when not surrounded by
+    letters or digits, so 'go' does not match inside 'google' and 'r' does
+    not match every word containing an r. Terms added with whole_words=False
+    keep plain substring semantics.
+    """
+
+    def __init__(self):
+        # term -> [(group, whole_words), ...]
+        self._entries: Dict[str, List[Tuple[str, bool]]] = {}
+        self._scanners: Optional[List[Tuple[Pattern, Dict[str, List[str]], bool]]] = None
+
+    def add(self, group: str, terms: Iterable[str], whole_words: bool = True) -> None:
+        """
+        Add terms under a group name.
+
+        Args:
+            group: Label reported with each match (e.g. 'skills', 'tools')
+            terms: Lowercase terms to match
+            whole_words: Require word boundaries around each match
+        """
+        for term in terms:
+            if term:
+                self._entries.setdefault(term, []).append((group, whole_words))
+        self._scanners = None
+
+    def _compile(self) -> None:
+        """Compile one scanner for whole-word terms and one for substring terms."""
+        self._scanners = []
+
+        for whole_words in (True, False):
+            terms = [
+                term for term, entries in self._entries.items()
+                if any(flag == whole_words for _, flag in entries)
+            ]
+            if not terms:
+                continue
+
+            trie: Dict[str, dict] = {}
+            for term in terms:
+                node = trie
+                for char in term:
+                    node = node.setdefault(char, {})
+                node[''] = {}
+
+            # Whatever terms match at a position are prefixes of the longest one
+            prefixes = {
+                term: [other for other in terms if term.startswith(other)]
+                for term in terms
+            }
+
+            pattern = '(?=(' + _trie_pattern(trie) + '))'
+            if whole_words:
+                pattern = r'(?<![^\W_])' + pattern
+            self._scanners.append((re.compile(pattern), prefixes, whole_words))
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """
+        Find every term occurrence in text.
+
+        Overlapping and nested matches are all reported (e.g. both 'sql' and
+        'sql server'), ordered by start offset.
+
+        Args:
+            text: Lowercased text to search
+
+        Returns:
+            List of KeywordMatch with offsets into text
+        """
+        if self._scanners is None:
+            self._compile()
+
+        matches = []
+        length = len(text)
+
+        for scanner, prefixes, whole_words in self._scanners:
+            for found in scanner.finditer(text):
+                start = found.start()
+                for term in prefixes[found.group(1)]:
+                    end = start + len(term)
+                    if whole_words and end < length and text[end].isalnum():
+                        continue
+                    for group, flag in self._entries[term]:
+                        if flag == whole_words:
+                            matches.append(KeywordMatch(term, group, start, end))
+
+        matches.sort(key=lambda match: (match.start, match.end))
+        return matches
+
+
+def match_context(text: str, match: KeywordMatch, width: int = 100) -> str:
+    """
+    Slice up to width characters either side of a match, within its line.
+
+    Args:
+        text: Text the match was found in
+        match: Match returned by KeywordMatcher.find_all
+        width: Characters of context on each side
+
+    Returns:
+        Context string around the match
+    """
+    start = max(match.start - width, text.rfind('\n', 0, match.start) + 1)
+    line_end = text.find('\n', match.end)
+    end = match.end + width if line_end == -1 else min(match.end + width, line_end)
+    return text[start:end]
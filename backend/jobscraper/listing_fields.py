@@ -0,0 +1,130 @@
+"""
+Listing Fields
+
+Values the job API shows for every posting -- employment type, requirement
+bullets and salary -- derived from the description once, when the job is
+saved, and stored in JobPosting.job_type, requirements and salary_min/
+salary_max/currency. Serializers read the stored columns instead of
+scanning every description on every response, and the employment type
+filter becomes an indexed job_type lookup.
+
+The content parser fills the same columns when enrichment is on; these
+lightweight heuristics only fill what it left empty.
+"""
+
+import re
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Stored columns derived here (currency is set along with a derived salary)
+LISTING_FIELDS = ('job_type', 'requirements', 'salary_min', 'salary_max')
+
+# job_type value -> description phrases, checked in order
+EMPLOYMENT_TYPE_PHRASES = [
+    ('full-time', ('full-time', 'full time')),
+    ('part-time', ('part-time', 'part time')),
+    ('contract', ('contract',)),
+    ('internship', ('intern',)),
+]
+
+# Lines that introduce a requirements list
+REQUIREMENT_HEADINGS = ('requirements', 'qualifications', 'skills', 'must have', 'we need')
+BULLETS = ('•', '-', '*')
+
+# (pattern, multiplier) over the lowercased description; the first match wins
+SALARY_PATTERNS = [
+    (re.compile(r'\$([\d,]+)\s*-\s*\$([\d,]+)'), 1),
+    (re.compile(r'([\d,]+)k\s*-\s*([\d,]+)k'), 1000),
+    (re.compile(r'(?:salary|compensation).*?\$([\d,]+)'), 1),
+]
+
+# Largest value the salary columns hold (max_digits=12, decimal_places=2)
+MAX_SALARY = Decimal('9999999999.99')
+
+
+def employment_type(description: Optional[str]) -> Optional[str]:
+    """JobPosting.job_type value named in a description, or None."""
+    text = (description or '').lower()
+    for job_type, phrases in EMPLOYMENT_TYPE_PHRASES:
+        if any(phrase in text for phrase in phrases):
+            return job_type
+    return None
+
+
+def requirement_lines(description: Optional[str]) -> List[str]:
+    """Bullet lines following the first requirements-style heading of a description."""
+    requirements = []
+    capture = False
+    for line in (description or '').split('\n'):
+        line = line.strip()
+        if any(heading in line.lower() for heading in REQUIREMENT_HEADINGS):
+            capture = True
+            continue
+        if capture and line:
+            if line.startswith(BULLETS):
+                requirements.append(line)
+            elif requirements:
+                break
+    return requirements
+
+
+def salary_range(description: Optional[str]) -> Tuple[Optional[Decimal], Optional[Decimal], Optional[str]]:
+    """
+    Salary range stated in a description.
+
+    Returns:
+        (minimum, maximum, currency code); maximum is None for a single
+        figure and currency is None when no currency symbol is present.
+        All None when no salary is found.
+    """
+    text = (description or '').lower()
+    for pattern, multiplier in SALARY_PATTERNS:
+        match = pattern.search(text)
+        if not match:
+            continue
+        try:
+            values = [Decimal(group.replace(',', '')) * multiplier for group in match.groups()]
+        except ArithmeticError:
+            continue
+        if any(value > MAX_SALARY for value in values):
+            continue
+        if '$' in text:
+            currency = 'USD'
+        elif '₹' in text or 'inr' in text or 'lakh' in text:
+            currency = 'INR'
+        else:
+            currency = None
+        return values[0], values[1] if len(values) > 1 else None, currency
+    return None, None, None
+
+
+def derive_listing_fields(description: Optional[str], fields=LISTING_FIELDS) -> Dict[str, Any]:
+    """
+    Listing column values for a description.
+
+    Args:
+        description: Job description
+        fields: Columns to derive (subset of LISTING_FIELDS)
+
+    Returns:
+        Column -> value for the columns the description provides; currency
+        is included with a derived salary when it could be told
+    """
+    derived: Dict[str, Any] = {}
+    if 'job_type' in fields:
+        job_type = employment_type(description)
+        if job_type:
+            derived['job_type'] = job_type
+    if 'requirements' in fields:
+        lines = requirement_lines(description)
+        if lines:
+            derived['requirements'] = '\n'.join(lines)
+    if 'salary_min' in fields or 'salary_max' in fields:
+        salary_min, salary_max, currency = salary_range(description)
+        if salary_min is not None:
+            derived['salary_min'] = salary_min
+            derived['salary_max'] = salary_max
+            if currency:
+                derived['currency'] = currency
+    return derived
@@ -0,0 +1,431 @@
+"""
+Job Location Normalization
+
+Free-text job locations ('Bangalore Urban, Karnataka', 'Remote - India',
+'Gurgaon, IN') are normalized at ingest into structured, indexed JobPosting
+fields: country_code (ISO 3166-1 alpha-2), region (state/province), city and
+is_remote. Listing filters then become index lookups instead of OR-ed
+icontains scans, and the place-name lists live here rather than in each
+scraper and view.
+
+The gazetteer is built from the tables below plus the canonical
+fyndr_auth.Location rows, and matches every place name in a location in one
+pass with KeywordMatcher (whole words only, so 'pune' does not match inside
+another word and 'delhi' matches inside 'New Delhi NCR').
+"""
+
+import logging
+import re
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .keyword_matcher import KeywordMatcher
+
+
+logger = logging.getLogger(__name__)
+
+
+class LocationInfo(NamedTuple):
+    country_code: str
+    region: str
+    city: str
+    is_remote: bool
+
+
+class City(NamedTuple):
+    name: str
+    region: str
+    country_code: str
+
+
+# JobPosting fields filled from a LocationInfo
+LOCATION_FIELDS = LocationInfo._fields
+
+EMPTY_LOCATION = LocationInfo('', '', '', False)
+
+# ISO 3166-1 alpha-2 code -> lowercase names and aliases
+COUNTRIES = {
+    'IN': ('india', 'bharat', 'भारत'),
+    'US': ('united states', 'united states of america', 'usa', 'us', 'u.s.', 'u.s.a.'),
+    'GB': ('united kingdom', 'uk', 'great britain', 'britain', 'england', 'scotland', 'wales', 'northern ireland'),
+    'CA': ('canada',),
+    'DE': ('germany', 'deutschland'),
+    'FR': ('france',),
+    'NL': ('netherlands', 'the netherlands', 'holland'),
+    'IE': ('ireland',),
+    'ES': ('spain',),
+    'PT': ('portugal',),
+    'IT': ('italy',),
+    'CH': ('switzerland',),
+    'AT': ('austria',),
+    'BE': ('belgium',),
+    'SE': ('sweden',),
+    'NO': ('norway',),
+    'DK': ('denmark',),
+    'FI': ('finland',),
+    'PL': ('poland',),
+    'CZ': ('czech republic', 'czechia'),
+    'RO': ('romania',),
+    'UA': ('ukraine',),
+    'IL': ('israel',),
+    'AE': ('united arab emirates', 'uae'),
+    'SA': ('saudi arabia',),
+    'QA': ('qatar',),
+    'SG': ('singapore',),
+    'MY': ('malaysia',),
+    'ID': ('indonesia',),
+    'PH': ('philippines',),
+    'VN': ('vietnam',),
+    'TH': ('thailand',),
+    'JP': ('japan',),
+    'KR': ('south korea', 'korea'),
+    'CN': ('china',),
+    'HK': ('hong kong',),
+    'TW': ('taiwan',),
+    'AU': ('australia',),
+    'NZ': ('new zealand',),
+    'BR': ('brazil',),
+    'MX': ('mexico',),
+    'AR': ('argentina',),
+    'CO': ('colombia',),
+    'CL': ('chile',),
+    'ZA': ('south africa',),
+    'NG': ('nigeria',),
+    'KE': ('kenya',),
+    'EG': ('egypt',),
+    'PK': ('pakistan',),
+    'BD': ('bangladesh',),
+    'LK': ('sri lanka',),
+    'NP': ('nepal',),
+}
+
+# Indian states and union territories: canonical name -> extra lowercase aliases
+INDIA_REGIONS = {
+    'Andhra Pradesh': (),
+    'Arunachal Pradesh': (),
+    'Assam': (),
+    'Bihar': (),
+    'Chhattisgarh': (),
+    'Goa': (),
+    'Gujarat': (),
+    'Haryana': (),
+    'Himachal Pradesh': (),
+    'Jharkhand': (),
+    'Karnataka': (),
+    'Kerala': (),
+    'Madhya Pradesh': (),
+    'Maharashtra': (),
+    'Manipur': (),
+    'Meghalaya': (),
+    'Mizoram': (),
+    'Nagaland': (),
+    'Odisha': ('orissa',),
+    'Punjab': (),
+    'Rajasthan': (),
+    'Sikkim': (),
+    'Tamil Nadu': (),
+    'Telangana': (),
+    'Tripura': (),
+    'Uttar Pradesh': (),
+    'Uttarakhand': ('uttaranchal',),
+    'West Bengal': (),
+    'Andaman and Nicobar Islands': ('andaman and nicobar',),
+    'Chandigarh': (),
+    'Dadra and Nagar Haveli and Daman and Diu': ('dadra and nagar haveli', 'daman and diu'),
+    'Delhi': ('nct of delhi', 'delhi ncr', 'ncr'),
+    'Jammu and Kashmir': (),
+    'Ladakh': (),
+    'Lakshadweep': (),
+    'Puducherry': ('pondicherry',),
+}
+
+# Indian cities by state: 'Canonical|alias|alias'. Districts ('Pune district',
+# 'Bangalore Urban') match through their city name.
+INDIA_CITIES = {
+    'Andhra Pradesh': [
+        'Visakhapatnam|vizag|vishakhapatnam', 'Vijayawada', 'Guntur', 'Nellore', 'Kurnool',
+        'Rajahmundry|rajamahendravaram', 'Kadapa', 'Kakinada', 'Eluru', 'Anantapur|anantapuram',
+        'Amaravati', 'Tirupati',
+    ],
+    'Assam': ['Guwahati'],
+    'Bihar': [
+        'Patna', 'Gaya', 'Bhagalpur', 'Muzaffarpur', 'Darbhanga', 'Bihar Sharif', 'Arrah',
+        'Begusarai', 'Purnia',
+    ],
+    'Chandigarh': ['Chandigarh'],
+    'Chhattisgarh': ['Raipur', 'Bhilai', 'Durg', 'Korba', 'Bilaspur'],
+    'Delhi': [
+        'Delhi|new delhi|old delhi|central delhi|north delhi|south delhi|east delhi|west delhi',
+        'Kirari Suleman Nagar',
+    ],
+    'Goa': ['Panaji|panjim', 'Margao', 'Vasco da Gama'],
+    'Gujarat': [
+        'Ahmedabad', 'Surat', 'Vadodara|baroda', 'Rajkot', 'Bhavnagar', 'Jamnagar', 'Junagadh',
+        'Gandhinagar',
+    ],
+    'Haryana': ['Gurugram|gurgaon', 'Faridabad', 'Panipat', 'Rohtak', 'Karnal', 'Sonipat'],
+    'Jammu and Kashmir': ['Srinagar', 'Jammu'],
+    'Jharkhand': ['Ranchi', 'Jamshedpur', 'Dhanbad', 'Bokaro|bokaro steel city'],
+    'Karnataka': [
+        'Bengaluru|bangalore', 'Mysuru|mysore', 'Mangaluru|mangalore', 'Hubballi|hubli|hubli-dharwad',
+        'Belagavi|belgaum', 'Kalaburagi|gulbarga', 'Davanagere', 'Ballari|bellary', 'Vijayapura|bijapur',
+        'Shivamogga|shimoga', 'Tumakuru|tumkur',
+    ],
+    'Kerala': [
+        'Kochi|cochin|ernakulam', 'Thiruvananthapuram|trivandrum', 'Kozhikode|calicut', 'Thrissur',
+        'Kollam',
+    ],
+    'Madhya Pradesh': [
+        'Indore', 'Bhopal', 'Jabalpur', 'Gwalior', 'Ujjain', 'Sagar', 'Dewas', 'Satna', 'Ratlam',
+    ],
+    'Maharashtra': [
+        'Mumbai|bombay|mumbai suburban', 'Navi Mumbai', 'Thane', 'Pune|pimpri|pimpri-chinchwad|pimpri chinchwad',
+        'Nagpur', 'Nashik', 'Aurangabad|chhatrapati sambhajinagar', 'Solapur', 'Kalyan|kalyan-dombivli',
+        'Vasai|vasai-virar', 'Bhiwandi', 'Amravati', 'Nanded', 'Kolhapur', 'Akola', 'Ulhasnagar',
+        'Sangli|miraj|kupwad', 'Malegaon', 'Jalgaon', 'Latur', 'Dhule', 'Ahmednagar', 'Chandrapur',
+        'Parbhani', 'Ichalkaranji', 'Jalna', 'Ambernath', 'Satara', 'Mira-Bhayandar|mira bhayandar|mira road|mira',
+    ],
+    'Manipur': ['Imphal'],
+    'Mizoram': ['Aizawl'],
+    'Odisha': ['Bhubaneswar', 'Cuttack', 'Rourkela', 'Berhampur|brahmapur', 'Sambalpur', 'Gopalpur'],
+    'Puducherry': ['Puducherry|pondicherry', 'Ozhukarai'],
+    'Punjab': ['Ludhiana', 'Amritsar', 'Jalandhar', 'Patiala', 'Bathinda', 'Mohali'],
+    'Rajasthan': [
+        'Jaipur', 'Jodhpur', 'Kota', 'Bikaner', 'Ajmer', 'Udaipur', 'Bhilwara', 'Alwar', 'Bharatpur',
+    ],
+    'Tamil Nadu': [
+        'Chennai|madras', 'Ambattur', 'Avadi', 'Coimbatore', 'Madurai', 'Tiruchirappalli|trichy', 'Salem',
+        'Tiruppur', 'Tirunelveli', 'Vellore',
+    ],
+    'Telangana': ['Hyderabad|secunderabad', 'Warangal', 'Nizamabad', 'Karimnagar', 'Khammam'],
+    'Tripura': ['Agartala'],
+    'Uttar Pradesh': [
+        'Noida|greater noida', 'Ghaziabad', 'Lucknow', 'Kanpur', 'Agra', 'Meerut', 'Varanasi|banaras|benares',
+        'Prayagraj|allahabad', 'Bareilly', 'Aligarh', 'Moradabad', 'Saharanpur', 'Gorakhpur', 'Firozabad',
+        'Jhansi', 'Muzaffarnagar', 'Mathura', 'Shahjahanpur', 'Rampur', 'Farrukhabad', 'Hapur', 'Etawah',
+        'Loni', 'Barabanki', 'Mau',
+    ],
+    'Uttarakhand': ['Dehradun'],
+    'West Bengal': [
+        'Kolkata|calcutta', 'Howrah|haora', 'Durgapur', 'Asansol', 'Siliguri', 'Maheshtala',
+        'Rajpur Sonarpur', 'South Dumdum|south dum dum', 'North Dumdum|north dum dum', 'Bhatpara',
+        'Panihati', 'Kamarhati', 'Bardhaman|burdwan', 'Kulti', 'Bally',
+    ],
+}
+
+# Frequent job locations outside India, by country code
+WORLD_CITIES = {
+    'US': [
+        'San Francisco|sf bay area|bay area', 'New York|new york city|nyc', 'Seattle', 'Austin', 'Boston',
+        'Chicago', 'Los Angeles', 'Denver', 'Atlanta', 'Mountain View', 'Palo Alto', 'Sunnyvale',
+        'San Jose', 'Menlo Park', 'Washington, D.C.|washington dc', 'Miami', 'Dallas', 'Pittsburgh',
+    ],
+    'GB': ['London', 'Manchester', 'Edinburgh', 'Cambridge', 'Bristol'],
+    'IE': ['Dublin'],
+    'DE': ['Berlin', 'Munich|münchen', 'Hamburg', 'Frankfurt'],
+    'NL': ['Amsterdam', 'Rotterdam'],
+    'FR': ['Paris'],
+    'ES': ['Madrid', 'Barcelona'],
+    'PT': ['Lisbon'],
+    'CH': ['Zurich|zürich', 'Geneva'],
+    'SE': ['Stockholm'],
+    'DK': ['Copenhagen'],
+    'PL': ['Warsaw', 'Krakow|kraków'],
+    'CA': ['Toronto', 'Vancouver', 'Montreal|montréal', 'Ottawa'],
+    'AU': ['Sydney', 'Melbourne'],
+    'SG': ['Singapore'],
+    'JP': ['Tokyo'],
+    'IL': ['Tel Aviv'],
+    'AE': ['Dubai', 'Abu Dhabi'],
+    'BR': ['São Paulo|sao paulo'],
+    'MX': ['Mexico City'],
+    'TH': ['Bangkok'],
+    'ID': ['Jakarta'],
+    'PH': ['Manila'],
+    'MY': ['Kuala Lumpur'],
+    'PK': ['Karachi', 'Lahore'],
+    'BD': ['Dhaka'],
+    'LK': ['Colombo'],
+    'NP': ['Kathmandu'],
+}
+
+_REMOTE = re.compile(r'\b(?:remote|work from home|wfh|anywhere|home[- ]based|distributed)\b')
+
+# 'Gurgaon, IN', 'Pune (IN)': a country code as the last token
+_TRAILING_CODE = re.compile(r'[,(/|-]\s*([A-Z]{2})\s*\)?\s*$')
+
+
+class Gazetteer:
+    """Place names (countries, regions, cities) matched in one pass over a location string."""
+
+    def __init__(self):
+        self._countries: Dict[str, str] = {}
+        self._regions: Dict[str, List[Tuple[str, str]]] = {}
+        self._cities: Dict[str, List[City]] = {}
+        self._matcher = KeywordMatcher()
+
+    @classmethod
+    def default(cls, load_locations: bool = True) -> 'Gazetteer':
+        """
+        Gazetteer with the built-in tables.
+
+        Args:
+            load_locations: Also add the fyndr_auth.Location table
+        """
+        gazetteer = cls()
+        for code, names in COUNTRIES.items():
+            gazetteer.add_country(code, names)
+        for region, aliases in INDIA_REGIONS.items():
+            gazetteer.add_region(region, 'IN', aliases)
+        for region, cities in INDIA_CITIES.items():
+            for entry in cities:
+                name, *aliases = entry.split('|')
+                gazetteer.add_city(name, region, 'IN', aliases)
+        for code, cities in WORLD_CITIES.items():
+            for entry in cities:
+                name, *aliases = entry.split('|')
+                gazetteer.add_city(name, '', code, aliases)
+        if load_locations:
+            gazetteer.load_locations()
+        return gazetteer
+
+    def add_country(self, code: str, names) -> None:
+        """Add a country's names and aliases under its ISO code."""
+        for name in names:
+            self._countries[name.lower()] = code
+        self._matcher.add('country', [name.lower() for name in names])
+
+    def add_region(self, name: str, country_code: str, aliases=()) -> None:
+        """Add a state/province of a country."""
+        for alias in (name.lower(), *aliases):
+            entries = self._regions.setdefault(alias, [])
+            if (name, country_code) not in entries:
+                entries.append((name, country_code))
+            self._matcher.add('region', [alias])
+
+    def add_city(self, name: str, region: str, country_code: str, aliases=()) -> None:
+        """Add a city; region may be empty when unknown."""
+        city = City(name, region, country_code)
+        for alias in (name.lower(), *aliases):
+            entries = self._cities.setdefault(alias, [])
+            if city not in entries:
+                entries.append(city)
+            self._matcher.add('city', [alias])
+
+    def load_locations(self) -> int:
+        """
+        Add cities and regions from the fyndr_auth.Location table.
+
+        Rows whose country is not in COUNTRIES are skipped.
+
+        Returns:
+            Number of rows added
+        """
+        from django.db import DatabaseError
+
+        try:
+            from fyndr_auth.models import Location
+            rows = list(Location.objects.filter(is_active=True).values_list('city', 'state', 'country'))
+        except (ImportError, DatabaseError) as e:
+            logger.debug(f"Location table not available for the gazetteer: {e}")
+            return 0
+
+        added = 0
+        for city, state, country in rows:
+            code = self.country_code(country)
+            if not code or not city:
+                continue
+            # Keep the built-in spelling when the table uses an alias ('Bangalore')
+            known = [entry for entry in self._cities.get(city.lower(), []) if entry.country_code == code]
+            if not known:
+                self.add_city(city, state or '', code)
+            if state:
+                self.add_region(state, code)
+            added += 1
+        return added
+
+    def country_code(self, name: Optional[str]) -> Optional[str]:
+        """ISO code for a country name, alias or code ('India', 'in', 'IN'); None if unknown."""
+        name = (name or '').strip()
+        if len(name) == 2 and name.upper() in COUNTRIES:
+            return name.upper()
+        return self._countries.get(name.lower())
+
+    def city_name(self, name: Optional[str]) -> Optional[str]:
+        """Canonical spelling of a city name or alias ('bangalore' -> 'Bengaluru'); None if unknown."""
+        entries = self._cities.get((name or '').strip().lower())
+        return entries[0].name if entries else None
+
+    def normalize(self, location: Optional[str]) -> LocationInfo:
+        """
+        Structured fields for a free-text location.
+
+        The country comes from an explicit country name, else the first city,
+        else the first region, else a trailing ISO code ('Pune, IN'). City and
+        region are taken from the same country; an explicit region picks
+        between cities of the same name.
+
+        Args:
+            location: Location as scraped
+
+        Returns:
+            LocationInfo with empty strings for parts that were not recognized
+        """
+        if not location:
+            return EMPTY_LOCATION
+
+        lowered = location.lower()
+        countries, regions, cities = [], [], []
+        for match in self._matcher.find_all(lowered):
+            if match.group == 'country':
+                countries.append(self._countries[match.term])
+            elif match.group == 'region':
+                regions.extend(self._regions[match.term])
+            else:
+                cities.extend(self._cities[match.term])
+
+        if countries:
+            code = countries[0]
+        elif cities:
+            code = cities[0].country_code
+        elif regions:
+            code = regions[0][1]
+        else:
+            trailing = _TRAILING_CODE.search(location)
+            code = trailing.group(1) if trailing and trailing.group(1) in COUNTRIES else ''
+
+        region_names = [name for name, country_code in regions if country_code == code]
+        city = next(
+            (
+                entry for entry in cities
+                if entry.country_code == code and (not region_names or not entry.region or entry.region in region_names)
+            ),
+            None,
+        )
+        region = city.region if city and city.region else (region_names[0] if region_names else '')
+
+        return LocationInfo(code, region, city.name if city else '', bool(_REMOTE.search(lowered)))
+
+
+_gazetteer: Optional[Gazetteer] = None
+
+
+def get_gazetteer() -> Gazetteer:
+    """Process-wide gazetteer, built on first use."""
+    global _gazetteer
+    if _gazetteer is None:
+        _gazetteer = Gazetteer.default()
+    return _gazetteer
+
+
+def reset_gazetteer() -> None:
+    """Rebuild the gazetteer on next use (e.g. after editing the Location table)."""
+    global _gazetteer
+    _gazetteer = None
+    normalize_location.cache_clear()
+
+
+@lru_cache(maxsize=10000)
+def normalize_location(location: Optional[str]) -> LocationInfo:
+    """Normalize a location with the shared gazetteer; repeated locations are cached."""
+    return get_gazetteer().normalize(location)
@@ -0,0 +1,252 @@
+"""
+Company Logo Resolution
+
+Logos belong to companies, not postings: thousands of postings usually come
+from a few hundred companies. LogoResolver looks each company up once and
+remembers the result in CompanyLogo -- hits for JOBSCRAPER_LOGO_TTL_DAYS,
+misses for the shorter JOBSCRAPER_LOGO_NEGATIVE_TTL_DAYS -- so later batches
+and runs only resolve companies they have not seen recently.
+
+Uncached companies are resolved concurrently, and each company's lookup
+strategies (LogoScraper.strategies()) run in parallel. The best-ranked
+strategy that finds a logo wins, as in the serial lookup, but a company
+costs the latency of the strategies it needs to wait for rather than their
+sum.
+"""
+
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import Case, Min, Q, URLField, Value, When
+from django.utils import timezone
+
+from .logo_scraper import logo_scraper
+
+
+logger = logging.getLogger(__name__)
+
+
+# Trailing words dropped from company names, so 'Acme Inc.' and 'ACME' share a logo
+_LEGAL_SUFFIXES = {
+    'inc', 'llc', 'ltd', 'limited', 'corp', 'corporation', 'co', 'company',
+    'plc', 'gmbh', 'pvt', 'private', 'llp',
+}
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+# Keys per lookup query and companies per backfill UPDATE
+_BATCH = 500
+
+# Most strategies LogoScraper.strategies() returns for one company
+_STRATEGIES_PER_COMPANY = 4
+
+# Longest logo URL JobPosting.company_logo can hold (URLField default)
+MAX_LOGO_URL_LENGTH = 200
+
+
+def company_key(name: Optional[str]) -> str:
+    """
+    Normalized company name used as the cache key.
+
+    Lowercased, punctuation collapsed to spaces and trailing legal suffixes
+    removed ('Acme, Inc.' -> 'acme'). Empty for names without letters or
+    digits.
+    """
+    words = _NON_ALNUM.sub(' ', (name or '').lower()).split()
+    while len(words) > 1 and words[-1] in _LEGAL_SUFFIXES:
+        words.pop()
+    return ' '.join(words)[:255]
+
+
+class LogoResolver:
+    """Resolves company logos in batches through the CompanyLogo cache."""
+
+    def __init__(
+        self,
+        scraper=None,
+        workers: Optional[int] = None,
+        ttl_days: Optional[float] = None,
+        negative_ttl_days: Optional[float] = None,
+    ):
+        """
+        Initialize the resolver.
+
+        Args:
+            scraper: LogoScraper whose strategies are used (default: the shared one)
+            workers: Companies resolved concurrently (default: JOBSCRAPER_LOGO_WORKERS)
+            ttl_days: Days a found logo is reused (default: JOBSCRAPER_LOGO_TTL_DAYS)
+            negative_ttl_days: Days a miss is reused (default: JOBSCRAPER_LOGO_NEGATIVE_TTL_DAYS)
+        """
+        self.scraper = scraper or logo_scraper
+        self.workers = workers or getattr(settings, 'JOBSCRAPER_LOGO_WORKERS', 8)
+        self.ttl = timedelta(days=ttl_days or getattr(settings, 'JOBSCRAPER_LOGO_TTL_DAYS', 30))
+        self.negative_ttl = timedelta(
+            days=negative_ttl_days or getattr(settings, 'JOBSCRAPER_LOGO_NEGATIVE_TTL_DAYS', 7)
+        )
+        self.cache_hits = 0
+        self.resolved = 0
+
+    def resolve_many(self, companies: Dict[str, Optional[str]], refresh: bool = False) -> Dict[str, Optional[str]]:
+        """
+        Look up logos for many companies.
+
+        Args:
+            companies: Company name -> a job URL of that company (or None);
+                       the URL lets the job page strategy run
+            refresh: Ignore cached results and resolve every company again
+
+        Returns:
+            Company name -> logo URL, or None when no logo is known
+        """
+        from .models import CompanyLogo
+
+        names_by_key: Dict[str, List[str]] = {}
+        for name in companies:
+            key = company_key(name)
+            if key:
+                names_by_key.setdefault(key, []).append(name)
+
+        keys = list(names_by_key)
+        stored = {}
+        for start in range(0, len(keys), _BATCH):
+            for row in CompanyLogo.objects.filter(company_key__in=keys[start:start + _BATCH]):
+                stored[row.company_key] = row
+
+        now = timezone.now()
+        logos: Dict[str, Optional[str]] = {}
+        pending = []
+        for key, names in names_by_key.items():
+            row = stored.get(key)
+            if row is not None and not refresh and row.expires_at > now:
+                logos[key] = row.logo_url or None
+                self.cache_hits += 1
+                continue
+            job_url = next((companies[name] for name in names if companies[name]), None)
+            pending.append((key, names[0], job_url))
+
+        if pending:
+            resolved = self._resolve(pending)
+            self._store(pending, resolved, stored)
+            logos.update({key: logo_url for key, (logo_url, _) in resolved.items()})
+            logger.info(
+                f"Resolved logos for {len(pending)} companies "
+                f"({sum(1 for logo_url, _ in resolved.values() if logo_url)} found), "
+                f"{len(names_by_key) - len(pending)} from cache"
+            )
+
+        return {name: logos.get(company_key(name)) for name in companies}
+
+    def backfill(self, queryset=None, update_existing: bool = False, refresh: bool = False) -> Dict[str, int]:
+        """
+        Set company_logo on postings, one resolution and one bulk UPDATE per batch of companies.
+
+        Args:
+            queryset: JobPostings to fill (default: active postings)
+            update_existing: Also overwrite postings that already have a logo
+            refresh: Ignore cached results
+
+        Returns:
+            Counts of 'companies' looked at, companies with a logo 'found'
+            and postings 'updated'
+        """
+        from .models import JobPosting
+
+        if queryset is None:
+            queryset = JobPosting.objects.filter(is_active=True)
+        if not update_existing:
+            queryset = queryset.filter(Q(company_logo__isnull=True) | Q(company_logo=''))
+
+        companies = dict(
+            queryset.order_by().values('company').annotate(job_url=Min('url')).values_list('company', 'job_url')
+        )
+        counts = {'companies': len(companies), 'found': 0, 'updated': 0}
+
+        names = list(companies)
+        for start in range(0, len(names), _BATCH):
+            batch = {name: companies[name] for name in names[start:start + _BATCH]}
+            found = {name: logo_url for name, logo_url in self.resolve_many(batch, refresh=refresh).items() if logo_url}
+            if not found:
+                continue
+            counts['found'] += len(found)
+            counts['updated'] += queryset.filter(company__in=list(found)).update(
+                company_logo=Case(
+                    *[When(company=name, then=Value(logo_url)) for name, logo_url in found.items()],
+                    output_field=URLField(),
+                )
+            )
+
+        logger.info(f"Logo backfill: {counts}")
+        return counts
+
+    def _resolve(self, pending: List[Tuple[str, str, Optional[str]]]) -> Dict[str, Tuple[Optional[str], str]]:
+        """Resolve companies concurrently: key -> (logo URL or None, winning strategy)."""
+        workers = min(self.workers, len(pending))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='jobscraper-logo') as companies_pool, \
+                ThreadPoolExecutor(max_workers=workers * _STRATEGIES_PER_COMPANY,
+                                   thread_name_prefix='jobscraper-logo-strategy') as strategy_pool:
+            futures = {
+                key: companies_pool.submit(self._race, name, job_url, strategy_pool)
+                for key, name, job_url in pending
+            }
+            results = {}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    logger.warning(f"Logo resolution failed for {key}: {e}")
+                    results[key] = (None, '')
+
+        self.resolved += len(pending)
+        return results
+
+    def _race(self, company: str, job_url: Optional[str], pool: ThreadPoolExecutor) -> Tuple[Optional[str], str]:
+        """
+        Run a company's strategies in parallel; the best-ranked one that finds a logo wins.
+
+        Strategies ranked below the winner that have not started are cancelled.
+        """
+        strategies = self.scraper.strategies(company, job_url)
+        futures = [pool.submit(strategy) for _, strategy in strategies]
+        try:
+            for (name, _), future in zip(strategies, futures):
+                try:
+                    logo_url = future.result()
+                except Exception as e:
+                    logger.debug(f"Logo strategy {name} failed for {company}: {e}")
+                    continue
+                if logo_url and len(logo_url) <= MAX_LOGO_URL_LENGTH:
+                    return logo_url, name
+            return None, ''
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _store(self, pending, resolved, stored) -> None:
+        """Write resolution results (hits and misses) to the CompanyLogo cache."""
+        from .models import CompanyLogo
+
+        now = timezone.now()
+        to_create, to_update = [], []
+        for key, name, _ in pending:
+            logo_url, strategy = resolved[key]
+            row = stored.get(key)
+            if row is None:
+                row = CompanyLogo(company_key=key, company=name[:255])
+                to_create.append(row)
+            else:
+                to_update.append(row)
+            row.domain = self.scraper._guess_company_domain(name) or ''
+            row.logo_url = logo_url
+            row.strategy = strategy
+            row.resolved_at = now
+            row.expires_at = now + (self.ttl if logo_url else self.negative_ttl)
+
+        # Another process may have resolved the same company meanwhile
+        CompanyLogo.objects.bulk_create(to_create, batch_size=_BATCH, ignore_conflicts=True)
+        if to_update:
+            CompanyLogo.objects.bulk_update(
+                to_update, ['domain', 'logo_url', 'strategy', 'resolved_at', 'expires_at'], batch_size=_BATCH
+            )
@@ -7,16 +7,21 @@ This service scrapes company logos from various sources:
 3. Logo APIs (e.g., Brandfetch)
 4. Google favicon service
 5. Social media profile images
+
+Requests go through the shared fetch policy, so a logo host that is down or
+throttling is skipped instead of stalling the scrape that wanted the logo.
 """
 
 import logging
 import requests
 from urllib.parse import urljoin, urlparse
-from typing import Optional, List
+from typing import Callable, Dict, Optional, List, Tuple
 import re
 import time
 from bs4 import BeautifulSoup
 
+from .fetch_policy import get_fetch_policy, parse_retry_after
+
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +34,9 @@ class LogoScraper:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
-        self.request_delay = 0.5  # seconds between requests
+        self.request_delay = 0.5  # seconds between page fetches from the same host
+        self.max_wait = 5  # longest wait for a throttled host before skipping it
+        self._last_fetch: Dict[str, float] = {}
         
     def get_company_logo(self, company_name: str, job_url: str = None) -> Optional[str]:
         """
@@ -42,48 +49,68 @@ class LogoScraper:
         Returns:
             URL to company logo or None if not found
         """
-        logo_url = None
-        
-        # Strategy 1: Try Clearbit Logo API (free tier)
-        try:
-            logo_url = self._get_clearbit_logo(company_name)
-            if logo_url:
-                logger.info(f"Found logo for {company_name} via Clearbit")
-                return logo_url
-        except Exception as e:
-            logger.debug(f"Clearbit logo search failed for {company_name}: {e}")
-        
-        # Strategy 2: Try to extract company domain from job URL
-        if job_url:
+        for name, strategy in self.strategies(company_name, job_url):
             try:
-                logo_url = self._get_logo_from_job_url(job_url)
+                logo_url = strategy()
                 if logo_url:
-                    logger.info(f"Found logo for {company_name} via job URL")
+                    logger.info(f"Found logo for {company_name} via {name}")
                     return logo_url
             except Exception as e:
-                logger.debug(f"Logo extraction from job URL failed for {company_name}: {e}")
-        
-        # Strategy 3: Try Google favicon service
-        try:
-            logo_url = self._get_google_favicon(company_name)
-            if logo_url:
-                logger.info(f"Found logo for {company_name} via Google favicon")
-                return logo_url
-        except Exception as e:
-            logger.debug(f"Google favicon search failed for {company_name}: {e}")
-        
-        # Strategy 4: Try company website search
-        try:
-            logo_url = self._search_company_website(company_name)
-            if logo_url:
-                logger.info(f"Found logo for {company_name} via website search")
-                return logo_url
-        except Exception as e:
-            logger.debug(f"Company website search failed for {company_name}: {e}")
+                logger.debug(f"Logo strategy {name} failed for {company_name}: {e}")
         
         logger.warning(f"No logo found for company: {company_name}")
         return None
     
+    def strategies(self, company_name: str, job_url: str = None) -> List[Tuple[str, Callable[[], Optional[str]]]]:
+        """
+        Logo lookup strategies for a company, best first.
+        
+        Each is a (name, callable) pair; the callable returns a logo URL or
+        None. get_company_logo() tries them in turn, LogoResolver runs them
+        concurrently.
+        
+        Args:
+            company_name: Name of the company
+            job_url: URL of the job posting (might contain company domain)
+        """
+        strategies = [('clearbit', lambda: self._get_clearbit_logo(company_name))]
+        if job_url:
+            strategies.append(('job_url', lambda: self._get_logo_from_job_url(job_url)))
+        strategies.append(('google_favicon', lambda: self._get_google_favicon(company_name)))
+        strategies.append(('website', lambda: self._search_company_website(company_name)))
+        return strategies
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the shared fetch policy.
+        
+        GET requests are paced per host by request_delay. A host whose
+        circuit is open, or that asked us to wait longer than max_wait,
+        raises HostUnavailable without a request being sent.
+        """
+        policy = get_fetch_policy()
+        
+        if method == 'GET':
+            host = policy.host_for(url)
+            wait = self._last_fetch.get(host, 0) + self.request_delay - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_fetch[host] = time.monotonic()
+        
+        if method == 'HEAD':
+            # Like session.head()
+            kwargs.setdefault('allow_redirects', False)
+        
+        slot = policy.acquire(url, max_wait=self.max_wait)
+        status, retry_after = None, None
+        try:
+            response = self.session.request(method, url, **kwargs)
+            status = response.status_code
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            return response
+        finally:
+            policy.release(slot, status, retry_after)
+    
     def _get_clearbit_logo(self, company_name: str) -> Optional[str]:
         """
         Use Clearbit Logo API to get company logo.
@@ -99,7 +126,7 @@ class LogoScraper:
         
         # Check if the logo exists
         try:
-            response = self.session.head(logo_url, timeout=5)
+            response = self._request('HEAD', logo_url, timeout=5)
             if response.status_code == 200:
                 return logo_url
         except Exception:
@@ -112,8 +139,7 @@ class LogoScraper:
         Extract company logo from the job posting page.
         """
         try:
-            time.sleep(self.request_delay)
-            response = self.session.get(job_url, timeout=10)
+            response = self._request('GET', job_url, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -167,7 +193,7 @@ class LogoScraper:
         favicon_url = f"https://www.google.com/s2/favicons?domain={domain}&sz=128"
         
         try:
-            response = self.session.head(favicon_url, timeout=5)
+            response = self._request('HEAD', favicon_url, timeout=5)
             if response.status_code == 200:
                 return favicon_url
         except Exception:
@@ -185,8 +211,7 @@ class LogoScraper:
         
         try:
             company_url = f"https://{domain}"
-            time.sleep(self.request_delay)
-            response = self.session.get(company_url, timeout=10)
+            response = self._request('GET', company_url, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -254,7 +279,7 @@ class LogoScraper:
             # Check if URL looks like an image
             if not any(ext in url.lower() for ext in ['.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp']):
                 # If no image extension, try to check content type
-                response = self.session.head(url, timeout=5)
+                response = self._request('HEAD', url, timeout=5)
                 content_type = response.headers.get('content-type', '')
                 if not content_type.startswith('image/'):
                     return False
@@ -0,0 +1,68 @@
+import logging
+from django.core.management.base import BaseCommand
+from jobscraper.facets import reconcile_facets
+from jobscraper.listing_fields import LISTING_FIELDS
+from jobscraper.models import JobPosting
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Derive job_type, requirements and salary columns from stored descriptions.
+    
+    Jobs get these columns as they are saved; this backfills postings saved
+    while the job API still derived them per request. Columns that are
+    already set (e.g. by the content parser) are left alone.
+    
+    Usage:
+        python manage.py backfill_listing_fields
+        python manage.py backfill_listing_fields --batch-size 2000
+    """
+    
+    help = 'Store employment type, requirements and salary derived from job descriptions'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Jobs processed per batch (default: 1000)'
+        )
+    
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        fields = [*LISTING_FIELDS, 'currency']
+        
+        checked = 0
+        updated = 0
+        last_id = 0
+        while True:
+            jobs = list(
+                JobPosting.objects.filter(id__gt=last_id)
+                .order_by('id')
+                .only('id', 'description', *fields)[:batch_size]
+            )
+            if not jobs:
+                break
+            
+            changed = []
+            for job in jobs:
+                before = [getattr(job, field) for field in fields]
+                job.derive_listing_fields()
+                if [getattr(job, field) for field in fields] != before:
+                    changed.append(job)
+            if changed:
+                JobPosting.objects.bulk_update(changed, fields)
+            
+            checked += len(jobs)
+            updated += len(changed)
+            last_id = jobs[-1].id
+            self.stdout.write(f'Checked {checked} jobs, {updated} updated so far')
+        
+        # Bulk updates bypass the incremental facet counters
+        reconcile_facets()
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'Done: {checked} jobs checked, {updated} updated')
+        )
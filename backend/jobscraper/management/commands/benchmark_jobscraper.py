@@ -0,0 +1,350 @@
+"""
+Benchmark job scraper hot paths against their previous implementations.
+
+Every case that writes runs inside a transaction that is rolled back at the
+end, so the command can be pointed at a development or staging database
+without leaving rows behind.
+"""
+
+import logging
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+from jobscraper.keyword_matcher import KeywordMatcher, match_context
+from jobscraper.models import JobPosting
+from jobscraper.services import JobScrapingService
+
+
+logger = logging.getLogger(__name__)
+
+# Vocabulary for synthetic postings in the search case
+SEARCH_ROLES = [
+    'Software Engineer', 'Backend Developer', 'Data Scientist', 'Product Manager', 'DevOps Engineer',
+    'Frontend Developer', 'QA Analyst', 'Sales Executive', 'UX Designer', 'Machine Learning Engineer',
+]
+SEARCH_LEVELS = ['Junior', 'Senior', 'Staff', 'Lead', 'Principal', '']
+SEARCH_LOCATIONS = ['Bengaluru, India', 'Pune, India', 'Remote', 'London, UK', 'New York, USA', 'Berlin, Germany']
+SEARCH_SKILLS = (
+    'python django postgresql redis kafka aws docker kubernetes terraform react typescript java spring '
+    'golang rust spark airflow pandas tensorflow pytorch figma sketch salesforce negotiation roadmap '
+    'analytics testing selenium cypress linux networking security compliance payments logistics '
+    'healthcare fintech ecommerce startup enterprise mentoring agile scrum stakeholders customers'
+).split()
+SEARCH_BOILERPLATE = (
+    "You will own features end to end, work closely with design and product, and help shape how the team "
+    "works. We value clear writing, careful reviews and shipping in small steps.\n"
+    "Benefits include health insurance, paid time off, parental leave and a wellness stipend.\n"
+) * 3
+SEARCH_QUERIES = ['python', 'kubernetes engineer', 'senior data scientist', 'fintech payments pune', 'company 42']
+
+
+# Stand-in for stored descriptions when the database has none
+SAMPLE_DESCRIPTION = (
+    "About the role: we're hiring a senior backend engineer to build distributed systems in Python and Go.\n"
+    "You will work with Django, PostgreSQL, Redis, Kafka and AWS. Experience with Docker and Kubernetes is "
+    "required; familiarity with Terraform, GitHub Actions and Jenkins is nice to have.\n"
+    "Strong communication and leadership skills. Preferred: React or TypeScript, Elasticsearch, Google Cloud.\n"
+    "Benefits include health insurance, paid time off, parental leave and a wellness stipend.\n"
+) * 3
+
+
+class Command(BaseCommand):
+    """
+    Django management command to benchmark job scraper code paths.
+
+    Usage:
+        python manage.py benchmark_jobscraper --case save_jobs
+        python manage.py benchmark_jobscraper --case save_jobs --jobs 5000 --batch-size 1000
+        python manage.py benchmark_jobscraper --case skill_matcher --jobs 500
+        python manage.py benchmark_jobscraper --case importtime --command scrape_jobs --max-import-ms 150
+        python manage.py benchmark_jobscraper --case search --jobs 100000
+    """
+
+    help = 'Benchmark job scraper hot paths (runs in a rolled-back transaction)'
+
+    CASES = ['save_jobs', 'skill_matcher', 'importtime', 'search']
+
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        parser.add_argument(
+            '--case',
+            type=str,
+            default='save_jobs',
+            choices=self.CASES,
+            help='Benchmark case to run'
+        )
+
+        parser.add_argument(
+            '--jobs',
+            type=int,
+            default=2000,
+            help='Number of synthetic jobs to generate (default: 2000)'
+        )
+
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Batch size for bulk code paths (default: JOBSCRAPER_BULK_BATCH_SIZE)'
+        )
+
+        parser.add_argument(
+            '--command',
+            type=str,
+            default='scrape_jobs',
+            help='Management command whose startup imports are measured (importtime case)'
+        )
+
+        parser.add_argument(
+            '--max-import-ms',
+            type=float,
+            default=None,
+            help='Fail if jobscraper modules take longer than this to import (importtime case)'
+        )
+
+    def handle(self, *args, **options):
+        """Main command handler."""
+        handler = getattr(self, f"_bench_{options['case']}", None)
+        if handler is None:
+            raise CommandError(f"Unknown benchmark case: {options['case']}")
+
+        handler(options)
+
+    def _timed(self, label, func, *args, **kwargs):
+        """Run func, print wall time and query count, and return its result."""
+        queries = 0
+
+        def count_query(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_query):
+            started = time.perf_counter()
+            result = func(*args, **kwargs)
+            elapsed = time.perf_counter() - started
+
+        self.stdout.write(f'  {label:<28} {elapsed * 1000:10.1f} ms {queries:8d} queries   {result}')
+        return result
+
+    def _synthetic_jobs(self, count, source='benchmark', title_suffix=''):
+        """Build normalized job dictionaries shaped like scraper output."""
+        now = timezone.now()
+        return [
+            {
+                'external_id': f'bench-{i}',
+                'title': f'Software Engineer {i}{title_suffix}',
+                'company': f'Company {i % 300}',
+                'location': 'Bengaluru, India' if i % 2 else 'Remote',
+                'description': f'Build and operate services for team {i}. ' * 20,
+                'url': f'https://jobs.example.com/{source}/{i}',
+                'source': source,
+                'date_posted': (now - timedelta(days=i % 30)).date(),
+                'date_scraped': now,
+            }
+            for i in range(count)
+        ]
+
+    def _bench_save_jobs(self, options):
+        """Compare per-row and bulk JobScrapingService.save_jobs."""
+        count = options['jobs']
+        service = JobScrapingService(batch_size=options['batch_size'])
+
+        fresh = self._synthetic_jobs(count)
+        changed = self._synthetic_jobs(count, title_suffix=' (updated)')
+
+        self.stdout.write(f'save_jobs: {count} jobs, batch size {service.batch_size}')
+
+        summary = {}
+        for bulk in (False, True):
+            mode = 'bulk' if bulk else 'per-row'
+            self.stdout.write(f'\n{mode}:')
+
+            with transaction.atomic():
+                summary[mode] = [
+                    self._timed('insert new jobs', service.save_jobs, fresh, bulk=bulk),
+                    self._timed('re-save unchanged jobs', service.save_jobs, fresh, bulk=bulk),
+                    self._timed('re-save changed jobs', service.save_jobs, changed, bulk=bulk),
+                ]
+                transaction.set_rollback(True)
+
+        if summary['per-row'] == summary['bulk']:
+            self.stdout.write(self.style.SUCCESS('\nCounts match between per-row and bulk paths'))
+        else:
+            self.stdout.write(self.style.ERROR('\nCounts differ between per-row and bulk paths'))
+
+    def _bench_skill_matcher(self, options):
+        """Compare per-skill substring scanning with the single-pass keyword matcher."""
+        from jobscraper.simple_job_parser import simple_job_parser as parser
+
+        count = options['jobs']
+        descriptions = list(
+            JobPosting.objects.exclude(description='').values_list('description', flat=True)[:count]
+        )
+        origin = 'stored'
+        if not descriptions:
+            descriptions = [SAMPLE_DESCRIPTION] * count
+            origin = 'sample'
+
+        vocabulary = parser.skills
+        matcher = KeywordMatcher()
+        matcher.add('skills', vocabulary)
+
+        def per_skill_scan():
+            hits = 0
+            for description in descriptions:
+                text = description.lower()
+                for skill in vocabulary:
+                    if skill in text:
+                        re.search(rf'.{{0,100}}{re.escape(skill)}.{{0,100}}', text, re.IGNORECASE)
+                        hits += 1
+            return hits
+
+        def automaton_scan():
+            hits = 0
+            for description in descriptions:
+                text = description.lower()
+                seen = set()
+                for match in matcher.find_all(text):
+                    if match.term not in seen:
+                        seen.add(match.term)
+                        match_context(text, match)
+                hits += len(seen)
+            return hits
+
+        self.stdout.write(
+            f'skill_matcher: {len(descriptions)} {origin} descriptions, {len(vocabulary)} terms'
+        )
+        self.stdout.write('  (hit counts differ where substring matches were not whole words)\n')
+        self._timed('per-skill scan', per_skill_scan)
+        self._timed('keyword matcher', automaton_scan)
+
+    def _bench_search(self, options):
+        """Compare SearchFilter-style icontains matching with the full-text index."""
+        from jobscraper.search import get_search_backend, install_search_index, search_jobs
+
+        count = options['jobs']
+        page_size = 20
+
+        with transaction.atomic():
+            backend = get_search_backend() or install_search_index()
+            if backend is None:
+                raise CommandError(f'No full-text search support for {connection.vendor}')
+
+            self.stdout.write(f'search: {count} synthetic jobs, {backend} index, first page of {page_size}')
+            self._timed('insert jobs (indexed)', self._insert_search_jobs, count)
+            jobs = JobPosting.objects.filter(source='benchmark')
+
+            for query in SEARCH_QUERIES:
+                self.stdout.write(f'\nq={query!r}')
+                substring = Q()
+                for word in query.split():
+                    substring &= (
+                        Q(title__icontains=word) | Q(company__icontains=word) |
+                        Q(location__icontains=word) | Q(description__icontains=word)
+                    )
+                self._timed(
+                    'icontains (SearchFilter)', self._first_page,
+                    jobs.filter(substring).order_by('-date_posted', '-date_scraped'), page_size
+                )
+                self._timed(
+                    'full-text, by relevance', self._first_page,
+                    search_jobs(jobs, query).order_by('-search_rank', '-date_posted'), page_size
+                )
+
+            transaction.set_rollback(True)
+
+    def _insert_search_jobs(self, count):
+        """Insert synthetic postings with varied text; returns the number inserted."""
+        rng = random.Random(0)
+        now = timezone.now()
+        batch = []
+        for i in range(count):
+            level = rng.choice(SEARCH_LEVELS)
+            batch.append(JobPosting(
+                external_id=f'bench-search-{i}',
+                title=f'{level} {rng.choice(SEARCH_ROLES)}'.strip(),
+                company=f'Company {i % 300}',
+                location=rng.choice(SEARCH_LOCATIONS),
+                description=f"Skills: {', '.join(rng.sample(SEARCH_SKILLS, 6))}.\n{SEARCH_BOILERPLATE}",
+                url=f'https://jobs.example.com/benchmark/search/{i}',
+                source='benchmark',
+                date_posted=(now - timedelta(days=i % 30)).date(),
+            ))
+            if len(batch) == 1000:
+                JobPosting.objects.bulk_create(batch)
+                batch = []
+        JobPosting.objects.bulk_create(batch)
+        return count
+
+    @staticmethod
+    def _first_page(queryset, page_size):
+        """What a paginated list request runs: a count and the first page."""
+        return queryset.count(), len(list(queryset[:page_size]))
+
+    def _bench_importtime(self, options):
+        """Measure startup imports of a management command with python -X importtime."""
+        command = options['command']
+        manage_py = os.path.join(settings.BASE_DIR, 'manage.py')
+
+        # --help loads the command module and its imports without running it
+        started = time.perf_counter()
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', manage_py, command, '--help'],
+            capture_output=True, text=True, env=os.environ.copy()
+        )
+        elapsed = time.perf_counter() - started
+        if process.returncode != 0:
+            raise CommandError(f'manage.py {command} --help failed:\n{process.stderr[-2000:]}')
+
+        # Lines look like "import time:  self [us] | cumulative | imported package"
+        imports = []
+        for line in process.stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            imports.append((name.rstrip(), int(self_us), int(cumulative_us)))
+
+        # Top-level entries (no indentation) partition the total import time
+        total_ms = sum(cumulative for name, _, cumulative in imports if not name.startswith('  ')) / 1000
+        package = [(name.strip(), cumulative) for name, _, cumulative in imports if name.strip().startswith('jobscraper')]
+
+        # Entries are emitted children first; walking them in reverse visits each
+        # import before its children, so only the outermost jobscraper imports count
+        package_us = 0
+        counted_depth = None
+        for name, _, cumulative in reversed(imports):
+            depth = len(name) - len(name.lstrip())
+            if counted_depth is not None and depth > counted_depth:
+                continue
+            counted_depth = None
+            if name.strip().startswith('jobscraper'):
+                package_us += cumulative
+                counted_depth = depth
+        package_ms = package_us / 1000
+
+        self.stdout.write(f'importtime: manage.py {command} --help')
+        self.stdout.write(f'  process wall time            {elapsed * 1000:10.1f} ms')
+        self.stdout.write(f'  all imports                  {total_ms:10.1f} ms {len(imports):8d} modules')
+        self.stdout.write(f'  jobscraper imports           {package_ms:10.1f} ms {len(package):8d} modules')
+
+        self.stdout.write('\nSlowest jobscraper modules (cumulative):')
+        for name, cumulative in sorted(package, key=lambda item: item[1], reverse=True)[:10]:
+            self.stdout.write(f'  {name:<45} {cumulative / 1000:8.1f} ms')
+
+        heavy = [name.strip() for name, _, _ in imports if name.strip().split('.')[0] in ('nltk', 'numpy', 'pandas', 'torch')]
+        if heavy:
+            self.stdout.write(self.style.WARNING(f'\nHeavy packages imported at startup: {", ".join(sorted(set(n.split(".")[0] for n in heavy)))}'))
+
+        max_ms = options['max_import_ms']
+        if max_ms is not None and package_ms > max_ms:
+            raise CommandError(f'jobscraper imports took {package_ms:.1f} ms (limit {max_ms:.1f} ms)')
@@ -2,8 +2,8 @@ import logging
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from datetime import timedelta
+from jobscraper.expiry import JobExpiry
 from jobscraper.models import JobPosting
-from jobapplier.models import JobApplication
 
 logger = logging.getLogger(__name__)
 
@@ -12,11 +12,16 @@ class Command(BaseCommand):
     """
     Clear expired or old job postings from the database.
     
+    Jobs are copied into the JobArchive table and deleted in chunks, one
+    transaction per chunk (see jobscraper.expiry); an interrupted run can
+    simply be started again.
+    
     Usage:
         python manage.py clear_expired_jobs --days 30        # Remove jobs older than 30 days
         python manage.py clear_expired_jobs --all            # Remove all jobs
         python manage.py clear_expired_jobs --inactive       # Remove only inactive jobs
         python manage.py clear_expired_jobs --dry-run        # Preview what would be deleted
+        python manage.py clear_expired_jobs --no-archive     # Delete without archiving
     """
     
     help = 'Clear expired job postings from the database'
@@ -52,9 +57,30 @@ class Command(BaseCommand):
             action='store_true',
             help='Keep jobs that have applications'
         )
+        
+        parser.add_argument(
+            '--no-archive',
+            action='store_true',
+            help='Delete jobs without copying them into the archive table'
+        )
+        
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='Jobs removed per transaction (default: JOBSCRAPER_EXPIRY_CHUNK_SIZE)'
+        )
+        
+        parser.add_argument(
+            '--noinput', '--no-input',
+            action='store_false',
+            dest='interactive',
+            help='Do not ask for confirmation (for scheduled runs)'
+        )
     
     def handle(self, *args, **options):
         dry_run = options['dry_run']
+        expiry = JobExpiry(chunk_size=options['chunk_size'])
         
         # Build query
         jobs_query = JobPosting.objects.all()
@@ -71,13 +97,11 @@ class Command(BaseCommand):
         
         # Optionally keep jobs with applications
         if options['keep_applications']:
-            # Get job IDs that have applications
-            applied_job_ids = JobApplication.objects.values_list('job_id', flat=True).distinct()
-            jobs_query = jobs_query.exclude(id__in=applied_job_ids)
             self.stdout.write('✅ Keeping jobs that have applications')
         
         # Get count before deletion
-        total_count = jobs_query.count()
+        cold_jobs = expiry.cold_jobs(jobs_query, options['keep_applications'])
+        total_count = cold_jobs.count()
         
         if total_count == 0:
             self.stdout.write('✅ No jobs found matching the criteria')
@@ -88,7 +112,7 @@ class Command(BaseCommand):
             self.stdout.write(f'🔍 DRY RUN: Would delete {total_count} job postings')
             
             # Show some examples
-            sample_jobs = jobs_query[:5]
+            sample_jobs = cold_jobs[:5]
             for job in sample_jobs:
                 self.stdout.write(f'  - {job.title} at {job.company} (scraped: {job.date_scraped})')
             
@@ -98,7 +122,7 @@ class Command(BaseCommand):
             return
         
         # Confirm deletion for large numbers
-        if total_count > 100 and not options['all']:
+        if total_count > 100 and not options['all'] and options['interactive']:
             confirm = input(f'⚠️  About to delete {total_count} jobs. Continue? (yes/no): ')
             if confirm.lower() != 'yes':
                 self.stdout.write('❌ Operation cancelled')
@@ -106,17 +130,25 @@ class Command(BaseCommand):
         
         # Perform deletion
         try:
-            deleted_count, deleted_details = jobs_query.delete()
+            results = expiry.archive(
+                jobs_query,
+                keep_applications=options['keep_applications'],
+                archive=not options['no_archive'],
+            )
             
             self.stdout.write(
-                self.style.SUCCESS(f'✅ Successfully deleted {deleted_count} job postings')
+                self.style.SUCCESS(
+                    f"✅ Successfully deleted {results['deleted']} job postings "
+                    f"({results['archived']} archived)"
+                )
             )
             
             # Show detailed breakdown
-            for model, count in deleted_details.items():
+            for model, count in results['related'].items():
                 if count > 0:
                     self.stdout.write(f'  - {model}: {count} records')
             
         except Exception as e:
             self.stderr.write(f'❌ Error deleting jobs: {str(e)}')
+            self.stderr.write('Jobs removed before the error stay removed; run the command again to continue')
             logger.exception('Failed to delete expired jobs')
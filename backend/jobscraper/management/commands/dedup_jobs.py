@@ -0,0 +1,75 @@
+import logging
+from django.core.management.base import BaseCommand
+from jobscraper.dedup import DuplicateIndex
+from jobscraper.facets import reconcile_facets
+from jobscraper.models import JobPosting
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Index stored job postings for near-duplicate detection.
+    
+    Jobs are indexed as they are saved; this backfills postings saved before
+    detection was enabled, or re-indexes after a threshold change.
+    
+    Usage:
+        python manage.py dedup_jobs                    # Index jobs without a signature
+        python manage.py dedup_jobs --rebuild          # Recompute every signature and cluster
+        python manage.py dedup_jobs --threshold 0.9    # Use a stricter similarity threshold
+    """
+    
+    help = 'Detect near-duplicate job postings and link them to a canonical posting'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Jobs indexed per batch (default: 500)'
+        )
+        
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            help='Minimum estimated similarity for a duplicate (default: JOBSCRAPER_DEDUP_THRESHOLD)'
+        )
+        
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='Clear existing signatures and clusters before indexing'
+        )
+    
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        index = DuplicateIndex(threshold=options['threshold'])
+        
+        if options['rebuild']:
+            JobPosting.objects.update(dedup_signature=[], canonical_job=None)
+            index.clear()
+            self.stdout.write('Cleared existing signatures')
+        
+        indexed = 0
+        duplicates = 0
+        last_id = 0
+        while True:
+            jobs = list(
+                JobPosting.objects.filter(id__gt=last_id)
+                .order_by('id')
+                .only('id', 'title', 'company', 'description', 'dedup_signature', 'canonical_job')[:batch_size]
+            )
+            if not jobs:
+                break
+            duplicates += index.index_jobs(jobs)
+            indexed += len(jobs)
+            last_id = jobs[-1].id
+            self.stdout.write(f'Indexed {indexed} jobs, {duplicates} near-duplicates so far')
+        
+        # Bulk updates bypass the incremental facet counters
+        reconcile_facets()
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'Done: {indexed} jobs checked, {duplicates} linked to a canonical posting')
+        )
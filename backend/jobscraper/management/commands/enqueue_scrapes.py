@@ -0,0 +1,63 @@
+import logging
+from django.core.management.base import BaseCommand, CommandError
+from jobscraper.work_queue import SCRAPER_CLASSES, WorkQueue
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Split crawls into work units and add them to the scrape queue.
+    
+    Units are drained by any number of scrape_worker processes. Enqueueing
+    is idempotent: units already pending or running are not duplicated.
+    
+    Usage:
+        python manage.py enqueue_scrapes --all                  # Queue every default source
+        python manage.py enqueue_scrapes --source naukri        # Queue one source
+        python manage.py enqueue_scrapes --status               # Show queue counts only
+    """
+    
+    help = 'Queue crawl work units for scrape_worker processes'
+    
+    # Sources queued by --all (naukri is opt-in, as in scrape_jobs)
+    DEFAULT_SOURCES = ['greenhouse', 'greenhouse_india', 'weworkremotely']
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Queue all default sources'
+        )
+        
+        parser.add_argument(
+            '--source',
+            type=str,
+            choices=sorted(SCRAPER_CLASSES),
+            help='Queue a single source'
+        )
+        
+        parser.add_argument(
+            '--status',
+            action='store_true',
+            help='Show unit counts by source and status'
+        )
+    
+    def handle(self, *args, **options):
+        queue = WorkQueue()
+        
+        if options['all']:
+            sources = self.DEFAULT_SOURCES
+        elif options['source']:
+            sources = [options['source']]
+        elif options['status']:
+            sources = []
+        else:
+            raise CommandError('No sources specified. Use --all or --source <source_name>')
+        
+        for source in sources:
+            self.stdout.write(f'{source}: {queue.enqueue_crawl(source)} units queued')
+        
+        for source, counts in sorted(queue.stats().items()):
+            summary = ', '.join(f'{status}={count}' for status, count in sorted(counts.items()))
+            self.stdout.write(f'  {source}: {summary}')
@@ -13,6 +13,7 @@ import asyncio
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from datetime import timedelta
+from jobscraper.expiry import JobExpiry
 from jobscraper.models import JobPosting
 from jobapplier.models import JobApplication
 from jobscraper.scrapers.greenhouse import GreenhouseScraper
@@ -175,7 +176,7 @@ class Command(BaseCommand):
             return
         
         # Deactivate instead of delete to preserve application history
-        updated = expired_jobs.update(is_active=False, date_deactivated=timezone.now())
+        updated = JobExpiry().deactivate(JobPosting.objects.all(), cutoff_date)
         self.stdout.write(f'✅ Deactivated {updated} expired jobs')
     
     def scrape_fresh_jobs(self, options: dict, dry_run: bool) -> list:
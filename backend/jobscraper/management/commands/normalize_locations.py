@@ -0,0 +1,69 @@
+import logging
+from django.core.management.base import BaseCommand
+from jobscraper.facets import reconcile_facets
+from jobscraper.locations import LOCATION_FIELDS, normalize_location, reset_gazetteer
+from jobscraper.models import JobPosting
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Normalize stored job locations into country_code, region, city and is_remote.
+    
+    Jobs are normalized as they are saved; this backfills postings saved before
+    the fields existed, or re-normalizes after the gazetteer or the
+    fyndr_auth Location table changed.
+    
+    Usage:
+        python manage.py normalize_locations
+        python manage.py normalize_locations --batch-size 2000
+    """
+    
+    help = 'Normalize job locations into structured, indexed location fields'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Jobs normalized per batch (default: 1000)'
+        )
+    
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        reset_gazetteer()
+        
+        checked = 0
+        updated = 0
+        last_id = 0
+        while True:
+            jobs = list(
+                JobPosting.objects.filter(id__gt=last_id)
+                .order_by('id')
+                .only('id', 'location', *LOCATION_FIELDS)[:batch_size]
+            )
+            if not jobs:
+                break
+            
+            changed = []
+            for job in jobs:
+                info = normalize_location(job.location)
+                if tuple(getattr(job, field) for field in LOCATION_FIELDS) != info:
+                    for field, value in zip(LOCATION_FIELDS, info):
+                        setattr(job, field, value)
+                    changed.append(job)
+            if changed:
+                JobPosting.objects.bulk_update(changed, LOCATION_FIELDS)
+            
+            checked += len(jobs)
+            updated += len(changed)
+            last_id = jobs[-1].id
+            self.stdout.write(f'Checked {checked} jobs, {updated} updated so far')
+        
+        # Bulk updates bypass the incremental facet counters
+        reconcile_facets()
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'Done: {checked} jobs checked, {updated} locations updated')
+        )
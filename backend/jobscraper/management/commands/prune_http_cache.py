@@ -0,0 +1,43 @@
+import logging
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from jobscraper.http_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Delete old entries from the conditional-request cache.
+    
+    Scrapers prune the cache after each completed run; run this on a
+    schedule when sources are scraped through work units, or to apply
+    tighter limits once.
+    
+    Usage:
+        python manage.py prune_http_cache                    # Limits from settings
+        python manage.py prune_http_cache --max-age-days 7   # Entries not refetched for a week
+        python manage.py prune_http_cache --max-entries 5000
+    """
+    
+    help = 'Delete HTTP cache entries past the age and entry limits'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-age-days',
+            type=float,
+            default=getattr(settings, 'JOBSCRAPER_HTTP_CACHE_MAX_AGE_DAYS', None),
+            help='Delete entries not written for this many days (default: JOBSCRAPER_HTTP_CACHE_MAX_AGE_DAYS)'
+        )
+        
+        parser.add_argument(
+            '--max-entries',
+            type=int,
+            default=getattr(settings, 'JOBSCRAPER_HTTP_CACHE_MAX_ENTRIES', None),
+            help='Keep at most this many entries (default: JOBSCRAPER_HTTP_CACHE_MAX_ENTRIES)'
+        )
+    
+    def handle(self, *args, **options):
+        cache = ResponseCache(settings.JOBSCRAPER_HTTP_CACHE_DIR)
+        removed = cache.prune(max_age_days=options['max_age_days'], max_entries=options['max_entries'])
+        self.stdout.write(self.style.SUCCESS(f'Pruned {removed} cache files from {cache.cache_dir}'))
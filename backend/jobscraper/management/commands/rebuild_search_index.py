@@ -0,0 +1,47 @@
+import logging
+from django.core.management.base import BaseCommand
+from jobscraper.search import drop_search_index, install_search_index
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Create (or re-create) the job full-text search index.
+    
+    The index is kept up to date by the database on every write; run this
+    after setting up a database without migrations, or with --drop to
+    rebuild it from scratch.
+    
+    Usage:
+        python manage.py rebuild_search_index           # Create if missing and index all jobs
+        python manage.py rebuild_search_index --drop    # Drop and re-create the index
+    """
+    
+    help = 'Create or rebuild the full-text search index for job postings'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='Database alias (default: default)'
+        )
+        
+        parser.add_argument(
+            '--drop',
+            action='store_true',
+            help='Drop the existing index first'
+        )
+    
+    def handle(self, *args, **options):
+        using = options['database']
+        
+        if options['drop']:
+            drop_search_index(using)
+            self.stdout.write('Dropped the search index')
+        
+        backend = install_search_index(using)
+        if backend is None:
+            self.stdout.write(self.style.WARNING('This database has no full-text support; search uses icontains'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Search index ready ({backend})'))
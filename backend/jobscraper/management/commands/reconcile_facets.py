@@ -0,0 +1,36 @@
+import logging
+from django.core.management.base import BaseCommand
+from jobscraper.facets import reconcile_facets
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Recount the job facet counters from the job table.
+    
+    The counters are updated as jobs are saved and deactivated; this
+    corrects drift from writes that bypass the scraping service (admin
+    edits, scripts, concurrent writers). Run it periodically, e.g. nightly.
+    
+    Usage:
+        python manage.py reconcile_facets
+    """
+    
+    help = 'Recount job facet counters (stats and filter options) from the job table'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='Database alias (default: default)'
+        )
+    
+    def handle(self, *args, **options):
+        results = reconcile_facets(options['database'])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Facet counters reconciled: {results['created']} created, "
+                f"{results['updated']} corrected, {results['deleted']} removed"
+            )
+        )
@@ -0,0 +1,29 @@
+import logging
+from django.core.management.base import BaseCommand
+from jobscraper.skill_taxonomy import reload_taxonomy
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the skill taxonomy in every process.
+
+    Processes pick up a changed taxonomy file by themselves; run this after
+    editing the Skill table (with JOBSCRAPER_SKILL_TAXONOMY_USE_SKILL_TABLE
+    set). Stored skill vectors of the old version are re-derived on first
+    use, or ahead of time with refresh_skill_vectors.
+
+    Usage:
+        python manage.py reload_skill_taxonomy
+    """
+
+    help = 'Rebuild the skill taxonomy shared by the job parsers and matching engine'
+
+    def handle(self, *args, **options):
+        taxonomy = reload_taxonomy()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Skill taxonomy reloaded: {len(taxonomy)} skills, version {taxonomy.version}"
+            )
+        )
@@ -1032,7 +1032,7 @@ class Command(BaseCommand):
             
             # Report final statistics
             total_jobs = JobPosting.objects.count()
-            india_jobs = JobPosting.objects.filter(location__icontains='India').count()
+            india_jobs = JobPosting.objects.filter(country_code='IN').count()
             
             self.stdout.write(
                 self.style.SUCCESS(
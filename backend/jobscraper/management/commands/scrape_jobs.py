@@ -1,10 +1,6 @@
 import logging
 from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
-from jobscraper.scrapers.greenhouse import GreenhouseScraper
-from jobscraper.scrapers.greenhouse_india import GreenhouseIndiaScraper
-from jobscraper.scrapers.weworkremotely import WeWorkRemotelyScraper
-# from jobscraper.scrapers.naukri import NaukriScraper  # Temporarily disabled
 from jobscraper.services import JobScrapingService
 
 
@@ -25,6 +21,8 @@ class Command(BaseCommand):
         python manage.py scrape_jobs --source greenhouse      # Run specific scraper
         python manage.py scrape_jobs --source weworkremotely  # Run specific scraper
         python manage.py scrape_jobs --deactivate-old         # Deactivate old jobs too
+        python manage.py scrape_jobs --all --bulk             # Save with bulk upserts
+        python manage.py scrape_jobs --all --incremental      # Only fetch and save new jobs
     """
     
     help = 'Scrape job postings from various sources and store them in the database'
@@ -61,6 +59,78 @@ class Command(BaseCommand):
             action='store_true',
             help='Enable verbose logging'
         )
+        
+        parser.add_argument(
+            '--bulk',
+            action='store_true',
+            help='Save jobs with set-based bulk upserts instead of one row at a time'
+        )
+        
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Rows per batch for --bulk saves (default: JOBSCRAPER_BULK_BATCH_SIZE)'
+        )
+        
+        parser.add_argument(
+            '--async-fetch',
+            action='store_true',
+            help='Fetch pages concurrently with per-host rate limits'
+        )
+        
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=None,
+            help='Requests in flight for --async-fetch (default: JOBSCRAPER_FETCH_CONCURRENCY)'
+        )
+        
+        parser.add_argument(
+            '--http-cache',
+            action='store_true',
+            help='Send conditional requests and skip jobs whose source pages are unchanged'
+        )
+        
+        parser.add_argument(
+            '--stream',
+            action='store_true',
+            help='Save jobs in chunks while later pages are still being fetched'
+        )
+        
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='Jobs per chunk for --stream (default: JOBSCRAPER_STREAM_CHUNK_SIZE)'
+        )
+        
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Worker processes for parsing job content (default: JOBSCRAPER_NORMALIZE_WORKERS)'
+        )
+        
+        parser.add_argument(
+            '--parse-cache',
+            type=str,
+            default=None,
+            choices=['local', 'django', 'sqlite', 'off'],
+            help='Parse result cache backend (default: JOBSCRAPER_PARSE_CACHE)'
+        )
+        
+        crawl_mode = parser.add_mutually_exclusive_group()
+        crawl_mode.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Skip jobs seen by earlier runs and stop paginating at known results'
+        )
+        crawl_mode.add_argument(
+            '--full',
+            action='store_true',
+            help='Crawl every source in full even if JOBSCRAPER_INCREMENTAL is set'
+        )
     
     def handle(self, *args, **options):
         """Main command handler."""
@@ -84,6 +154,27 @@ class Command(BaseCommand):
         for scraper_name, scraper in scrapers_to_run.items():
             self.stdout.write(f'\\nRunning {scraper_name} scraper...')
             
+            scraper.bulk_save = options['bulk']
+            scraper.save_batch_size = options['batch_size']
+            if options['async_fetch']:
+                scraper.async_fetch = True
+            if options['concurrency']:
+                scraper.fetch_concurrency = options['concurrency']
+            if options['http_cache']:
+                scraper.use_http_cache = True
+            if options['stream']:
+                scraper.stream = True
+            if options['chunk_size']:
+                scraper.stream_chunk_size = options['chunk_size']
+            if options['workers'] is not None:
+                scraper.normalize_workers = options['workers']
+            if options['parse_cache']:
+                scraper.parse_cache_backend = '' if options['parse_cache'] == 'off' else options['parse_cache']
+            if options['incremental']:
+                scraper.incremental = True
+            elif options['full']:
+                scraper.incremental = False
+            
             try:
                 if options['dry_run']:
                     results = self._dry_run_scraper(scraper)
@@ -116,6 +207,12 @@ class Command(BaseCommand):
         Returns:
             Dictionary of {scraper_name: scraper_instance}
         """
+        # Imported here so --help and argument errors skip the scraping stack
+        from jobscraper.scrapers.greenhouse import GreenhouseScraper
+        from jobscraper.scrapers.greenhouse_india import GreenhouseIndiaScraper
+        from jobscraper.scrapers.weworkremotely import WeWorkRemotelyScraper
+        # from jobscraper.scrapers.naukri import NaukriScraper  # Temporarily disabled
+        
         available_scrapers = {
             'greenhouse': GreenhouseScraper(),
             'greenhouse_india': GreenhouseIndiaScraper(),
@@ -143,18 +240,27 @@ class Command(BaseCommand):
         """
         self.stdout.write('  [DRY RUN] Fetching job data...')
         
+        # Don't let a dry run refresh the cache, or the next real run would
+        # treat everything it saw as unchanged and never save it
+        scraper.use_http_cache = False
+        scraper.incremental = False
+        
         # Fetch and parse data but don't save
-        raw_data = scraper.fetch_data_for_scraping()
-        job_list = scraper.parse_data(raw_data)
+        try:
+            raw_data = scraper.fetch_data_for_scraping()
+            job_list = scraper.parse_data(raw_data)
+        finally:
+            scraper.close_fetcher()
         
-        normalized_jobs = []
-        for job_data in job_list:
-            try:
-                normalized_job = scraper.normalize_job(job_data)
-                normalized_jobs.append(normalized_job)
-            except Exception as e:
-                logger.warning(f"Failed to normalize job: {str(e)}")
-                continue
+        try:
+            normalized_jobs = scraper.normalize_jobs(job_list)
+            enricher = scraper._enricher
+            parse_cache_stats = {
+                'parse_cache_hits': enricher.cache_hits if enricher else 0,
+                'parse_cache_misses': enricher.cache_misses if enricher else 0,
+            }
+        finally:
+            scraper.close_enricher()
         
         # Return mock results
         return {
@@ -162,7 +268,8 @@ class Command(BaseCommand):
             'created': len(normalized_jobs),  # Would be created
             'updated': 0,
             'skipped': 0,
-            'errors': 0
+            'errors': 0,
+            **parse_cache_stats
         }
     
     def _deactivate_old_jobs(self, scraper_names):
@@ -189,7 +296,16 @@ class Command(BaseCommand):
         self.stdout.write(f'    Created: {results.get("created", 0)}')
         self.stdout.write(f'    Updated: {results.get("updated", 0)}')
         self.stdout.write(f'    Skipped: {results.get("skipped", 0)}')
+        self.stdout.write(f'    Unchanged: {results.get("unchanged", 0)}')
         self.stdout.write(f'    Errors: {results.get("errors", 0)}')
+        self._display_parse_cache(results, indent='    ')
+    
+    def _display_parse_cache(self, results, indent=''):
+        """Display parse cache hits and hit rate, if the cache was used."""
+        hits = results.get('parse_cache_hits', 0)
+        lookups = hits + results.get('parse_cache_misses', 0)
+        if lookups:
+            self.stdout.write(f'{indent}Parse cache: {hits}/{lookups} hits ({hits / lookups * 100:.1f}%)')
     
     def _display_summary(self, total_results):
         """Display overall summary of all scrapers."""
@@ -211,6 +327,10 @@ class Command(BaseCommand):
         self.stdout.write(f'Total updated: {total_updated}')
         self.stdout.write(f'Total skipped: {total_skipped}')
         self.stdout.write(f'Total errors: {total_errors}')
+        self._display_parse_cache({
+            'parse_cache_hits': sum(r.get('parse_cache_hits', 0) for r in total_results.values()),
+            'parse_cache_misses': sum(r.get('parse_cache_misses', 0) for r in total_results.values()),
+        })
         
         # Success rate
         if grand_total > 0:
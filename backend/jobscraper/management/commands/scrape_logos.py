@@ -2,15 +2,15 @@
 Management command to scrape company logos for existing jobs.
 
 This command processes existing job postings and attempts to find
-company logos using various strategies.
+company logos using various strategies. Each company is resolved once
+(results are cached in CompanyLogo) and its postings are updated in bulk.
 """
 
-from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.core.management.base import BaseCommand
 from jobscraper.models import JobPosting
-from jobscraper.logo_scraper import scrape_company_logo
+from jobscraper.logo_resolver import LogoResolver
+from jobscraper.logo_scraper import logo_scraper
 import logging
-import time
 
 
 logger = logging.getLogger(__name__)
@@ -50,7 +50,18 @@ class Command(BaseCommand):
             '--delay',
             type=float,
             default=1.0,
-            help='Delay between requests in seconds (default: 1.0)'
+            help='Delay between page fetches from the same host in seconds (default: 1.0)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Companies resolved concurrently (default: JOBSCRAPER_LOGO_WORKERS)'
+        )
+        parser.add_argument(
+            '--refresh',
+            action='store_true',
+            help='Ignore cached lookups and resolve every company again'
         )
 
     def handle(self, *args, **options):
@@ -78,10 +89,11 @@ class Command(BaseCommand):
         total_jobs = query.count()
         
         if options['limit']:
-            query = query[:options['limit']]
+            query = JobPosting.objects.filter(id__in=list(query.values_list('id', flat=True)[:options['limit']]))
             total_jobs = min(total_jobs, options['limit'])
         
-        self.stdout.write(f"📊 Found {total_jobs} jobs to process")
+        total_companies = query.values('company').distinct().count()
+        self.stdout.write(f"📊 Found {total_jobs} jobs from {total_companies} companies to process")
         
         if options['dry_run']:
             self.stdout.write(self.style.WARNING("🔍 DRY RUN MODE - No changes will be made"))
@@ -97,71 +109,31 @@ class Command(BaseCommand):
             
             return
         
-        # Process jobs
-        processed = 0
-        found_logos = 0
-        failed = 0
+        logo_scraper.request_delay = options['delay']
+        resolver = LogoResolver(workers=options['workers'])
         
         try:
-            for job in query.iterator():
-                try:
-                    self.stdout.write(
-                        f"🔍 Processing {job.company} - {job.title[:50]}...",
-                        ending=''
-                    )
-                    
-                    # Scrape company logo
-                    logo_url = scrape_company_logo(job.company, job.url)
-                    
-                    if logo_url:
-                        if not options['dry_run']:
-                            with transaction.atomic():
-                                job.company_logo = logo_url
-                                job.save(update_fields=['company_logo'])
-                        
-                        found_logos += 1
-                        self.stdout.write(
-                            self.style.SUCCESS(f" ✅ Found logo: {logo_url[:60]}...")
-                        )
-                    else:
-                        self.stdout.write(
-                            self.style.WARNING(" ❌ No logo found")
-                        )
-                    
-                    processed += 1
-                    
-                    # Rate limiting
-                    if options['delay'] > 0:
-                        time.sleep(options['delay'])
-                    
-                    # Progress update every 10 jobs
-                    if processed % 10 == 0:
-                        self.stdout.write(
-                            f"📊 Progress: {processed}/{total_jobs} processed, "
-                            f"{found_logos} logos found"
-                        )
-                
-                except Exception as e:
-                    failed += 1
-                    self.stdout.write(
-                        self.style.ERROR(f" ❌ Error: {str(e)}")
-                    )
-                    logger.error(f"Failed to process job {job.id}: {e}")
-                    
+            counts = resolver.backfill(
+                query,
+                update_existing=options['update_existing'],
+                refresh=options['refresh'],
+            )
         except KeyboardInterrupt:
             self.stdout.write(
                 self.style.WARNING("\n⏹️ Interrupted by user")
             )
+            return
         
         # Final summary
         self.stdout.write("\n" + "="*50)
         self.stdout.write(
             self.style.SUCCESS(f"✅ Logo scraping completed!")
         )
-        self.stdout.write(f"📊 Total processed: {processed}")
-        self.stdout.write(f"🎯 Logos found: {found_logos}")
-        self.stdout.write(f"❌ Failed: {failed}")
+        self.stdout.write(f"📊 Companies processed: {counts['companies']}")
+        self.stdout.write(f"🌐 Resolved: {resolver.resolved}, from cache: {resolver.cache_hits}")
+        self.stdout.write(f"🎯 Logos found: {counts['found']}")
+        self.stdout.write(f"📝 Jobs updated: {counts['updated']}")
         
-        if found_logos > 0:
-            success_rate = (found_logos / processed) * 100 if processed > 0 else 0
+        if counts['companies'] > 0:
+            success_rate = (counts['found'] / counts['companies']) * 100
             self.stdout.write(f"📈 Success rate: {success_rate:.1f}%")
@@ -0,0 +1,72 @@
+import logging
+from django.core.management.base import BaseCommand
+from jobscraper.work_queue import SCRAPER_CLASSES, ScrapeWorker, WorkQueue
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Drain the scrape work queue.
+    
+    Run as many workers as needed, on one host or several sharing the
+    database. Units leased by a worker that dies are picked up by the others
+    once their lease expires.
+    
+    Usage:
+        python manage.py scrape_worker                       # Run until the queue is empty
+        python manage.py scrape_worker --idle-timeout 600    # Keep polling for 10 minutes
+        python manage.py scrape_worker --source naukri --max-units 100
+    """
+    
+    help = 'Process crawl work units from the scrape queue'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source',
+            action='append',
+            choices=sorted(SCRAPER_CLASSES),
+            help='Only process units of this source (repeatable)'
+        )
+        
+        parser.add_argument(
+            '--max-units',
+            type=int,
+            default=None,
+            help='Exit after processing this many units'
+        )
+        
+        parser.add_argument(
+            '--idle-timeout',
+            type=float,
+            default=0,
+            help='Seconds to keep polling an empty queue before exiting (default: exit when empty)'
+        )
+        
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=5,
+            help='Seconds between polls of an empty queue (default: 5)'
+        )
+        
+        parser.add_argument(
+            '--worker-id',
+            type=str,
+            default=None,
+            help='Name recorded on leased units (default: host:pid)'
+        )
+    
+    def handle(self, *args, **options):
+        worker = ScrapeWorker(WorkQueue(worker_id=options['worker_id']), sources=options['source'])
+        self.stdout.write(f'Worker {worker.queue.worker_id} started')
+        
+        counts = worker.run(
+            max_units=options['max_units'],
+            idle_timeout=options['idle_timeout'],
+            poll_interval=options['poll_interval'],
+        )
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'Processed {counts["completed"]} units ({counts["failed"]} failed)')
+        )
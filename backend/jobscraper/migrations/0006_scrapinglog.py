@@ -0,0 +1,34 @@
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobscraper', '0005_jobposting_recruiter_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScrapingLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(help_text='Source identifier that was scraped', max_length=50)),
+                ('status', models.CharField(choices=[('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='running', max_length=20)),
+                ('started_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('jobs_found', models.PositiveIntegerField(default=0, help_text='Jobs parsed from the source')),
+                ('jobs_created', models.PositiveIntegerField(default=0)),
+                ('jobs_updated', models.PositiveIntegerField(default=0)),
+                ('jobs_unchanged', models.PositiveIntegerField(default=0, help_text='Jobs skipped because their source response was unchanged')),
+                ('errors_count', models.PositiveIntegerField(default=0)),
+                ('error_details', models.TextField(blank=True, null=True)),
+                ('cache_hits', models.PositiveIntegerField(default=0, help_text='Fetches answered as unchanged (304 or identical body)')),
+                ('cache_misses', models.PositiveIntegerField(default=0, help_text='Fetches that returned new content')),
+            ],
+            options={
+                'ordering': ['-started_at'],
+                'indexes': [models.Index(fields=['source', 'started_at'], name='jobscraper__source_bce940_idx')],
+            },
+        ),
+    ]
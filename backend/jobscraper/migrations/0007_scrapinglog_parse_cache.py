@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobscraper', '0006_scrapinglog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scrapinglog',
+            name='parse_cache_hits',
+            field=models.PositiveIntegerField(default=0, help_text='Descriptions whose parse result was served from the parse cache'),
+        ),
+        migrations.AddField(
+            model_name='scrapinglog',
+            name='parse_cache_misses',
+            field=models.PositiveIntegerField(default=0, help_text='Descriptions that had to be parsed'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobscraper', '0007_scrapinglog_parse_cache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobposting',
+            name='dedup_signature',
+            field=models.JSONField(blank=True, default=list, help_text='MinHash signature of title, company and description shingles'),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='canonical_job',
+            field=models.ForeignKey(blank=True, help_text='Canonical posting this one duplicates (empty if this is the canonical posting)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='duplicates', to='jobscraper.jobposting'),
+        ),
+        migrations.CreateModel(
+            name='JobSignatureBand',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.BigIntegerField(db_index=True, help_text='Hash of the band number and its signature rows')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='signature_bands', to='jobscraper.jobposting')),
+            ],
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobscraper', '0008_jobposting_dedup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScrapeWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(help_text='Source identifier', max_length=50)),
+                ('scope', models.CharField(blank=True, default='', help_text='Board, search or category within the source', max_length=255)),
+                ('last_posted_at', models.DateTimeField(blank=True, help_text='Newest posting/update timestamp seen in this scope', null=True)),
+                ('seen_ids', models.JSONField(blank=True, default=list, help_text='Most recently seen job ids (or URLs), oldest first')),
+                ('cursor', models.JSONField(blank=True, help_text='Position (page, offset, ...) reached by the last successful run', null=True)),
+                ('last_success_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['source', 'scope'],
+                'unique_together': {('source', 'scope')},
+            },
+        ),
+    ]
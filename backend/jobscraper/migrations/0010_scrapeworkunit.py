@@ -0,0 +1,43 @@
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobscraper', '0009_scrapewatermark'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScrapeWorkUnit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(help_text='Source identifier', max_length=50)),
+                ('kind', models.CharField(help_text='Unit type: board, search, detail, ...', max_length=20)),
+                ('key', models.CharField(help_text='Hash of kind and payload; one unit per key', max_length=64)),
+                ('payload', models.JSONField(blank=True, default=dict, help_text='Scraper-specific unit parameters')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('leased', 'Leased'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('max_attempts', models.PositiveIntegerField(default=5)),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Not leased before this time (retry backoff)')),
+                ('leased_by', models.CharField(blank=True, default='', max_length=255)),
+                ('lease_token', models.CharField(blank=True, default='', max_length=32)),
+                ('lease_expires_at', models.DateTimeField(blank=True, null=True)),
+                ('heartbeat_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('result', models.JSONField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['available_at', 'id'],
+                'unique_together': {('source', 'kind', 'key')},
+                'indexes': [
+                    models.Index(fields=['status', 'available_at'], name='jobscraper__status_b8c6fb_idx'),
+                    models.Index(fields=['status', 'lease_expires_at'], name='jobscraper__status_1bcfb3_idx'),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobscraper', '0010_scrapeworkunit'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scrapinglog',
+            name='host_stats',
+            field=models.JSONField(blank=True, default=dict, help_text='Per-host request outcomes, latency histograms and circuit state'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobscraper', '0011_scrapinglog_host_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompanyLogo',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('company_key', models.CharField(help_text='Normalized company name', max_length=255, unique=True)),
+                ('company', models.CharField(help_text='Company name as first seen', max_length=255)),
+                ('domain', models.CharField(blank=True, default='', help_text='Guessed company domain', max_length=255)),
+                ('logo_url', models.URLField(blank=True, help_text='Logo found, or empty for a cached miss', null=True)),
+                ('strategy', models.CharField(blank=True, default='', help_text='Lookup strategy that found the logo', max_length=30)),
+                ('resolved_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('expires_at', models.DateTimeField(help_text='Looked up again after this time')),
+            ],
+            options={
+                'ordering': ['company_key'],
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations
+
+
+def install(apps, schema_editor):
+    from jobscraper.search import install_search_index
+
+    install_search_index(schema_editor.connection.alias)
+
+
+def drop(apps, schema_editor):
+    from jobscraper.search import drop_search_index
+
+    drop_search_index(schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobscraper', '0012_companylogo'),
+    ]
+
+    operations = [
+        # tsvector column + GIN index on PostgreSQL, FTS5 table + triggers on SQLite
+        migrations.RunPython(install, drop),
+    ]
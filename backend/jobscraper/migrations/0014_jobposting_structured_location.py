@@ -0,0 +1,39 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobscraper', '0013_jobposting_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobposting',
+            name='country_code',
+            field=models.CharField(blank=True, default='', help_text='ISO 3166-1 alpha-2 country code of the location', max_length=2),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='region',
+            field=models.CharField(blank=True, default='', help_text='State or province of the location', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='city',
+            field=models.CharField(blank=True, default='', help_text='Canonical city name of the location', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='is_remote',
+            field=models.BooleanField(default=False, help_text='Whether the location allows remote work'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['country_code', 'city'], name='jobscraper__country_1eb9a7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['is_remote'], name='jobscraper__is_remo_0d51c8_idx'),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobscraper', '0014_jobposting_structured_location'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['is_active', 'date_posted', 'date_scraped', 'id'], name='jobscraper__is_acti_8638eb_idx'),
+        ),
+    ]
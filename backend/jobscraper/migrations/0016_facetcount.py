@@ -0,0 +1,34 @@
+from django.db import migrations, models
+
+
+def reconcile(apps, schema_editor):
+    from jobscraper.facets import reconcile_facets
+
+    reconcile_facets(schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobscraper', '0015_jobposting_feed_keyset_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FacetCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(help_text='Source identifier', max_length=50)),
+                ('facet', models.CharField(help_text='Facet name: company, location, country, status, ...', max_length=30)),
+                ('value', models.CharField(blank=True, default='', help_text="Facet value ('' when unset)", max_length=255)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('revision', models.PositiveIntegerField(default=1, help_text='Bumped on every change; versions cached payloads')),
+            ],
+            options={
+                'ordering': ['facet', '-count'],
+                'unique_together': {('facet', 'value', 'source')},
+            },
+        ),
+        # Initial counts for the jobs already stored
+        migrations.RunPython(reconcile, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobscraper', '0016_facetcount'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_id', models.BigIntegerField(help_text='Id the posting had', unique=True)),
+                ('external_id', models.CharField(max_length=255)),
+                ('source', models.CharField(help_text='Source identifier', max_length=50)),
+                ('title', models.CharField(max_length=255)),
+                ('company', models.CharField(max_length=255)),
+                ('date_posted', models.DateField(blank=True, null=True)),
+                ('date_scraped', models.DateTimeField(help_text='When the posting was last scraped')),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('data', models.BinaryField(help_text="zlib-compressed JSON of the posting's columns")),
+            ],
+            options={
+                'ordering': ['-archived_at'],
+                'indexes': [models.Index(fields=['source', 'external_id'], name='jobscraper__source_39ea0d_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobscraper', '0017_jobarchive'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobposting',
+            name='skill_ids',
+            field=models.JSONField(blank=True, default=list, help_text='Sorted ids of the canonical skills the job requires, repeats kept'),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='skill_version',
+            field=models.PositiveIntegerField(default=0, help_text='Version of the skill rules skill_ids was derived with (0 if never derived)'),
+        ),
+    ]
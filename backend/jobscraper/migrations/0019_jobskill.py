@@ -0,0 +1,25 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobscraper', '0018_jobposting_skill_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill_id', models.PositiveIntegerField(help_text='Canonical skill id in the skill taxonomy')),
+                ('weight', models.FloatField(help_text="Share of the job's skill requirements")),
+                ('skill_version', models.PositiveIntegerField(help_text='Skill taxonomy version of skill_id')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_entries', to='jobscraper.jobposting')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['skill_version', 'skill_id'], name='jobscraper__skill_v_13cf2c_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobscraper', '0019_jobskill'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scrapeworkunit',
+            name='rerun',
+            field=models.BooleanField(default=False, help_text='Enqueued again while leased: re-opened instead of done when completed'),
+        ),
+    ]
@@ -1,9 +1,18 @@
 from django.db import models
 from django.conf import settings
 from django.utils import timezone
+import copy
 import hashlib
 
 
+class JobPostingQuerySet(models.QuerySet):
+    """QuerySet helpers for job postings."""
+    
+    def canonical(self):
+        """Exclude postings that are near-duplicates of another posting."""
+        return self.filter(canonical_job__isnull=True)
+
+
 class JobPosting(models.Model):
     """
     Comprehensive model to store job postings with extensive metadata.
@@ -30,6 +39,29 @@ class JobPosting(models.Model):
         null=True, 
         help_text="Job location (can be 'Remote', city, etc.)"
     )
+    # Structured location, normalized from location on save (see jobscraper.locations)
+    country_code = models.CharField(
+        max_length=2,
+        blank=True,
+        default='',
+        help_text="ISO 3166-1 alpha-2 country code of the location"
+    )
+    region = models.CharField(
+        max_length=100,
+        blank=True,
+        default='',
+        help_text="State or province of the location"
+    )
+    city = models.CharField(
+        max_length=100,
+        blank=True,
+        default='',
+        help_text="Canonical city name of the location"
+    )
+    is_remote = models.BooleanField(
+        default=False,
+        help_text="Whether the location allows remote work"
+    )
     url = models.URLField(help_text="Direct link to the job posting")
     # New unified model fields
     SOURCE_TYPE_CHOICES = [
@@ -358,6 +390,34 @@ class JobPosting(models.Model):
         help_text="Raw scraped data for debugging"
     )
     
+    # Near-duplicate detection (see jobscraper.dedup)
+    dedup_signature = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="MinHash signature of title, company and description shingles"
+    )
+    canonical_job = models.ForeignKey(
+        'self',
+        on_delete=models.SET_NULL,
+        related_name='duplicates',
+        blank=True,
+        null=True,
+        help_text="Canonical posting this one duplicates (empty if this is the canonical posting)"
+    )
+    
+    # Canonical skills for matching, derived on save (see jobmatcher.skill_vectors)
+    skill_ids = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Sorted ids of the canonical skills the job requires, repeats kept"
+    )
+    skill_version = models.PositiveIntegerField(
+        default=0,
+        help_text="Version of the skill rules skill_ids was derived with (0 if never derived)"
+    )
+    
+    objects = JobPostingQuerySet.as_manager()
+    
     class Meta:
         # Ensure no duplicate jobs from the same source
         unique_together = ['external_id', 'source']
@@ -366,6 +426,8 @@ class JobPosting(models.Model):
             models.Index(fields=['source', 'date_scraped']),
             models.Index(fields=['company']),
             models.Index(fields=['location']),
+            models.Index(fields=['country_code', 'city']),
+            models.Index(fields=['is_remote']),
             models.Index(fields=['is_active']),
             models.Index(fields=['job_type']),
             models.Index(fields=['employment_mode']),
@@ -373,6 +435,8 @@ class JobPosting(models.Model):
             models.Index(fields=['industry']),
             models.Index(fields=['salary_min', 'salary_max']),
             models.Index(fields=['date_posted']),
+            # Keyset pagination of the active feed (see jobscraper.pagination)
+            models.Index(fields=['is_active', 'date_posted', 'date_scraped', 'id']),
             models.Index(fields=['source_type', 'recruiter_owner', 'is_active', 'date_posted']),
         ]
     
@@ -404,10 +468,444 @@ class JobPosting(models.Model):
         
         return hashlib.md5(base_string.encode()).hexdigest()[:16]
     
+    def normalize_location(self):
+        """Fill country_code, region, city and is_remote from location."""
+        from .locations import LOCATION_FIELDS, normalize_location
+        
+        for field, value in zip(LOCATION_FIELDS, normalize_location(self.location)):
+            setattr(self, field, value)
+    
+    def derive_listing_fields(self):
+        """Fill empty job_type, requirements and salary columns from the description."""
+        from .listing_fields import derive_listing_fields
+        
+        empty = []
+        if not self.job_type:
+            empty.append('job_type')
+        if not self.requirements:
+            empty.append('requirements')
+        if self.salary_min is None and self.salary_max is None:
+            empty += ['salary_min', 'salary_max']
+        
+        if empty and self.description:
+            for field, value in derive_listing_fields(self.description, empty).items():
+                setattr(self, field, value)
+    
+    def derive_skill_vector(self):
+        """Fill skill_ids and skill_version from the title and description (once per text)."""
+        from jobmatcher.skill_vectors import derive_skill_vector, is_current
+        
+        source = (self.title, self.description)
+        if getattr(self, '_skill_source', None) != source or not is_current(self):
+            derive_skill_vector(self)
+            self._skill_source = source
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded field values, so save() can tell which ones changed."""
+        instance = super().from_db(db, field_names, values)
+        # JSON values are copied so in-place edits still count as changes
+        instance._loaded_values = {
+            name: copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+            for name, value in zip(field_names, values) if value is not models.DEFERRED
+        }
+        if 'title' in instance._loaded_values and 'description' in instance._loaded_values:
+            # The stored skill vector was derived from the stored text
+            instance._skill_source = (instance.title, instance.description)
+        return instance
+    
+    def changed_fields(self, fields):
+        """
+        Those of fields whose value differs from the one loaded or last saved.
+        
+        Every field counts as changed on instances that were not loaded from
+        the database; deferred fields only once they were loaded or set.
+        """
+        loaded = getattr(self, '_loaded_values', None)
+        if loaded is None:
+            return set(fields)
+        
+        changed = set()
+        for name in fields:
+            attname = self._meta.get_field(name).attname
+            if attname in loaded:
+                if self.__dict__.get(attname) != loaded[attname]:
+                    changed.add(name)
+            elif attname in self.__dict__:
+                changed.add(name)
+        return changed
+    
+    def _remember_values(self, fields):
+        """Record the saved values of fields for later changed_fields() calls."""
+        loaded = getattr(self, '_loaded_values', None)
+        if loaded is None:
+            loaded = self._loaded_values = {}
+        for name in fields:
+            attname = self._meta.get_field(name).attname
+            if attname in self.__dict__:
+                value = self.__dict__[attname]
+                loaded[attname] = copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+    
     def save(self, *args, **kwargs):
-        """Override save to auto-generate external_id if not provided."""
+        """
+        Override save to auto-generate external_id, derive the structured location, listing fields and skills,
+        and index the skills and queue rescoring when the fields they depend on changed.
+        """
+        from .listing_fields import LISTING_FIELDS
+        from .locations import LOCATION_FIELDS
+        
         if not self.external_id:
             self.external_id = self.generate_external_id(
                 self.url, self.title, self.company
             )
+        
+        update_fields = kwargs.get('update_fields')
+        source_fields = {'location', 'title', 'description'}
+        if update_fields is not None:
+            source_fields &= set(update_fields)
+        # Columns derived from fields that did not change are left alone
+        changed = self.changed_fields(source_fields)
+        derived_fields = []
+        if 'location' in changed:
+            self.normalize_location()
+            derived_fields += LOCATION_FIELDS
+        if 'description' in changed:
+            self.derive_listing_fields()
+            derived_fields += [*LISTING_FIELDS, 'currency']
+        if {'title', 'description'} & source_fields:
+            # Only re-derived when the text changed or the vector is stale
+            self.derive_skill_vector()
+            derived_fields += ['skill_ids', 'skill_version']
+        if update_fields is not None and derived_fields:
+            kwargs['update_fields'] = set(update_fields) | set(derived_fields)
+        
         super().save(*args, **kwargs)
+        
+        from jobmatcher.rescoring import JOB_SCORE_FIELDS, enqueue_jobs
+        
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            saved_fields = [field.name for field in self._meta.concrete_fields]
+        else:
+            saved_fields = list(update_fields)
+        changed = self.changed_fields(set(saved_fields) & (JOB_SCORE_FIELDS | {'skill_version'}))
+        self._remember_values(saved_fields)
+        
+        if changed & {'skill_ids', 'skill_version'}:
+            # Keep the skill index used for candidate generation in step
+            from jobmatcher.candidates import index_jobs
+            index_jobs([self])
+        
+        if changed & JOB_SCORE_FIELDS:
+            enqueue_jobs([self.pk])
+
+
+class JobSignatureBand(models.Model):
+    """
+    LSH index entry: one band of a job's MinHash signature.
+    
+    Jobs sharing a bucket are near-duplicate candidates; the band number is
+    hashed into the bucket, so a single indexed column covers every band.
+    """
+    
+    job = models.ForeignKey(
+        JobPosting,
+        on_delete=models.CASCADE,
+        related_name='signature_bands'
+    )
+    bucket = models.BigIntegerField(db_index=True, help_text="Hash of the band number and its signature rows")
+    
+    def __str__(self):
+        return f"{self.job_id}:{self.bucket}"
+
+
+class JobSkill(models.Model):
+    """
+    Inverted index entry: a canonical skill a job requires.
+    
+    One row per distinct skill of the job's stored skill vector; weight is
+    the skill's share of the job's requirements, so the weights of the
+    skills a user has sum to the job's skill match fraction.
+    """
+    
+    job = models.ForeignKey(
+        JobPosting,
+        on_delete=models.CASCADE,
+        related_name='skill_entries'
+    )
+    skill_id = models.PositiveIntegerField(help_text="Canonical skill id in the skill taxonomy")
+    weight = models.FloatField(help_text="Share of the job's skill requirements")
+    skill_version = models.PositiveIntegerField(help_text="Skill taxonomy version of skill_id")
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['skill_version', 'skill_id']),
+        ]
+    
+    def __str__(self):
+        return f"{self.job_id}:{self.skill_id}"
+
+
+class ScrapingLog(models.Model):
+    """
+    Record of a single scraper run.
+    
+    Tracks job counts and HTTP/parse cache effectiveness per source so runs
+    can be compared over time.
+    """
+    
+    STATUS_CHOICES = [
+        ('running', 'Running'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+    
+    source = models.CharField(max_length=50, help_text="Source identifier that was scraped")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='running')
+    started_at = models.DateTimeField(default=timezone.now)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    
+    jobs_found = models.PositiveIntegerField(default=0, help_text="Jobs parsed from the source")
+    jobs_created = models.PositiveIntegerField(default=0)
+    jobs_updated = models.PositiveIntegerField(default=0)
+    jobs_unchanged = models.PositiveIntegerField(
+        default=0,
+        help_text="Jobs skipped because their source response was unchanged"
+    )
+    errors_count = models.PositiveIntegerField(default=0)
+    error_details = models.TextField(blank=True, null=True)
+    
+    # HTTP cache effectiveness
+    cache_hits = models.PositiveIntegerField(
+        default=0,
+        help_text="Fetches answered as unchanged (304 or identical body)"
+    )
+    cache_misses = models.PositiveIntegerField(
+        default=0,
+        help_text="Fetches that returned new content"
+    )
+    
+    # Parse result cache effectiveness
+    parse_cache_hits = models.PositiveIntegerField(
+        default=0,
+        help_text="Descriptions whose parse result was served from the parse cache"
+    )
+    parse_cache_misses = models.PositiveIntegerField(
+        default=0,
+        help_text="Descriptions that had to be parsed"
+    )
+    
+    # Fetch policy stats for the run
+    host_stats = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Per-host request outcomes, latency histograms and circuit state"
+    )
+    
+    class Meta:
+        ordering = ['-started_at']
+        indexes = [
+            models.Index(fields=['source', 'started_at']),
+        ]
+    
+    def __str__(self):
+        return f"{self.source} run at {self.started_at:%Y-%m-%d %H:%M} ({self.status})"
+
+
+class ScrapeWatermark(models.Model):
+    """
+    Incremental scraping state for one scope of a source.
+    
+    A scope is whatever a scraper paginates or lists independently: a
+    company board, a keyword/location search, a category ('' for the whole
+    source). Updated only after a successful run (see jobscraper.watermarks).
+    """
+    
+    source = models.CharField(max_length=50, help_text="Source identifier")
+    scope = models.CharField(
+        max_length=255,
+        blank=True,
+        default='',
+        help_text="Board, search or category within the source"
+    )
+    last_posted_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Newest posting/update timestamp seen in this scope"
+    )
+    seen_ids = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Most recently seen job ids (or URLs), oldest first"
+    )
+    cursor = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Position (page, offset, ...) reached by the last successful run"
+    )
+    last_success_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        unique_together = ['source', 'scope']
+        ordering = ['source', 'scope']
+    
+    def __str__(self):
+        return f"{self.source}:{self.scope or '*'}"
+
+
+class ScrapeWorkUnit(models.Model):
+    """
+    One unit of crawl work in the durable scrape queue.
+    
+    A unit is a company board, a search page range or a job detail URL,
+    identified within its source by a hash of its kind and payload. Workers
+    lease units, heartbeat while running them and settle them as done or
+    failed (see jobscraper.work_queue).
+    """
+    
+    PENDING = 'pending'
+    LEASED = 'leased'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (LEASED, 'Leased'),
+        (DONE, 'Done'),
+        (FAILED, 'Failed'),
+    ]
+    
+    source = models.CharField(max_length=50, help_text="Source identifier")
+    kind = models.CharField(max_length=20, help_text="Unit type: board, search, detail, ...")
+    key = models.CharField(max_length=64, help_text="Hash of kind and payload; one unit per key")
+    payload = models.JSONField(default=dict, blank=True, help_text="Scraper-specific unit parameters")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    available_at = models.DateTimeField(default=timezone.now, help_text="Not leased before this time (retry backoff)")
+    
+    # Lease
+    leased_by = models.CharField(max_length=255, blank=True, default='')
+    lease_token = models.CharField(max_length=32, blank=True, default='')
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    
+    rerun = models.BooleanField(
+        default=False,
+        help_text="Enqueued again while leased: re-opened instead of done when completed"
+    )
+    
+    last_error = models.TextField(blank=True, default='')
+    result = models.JSONField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        unique_together = ['source', 'kind', 'key']
+        ordering = ['available_at', 'id']
+        indexes = [
+            models.Index(fields=['status', 'available_at']),
+            models.Index(fields=['status', 'lease_expires_at']),
+        ]
+    
+    def __str__(self):
+        return f"{self.source} {self.kind} {self.key[:8]} ({self.status})"
+
+
+class CompanyLogo(models.Model):
+    """
+    Cached logo lookup for one company, shared by all of its postings.
+    
+    Misses are cached too (logo_url empty) but expire sooner, so companies
+    whose logo could not be found are retried later (see
+    jobscraper.logo_resolver).
+    """
+    
+    company_key = models.CharField(max_length=255, unique=True, help_text="Normalized company name")
+    company = models.CharField(max_length=255, help_text="Company name as first seen")
+    domain = models.CharField(max_length=255, blank=True, default='', help_text="Guessed company domain")
+    logo_url = models.URLField(null=True, blank=True, help_text="Logo found, or empty for a cached miss")
+    strategy = models.CharField(max_length=30, blank=True, default='', help_text="Lookup strategy that found the logo")
+    resolved_at = models.DateTimeField(default=timezone.now)
+    expires_at = models.DateTimeField(help_text="Looked up again after this time")
+    
+    class Meta:
+        ordering = ['company_key']
+    
+    def __str__(self):
+        return f"{self.company} ({'logo' if self.logo_url else 'no logo'})"
+
+
+class JobArchive(models.Model):
+    """
+    Compact copy of a deleted job posting.
+    
+    The posting's columns are kept as zlib-compressed JSON; the fields
+    needed to find an archived posting are stored alongside (see
+    jobscraper.expiry).
+    """
+    
+    job_id = models.BigIntegerField(unique=True, help_text="Id the posting had")
+    external_id = models.CharField(max_length=255)
+    source = models.CharField(max_length=50, help_text="Source identifier")
+    title = models.CharField(max_length=255)
+    company = models.CharField(max_length=255)
+    date_posted = models.DateField(null=True, blank=True)
+    date_scraped = models.DateTimeField(help_text="When the posting was last scraped")
+    archived_at = models.DateTimeField(default=timezone.now)
+    data = models.BinaryField(help_text="zlib-compressed JSON of the posting's columns")
+    
+    class Meta:
+        ordering = ['-archived_at']
+        indexes = [
+            models.Index(fields=['source', 'external_id']),
+        ]
+    
+    def __str__(self):
+        return f"{self.title} at {self.company} (archived {self.archived_at:%Y-%m-%d})"
+    
+    @classmethod
+    def from_posting(cls, row):
+        """Archive entry for a job's column values (JobPosting.objects.values() row)."""
+        from .expiry import compress_posting
+        
+        return cls(
+            job_id=row['id'],
+            external_id=row['external_id'],
+            source=row['source'],
+            title=row['title'][:255],
+            company=row['company'][:255],
+            date_posted=row['date_posted'],
+            date_scraped=row['date_scraped'],
+            data=compress_posting(row),
+        )
+    
+    def posting_data(self):
+        """Column values of the archived posting."""
+        from .expiry import decompress_posting
+        
+        return decompress_posting(self.data)
+
+
+class FacetCount(models.Model):
+    """
+    Number of jobs with one value of one facet, per source.
+    
+    Maintained incrementally as jobs are saved and deactivated, and
+    recounted by the reconcile_facets command (see jobscraper.facets).
+    """
+    
+    source = models.CharField(max_length=50, help_text="Source identifier")
+    facet = models.CharField(max_length=30, help_text="Facet name: company, location, country, status, ...")
+    value = models.CharField(max_length=255, blank=True, default='', help_text="Facet value ('' when unset)")
+    count = models.PositiveIntegerField(default=0)
+    revision = models.PositiveIntegerField(default=1, help_text="Bumped on every change; versions cached payloads")
+    
+    class Meta:
+        unique_together = ['facet', 'value', 'source']
+        ordering = ['facet', '-count']
+    
+    def __str__(self):
+        return f"{self.source} {self.facet}={self.value!r}: {self.count}"
@@ -0,0 +1,206 @@
+"""
+Job Feed Pagination
+
+Keyset (cursor) pagination for the job listing API. The default feed order,
+newest first by (date_posted, date_scraped), is paged by remembering the
+last row's (date_posted, date_scraped, id) and asking for the rows after it.
+That is an index range scan with a LIMIT, so page N costs what page 1 costs,
+where OFFSET pagination reads and discards every earlier row.
+
+Requests with ?page= (existing clients) or another ordering (?ordering=,
+relevance-ranked ?q=) keep page-number pagination. Both modes return the
+same {count, next, previous, results} envelope; cursor pages link forward
+only.
+
+The count can be exact (default), a planner estimate or skipped: pass
+?count=estimate or ?count=none, or set JOBSCRAPER_FEED_COUNT.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+# Feed ordering paged by keyset, and the keyset columns (id breaks ties)
+FEED_ORDERING = ('-date_posted', '-date_scraped')
+KEYSET_FIELDS = ('date_posted', 'date_scraped', 'id')
+
+COUNT_MODES = ('exact', 'estimate', 'none')
+
+
+def estimate_count(queryset) -> Optional[int]:
+    """
+    Row estimate from the query planner (PostgreSQL), without running the query.
+
+    Returns:
+        Estimated rows, or None when the database gives no estimate
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class JobFeedPagination(PageNumberPagination):
+    """Cursor pagination for the default feed ordering, page numbers otherwise."""
+
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.count_mode = self.get_count_mode(request)
+        self.use_cursor = (
+            self.page_query_param not in request.query_params
+            and tuple(queryset.query.order_by) == FEED_ORDERING
+        )
+        if not self.use_cursor:
+            return self._paginate_by_page(queryset, request, view)
+
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        position = self.decode_cursor(request)
+        page_queryset = queryset.order_by(*FEED_ORDERING, '-id')
+        if position is not None:
+            page_queryset = page_queryset.filter(self.after(position, queryset.db))
+
+        rows = list(page_queryset[:page_size + 1])
+        self.has_next = len(rows) > page_size
+        self.rows = rows[:page_size]
+        self.count = self.get_count(queryset)
+        return self.rows
+
+    def _paginate_by_page(self, queryset, request, view):
+        """Page-number pagination, counting as requested."""
+        # id breaks ties so rows with equal sort keys keep their page
+        ordering = tuple(queryset.query.order_by)
+        if ordering and not {'id', '-id', 'pk', '-pk'} & set(ordering):
+            queryset = queryset.order_by(*ordering, '-id')
+        if self.count_mode == 'exact':
+            return super().paginate_queryset(queryset, request, view)
+
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+        try:
+            self.page_number = max(int(request.query_params.get(self.page_query_param, 1)), 1)
+        except ValueError:
+            raise NotFound('Invalid page.')
+
+        offset = (self.page_number - 1) * page_size
+        rows = list(queryset[offset:offset + page_size + 1])
+        if not rows and self.page_number > 1:
+            raise NotFound('Invalid page.')
+        self.has_next = len(rows) > page_size
+        self.rows = rows[:page_size]
+        self.count = self.get_count(queryset)
+        return self.rows
+
+    def get_count_mode(self, request) -> str:
+        mode = request.query_params.get(self.count_query_param) or getattr(settings, 'JOBSCRAPER_FEED_COUNT', 'exact')
+        return mode if mode in COUNT_MODES else 'exact'
+
+    def get_count(self, queryset) -> Optional[int]:
+        if self.count_mode == 'none':
+            return None
+        if self.count_mode == 'estimate':
+            estimate = estimate_count(queryset)
+            if estimate is not None:
+                return estimate
+        return queryset.count()
+
+    def after(self, position: Tuple[Optional[date], datetime, int], using: str) -> Q:
+        """
+        Rows after position in FEED_ORDERING.
+
+        The redundant date_posted bound keeps the condition an index range
+        scan. NULL date_posted rows come first in a descending sort on
+        databases that sort NULL as the largest value (PostgreSQL) and last
+        on the others (SQLite, MySQL).
+        """
+        date_posted, date_scraped, job_id = position
+        nulls_first = connections[using].features.nulls_order_largest
+        tail = Q(date_scraped__lt=date_scraped) | Q(date_scraped=date_scraped, id__lt=job_id)
+
+        if date_posted is None:
+            condition = Q(date_posted__isnull=True) & tail
+            return condition | Q(date_posted__isnull=False) if nulls_first else condition
+
+        condition = Q(date_posted__lte=date_posted) & (
+            Q(date_posted__lt=date_posted) | (Q(date_posted=date_posted) & tail)
+        )
+        return condition if nulls_first else condition | Q(date_posted__isnull=True)
+
+    def encode_cursor(self, job) -> str:
+        date_posted, date_scraped, job_id = (getattr(job, field) for field in KEYSET_FIELDS)
+        payload = [date_posted.isoformat() if date_posted else None, date_scraped.isoformat(), job_id]
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+    def decode_cursor(self, request) -> Optional[Tuple[Optional[date], datetime, int]]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw_date_posted, raw_date_scraped, job_id = json.loads(
+                base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4))
+            )
+            date_posted = parse_date(raw_date_posted) if raw_date_posted else None
+            date_scraped = parse_datetime(raw_date_scraped)
+            if date_scraped is None or (raw_date_posted and date_posted is None):
+                raise ValueError(encoded)
+            return date_posted, date_scraped, int(job_id)
+        except (TypeError, ValueError):
+            raise NotFound('Invalid cursor.')
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.use_cursor and self.count_mode == 'exact':
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.use_cursor:
+            return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.rows[-1]))
+        return replace_query_param(url, self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.use_cursor and self.count_mode == 'exact':
+            return super().get_previous_link()
+        if self.use_cursor or self.page_number <= 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.page_number - 1)
+
+    def get_paginated_response(self, data: List[Any]) -> Response:
+        if not self.use_cursor and self.count_mode == 'exact':
+            return super().get_paginated_response(data)
+        return Response({
+            'count': self.count,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        schema = super().get_paginated_response_schema(schema)
+        schema['properties']['count']['nullable'] = True
+        return schema
@@ -0,0 +1,224 @@
+"""
+Parse Result Cache
+
+Content-addressed cache for job content parser output. Entries are keyed by
+a hash of the description text plus the parser version and skill taxonomy
+version, so a description that was already parsed -- on an earlier run, or
+by another scraper hitting the same board -- skips the parser entirely, and
+bumping PARSER_VERSION or changing the taxonomy invalidates everything at
+once.
+
+Backends: 'local' (in-process LRU), 'django' (the configured Django cache)
+and 'sqlite' (a local file shared across processes and runs). All of them
+are bounded and evict the least recently used entries.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class BaseParseCache:
+    """
+    Parse result cache front; subclasses provide byte storage.
+
+    get()/set() take the description text; keys and serialization are
+    handled here. Values are pickled, so callers never share mutable state
+    with the cache.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(text: str) -> str:
+        """Key for a description under the current parser version and skill taxonomy."""
+        from .simple_job_parser import PARSER_VERSION
+        from .skill_taxonomy import get_taxonomy
+
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        return f'{PARSER_VERSION}.{get_taxonomy().version}:{digest}'
+
+    def get(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up parser output for a description.
+
+        Args:
+            text: Description text that was passed to the parser
+
+        Returns:
+            Cached parse result, or None on a miss
+        """
+        try:
+            value = self._get(self.key_for(text))
+        except Exception as e:
+            logger.warning(f"Parse cache lookup failed: {str(e)}")
+            value = None
+
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return pickle.loads(value)
+
+    def set(self, text: str, parsed: Dict[str, Any]) -> None:
+        """
+        Store parser output for a description.
+
+        Args:
+            text: Description text that was passed to the parser
+            parsed: Parser output
+        """
+        try:
+            self._set(self.key_for(text), pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception as e:
+            logger.warning(f"Parse cache store failed: {str(e)}")
+
+    def _get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def _set(self, key: str, value: bytes) -> None:
+        raise NotImplementedError
+
+
+class LocalParseCache(BaseParseCache):
+    """In-process LRU cache holding up to max_entries results."""
+
+    def __init__(self, max_entries: int = 10000):
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class DjangoParseCache(BaseParseCache):
+    """Stores results in a Django cache; size and expiry follow its configuration."""
+
+    KEY_PREFIX = 'jobscraper:parse:'
+
+    def __init__(self, alias: str = 'default'):
+        super().__init__()
+        from django.core.cache import caches
+
+        self._cache = caches[alias]
+
+    def _get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(self.KEY_PREFIX + key)
+
+    def _set(self, key: str, value: bytes) -> None:
+        self._cache.set(self.KEY_PREFIX + key, value)
+
+
+class SQLiteParseCache(BaseParseCache):
+    """SQLite file cache holding up to max_entries results, evicting least recently used."""
+
+    # Check the table size every this many writes rather than on each one
+    EVICT_EVERY = 100
+
+    def __init__(self, path: str, max_entries: int = 10000):
+        super().__init__()
+        self.path = path
+        self.max_entries = max_entries
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS parse_cache '
+            '(key TEXT PRIMARY KEY, value BLOB NOT NULL, used_at REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS parse_cache_used_at ON parse_cache (used_at)')
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM parse_cache WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute('UPDATE parse_cache SET used_at = ? WHERE key = ?', (time.time(), key))
+            return row[0]
+
+    def _set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO parse_cache (key, value, used_at) VALUES (?, ?, ?)',
+                (key, value, time.time())
+            )
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY == 0:
+                self._evict()
+
+    def _evict(self) -> None:
+        (count,) = self._conn.execute('SELECT COUNT(*) FROM parse_cache').fetchone()
+        if count > self.max_entries:
+            self._conn.execute(
+                'DELETE FROM parse_cache WHERE key IN '
+                '(SELECT key FROM parse_cache ORDER BY used_at LIMIT ?)',
+                (count - self.max_entries,)
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+_caches: Dict[str, BaseParseCache] = {}
+
+
+def get_parse_cache(backend: Optional[str] = None) -> Optional[BaseParseCache]:
+    """
+    Get the process-wide parse cache for a backend.
+
+    Args:
+        backend: 'local', 'django' or 'sqlite' (default: JOBSCRAPER_PARSE_CACHE);
+            empty disables caching
+
+    Returns:
+        Shared cache instance, or None when caching is disabled
+    """
+    from django.conf import settings
+
+    if backend is None:
+        backend = getattr(settings, 'JOBSCRAPER_PARSE_CACHE', 'local')
+    if not backend:
+        return None
+
+    if backend not in _caches:
+        max_entries = getattr(settings, 'JOBSCRAPER_PARSE_CACHE_SIZE', 10000)
+        if backend == 'local':
+            _caches[backend] = LocalParseCache(max_entries)
+        elif backend == 'django':
+            _caches[backend] = DjangoParseCache()
+        elif backend == 'sqlite':
+            _caches[backend] = SQLiteParseCache(settings.JOBSCRAPER_PARSE_CACHE_PATH, max_entries)
+        else:
+            raise ValueError(f"Unknown parse cache backend: {backend}")
+
+    return _caches[backend]
@@ -0,0 +1,191 @@
+"""
+Parser Pattern Registry
+
+Regular expressions used by JobParser and SimpleJobParser, compiled once at
+import. Mutually exclusive categories (job type, employment mode, experience
+level, education level) are combined into one named-group alternation per
+category set, so the winning category is decided in a single scan.
+"""
+
+import re
+from typing import Dict, List, Optional, Pattern, Tuple
+
+
+class CategoryPatterns:
+    """
+    Ordered, mutually exclusive categories decided in one scan.
+
+    classify() returns the first category, in definition order, whose pattern
+    matches anywhere in the text -- the same answer as searching each pattern
+    in turn. The alternation sits inside a lookahead so every position is
+    tried and a lower-priority match cannot hide a higher-priority one.
+    """
+
+    def __init__(self, patterns: Dict[str, str], flags: int = re.IGNORECASE):
+        """
+        Compile the category patterns.
+
+        Args:
+            patterns: Category name -> pattern, in priority order. Patterns
+                must not contain capturing groups.
+            flags: Regex flags applied to every pattern
+        """
+        self.names = list(patterns)
+        self.patterns = {name: re.compile(pattern, flags) for name, pattern in patterns.items()}
+        alternation = '|'.join(f'(?P<c{index}>{pattern})' for index, pattern in enumerate(patterns.values()))
+        self.combined = re.compile(f'(?=(?:{alternation}))', flags)
+
+    def classify(self, text: str) -> Optional[str]:
+        """
+        Find the highest-priority category present in text.
+
+        Args:
+            text: Text to classify
+
+        Returns:
+            Category name, or None if no pattern matches
+        """
+        best = None
+        for match in self.combined.finditer(text):
+            index = int(match.lastgroup[1:])
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
+        return self.names[best] if best is not None else None
+
+    def items(self):
+        return self.patterns.items()
+
+
+def _compile_all(patterns: List[str], flags: int = 0) -> List[Pattern]:
+    return [re.compile(pattern, flags) for pattern in patterns]
+
+
+# Salary patterns, tried in order (first one that parses wins)
+SALARY_PATTERNS = _compile_all([
+    r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*-\s*\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',  # $80,000 - $120,000
+    r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*to\s*\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',  # $80,000 to $120,000
+    r'(\d{1,3}(?:,\d{3})*)\s*-\s*(\d{1,3}(?:,\d{3})*)\s*(?:USD|dollars?|per\s+year)',  # 80,000 - 120,000 USD
+    r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*/\s*(?:hour|hr)',  # $25.00/hour
+    r'(\d{1,2})\s*-\s*(\d{1,2})\s*(?:LPA|lakhs?)',  # 8 - 12 LPA (Indian salary)
+], re.IGNORECASE)
+
+EXPERIENCE_LEVELS = CategoryPatterns({
+    'entry': r'(?:entry|junior|graduate|fresher|0-2\s+years?|new\s+grad)',
+    'junior': r'(?:junior|1-3\s+years?|early\s+career)',
+    'mid': r'(?:mid|middle|3-5\s+years?|4-6\s+years?|intermediate)',
+    'senior': r'(?:senior|5\+\s+years?|6\+\s+years?|experienced|lead)',
+    'lead': r'(?:lead|principal|staff|architect|team\s+lead)',
+    'executive': r'(?:director|vp|vice\s+president|head\s+of|chief|executive)',
+})
+
+JOB_TYPES = CategoryPatterns({
+    'full-time': r'(?:full.?time|permanent|fte)',
+    'part-time': r'(?:part.?time|pte)',
+    'contract': r'(?:contract|contractor|freelance|consulting)',
+    'internship': r'(?:intern|internship|co.?op)',
+    'temporary': r'(?:temp|temporary|seasonal)',
+})
+
+EMPLOYMENT_MODES = CategoryPatterns({
+    'remote': r'(?:remote|work\s+from\s+home|wfh|distributed)',
+    'hybrid': r'(?:hybrid|flexible|mix|combination)',
+    'on-site': r'(?:on.?site|office|in.?person|onsite)',
+})
+
+EDUCATION_LEVELS = CategoryPatterns({
+    'high-school': r'(?:high\s+school|hs|secondary)',
+    'associate': r'(?:associate|aa|as)\s+degree',
+    'bachelor': r'(?:bachelor|ba|bs|btech|be)\s+degree',
+    'master': r'(?:master|ma|ms|mtech|mba|me)\s+degree',
+    'phd': r'(?:phd|doctorate|doctoral)',
+})
+
+
+def _benefit_label(pattern: str) -> str:
+    return pattern.replace(r'\s+', ' ').replace(r'\(', '(').replace(r'\)', ')')
+
+
+# Benefit patterns with their display labels; every match is reported
+BENEFITS: List[Tuple[Pattern, str]] = [
+    (re.compile(pattern), _benefit_label(pattern))
+    for pattern in [
+        r'health\s+insurance', r'medical\s+coverage', r'dental',
+        r'401\(k\)', r'retirement', r'pension',
+        r'paid\s+time\s+off', r'pto', r'vacation',
+        r'stock\s+options', r'equity', r'rsu',
+        r'life\s+insurance', r'disability',
+        r'parental\s+leave', r'maternity', r'paternity',
+        r'tuition\s+reimbursement', r'education',
+        r'gym\s+membership', r'wellness',
+        r'flexible\s+hours', r'work.life\s+balance',
+    ]
+]
+
+# Section headers; sections are not exclusive, each is located separately
+SECTION_HEADERS = {
+    name: re.compile(pattern, re.IGNORECASE)
+    for name, pattern in {
+        'responsibilities': r'(?:responsibilities|duties|what\s+you.ll\s+do|role\s+description)',
+        'requirements': r'(?:requirements|qualifications|what\s+we.re\s+looking\s+for|skills)',
+        'benefits': r'(?:benefits|perks|what\s+we\s+offer|compensation)',
+        'about': r'(?:about\s+us|company\s+overview|who\s+we\s+are)',
+    }.items()
+}
+
+
+def _context_patterns(patterns: List[str]) -> List[Pattern]:
+    """Compile patterns that capture up to 50 characters either side of a mention."""
+    return _compile_all([rf'.{{0,50}}{pattern}.{{0,50}}' for pattern in patterns], re.IGNORECASE)
+
+
+BONUS_CONTEXTS = _context_patterns([
+    r'bonus', r'equity', r'stock\s+options', r'rsu',
+    r'commission', r'profit\s+sharing',
+])
+
+PORTFOLIO_CONTEXTS = _context_patterns([
+    r'portfolio', r'github', r'code\s+samples',
+    r'work\s+samples', r'examples\s+of\s+work',
+])
+
+WEBSITE = re.compile(r'https?://(?:www\.)?([a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}')
+
+DEADLINES = _compile_all([
+    r'deadline[:\s]+(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
+    r'apply\s+by[:\s]+(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
+    r'closing\s+date[:\s]+(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
+], re.IGNORECASE)
+
+OPENINGS = _compile_all([
+    r'(\d+)\s+openings?',
+    r'(\d+)\s+positions?',
+    r'hiring\s+(\d+)',
+], re.IGNORECASE)
+
+# Case-sensitive: names are matched by capitalisation
+HIRING_MANAGERS = _compile_all([
+    r'contact[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
+    r'recruiter[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
+    r'hiring\s+manager[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
+])
+
+# Matched against lowercased text
+TRAVEL = _compile_all([
+    r'(\d{1,2})%\s+travel',
+    r'travel\s+(\d{1,2})%',
+    r'minimal\s+travel',
+    r'extensive\s+travel',
+    r'no\s+travel',
+])
+
+LANGUAGES = _compile_all([
+    r'fluent\s+in\s+(\w+)',
+    r'(\w+)\s+language\s+required',
+    r'bilingual\s+(\w+)',
+])
+
+EXPERIENCE_YEARS = re.compile(r'(\d+)\+?\s*years?\s+(?:of\s+)?experience')
+
+KEYWORD_WORDS = re.compile(r'\b[a-zA-Z]{3,}\b')
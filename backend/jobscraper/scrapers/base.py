@@ -1,15 +1,101 @@
 import logging
+import queue
+import threading
 import requests
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
 from datetime import datetime, date
 import time
-from ..logo_scraper import scrape_company_logo
+from django.conf import settings
+from django.utils import timezone
 
 
 logger = logging.getLogger(__name__)
 
 
+def resolve_company_logos(companies: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
+    """
+    Look up logo URLs for companies (see logo_resolver.LogoResolver.resolve_many).
+    
+    logo_resolver pulls in BeautifulSoup and lxml through logo_scraper, so
+    it is imported on the first lookup rather than whenever a scraper
+    module is imported.
+    """
+    from ..logo_resolver import LogoResolver
+    return LogoResolver().resolve_many(companies)
+
+
+def iter_chunks(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield lists of up to size items from iterable."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def prefetch(iterable: Iterable[Any], maxsize: int) -> Iterator[Any]:
+    """
+    Run iterable on a background thread, buffering at most maxsize items.
+    
+    Lets the producer (fetching and parsing pages) keep working while the
+    consumer normalizes and saves, with a bounded queue keeping memory flat.
+    Exceptions raised by the producer are re-raised in the consumer.
+    
+    Close the returned generator when the consumer stops early: the
+    producer checks for that between items, stops pulling from iterable
+    and closes it, and close() waits for it to exit.
+    """
+    buffer = queue.Queue(maxsize=max(1, maxsize))
+    stop = threading.Event()
+    
+    def put(kind, value=None):
+        while not stop.is_set():
+            try:
+                buffer.put((kind, value), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        items = iter(iterable)
+        try:
+            while not stop.is_set():
+                try:
+                    item = next(items)
+                except StopIteration:
+                    put('done')
+                    return
+                if not put('item', item):
+                    return
+        except Exception as e:
+            put('error', e)
+        finally:
+            # Run the iterable's own cleanup (e.g. closing connections) now, not on collection
+            close = getattr(items, 'close', None)
+            if close is not None:
+                close()
+    
+    producer = threading.Thread(target=produce, name='jobscraper-stream', daemon=True)
+    producer.start()
+    
+    try:
+        while True:
+            kind, value = buffer.get()
+            if kind == 'done':
+                return
+            if kind == 'error':
+                raise value
+            yield value
+    finally:
+        # Consumer stopped early (error or close): let the producer exit
+        stop.set()
+        producer.join()
+
+
 class BaseScraper(ABC):
     """
     Abstract base class for all job scrapers.
@@ -39,6 +125,50 @@ class BaseScraper(ABC):
         # Rate limiting
         self.request_delay = 1  # seconds between requests
         self.last_request_time = 0
+        
+        # Saving: set bulk_save to use the set-based upsert path
+        self.bulk_save = False
+        self.save_batch_size = None
+        
+        # Concurrent fetching: set async_fetch to route fetch_many through
+        # the shared AsyncFetcher instead of sequential fetch_data calls
+        self.async_fetch = getattr(settings, 'JOBSCRAPER_ASYNC_FETCH', False)
+        self.fetch_concurrency = getattr(settings, 'JOBSCRAPER_FETCH_CONCURRENCY', 10)
+        self.per_host_rate = getattr(settings, 'JOBSCRAPER_PER_HOST_RATE', None)
+        self._fetcher = None
+        
+        # Adaptive fetching: route requests through the process-wide
+        # FetchPolicy (per-host AIMD concurrency, Retry-After, circuit
+        # breaker); retryable failures are tried up to fetch_retries times
+        self.adaptive_fetch = getattr(settings, 'JOBSCRAPER_FETCH_POLICY', True)
+        self.fetch_retries = getattr(settings, 'JOBSCRAPER_FETCH_RETRIES', 3)
+        
+        # Conditional requests: set use_http_cache to send stored validators
+        # and skip parse/normalize/save for responses that did not change
+        self.use_http_cache = getattr(settings, 'JOBSCRAPER_HTTP_CACHE', False)
+        self._http_cache = None
+        
+        # Streaming: set stream to normalize and save jobs in chunks while
+        # later pages are still being fetched
+        self.stream = getattr(settings, 'JOBSCRAPER_STREAM', False)
+        self.stream_chunk_size = getattr(settings, 'JOBSCRAPER_STREAM_CHUNK_SIZE', 100)
+        
+        # Enrichment: parse_content fills structured fields (skills, salary,
+        # experience level, ...) from the description; normalize_workers > 1
+        # runs the parsing on a process pool
+        self.parse_content = getattr(settings, 'JOBSCRAPER_PARSE_CONTENT', True)
+        self.normalize_workers = getattr(settings, 'JOBSCRAPER_NORMALIZE_WORKERS', 0)
+        self._enricher = None
+        
+        # Parse result cache backend ('local', 'django', 'sqlite'; '' disables)
+        self.parse_cache_backend = getattr(settings, 'JOBSCRAPER_PARSE_CACHE', 'local')
+        
+        # Incremental scraping: set incremental to skip jobs and stop
+        # paginating where earlier successful runs already reached
+        self.incremental = getattr(settings, 'JOBSCRAPER_INCREMENTAL', False)
+        self._watermarks = None
+        self._known_urls = set()
+        self._url_scopes = {}
     
     def fetch_data(self, url: str, **kwargs) -> Any:
         """
@@ -50,29 +180,235 @@ class BaseScraper(ABC):
             
         Returns:
             Response object or parsed JSON data
+            
+        Raises:
+            requests.RequestException: If every attempt failed, or the
+                response was a non-retryable client error
+            HostUnavailable: If the fetch policy is skipping the host
         """
-        # Rate limiting
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.request_delay:
-            time.sleep(self.request_delay - time_since_last)
+        from ..fetch_policy import is_retryable, parse_retry_after
         
-        try:
-            logger.info(f"Fetching data from: {url}")
-            response = self.session.get(url, timeout=30, **kwargs)
-            response.raise_for_status()
+        policy = self.get_fetch_policy()
+        cache = self.get_http_cache()
+        if cache is not None:
+            kwargs['headers'] = {**cache.conditional_headers(url), **(kwargs.get('headers') or {})}
+        
+        attempts = max(1, self.fetch_retries)
+        for attempt in range(attempts):
+            # Rate limiting
+            current_time = time.time()
+            time_since_last = current_time - self.last_request_time
+            if time_since_last < self.request_delay:
+                time.sleep(self.request_delay - time_since_last)
             
-            self.last_request_time = time.time()
+            slot = policy.acquire(url) if policy is not None else None
+            status, retry_after = None, None
+            try:
+                logger.info(f"Fetching data from: {url}")
+                response = self.session.get(url, timeout=30, **kwargs)
+                status = response.status_code
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                if cache is not None:
+                    response = cache.resolve(url, response)
+                response.raise_for_status()
+                
+            except requests.RequestException as e:
+                if attempt == attempts - 1 or not is_retryable(status):
+                    logger.error(f"Error fetching {url}: {str(e)}")
+                    raise
+                logger.warning(f"Error fetching {url} (attempt {attempt + 1}/{attempts}): {str(e)}")
+                if policy is None:
+                    time.sleep(self.request_delay * (2 ** attempt))
+                elif retry_after is None:
+                    time.sleep(policy.backoff(attempt))
+                # Otherwise the next acquire waits out Retry-After
+                continue
+            
+            finally:
+                self.last_request_time = time.time()
+                if slot is not None:
+                    policy.release(slot, status, retry_after)
             
             # Try to return JSON if possible, otherwise return response
             try:
                 return response.json()
             except ValueError:
                 return response
-                
-        except requests.RequestException as e:
-            logger.error(f"Error fetching {url}: {str(e)}")
-            raise
+    
+    def fetch_many(self, urls: List[str], **kwargs) -> List[Any]:
+        """
+        Fetch several URLs, concurrently when async_fetch is enabled.
+        
+        Each result follows the fetch_data contract (parsed JSON or a response
+        object). A URL that fails yields its exception in place of a result,
+        so callers can skip failures without losing the rest of the batch.
+        
+        Args:
+            urls: URLs to fetch
+            **kwargs: Additional arguments for the HTTP client
+            
+        Returns:
+            List of results in the same order as urls
+        """
+        if self.async_fetch:
+            return self.get_fetcher().fetch_many(urls, **kwargs)
+        
+        results = []
+        for url in urls:
+            try:
+                results.append(self.fetch_data(url, **kwargs))
+            except Exception as e:
+                results.append(e)
+        return results
+    
+    def get_fetcher(self):
+        """
+        Get the AsyncFetcher shared by this scraper's fetch_many calls.
+        
+        Returns:
+            AsyncFetcher configured with the session headers, the global
+            concurrency limit and the per-host rate (defaults to 1/request_delay)
+        """
+        if self._fetcher is None:
+            from ..fetcher import AsyncFetcher
+            
+            per_host_rate = self.per_host_rate
+            if per_host_rate is None:
+                per_host_rate = 1 / self.request_delay if self.request_delay else 0
+            
+            self._fetcher = AsyncFetcher(
+                max_concurrency=self.fetch_concurrency,
+                per_host_rate=per_host_rate,
+                headers=dict(self.session.headers),
+                max_retries=self.fetch_retries,
+                cache=self.get_http_cache(),
+                policy=self.get_fetch_policy(),
+            )
+        return self._fetcher
+    
+    def get_fetch_policy(self):
+        """
+        Get the FetchPolicy applied to this scraper's requests.
+        
+        Returns:
+            The process-wide FetchPolicy, or None when adaptive_fetch is off
+        """
+        if not self.adaptive_fetch:
+            return None
+        
+        from ..fetch_policy import get_fetch_policy
+        return get_fetch_policy()
+    
+    def get_http_cache(self):
+        """
+        Get the ResponseCache used for conditional requests.
+        
+        Returns:
+            ResponseCache rooted at JOBSCRAPER_HTTP_CACHE_DIR, or None when
+            use_http_cache is off
+        """
+        if not self.use_http_cache:
+            return None
+        
+        if self._http_cache is None:
+            from ..http_cache import ResponseCache
+            self._http_cache = ResponseCache(
+                settings.JOBSCRAPER_HTTP_CACHE_DIR,
+                max_age_days=getattr(settings, 'JOBSCRAPER_HTTP_CACHE_MAX_AGE_DAYS', None),
+                max_entries=getattr(settings, 'JOBSCRAPER_HTTP_CACHE_MAX_ENTRIES', None),
+            )
+        return self._http_cache
+    
+    def is_unchanged(self, url: str) -> bool:
+        """
+        Check whether url was answered as unchanged by the HTTP cache this run.
+        
+        Scrapers mark jobs that came from unchanged responses with
+        '_unchanged': True so scrape_jobs can skip normalizing and saving them.
+        Jobs parsed from a listing response rather than their own page carry
+        its URL as '_response_url', so the response is fetched in full again
+        when one of them fails to save.
+        """
+        cache = self.get_http_cache()
+        return cache is not None and cache.is_unchanged(url)
+    
+    def get_watermarks(self):
+        """
+        Get the WatermarkTracker for this run.
+        
+        Returns:
+            WatermarkTracker for this source, or None when incremental is off
+        """
+        if not self.incremental:
+            return None
+        
+        if self._watermarks is None:
+            from ..watermarks import WatermarkTracker
+            self._watermarks = WatermarkTracker(self.source_name)
+        return self._watermarks
+    
+    def is_known_job(self, scope: str, external_id: Any, posted_at: Any = None) -> bool:
+        """
+        Check whether an earlier successful run already saw a job.
+        
+        Scrapers pass known jobs on with '_unchanged': True, like jobs from
+        unchanged responses, so they are marked seen but not fetched, parsed
+        or saved again. Always False when incremental is off.
+        
+        Args:
+            scope: Board, search or category the job was listed under
+            external_id: Job id (or URL) within the source
+            posted_at: Posting or last-update timestamp, if the listing has one
+        """
+        watermarks = self.get_watermarks()
+        return watermarks is not None and bool(external_id) and watermarks.is_known(scope, external_id, posted_at)
+    
+    def record_job(self, scope: str, external_id: Any, posted_at: Any = None) -> None:
+        """
+        Record a stored job listed under scope so later incremental runs can skip it.
+        
+        Scrapers do not call this while parsing: they tag parsed jobs with
+        '_watermark': (scope, external_id, posted_at), and jobs are recorded
+        once they are known to be stored.
+        """
+        watermarks = self.get_watermarks()
+        if watermarks is not None and external_id:
+            watermarks.observe(scope, external_id, posted_at)
+    
+    def track_listing_urls(self, scoped_urls: List[Tuple[str, str]]) -> List[str]:
+        """
+        Register job page URLs found on listing pages.
+        
+        For scrapers that collect detail-page URLs from listings: URLs are
+        remembered with the scope they were listed under, and known ones
+        are put last so per-run page limits are spent on new jobs.
+        
+        Args:
+            scoped_urls: (url, scope) pairs in listing order
+            
+        Returns:
+            Unique URLs, new ones first
+        """
+        for url, scope in scoped_urls:
+            self._url_scopes.setdefault(url, scope)
+        
+        urls = list(dict.fromkeys(url for url, _ in scoped_urls))
+        self._known_urls = {url for url in urls if self.is_known_job(self._url_scopes[url], url)}
+        return [url for url in urls if url not in self._known_urls] + [url for url in urls if url in self._known_urls]
+    
+    def is_known_url(self, url: str) -> bool:
+        """Check whether a URL from track_listing_urls() belongs to a known job."""
+        return url in self._known_urls
+    
+    def record_url(self, url: str) -> None:
+        """Record the stored job at a URL from track_listing_urls() as seen this run."""
+        self.record_job(self._url_scopes.get(url, ''), url)
+    
+    def close_fetcher(self):
+        """Release the AsyncFetcher's connection pool, if one was created."""
+        if self._fetcher is not None:
+            self._fetcher.close()
+            self._fetcher = None
     
     @abstractmethod
     def parse_data(self, raw_data: Any) -> List[Dict[str, Any]]:
@@ -114,17 +450,6 @@ class BaseScraper(ABC):
             'date_scraped': datetime.now().date(),
         }
         
-        # Scrape company logo
-        try:
-            company_logo = scrape_company_logo(company_name, job_url)
-            if company_logo:
-                normalized['company_logo'] = company_logo
-                logger.info(f"Found logo for {company_name}: {company_logo}")
-            else:
-                logger.debug(f"No logo found for {company_name}")
-        except Exception as e:
-            logger.warning(f"Logo scraping failed for {company_name}: {e}")
-        
         # Add HTML content if available (for comprehensive parsing)
         if hasattr(self, '_extract_html_content'):
             html_content = self._extract_html_content(job_data)
@@ -181,13 +506,18 @@ class BaseScraper(ABC):
         """
         from ..services import JobScrapingService
         
-        service = JobScrapingService()
-        return service.save_jobs(jobs)
+        service = JobScrapingService(batch_size=self.save_batch_size)
+        return service.save_jobs(jobs, bulk=self.bulk_save)
     
     def scrape_jobs(self, **kwargs) -> Dict[str, int]:
         """
         Main method to scrape jobs. Template method pattern.
         
+        With stream enabled, jobs flow from iter_parsed_jobs() through
+        normalize and save in chunks of stream_chunk_size while later pages
+        are still downloading, so memory stays bounded and chunks saved
+        before a failure are kept.
+        
         Args:
             **kwargs: Scraper-specific parameters
             
@@ -196,35 +526,408 @@ class BaseScraper(ABC):
         """
         logger.info(f"Starting job scraping from {self.source_name}")
         
+        from ..models import ScrapingLog
+        
+        scraping_log = ScrapingLog.objects.create(source=self.source_name)
+        cache = self.get_http_cache()
+        if cache is not None:
+            cache.reset_stats()
+        policy = self.get_fetch_policy()
+        host_stats = policy.stats() if policy is not None else None
+        
+        results = {'total': 0, 'created': 0, 'updated': 0, 'skipped': 0, 'errors': 0, 'unchanged': 0}
+        
         try:
-            # Step 1: Fetch raw data
-            raw_data = self.fetch_data_for_scraping(**kwargs)
-            
-            # Step 2: Parse into job dictionaries
-            job_list = self.parse_data(raw_data)
-            logger.info(f"Parsed {len(job_list)} jobs from {self.source_name}")
-            
-            # Step 3: Normalize jobs
-            normalized_jobs = []
-            for job_data in job_list:
+            if self.stream:
+                chunk = []
+                jobs = prefetch(self.iter_parsed_jobs(**kwargs), maxsize=self.stream_chunk_size)
                 try:
-                    normalized_job = self.normalize_job(job_data)
-                    normalized_jobs.append(normalized_job)
-                except Exception as e:
-                    logger.warning(f"Failed to normalize job: {str(e)}")
-                    continue
-            
-            logger.info(f"Normalized {len(normalized_jobs)} jobs from {self.source_name}")
+                    for job in jobs:
+                        chunk.append(job)
+                        if len(chunk) >= self.stream_chunk_size:
+                            batch, chunk = chunk, []
+                            self._save_stream_chunk(batch, results, scraping_log)
+                finally:
+                    # Stop the producer thread even if a save failed, then
+                    # save what was parsed before the crawl ended or failed
+                    jobs.close()
+                    if chunk:
+                        self._save_stream_chunk(chunk, results, scraping_log)
+            else:
+                # Step 1: Fetch raw data
+                raw_data = self.fetch_data_for_scraping(**kwargs)
+                
+                # Step 2: Parse into job dictionaries
+                job_list = self.parse_data(raw_data)
+                logger.info(f"Parsed {len(job_list)} jobs from {self.source_name}")
+                
+                # Steps 3-4: Normalize and save
+                self._add_results(results, self._process_jobs(job_list, scraping_log))
             
-            # Step 4: Save to database
-            results = self.save_jobs(normalized_jobs)
+            # Only a completed run moves the watermarks forward and
+            # caches its responses
+            if self._watermarks is not None:
+                self._watermarks.save()
+            if cache is not None:
+                cache.commit()
+                cache.prune()
             
             logger.info(f"Scraping complete for {self.source_name}: {results}")
+            scraping_log.status = 'completed'
             return results
             
         except Exception as e:
             logger.error(f"Error during scraping from {self.source_name}: {str(e)}")
+            scraping_log.status = 'failed'
+            scraping_log.errors_count += 1
+            scraping_log.error_details = str(e)
             raise
+        
+        finally:
+            self.close_fetcher()
+            self._watermarks = None
+            self._known_urls = set()
+            self._url_scopes = {}
+            if self._enricher is not None:
+                scraping_log.parse_cache_hits = self._enricher.cache_hits
+                scraping_log.parse_cache_misses = self._enricher.cache_misses
+                results['parse_cache_hits'] = self._enricher.cache_hits
+                results['parse_cache_misses'] = self._enricher.cache_misses
+            self.close_enricher()
+            if cache is not None:
+                cache.rollback()
+                scraping_log.cache_hits = cache.hits
+                scraping_log.cache_misses = cache.misses
+            if policy is not None:
+                scraping_log.host_stats = policy.stats(since=host_stats)
+            scraping_log.completed_at = timezone.now()
+            scraping_log.save()
+    
+    def iter_parsed_jobs(self, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Yield parsed job dictionaries for the streaming pipeline.
+        
+        The default fetches everything and then parses it; scrapers override
+        this to fetch and parse in batches so jobs are yielded as pages arrive.
+        
+        Args:
+            **kwargs: Scraper-specific parameters
+            
+        Yields:
+            Job dictionaries as returned by parse_data()
+        """
+        raw_data = self.fetch_data_for_scraping(**kwargs)
+        yield from self.parse_data(raw_data)
+    
+    def normalize_jobs(self, job_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Normalize parsed jobs and, with parse_content on, enrich them.
+        
+        Jobs that fail to normalize are logged and dropped. Enrichment runs
+        on the process pool when normalize_workers > 1; order is preserved.
+        
+        Args:
+            job_list: Parsed job dictionaries
+            
+        Returns:
+            Normalized (and enriched) job dictionaries
+        """
+        normalized_jobs = []
+        for job_data in job_list:
+            try:
+                normalized_job = self.normalize_job(job_data)
+                normalized_jobs.append(normalized_job)
+            except Exception as e:
+                logger.warning(f"Failed to normalize job: {str(e)}")
+                continue
+        
+        self.attach_logos(normalized_jobs)
+        
+        if self.parse_content and normalized_jobs:
+            normalized_jobs = self.get_enricher().enrich(normalized_jobs)
+        
+        return normalized_jobs
+    
+    def attach_logos(self, normalized_jobs: List[Dict[str, Any]]) -> None:
+        """
+        Set company_logo on normalized jobs that have none, one lookup per company.
+        
+        Lookups go through the CompanyLogo cache, so a batch only resolves
+        companies not seen recently. A failed lookup leaves jobs without a logo.
+        """
+        companies = {}
+        for job in normalized_jobs:
+            if job.get('company') and not job.get('company_logo'):
+                companies.setdefault(job['company'], job.get('url'))
+        if not companies:
+            return
+        
+        try:
+            logos = resolve_company_logos(companies)
+        except Exception as e:
+            logger.warning(f"Logo lookup failed for {self.source_name}: {e}")
+            return
+        
+        for job in normalized_jobs:
+            company_logo = logos.get(job.get('company'))
+            if company_logo and not job.get('company_logo'):
+                job['company_logo'] = company_logo
+    
+    def get_enricher(self):
+        """Get the JobEnricher for this run, sized by normalize_workers and backed by the parse cache."""
+        if self._enricher is None:
+            from ..enrichment import JobEnricher
+            from ..parse_cache import get_parse_cache
+            self._enricher = JobEnricher(
+                workers=self.normalize_workers,
+                cache=get_parse_cache(self.parse_cache_backend)
+            )
+        return self._enricher
+    
+    def close_enricher(self):
+        """Shut down the enrichment worker pool, if one was started."""
+        if self._enricher is not None:
+            self._enricher.close()
+            self._enricher = None
+    
+    def _process_jobs(self, job_list: List[Dict[str, Any]], scraping_log) -> Dict[str, int]:
+        """
+        Normalize and save a batch of parsed jobs.
+        
+        Args:
+            job_list: Parsed job dictionaries
+            scraping_log: ScrapingLog for this run; its counters are incremented
+            
+        Returns:
+            save_jobs() results for the batch plus an 'unchanged' count
+        """
+        from ..services import JobScrapingService
+        
+        scraping_log.jobs_found += len(job_list)
+        
+        # Jobs from unchanged responses skip normalize/save; only
+        # refresh their last-seen time so they are not aged out
+        unchanged_jobs = [job for job in job_list if job.get('_unchanged')]
+        if unchanged_jobs:
+            job_list = [job for job in job_list if not job.get('_unchanged')]
+            JobScrapingService(batch_size=self.save_batch_size).mark_jobs_seen(
+                self.source_name,
+                [self._extract_url(job) for job in unchanged_jobs]
+            )
+            logger.info(f"Skipped {len(unchanged_jobs)} unchanged jobs from {self.source_name}")
+        
+        # Step 3: Normalize jobs
+        normalized_jobs = self.normalize_jobs(job_list)
+        
+        logger.info(f"Normalized {len(normalized_jobs)} jobs from {self.source_name}")
+        
+        # Step 4: Save to database
+        results = self.save_jobs(normalized_jobs)
+        results['unchanged'] = len(unchanged_jobs)
+        
+        scraping_log.jobs_created += results.get('created', 0)
+        scraping_log.jobs_updated += results.get('updated', 0)
+        scraping_log.jobs_unchanged += len(unchanged_jobs)
+        scraping_log.errors_count += results.get('errors', 0)
+        
+        self._settle_jobs(unchanged_jobs + job_list)
+        return results
+    
+    def _settle_jobs(self, job_list: List[Dict[str, Any]]) -> Set[str]:
+        """
+        Check which parsed jobs are stored after a save.
+        
+        Stored jobs are recorded in the watermarks. Jobs can go missing
+        between parse and save (dropped by normalize, save errors, or
+        marked unchanged without ever having been saved); they are dropped
+        from the watermarks and the cached responses they came from are
+        forgotten, so the next run fetches and saves them again.
+        
+        Args:
+            job_list: Parsed job dictionaries of the batch, unchanged ones included
+            
+        Returns:
+            URLs of the jobs that are stored
+        """
+        cache = self.get_http_cache()
+        watermarks = self.get_watermarks()
+        if (cache is None and watermarks is None) or not job_list:
+            return set()
+        
+        job_urls = [self._job_url(job) for job in job_list]
+        stored = self._stored_urls(job_urls)
+        missing = set()
+        for job, url in zip(job_list, job_urls):
+            key = self._watermark_key(job, url)
+            if url in stored:
+                if key:
+                    self.record_job(*key)
+                continue
+            if watermarks is not None and key and key[1]:
+                watermarks.forget(key[0], key[1])
+            missing.add(job.get('_response_url') or url)
+        
+        missing.discard(None)
+        if missing:
+            logger.warning(f"{len(missing)} responses from {self.source_name} had jobs that were not saved")
+            if cache is not None:
+                cache.forget(missing)
+        return stored
+    
+    def _watermark_key(self, job_data: Dict[str, Any], url: Optional[str]) -> Optional[Tuple[str, Any, Any]]:
+        """(scope, external_id, posted_at) a parsed job is recorded under, if it is tracked."""
+        if job_data.get('_watermark'):
+            return tuple(job_data['_watermark'])
+        if url and url in self._url_scopes:
+            return (self._url_scopes[url], url, None)
+        return None
+    
+    def _job_url(self, job_data: Dict[str, Any]) -> Optional[str]:
+        """URL of a parsed job, or None if it has none."""
+        try:
+            return self._extract_url(job_data) or None
+        except Exception:
+            return None
+    
+    def _stored_urls(self, urls: Iterable[Optional[str]]) -> Set[str]:
+        """Those of urls that belong to a stored job of this source."""
+        from ..models import JobPosting
+        
+        urls = list({url for url in urls if url})
+        batch_size = self.save_batch_size or 500
+        stored = set()
+        for start in range(0, len(urls), batch_size):
+            stored.update(JobPosting.objects.filter(
+                source=self.source_name,
+                url__in=urls[start:start + batch_size]
+            ).values_list('url', flat=True))
+        return stored
+    
+    def _save_stream_chunk(self, chunk: List[Dict[str, Any]], results: Dict[str, int], scraping_log) -> None:
+        """Normalize and save one streaming chunk, persisting progress to the log."""
+        self._add_results(results, self._process_jobs(chunk, scraping_log))
+        # Persist progress so a crash mid-crawl leaves an accurate log
+        scraping_log.save()
+    
+    @staticmethod
+    def _add_results(totals: Dict[str, int], results: Dict[str, int]) -> None:
+        """Accumulate per-batch counts into the run totals."""
+        for key, value in results.items():
+            totals[key] = totals.get(key, 0) + value
+    
+    def plan_work_units(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Split a crawl of this source into independent work queue units.
+        
+        The default is a single unit running the whole scrape; scrapers
+        override this to split by board, search or category.
+        
+        Returns:
+            (kind, payload) pairs for WorkQueue.enqueue
+        """
+        return [('source', {})]
+    
+    def run_work_unit(self, kind: str, payload: Dict[str, Any], queue=None) -> Dict[str, int]:
+        """
+        Execute one work queue unit.
+        
+        Handles 'source' (a full scrape_jobs run) and 'detail' (fetch and
+        save one job page); scrapers handle their own kinds and defer here
+        for the rest. A unit can run more than once after a lost lease, so
+        handlers must be idempotent -- saves are upserts.
+        
+        Args:
+            kind: Unit kind from plan_work_units()
+            payload: Unit parameters
+            queue: WorkQueue, for units that fan out into further units
+            
+        Returns:
+            Result counts, stored on the unit
+        """
+        if kind == 'source':
+            return self.scrape_jobs()
+        if kind == 'detail':
+            return self._run_detail_unit(payload['url'], payload.get('scope', ''))
+        raise ValueError(f"Unknown work unit kind for {self.source_name}: {kind}")
+    
+    def _run_detail_unit(self, url: str, scope: str = '') -> Dict[str, int]:
+        """
+        Fetch, normalize and save the job page at url.
+        
+        The job is recorded in the watermarks under the scope it was listed
+        under once it is stored. A page that cannot be fetched or parsed, or
+        whose job is not stored, fails the unit so the queue retries it.
+        Detail units save watermarks concurrently; an id lost to a racing
+        save is only fetched again.
+        """
+        from ..models import ScrapingLog
+        
+        self._url_scopes[url] = scope
+        cache = self.get_http_cache()
+        try:
+            job_list = self.parse_data([url])
+            if not job_list:
+                raise RuntimeError(f"No job parsed from {url}")
+            # Detail units are too fine-grained for a ScrapingLog each
+            results = self._process_jobs(job_list, ScrapingLog(source=self.source_name))
+            if url not in self._stored_urls([url]):
+                raise RuntimeError(f"Job from {url} was not saved")
+            
+            if self._watermarks is not None:
+                self._watermarks.save()
+            if cache is not None:
+                cache.commit()
+            return results
+        finally:
+            self.close_fetcher()
+            self.close_enricher()
+            if cache is not None:
+                cache.rollback()
+            self._watermarks = None
+            self._url_scopes = {}
+    
+    def _run_listing_unit(self, queue) -> Dict[str, int]:
+        """
+        Collect job page URLs from this scraper's listings and queue a
+        'detail' unit for each new one.
+        
+        Known jobs (see incremental) are only marked seen; known jobs that
+        are not stored are forgotten and queued like new ones. New jobs are
+        recorded in the watermarks by their detail units, once saved.
+        """
+        from ..services import JobScrapingService
+        
+        try:
+            job_urls = self.fetch_data_for_scraping()
+        finally:
+            self.close_fetcher()
+        
+        known_urls = [url for url in job_urls if self.is_known_url(url)]
+        stored = self._stored_urls(known_urls)
+        seen_urls = [url for url in known_urls if url in stored]
+        new_urls = [url for url in job_urls if url not in stored]
+        for url in seen_urls:
+            self.record_url(url)
+        for url in known_urls:
+            if url not in stored:
+                self._watermarks.forget(self._url_scopes.get(url, ''), url)
+        
+        if seen_urls:
+            JobScrapingService(batch_size=self.save_batch_size).mark_jobs_seen(self.source_name, seen_urls)
+        enqueued = queue.enqueue(self.source_name, 'detail', [
+            {'url': url, 'scope': self._url_scopes.get(url, '')} for url in new_urls
+        ])
+        
+        if self._watermarks is not None:
+            self._watermarks.save()
+        cache = self.get_http_cache()
+        if cache is not None:
+            cache.commit()
+        self._watermarks = None
+        self._known_urls = set()
+        self._url_scopes = {}
+        
+        return {'found': len(job_urls), 'enqueued': enqueued, 'unchanged': len(seen_urls)}
     
     @abstractmethod
     def fetch_data_for_scraping(self, **kwargs) -> Any:
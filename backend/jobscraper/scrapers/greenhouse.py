@@ -1,7 +1,7 @@
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime, date
-from .base import BaseScraper
+from .base import BaseScraper, iter_chunks
 
 
 logger = logging.getLogger(__name__)
@@ -45,14 +45,49 @@ class GreenhouseScraper(BaseScraper):
         Returns:
             List of all jobs from all companies
         """
+        return self._fetch_boards(self.company_names)
+    
+    def iter_parsed_jobs(self, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Yield parsed jobs board by board for the streaming pipeline.
+        
+        Boards are fetched fetch_concurrency at a time and job pages are
+        fetched stream_chunk_size at a time, so only one batch is in memory.
+        """
+        for companies in iter_chunks(self.company_names, self.fetch_concurrency):
+            for jobs in iter_chunks(self._fetch_boards(companies), self.stream_chunk_size):
+                yield from self.parse_data(jobs)
+    
+    def plan_work_units(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """One work unit per company board."""
+        return [('board', {'company': company}) for company in self.company_names]
+    
+    def run_work_unit(self, kind: str, payload: Dict[str, Any], queue=None) -> Dict[str, int]:
+        """Scrape a single company board for 'board' units."""
+        if kind == 'board':
+            self.company_names = [payload['company']]
+            return self.scrape_jobs()
+        return super().run_work_unit(kind, payload, queue)
+    
+    def _fetch_boards(self, company_names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch and flatten the job lists of the given company boards.
+        
+        Args:
+            company_names: Greenhouse board identifiers
+            
+        Returns:
+            Jobs from all boards, tagged with their company identifier
+        """
         all_jobs = []
         
-        for company in self.company_names:
+        urls = [f"{self.base_url}/{company}/jobs" for company in company_names]
+        logger.info(f"Fetching jobs for {len(urls)} companies from Greenhouse")
+        
+        for company, url, data in zip(company_names, urls, self.fetch_many(urls)):
             try:
-                url = f"{self.base_url}/{company}/jobs"
-                logger.info(f"Fetching jobs for {company} from Greenhouse")
-                
-                data = self.fetch_data(url)
+                if isinstance(data, Exception):
+                    raise data
                 
                 if isinstance(data, dict) and 'jobs' in data:
                     jobs = data['jobs']
@@ -62,9 +97,14 @@ class GreenhouseScraper(BaseScraper):
                     logger.warning(f"Unexpected data format for {company}: {type(data)}")
                     continue
                 
-                # Add company identifier to each job
+                # Add company identifier to each job; jobs the board's
+                # watermark already covers are passed on as unchanged
+                unchanged = self.is_unchanged(url)
                 for job in jobs:
                     job['_company_identifier'] = company
+                    job['_response_url'] = url
+                    job['_unchanged'] = unchanged or self.is_known_job(company, job.get('id'), job.get('updated_at'))
+                    job['_watermark'] = (company, job.get('id'), job.get('updated_at'))
                 
                 all_jobs.extend(jobs)
                 logger.info(f"Found {len(jobs)} jobs for {company}")
@@ -87,7 +127,14 @@ class GreenhouseScraper(BaseScraper):
         """
         parsed_jobs = []
         
-        for job_data in raw_data:
+        # Fetch HTML content from job URLs for comprehensive parsing; jobs from
+        # unchanged boards are skipped downstream, so their pages are not fetched
+        html_pages = self._fetch_html_pages([
+            None if job_data.get('_unchanged') else job_data.get('absolute_url')
+            for job_data in raw_data
+        ])
+        
+        for job_data, html_content in zip(raw_data, html_pages):
             try:
                 # Greenhouse API provides well-structured data, minimal parsing needed
                 parsed_job = {
@@ -100,25 +147,12 @@ class GreenhouseScraper(BaseScraper):
                     'company_identifier': job_data.get('_company_identifier'),
                     'departments': job_data.get('departments', []),
                     'offices': job_data.get('offices', []),
+                    'html_content': html_content,
+                    '_unchanged': job_data.get('_unchanged', False),
+                    '_response_url': job_data.get('_response_url'),
+                    '_watermark': job_data.get('_watermark'),
                 }
                 
-                # Fetch HTML content from job URL for comprehensive parsing
-                job_url = job_data.get('absolute_url')
-                if job_url:
-                    try:
-                        logger.debug(f"Fetching HTML content for job: {job_data.get('title')}")
-                        response = self.session.get(job_url, timeout=10)
-                        if response.status_code == 200:
-                            parsed_job['html_content'] = response.text
-                        else:
-                            logger.warning(f"Failed to fetch HTML content for {job_url}: Status {response.status_code}")
-                            parsed_job['html_content'] = ''
-                    except Exception as e:
-                        logger.warning(f"Error fetching HTML content for {job_url}: {str(e)}")
-                        parsed_job['html_content'] = ''
-                else:
-                    parsed_job['html_content'] = ''
-                
                 parsed_jobs.append(parsed_job)
                 
             except Exception as e:
@@ -127,6 +161,44 @@ class GreenhouseScraper(BaseScraper):
         
         return parsed_jobs
     
+    def _fetch_html_pages(self, job_urls: List[Optional[str]]) -> List[str]:
+        """
+        Fetch the HTML page for each job URL.
+        
+        Job pages are fetched concurrently when async fetching is enabled;
+        otherwise they are fetched one by one without the board rate limit.
+        
+        Args:
+            job_urls: Job URLs (None entries are skipped)
+            
+        Returns:
+            HTML content per URL, '' where the page could not be fetched
+        """
+        html_pages = [''] * len(job_urls)
+        indexed_urls = [(i, url) for i, url in enumerate(job_urls) if url]
+        
+        if self.async_fetch:
+            results = self.fetch_many([url for _, url in indexed_urls])
+            for (i, url), result in zip(indexed_urls, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Error fetching HTML content for {url}: {str(result)}")
+                else:
+                    html_pages[i] = getattr(result, 'text', '')
+            return html_pages
+        
+        for i, url in indexed_urls:
+            try:
+                logger.debug(f"Fetching HTML content for job: {url}")
+                response = self.session.get(url, timeout=10)
+                if response.status_code == 200:
+                    html_pages[i] = response.text
+                else:
+                    logger.warning(f"Failed to fetch HTML content for {url}: Status {response.status_code}")
+            except Exception as e:
+                logger.warning(f"Error fetching HTML content for {url}: {str(e)}")
+        
+        return html_pages
+    
     def _parse_location(self, location_data: Dict[str, Any]) -> str:
         """Parse location data from Greenhouse API."""
         if not location_data:
@@ -1,8 +1,8 @@
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime, date
-from time import sleep
-from .base import BaseScraper
+from ..locations import normalize_location
+from .base import BaseScraper, iter_chunks
 
 
 logger = logging.getLogger(__name__)
@@ -117,105 +117,6 @@ class GreenhouseIndiaScraper(BaseScraper):
             'pwc',
             'kpmg'
         ]
-        
-        # Indian cities and locations to filter for
-        self.india_locations = [
-            'india', 'भारत',
-            'mumbai', 'delhi', 'bangalore', 'bengaluru', 'chennai', 'hyderabad',
-            'pune', 'kolkata', 'ahmedabad', 'surat', 'jaipur', 'lucknow',
-            'kanpur', 'nagpur', 'indore', 'thane', 'bhopal', 'visakhapatnam',
-            'pimpri', 'patna', 'vadodara', 'ghaziabad', 'ludhiana', 'agra',
-            'nashik', 'faridabad', 'meerut', 'rajkot', 'kalyan', 'vasai',
-            'varanasi', 'srinagar', 'aurangabad', 'dhanbad', 'amritsar',
-            'navi mumbai', 'allahabad', 'prayagraj', 'ranchi', 'haora',
-            'jabalpur', 'gwalior', 'coimbatore', 'vijayawada', 'jodhpur',
-            'madurai', 'raipur', 'kota', 'guwahati', 'chandigarh',
-            'thiruvananthapuram', 'solapur', 'hubballi', 'tiruchirappalli',
-            'bareilly', 'mysore', 'tiruppur', 'gurgaon', 'gurugram',
-            'aligarh', 'jalandhar', 'bhubaneswar', 'salem', 'warangal',
-            'guntur', 'bhiwandi', 'saharanpur', 'gorakhpur', 'bikaner',
-            'amravati', 'noida', 'jamshedpur', 'bhilai', 'cuttack',
-            'firozabad', 'kochi', 'ernakulam', 'bhavnagar', 'dehradun',
-            'durgapur', 'asansol', 'rourkela', 'nanded', 'kolhapur',
-            'ajmer', 'akola', 'gulbarga', 'jamnagar', 'ujjain',
-            'loni', 'siliguri', 'jhansi', 'ulhasnagar', 'jammu',
-            'sangli', 'miraj', 'kupwad', 'belgaum', 'mangalore',
-            'ambattur', 'tirunelveli', 'malegaon', 'gaya', 'jalgaon',
-            'udaipur', 'maheshtala', 'davanagere', 'kozhikode', 'kurnool',
-            'rajpur sonarpur', 'rajahmundry', 'bokaro', 'south dumdum',
-            'bellary', 'patiala', 'gopalpur', 'agartala', 'bhagalpur',
-            'muzaffarnagar', 'bhatpara', 'panihati', 'latur', 'dhule',
-            'rohtak', 'korba', 'bhilwara', 'berhampur', 'muzaffarpur',
-            'ahmednagar', 'mathura', 'kollam', 'avadi', 'kadapa',
-            'kamarhati', 'sambalpur', 'bilaspur', 'shahjahanpur',
-            'satara', 'bijapur', 'rampur', 'shivamogga', 'chandrapur',
-            'junagadh', 'thrissur', 'alwar', 'bardhaman', 'kulti',
-            'kakinada', 'nizamabad', 'parbhani', 'tumkur', 'khammam',
-            'ozhukarai', 'bihar sharif', 'panipat', 'darbhanga',
-            'bally', 'aizawl', 'dewas', 'ichalkaranji', 'karnal',
-            'bathinda', 'jalna', 'eluru', 'kirari suleman nagar',
-            'barabanki', 'purnia', 'satna', 'mau', 'sonipat',
-            'farrukhabad', 'sagar', 'rourkela', 'durg', 'imphal',
-            'ratlam', 'hapur', 'arrah', 'anantapur', 'karimnagar',
-            'etawah', 'ambernath', 'north dumdum', 'bharatpur',
-            'begusarai', 'new delhi', 'old delhi', 'central delhi',
-            'north delhi', 'south delhi', 'east delhi', 'west delhi',
-            'mumbai suburban', 'thane district', 'pune district',
-            'bangalore urban', 'bangalore rural', 'hyderabad district',
-            'chennai district', 'kolkata district', 'ahmedabad district',
-            'kanpur district', 'lucknow district', 'jaipur district',
-            'indore district', 'nagpur district', 'patna district',
-            'bhopal district', 'vadodara district', 'ludhiana district',
-            'agra district', 'meerut district', 'nashik district',
-            'faridabad district', 'rajkot district', 'varanasi district',
-            'srinagar district', 'aurangabad district', 'dhanbad district',
-            'amritsar district', 'allahabad district', 'ranchi district',
-            'jabalpur district', 'gwalior district', 'coimbatore district',
-            'vijayawada district', 'jodhpur district', 'madurai district',
-            'raipur district', 'kota district', 'guwahati district',
-            'chandigarh district', 'thiruvananthapuram district',
-            'solapur district', 'hubballi district', 'tiruchirappalli district',
-            'bareilly district', 'mysore district', 'tiruppur district',
-            'aligarh district', 'jalandhar district', 'bhubaneswar district',
-            'salem district', 'warangal district', 'guntur district',
-            'bhiwandi district', 'saharanpur district', 'gorakhpur district',
-            'bikaner district', 'amravati district', 'jamshedpur district',
-            'bhilai district', 'cuttack district', 'firozabad district',
-            'kochi district', 'bhavnagar district', 'dehradun district',
-            'durgapur district', 'asansol district', 'rourkela district',
-            'nanded district', 'kolhapur district', 'ajmer district',
-            'akola district', 'gulbarga district', 'jamnagar district',
-            'ujjain district', 'loni district', 'siliguri district',
-            'jhansi district', 'ulhasnagar district', 'jammu district',
-            'sangli district', 'belgaum district', 'mangalore district',
-            'ambattur district', 'tirunelveli district', 'malegaon district',
-            'gaya district', 'jalgaon district', 'udaipur district',
-            'maheshtala district', 'davanagere district', 'kozhikode district',
-            'kurnool district', 'rajahmundry district', 'bokaro district',
-            'bellary district', 'patiala district', 'agartala district',
-            'bhagalpur district', 'muzaffarnagar district', 'bhatpara district',
-            'panihati district', 'latur district', 'dhule district',
-            'rohtak district', 'korba district', 'bhilwara district',
-            'berhampur district', 'muzaffarpur district', 'ahmednagar district',
-            'mathura district', 'kollam district', 'avadi district',
-            'kadapa district', 'kamarhati district', 'sambalpur district',
-            'bilaspur district', 'shahjahanpur district', 'satara district',
-            'bijapur district', 'rampur district', 'shivamogga district',
-            'chandrapur district', 'junagadh district', 'thrissur district',
-            'alwar district', 'bardhaman district', 'kulti district',
-            'kakinada district', 'nizamabad district', 'parbhani district',
-            'tumkur district', 'khammam district', 'ozhukarai district',
-            'bihar sharif district', 'panipat district', 'darbhanga district',
-            'bally district', 'aizawl district', 'dewas district',
-            'ichalkaranji district', 'karnal district', 'bathinda district',
-            'jalna district', 'eluru district', 'barabanki district',
-            'purnia district', 'satna district', 'mau district',
-            'sonipat district', 'farrukhabad district', 'sagar district',
-            'durg district', 'imphal district', 'ratlam district',
-            'hapur district', 'arrah district', 'anantapur district',
-            'karimnagar district', 'etawah district', 'ambernath district',
-            'bharatpur district', 'begusarai district'
-        ]
     
     def is_india_location(self, location: str) -> bool:
         """
@@ -225,45 +126,12 @@ class GreenhouseIndiaScraper(BaseScraper):
             location: Location string to check
             
         Returns:
-            True if location appears to be in India
+            True if the location normalizes to India (see jobscraper.locations)
         """
-        if not location:
-            return False
-            
-        location_lower = location.lower().strip()
-        
-        # Direct matches
-        for india_loc in self.india_locations:
-            if india_loc.lower() in location_lower:
-                return True
-                
-        # Additional patterns
-        india_patterns = [
-            'in ',  # "Mumbai, IN"
-            ', in',  # "Mumbai, IN"
-            'india',
-            'भारत',
-            ' in)',  # "(Mumbai, IN)"
-            '(in)',
-            'karnataka', 'maharashtra', 'tamil nadu', 'delhi', 'punjab',
-            'gujarat', 'rajasthan', 'uttar pradesh', 'madhya pradesh',
-            'west bengal', 'bihar', 'odisha', 'telangana', 'andhra pradesh',
-            'kerala', 'haryana', 'jharkhand', 'assam', 'chhattisgarh',
-            'uttarakhand', 'himachal pradesh', 'tripura', 'meghalaya',
-            'manipur', 'nagaland', 'goa', 'arunachal pradesh', 'mizoram',
-            'sikkim', 'jammu and kashmir', 'ladakh', 'andaman and nicobar',
-            'chandigarh', 'dadra and nagar haveli', 'daman and diu',
-            'lakshadweep', 'puducherry'
-        ]
-        
-        for pattern in india_patterns:
-            if pattern in location_lower:
-                return True
-                
-        return False
+        return normalize_location(location).country_code == 'IN'
     
     def filter_india_jobs(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Filter jobs to only include those in Indian locations."""
+        """Filter jobs to only include those with an Indian location or office."""
         india_jobs = []
         
         for job in jobs:
@@ -275,11 +143,8 @@ class GreenhouseIndiaScraper(BaseScraper):
             offices = job.get('offices', [])
             office_locations = [office.get('name', '') for office in offices if office.get('name')]
             
-            # Combine all location info
-            all_locations = [location] + office_locations
-            location_text = ' '.join(filter(None, all_locations))
-            
-            if self.is_india_location(location_text):
+            # Multi-office jobs qualify when any of their locations is in India
+            if any(self.is_india_location(name) for name in [location] + office_locations if name):
                 india_jobs.append(job)
                 
         return india_jobs
@@ -287,8 +152,10 @@ class GreenhouseIndiaScraper(BaseScraper):
     def fetch_jobs_for_company(self, company: str) -> List[Dict[str, Any]]:
         """Fetch all jobs for a specific company from Greenhouse API."""
         url = f"{self.base_url}/{company}/jobs"
-        data = self.fetch_data(url)
-        
+        return self._extract_board_jobs(company, self.fetch_data(url))
+    
+    def _extract_board_jobs(self, company: str, data: Any) -> List[Dict[str, Any]]:
+        """Extract the job list from a Greenhouse board response."""
         if isinstance(data, dict) and 'jobs' in data:
             return data['jobs']
         elif isinstance(data, list):
@@ -299,18 +166,51 @@ class GreenhouseIndiaScraper(BaseScraper):
     
     def fetch_data_for_scraping(self) -> List[Dict[str, Any]]:
         """Fetch job data from multiple companies and filter for India locations."""
+        all_india_jobs = self._fetch_india_jobs(self.company_names)
+        logger.info(f"Total India jobs found across all companies: {len(all_india_jobs)}")
+        return all_india_jobs
+    
+    def iter_parsed_jobs(self, **kwargs) -> Iterator[Dict[str, Any]]:
+        """Yield India jobs board by board for the streaming pipeline."""
+        for companies in iter_chunks(self.company_names, self.fetch_concurrency):
+            yield from self.parse_data(self._fetch_india_jobs(companies))
+    
+    def plan_work_units(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """One work unit per company board."""
+        return [('board', {'company': company}) for company in self.company_names]
+    
+    def run_work_unit(self, kind: str, payload: Dict[str, Any], queue=None) -> Dict[str, int]:
+        """Scrape a single company board for 'board' units."""
+        if kind == 'board':
+            self.company_names = [payload['company']]
+            return self.scrape_jobs()
+        return super().run_work_unit(kind, payload, queue)
+    
+    def _fetch_india_jobs(self, company_names: List[str]) -> List[Dict[str, Any]]:
+        """Fetch the given company boards and keep only India-based jobs."""
         all_india_jobs = []
         
-        for company in self.company_names:
-            logger.info(f"Fetching jobs for {company} from Greenhouse")
-            
+        # fetch_data/fetch_many already pace requests per host, so no extra
+        # delay between companies is needed
+        urls = [f"{self.base_url}/{company}/jobs" for company in company_names]
+        logger.info(f"Fetching jobs for {len(urls)} companies from Greenhouse")
+        
+        for company, url, data in zip(company_names, urls, self.fetch_many(urls)):
             try:
-                company_jobs = self.fetch_jobs_for_company(company)
+                if isinstance(data, Exception):
+                    raise data
+                
+                company_jobs = self._extract_board_jobs(company, data)
                 india_jobs = self.filter_india_jobs(company_jobs)
+                unchanged = self.is_unchanged(url)
                 
-                # Add company name to each job
+                # Add company name to each job; jobs the board's watermark
+                # already covers are passed on as unchanged
                 for job in india_jobs:
                     job['company_name'] = company.title()  # Store company name
+                    job['_response_url'] = url
+                    job['_unchanged'] = unchanged or self.is_known_job(company, job.get('id'), job.get('updated_at'))
+                    job['_watermark'] = (company, job.get('id'), job.get('updated_at'))
                 
                 if india_jobs:
                     logger.info(f"Found {len(india_jobs)} India jobs for {company}")
@@ -321,11 +221,7 @@ class GreenhouseIndiaScraper(BaseScraper):
             except Exception as e:
                 logger.error(f"Failed to fetch jobs for {company}: {e}")
                 continue
-            
-            # Add delay between companies to be respectful
-            sleep(1)
         
-        logger.info(f"Total India jobs found across all companies: {len(all_india_jobs)}")
         return all_india_jobs
     
     def parse_data(self, raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
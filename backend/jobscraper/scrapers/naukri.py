@@ -1,9 +1,9 @@
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime, date
 import re
 from bs4 import BeautifulSoup
-from .base import BaseScraper
+from .base import BaseScraper, iter_chunks
 
 
 logger = logging.getLogger(__name__)
@@ -170,6 +170,16 @@ class NaukriScraper(BaseScraper):
             'durgapur', 'asansol', 'rourkela', 'nanded', 'kolhapur',
             'ajmer', 'akola', 'gulbarga', 'jamnagar', 'ujjain'
         ]
+        
+        # Searches per crawl: the first max_search_keywords keywords in each
+        # priority location, results pages first_page..max_pages_per_keyword
+        self.max_search_keywords = 20
+        self.priority_locations = ['bangalore', 'mumbai', 'delhi', 'hyderabad', 'pune', 'chennai']
+        self.first_page = 1
+        self.max_pages_per_keyword = 3
+        
+        # Limit the number of job detail pages parsed per run
+        self.max_jobs_to_parse = 100
     
     def build_search_url(self, keyword: str, location: str = '', page: int = 1) -> str:
         """
@@ -206,49 +216,92 @@ class NaukriScraper(BaseScraper):
         Returns:
             List of job detail page URLs
         """
-        job_urls = []
-        max_pages_per_keyword = 3  # Limit to avoid too many requests
+        scoped_urls = []
         
         # Search with a subset of keywords to avoid overloading
-        priority_keywords = self.search_keywords[:20]  # Use first 20 keywords
-        priority_locations = ['bangalore', 'mumbai', 'delhi', 'hyderabad', 'pune', 'chennai']
+        priority_keywords = self.search_keywords[:self.max_search_keywords]
         
-        for keyword in priority_keywords:
-            for location in priority_locations:
+        # Fetch page N of every keyword/location search in one batch, then
+        # page N+1 only for searches whose page N still returned new jobs
+        active_searches = [
+            (keyword, location)
+            for keyword in priority_keywords
+            for location in self.priority_locations
+        ]
+        
+        watermarks = self.get_watermarks()
+        
+        for page in range(self.first_page, self.max_pages_per_keyword + 1):
+            if not active_searches:
+                break
+            
+            logger.info(f"Fetching page {page} for {len(active_searches)} searches")
+            search_urls = [
+                self.build_search_url(keyword, location, page)
+                for keyword, location in active_searches
+            ]
+            
+            next_searches = []
+            for (keyword, location), response in zip(active_searches, self.fetch_many(search_urls)):
                 try:
-                    logger.info(f"Searching for '{keyword}' jobs in {location}")
+                    if isinstance(response, Exception):
+                        raise response
                     
-                    for page in range(1, max_pages_per_keyword + 1):
-                        search_url = self.build_search_url(keyword, location, page)
-                        logger.info(f"Fetching page {page}: {search_url}")
-                        
-                        response_text = self.fetch_data(search_url)
-                        if not response_text:
-                            break
-                        
-                        # Parse job URLs from search results
-                        page_job_urls = self.extract_job_urls(response_text)
-                        job_urls.extend(page_job_urls)
-                        
-                        logger.info(f"Found {len(page_job_urls)} job URLs on page {page}")
-                        
-                        # Break if no more jobs found
-                        if len(page_job_urls) == 0:
-                            break
-                            
-                        # Add delay to be respectful
-                        self.sleep()
+                    response_text = getattr(response, 'text', None)
+                    if not response_text:
+                        continue
+                    
+                    # Parse job URLs from search results
+                    page_job_urls = self.extract_job_urls(response_text)
+                    scope = f"{keyword}|{location}"
+                    scoped_urls.extend((url, scope) for url in page_job_urls)
+                    new_job_urls = [url for url in page_job_urls if not self.is_known_job(scope, url)]
+                    if watermarks is not None:
+                        watermarks.set_cursor(scope, {'page': page})
+                    
+                    logger.info(
+                        f"Found {len(page_job_urls)} job URLs ({len(new_job_urls)} new) "
+                        f"for '{keyword}' in {location} on page {page}"
+                    )
+                    
+                    # Only fetch the next page if this one had new jobs;
+                    # results past a page of known jobs were seen before
+                    if new_job_urls:
+                        next_searches.append((keyword, location))
                         
                 except Exception as e:
                     logger.error(f"Error searching for {keyword} in {location}: {str(e)}")
                     continue
+            
+            active_searches = next_searches
         
-        # Remove duplicates
-        unique_job_urls = list(set(job_urls))
+        # Remove duplicates; jobs seen by earlier runs go last
+        unique_job_urls = self.track_listing_urls(scoped_urls)
         logger.info(f"Total unique job URLs found: {len(unique_job_urls)}")
         
         return unique_job_urls
     
+    def plan_work_units(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """One unit per keyword x location search; each queues a detail unit per new job."""
+        return [
+            ('search', {
+                'keyword': keyword,
+                'location': location,
+                'pages': [self.first_page, self.max_pages_per_keyword],
+            })
+            for keyword in self.search_keywords[:self.max_search_keywords]
+            for location in self.priority_locations
+        ]
+    
+    def run_work_unit(self, kind: str, payload: Dict[str, Any], queue=None) -> Dict[str, int]:
+        """Collect one search's job pages over its page range for 'search' units."""
+        if kind == 'search':
+            self.search_keywords = [payload['keyword']]
+            self.priority_locations = [payload['location']]
+            self.first_page, self.max_pages_per_keyword = payload['pages']
+            return self._run_listing_unit(queue)
+        return super().run_work_unit(kind, payload, queue)
+    
     def extract_job_urls(self, html_content: str) -> List[str]:
         """
         Extract job detail URLs from Naukri search results page.
@@ -290,6 +343,14 @@ class NaukriScraper(BaseScraper):
         
         return job_urls
     
+    def iter_parsed_jobs(self, **kwargs) -> Iterator[Dict[str, Any]]:
+        """Yield parsed jobs one batch of job pages at a time for the streaming pipeline."""
+        job_urls = self.fetch_data_for_scraping(**kwargs)
+        new_urls = [url for url in job_urls if not self.is_known_url(url)]
+        known_urls = [url for url in job_urls if self.is_known_url(url)]
+        for urls in iter_chunks(new_urls[:self.max_jobs_to_parse] + known_urls, self.stream_chunk_size):
+            yield from self.parse_data(urls)
+    
     def parse_data(self, job_urls: List[str]) -> List[Dict[str, Any]]:
         """
         Parse job data from Naukri job detail pages.
@@ -302,15 +363,28 @@ class NaukriScraper(BaseScraper):
         """
         parsed_jobs = []
         
+        # Jobs known from earlier runs are passed on without fetching their pages
+        for job_url in job_urls:
+            if self.is_known_url(job_url):
+                parsed_jobs.append({'url': job_url, '_unchanged': True})
+        
         # Limit the number of jobs to parse to avoid overloading
-        max_jobs_to_parse = 100
-        job_urls_to_parse = job_urls[:max_jobs_to_parse]
+        job_urls_to_parse = [url for url in job_urls if not self.is_known_url(url)][:self.max_jobs_to_parse]
+        
+        responses = self.fetch_many(job_urls_to_parse)
         
-        for i, job_url in enumerate(job_urls_to_parse, 1):
+        for i, (job_url, response) in enumerate(zip(job_urls_to_parse, responses), 1):
             try:
                 logger.info(f"Parsing job {i}/{len(job_urls_to_parse)}: {job_url}")
                 
-                html_content = self.fetch_data(job_url)
+                if isinstance(response, Exception):
+                    raise response
+                
+                if self.is_unchanged(job_url):
+                    parsed_jobs.append({'url': job_url, '_unchanged': True})
+                    continue
+                
+                html_content = getattr(response, 'text', None)
                 if not html_content:
                     continue
                 
@@ -318,9 +392,6 @@ class NaukriScraper(BaseScraper):
                 if job_data:
                     parsed_jobs.append(job_data)
                 
-                # Add delay to be respectful
-                self.sleep()
-                
             except Exception as e:
                 logger.error(f"Error parsing job URL {job_url}: {str(e)}")
                 continue
@@ -1,9 +1,9 @@
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime, date
 from bs4 import BeautifulSoup
 import re
-from .base import BaseScraper
+from .base import BaseScraper, iter_chunks
 
 
 logger = logging.getLogger(__name__)
@@ -42,14 +42,15 @@ class WeWorkRemotelyScraper(BaseScraper):
         Returns:
             List of job detail page URLs
         """
-        job_urls = []
+        scoped_urls = []
         
-        for category in self.categories:
+        category_urls = [f"{self.base_url}/remote-jobs/{category}" for category in self.categories]
+        logger.info(f"Fetching jobs from {len(category_urls)} categories")
+        
+        for category, response in zip(self.categories, self.fetch_many(category_urls)):
             try:
-                category_url = f"{self.base_url}/remote-jobs/{category}"
-                logger.info(f"Fetching jobs from category: {category}")
-                
-                response = self.fetch_data(category_url)
+                if isinstance(response, Exception):
+                    raise response
                 
                 if hasattr(response, 'text'):
                     soup = BeautifulSoup(response.text, 'html.parser')
@@ -61,7 +62,7 @@ class WeWorkRemotelyScraper(BaseScraper):
                         href = link.get('href')
                         if href and href.startswith('/remote-jobs/'):
                             full_url = f"{self.base_url}{href}"
-                            job_urls.append(full_url)
+                            scoped_urls.append((full_url, category))
                     
                     logger.info(f"Found {len(job_links)} jobs in {category}")
                 
@@ -69,12 +70,29 @@ class WeWorkRemotelyScraper(BaseScraper):
                 logger.error(f"Failed to fetch category {category}: {str(e)}")
                 continue
         
-        # Remove duplicates
-        job_urls = list(set(job_urls))
+        # Remove duplicates; jobs seen by earlier runs go last
+        job_urls = self.track_listing_urls(scoped_urls)
         logger.info(f"Total unique job URLs found: {len(job_urls)}")
         
         return job_urls
     
+    def plan_work_units(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """One listing unit per category; each queues a detail unit per new job."""
+        return [('search', {'category': category}) for category in self.categories]
+    
+    def run_work_unit(self, kind: str, payload: Dict[str, Any], queue=None) -> Dict[str, int]:
+        """Collect one category's job pages for 'search' units."""
+        if kind == 'search':
+            self.categories = [payload['category']]
+            return self._run_listing_unit(queue)
+        return super().run_work_unit(kind, payload, queue)
+    
+    def iter_parsed_jobs(self, **kwargs) -> Iterator[Dict[str, Any]]:
+        """Yield parsed jobs one batch of job pages at a time for the streaming pipeline."""
+        job_urls = self.fetch_data_for_scraping(**kwargs)
+        for urls in iter_chunks(job_urls, self.stream_chunk_size):
+            yield from self.parse_data(urls)
+    
     def parse_data(self, raw_data: List[str]) -> List[Dict[str, Any]]:
         """
         Parse job detail pages to extract job information.
@@ -87,10 +105,22 @@ class WeWorkRemotelyScraper(BaseScraper):
         """
         parsed_jobs = []
         
+        # Jobs known from earlier runs are passed on without fetching their pages
         for url in raw_data:
+            if self.is_known_url(url):
+                parsed_jobs.append({'url': url, '_unchanged': True})
+        job_urls = [url for url in raw_data if not self.is_known_url(url)]
+        
+        for url, response in zip(job_urls, self.fetch_many(job_urls)):
             try:
+                if isinstance(response, Exception):
+                    raise response
+                
+                if self.is_unchanged(url):
+                    parsed_jobs.append({'url': url, '_unchanged': True})
+                    continue
+                
                 logger.debug(f"Parsing job details from: {url}")
-                response = self.fetch_data(url)
                 
                 if hasattr(response, 'text'):
                     soup = BeautifulSoup(response.text, 'html.parser')
@@ -0,0 +1,211 @@
+"""
+Job Full-Text Search
+
+Indexed search over job title, company, location and description, replacing
+'%q%' scans of the description column.
+
+- PostgreSQL: a generated, stored tsvector column (search_vector) on the
+  job table, weighted title > company > location > description, with a GIN
+  index. Matches use websearch_to_tsquery and are ranked with ts_rank_cd.
+- SQLite: an FTS5 external-content table kept in sync by triggers, ranked
+  with bm25 using the same field weighting.
+
+The index is maintained by the database itself, so every write path --
+save(), bulk_create/bulk_update at ingest, QuerySet.update() -- updates it
+incrementally. The index lives outside the model: the ORM never selects the
+column or table, and databases without it fall back to icontains matching.
+
+install_search_index() creates the index (the 0013 migration and the
+rebuild_search_index command call it); search_jobs() queries it.
+"""
+
+import logging
+import re
+from typing import Dict, Optional
+
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+
+logger = logging.getLogger(__name__)
+
+
+JOB_TABLE = 'jobscraper_jobposting'
+FTS_TABLE = 'jobscraper_jobposting_fts'
+VECTOR_COLUMN = 'search_vector'
+VECTOR_INDEX = 'jobscraper_jobposting_search_idx'
+
+# Fields in weight order; FTS5 bm25 takes matching per-column weights
+SEARCH_FIELDS = ('title', 'company', 'location', 'description')
+FTS_WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+
+_POSTGRES_VECTOR = (
+    "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(company, '')), 'B') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(location, '')), 'C') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'D')"
+)
+
+_SQLITE_TRIGGERS = {
+    'ai': f"AFTER INSERT ON {JOB_TABLE} BEGIN "
+          f"INSERT INTO {FTS_TABLE}(rowid, {', '.join(SEARCH_FIELDS)}) "
+          f"VALUES (new.id, {', '.join(f'new.{field}' for field in SEARCH_FIELDS)}); END",
+    'ad': f"AFTER DELETE ON {JOB_TABLE} BEGIN "
+          f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {', '.join(SEARCH_FIELDS)}) "
+          f"VALUES ('delete', old.id, {', '.join(f'old.{field}' for field in SEARCH_FIELDS)}); END",
+    # Only re-index when a searched column changed
+    'au': f"AFTER UPDATE OF {', '.join(SEARCH_FIELDS)} ON {JOB_TABLE} BEGIN "
+          f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {', '.join(SEARCH_FIELDS)}) "
+          f"VALUES ('delete', old.id, {', '.join(f'old.{field}' for field in SEARCH_FIELDS)}); "
+          f"INSERT INTO {FTS_TABLE}(rowid, {', '.join(SEARCH_FIELDS)}) "
+          f"VALUES (new.id, {', '.join(f'new.{field}' for field in SEARCH_FIELDS)}); END",
+}
+
+_FTS_TOKENS = re.compile(r'\w+', re.UNICODE)
+
+# alias -> 'postgresql', 'sqlite' or None (no index installed)
+_backends: Dict[str, Optional[str]] = {}
+
+
+def get_search_backend(using: str = 'default') -> Optional[str]:
+    """
+    Full-text backend available on a database.
+
+    Returns:
+        'postgresql' or 'sqlite' when the index is installed, else None
+    """
+    if using not in _backends:
+        connection = connections[using]
+        backend = None
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                columns = connection.introspection.get_table_description(cursor, JOB_TABLE)
+                if any(column.name == VECTOR_COLUMN for column in columns):
+                    backend = 'postgresql'
+            elif connection.vendor == 'sqlite':
+                if FTS_TABLE in connection.introspection.table_names(cursor):
+                    backend = 'sqlite'
+        _backends[using] = backend
+    return _backends[using]
+
+
+def install_search_index(using: str = 'default') -> Optional[str]:
+    """
+    Create the full-text index if it is missing and index existing jobs.
+
+    Returns:
+        Backend installed, or None for databases without full-text support
+    """
+    connection = connections[using]
+    _backends.pop(using, None)
+
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                f"ALTER TABLE {JOB_TABLE} ADD COLUMN IF NOT EXISTS {VECTOR_COLUMN} tsvector "
+                f"GENERATED ALWAYS AS ({_POSTGRES_VECTOR}) STORED"
+            )
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {VECTOR_INDEX} ON {JOB_TABLE} USING gin ({VECTOR_COLUMN})")
+        elif connection.vendor == 'sqlite':
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                f"{', '.join(SEARCH_FIELDS)}, content='{JOB_TABLE}', content_rowid='id', "
+                f"tokenize='porter unicode61 remove_diacritics 2')"
+            )
+            for name, body in _SQLITE_TRIGGERS.items():
+                cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_{name} {body}")
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        else:
+            logger.warning(f"No full-text search support for {connection.vendor}; search uses icontains")
+
+    return get_search_backend(using)
+
+
+def drop_search_index(using: str = 'default') -> None:
+    """Remove the full-text index; search falls back to icontains."""
+    connection = connections[using]
+    _backends.pop(using, None)
+
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(f"DROP INDEX IF EXISTS {VECTOR_INDEX}")
+            cursor.execute(f"ALTER TABLE {JOB_TABLE} DROP COLUMN IF EXISTS {VECTOR_COLUMN}")
+        elif connection.vendor == 'sqlite':
+            for name in _SQLITE_TRIGGERS:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{name}")
+            cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+def rebuild_search_index(using: str = 'default') -> None:
+    """Re-index every job (SQLite); PostgreSQL's generated column never needs it."""
+    if get_search_backend(using) == 'sqlite':
+        with connections[using].cursor() as cursor:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def fts_query(text: str) -> str:
+    """
+    FTS5 MATCH expression for free text.
+
+    Every word must match (quoted, so FTS5 operators in user input are
+    literal); the last word also matches as a prefix, for search-as-you-type.
+    Empty when the text has no words.
+    """
+    words = _FTS_TOKENS.findall(text or '')
+    if not words:
+        return ''
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def search_jobs(queryset, text: str):
+    """
+    Filter jobs to those matching text and annotate their relevance.
+
+    Args:
+        queryset: JobPosting queryset
+        text: Free-text query (PostgreSQL accepts websearch syntax:
+              "quoted phrases", OR, -excluded)
+
+    Returns:
+        Matching jobs annotated with search_rank (higher is more relevant);
+        ordering is left to the caller
+    """
+    backend = get_search_backend(queryset.db)
+    table = queryset.model._meta.db_table
+
+    if backend == 'postgresql':
+        tsquery = "websearch_to_tsquery('english'::regconfig, %s)"
+        return queryset.filter(
+            RawSQL(f'"{table}"."{VECTOR_COLUMN}" @@ {tsquery}', (text,), output_field=BooleanField())
+        ).annotate(
+            search_rank=RawSQL(f'ts_rank_cd("{table}"."{VECTOR_COLUMN}", {tsquery})', (text,), output_field=FloatField())
+        )
+
+    if backend == 'sqlite':
+        match = fts_query(text)
+        if not match:
+            return queryset.none()
+        weights = ', '.join(str(weight) for weight in FTS_WEIGHTS)
+        # bm25() only works in the query that runs the MATCH, so join the FTS
+        # table rather than ranking in a per-row subquery (which re-runs the
+        # match for every row). The unary + hides the rowid from the FTS
+        # table, so SQLite drives the join from the match instead of probing
+        # the index once per job. bm25 is lower for better matches.
+        return queryset.extra(
+            select={'search_rank': f'-bm25({FTS_TABLE}, {weights})'},
+            tables=[FTS_TABLE],
+            where=[f'+{FTS_TABLE}.rowid = "{table}"."id"', f'{FTS_TABLE} MATCH %s'],
+            params=[match],
+        )
+
+    # No index: every word must appear in one of the fields
+    condition = Q()
+    for word in (text or '').split():
+        word_condition = Q()
+        for field in SEARCH_FIELDS:
+            word_condition |= Q(**{f'{field}__icontains': word})
+        condition &= word_condition
+    return queryset.filter(condition).annotate(search_rank=Value(0.0, output_field=FloatField()))
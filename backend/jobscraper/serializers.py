@@ -19,6 +19,10 @@ class JobPostingSerializer(serializers.ModelSerializer):
             'company',
             'company_logo',
             'location',
+            'country_code',
+            'region',
+            'city',
+            'is_remote',
             'employment_type',
             'description',
             'requirements',
@@ -38,76 +42,18 @@ class JobPostingSerializer(serializers.ModelSerializer):
         return obj.id
     
     def get_employment_type(self, obj):
-        """Extract employment type from description or return default."""
-        # Handle None or empty description
-        if not obj.description:
-            return 'To be updated'
-            
-        # Try to extract employment type from description
-        description_lower = obj.description.lower()
-        if 'full-time' in description_lower or 'full time' in description_lower:
-            return 'Full-time'
-        elif 'part-time' in description_lower or 'part time' in description_lower:
-            return 'Part-time'
-        elif 'contract' in description_lower:
-            return 'Contract'
-        elif 'intern' in description_lower:
-            return 'Internship'
-        else:
-            return 'To be updated'  # Default when no clear type is found
+        """Employment type stored at ingest (see jobscraper.listing_fields)."""
+        return obj.get_job_type_display() if obj.job_type else 'To be updated'
     
     def get_requirements(self, obj):
-        """Extract requirements from description."""
-        # Handle None or empty description
-        if not obj.description:
-            return ['To be updated']
-            
-        # Simple extraction - look for common requirement patterns
-        description = obj.description
-        requirements = []
-        
-        # Look for skills, qualifications, requirements sections
-        lines = description.split('\n')
-        capture_next = False
-        
-        for line in lines:
-            line_lower = line.lower().strip()
-            if any(keyword in line_lower for keyword in ['requirements', 'qualifications', 'skills', 'must have', 'we need']):
-                capture_next = True
-                continue
-            
-            if capture_next and line.strip():
-                if line.strip().startswith('•') or line.strip().startswith('-') or line.strip().startswith('*'):
-                    requirements.append(line.strip())
-                elif len(requirements) > 0:
-                    break
-        
-        return requirements if requirements else ['To be updated']
+        """Requirement lines stored at ingest."""
+        return obj.requirements.splitlines() if obj.requirements else ['To be updated']
     
     def get_salary_range(self, obj):
-        """Extract salary information from description."""
-        # Handle None or empty description
-        if not obj.description:
+        """Salary range stored at ingest."""
+        if obj.salary_min is None and obj.salary_max is None:
             return 'To be updated'
-            
-        # Look for salary patterns in description
-        description = obj.description.lower()
-        
-        # Common salary patterns
-        import re
-        salary_patterns = [
-            r'\$[\d,]+\s*-\s*\$[\d,]+',
-            r'[\d,]+k\s*-\s*[\d,]+k',
-            r'salary.*?\$[\d,]+',
-            r'compensation.*?\$[\d,]+',
-        ]
-        
-        for pattern in salary_patterns:
-            match = re.search(pattern, description)
-            if match:
-                return match.group(0)
-        
-        return 'To be updated'
+        return obj.salary_range_display
 
 
 class JobPostingListSerializer(serializers.ModelSerializer):
@@ -123,6 +69,9 @@ class JobPostingListSerializer(serializers.ModelSerializer):
             'title',
             'company',
             'location',
+            'country_code',
+            'city',
+            'is_remote',
             'employment_type',
             'url',
             'apply_url',
@@ -137,20 +86,7 @@ class JobPostingListSerializer(serializers.ModelSerializer):
         return obj.id
     
     def get_employment_type(self, obj):
-        if not obj.description:
-            return 'To be updated'
-            
-        description_lower = obj.description.lower()
-        if 'full-time' in description_lower or 'full time' in description_lower:
-            return 'Full-time'
-        elif 'part-time' in description_lower or 'part time' in description_lower:
-            return 'Part-time'
-        elif 'contract' in description_lower:
-            return 'Contract'
-        elif 'intern' in description_lower:
-            return 'Internship'
-        else:
-            return 'To be updated'
+        return obj.get_job_type_display() if obj.job_type else 'To be updated'
 
 
 class RecruiterJobSerializer(serializers.ModelSerializer):
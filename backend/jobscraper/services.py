@@ -1,6 +1,13 @@
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+from django.conf import settings
 from django.db import transaction, IntegrityError
+from django.db.models import Q
+from django.utils import timezone
+from .enrichment import PARSED_FIELDS
+from .expiry import JobExpiry
+from .facets import source_stats, track_facets
+from .listing_fields import LISTING_FIELDS
 from .models import JobPosting
 
 
@@ -12,18 +19,80 @@ class JobScrapingService:
     Service layer for saving scraped job data to the database.
     
     Handles deduplication, validation, and database operations for job postings.
+    Jobs can be saved one row at a time or through the set-based bulk path,
+    which produces the same created/updated/skipped/errors counts.
     """
     
-    def save_jobs(self, job_data_list: List[Dict[str, Any]]) -> Dict[str, int]:
+    # Fields written when an existing job is refreshed (see _apply_job_update)
+    UPDATE_FIELDS = [
+        'title',
+        'location',
+        'country_code',
+        'region',
+        'city',
+        'is_remote',
+        'description',
+        'job_type',
+        'requirements',
+        'salary_min',
+        'salary_max',
+        'currency',
+        'skill_ids',
+        'skill_version',
+        'date_posted',
+        'date_scraped',
+        'is_active',
+        'updated_at',
+    ]
+    
+    # Columns needed to diff incoming data against stored rows
+    DIFF_FIELDS = [
+        'id',
+        'external_id',
+        'source',
+        'title',
+        'location',
+        'description',
+        'job_type',
+        'requirements',
+        'salary_min',
+        'salary_max',
+        'currency',
+        'skill_ids',
+        'skill_version',
+        'date_posted',
+        'date_scraped',
+        'is_active',
+        'updated_at',
+    ]
+    
+    def __init__(self, batch_size: int = None, dedup: bool = None):
+        """
+        Initialize the service.
+        
+        Args:
+            batch_size: Rows per lookup/write batch for bulk saves
+                        (defaults to settings.JOBSCRAPER_BULK_BATCH_SIZE)
+            dedup: Link near-duplicate postings to a canonical posting after
+                   saving (defaults to settings.JOBSCRAPER_DEDUP)
+        """
+        self.batch_size = batch_size or getattr(settings, 'JOBSCRAPER_BULK_BATCH_SIZE', 500)
+        self.dedup = getattr(settings, 'JOBSCRAPER_DEDUP', True) if dedup is None else dedup
+    
+    def save_jobs(self, job_data_list: List[Dict[str, Any]], bulk: bool = False) -> Dict[str, int]:
         """
         Save a list of normalized job dictionaries to the database.
         
         Args:
             job_data_list: List of normalized job dictionaries
+            bulk: Use the set-based bulk path instead of one transaction per job
             
         Returns:
             Dictionary with counts: {'created': 5, 'updated': 2, 'skipped': 1, 'errors': 0}
         """
+        if bulk:
+            return self.bulk_save_jobs(job_data_list)
+        
         results = {
             'created': 0,
             'updated': 0,
@@ -32,18 +101,269 @@ class JobScrapingService:
             'total': len(job_data_list)
         }
         
+        saved_keys = []
+        with track_facets(self._jobs_for_keys(job_data_list)):
+            for job_data in job_data_list:
+                try:
+                    result = self._save_single_job(job_data)
+                    results[result] += 1
+                    if result in ('created', 'updated'):
+                        saved_keys.append((job_data['external_id'], job_data['source']))
+                    
+                except Exception as e:
+                    logger.error(f"Error saving job {job_data.get('title', 'Unknown')}: {str(e)}")
+                    results['errors'] += 1
+        
+        # Dedup counts its own relinks and promotions
+        self._index_duplicates(saved_keys)
+        
+        logger.info(f"Job saving results: {results}")
+        return results
+    
+    def bulk_save_jobs(self, job_data_list: List[Dict[str, Any]], batch_size: int = None) -> Dict[str, int]:
+        """
+        Save jobs using chunked lookups and bulk writes.
+        
+        Existing (external_id, source) rows are fetched one query per chunk,
+        diffed in memory with _should_update_job, and written back with
+        bulk_create(update_conflicts=True) and bulk_update. Jobs that repeat
+        within the input are resolved against the pending state so the counts
+        match save_jobs(bulk=False) exactly.
+        
+        Args:
+            job_data_list: List of normalized job dictionaries
+            batch_size: Rows per lookup/write batch (defaults to self.batch_size)
+            
+        Returns:
+            Dictionary with counts: {'created': 5, 'updated': 2, 'skipped': 1, 'errors': 0}
+        """
+        batch_size = batch_size or self.batch_size
+        results = {
+            'created': 0,
+            'updated': 0,
+            'skipped': 0,
+            'errors': 0,
+            'total': len(job_data_list)
+        }
+        
+        for start in range(0, len(job_data_list), batch_size):
+            chunk = job_data_list[start:start + batch_size]
+            try:
+                chunk_results = self._bulk_save_chunk(chunk)
+            except Exception as e:
+                logger.error(f"Bulk save failed for chunk at offset {start}, retrying row by row: {str(e)}")
+                chunk_results = self.save_jobs(chunk)
+            
+            for key in ('created', 'updated', 'skipped', 'errors'):
+                results[key] += chunk_results[key]
+        
+        logger.info(f"Bulk job saving results: {results}")
+        return results
+    
+    def _bulk_save_chunk(self, job_data_list: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Diff and write one chunk of jobs inside a single transaction.
+        
+        Args:
+            job_data_list: Chunk of normalized job dictionaries
+            
+        Returns:
+            Dictionary with created/updated/skipped/errors counts for the chunk
+        """
+        results = {'created': 0, 'updated': 0, 'skipped': 0, 'errors': 0}
+        
+        valid_jobs = []
         for job_data in job_data_list:
+            if not self._validate_job_data(job_data):
+                logger.warning(f"Invalid job data: {job_data}")
+                results['skipped'] += 1
+            elif not job_data.get('external_id') or not job_data.get('source'):
+                logger.warning(f"Missing external_id or source in job data: {job_data}")
+                results['skipped'] += 1
+            else:
+                valid_jobs.append(job_data)
+        
+        if not valid_jobs:
+            return results
+        
+        # Parsed fields are only loaded and written when the chunk carries them
+        parsed_fields = [field for field in PARSED_FIELDS if any(field in job_data for job_data in valid_jobs)]
+        update_fields = self.UPDATE_FIELDS + [field for field in parsed_fields if field not in self.UPDATE_FIELDS]
+        
+        known_jobs = self._fetch_existing_jobs(valid_jobs, parsed_fields)
+        to_create: Dict[Tuple[str, str], JobPosting] = {}
+        to_update: Dict[Tuple[str, str], JobPosting] = {}
+        
+        for job_data in valid_jobs:
+            key = (job_data['external_id'], job_data['source'])
             try:
-                result = self._save_single_job(job_data)
-                results[result] += 1
-                
+                job = known_jobs.get(key)
+                if job is None:
+                    job = self._build_job(job_data)
+                    known_jobs[key] = job
+                    to_create[key] = job
+                    results['created'] += 1
+                elif self._should_update_job(job, job_data):
+                    self._apply_job_update(job, job_data)
+                    if key not in to_create:
+                        to_update[key] = job
+                    results['updated'] += 1
+                else:
+                    results['skipped'] += 1
             except Exception as e:
                 logger.error(f"Error saving job {job_data.get('title', 'Unknown')}: {str(e)}")
                 results['errors'] += 1
         
-        logger.info(f"Job saving results: {results}")
+        now = timezone.now()
+        for job in to_update.values():
+            job.updated_at = now
+        
+        with track_facets(self._jobs_for_keys(valid_jobs)), transaction.atomic():
+            if to_create:
+                JobPosting.objects.bulk_create(
+                    list(to_create.values()),
+                    batch_size=self.batch_size,
+                    update_conflicts=True,
+                    unique_fields=['external_id', 'source'],
+                    update_fields=update_fields,
+                )
+            if to_update:
+                JobPosting.objects.bulk_update(
+                    list(to_update.values()),
+                    update_fields,
+                    batch_size=self.batch_size,
+                )
+        
+        self._index_duplicates(list(to_create) + list(to_update))
+        
+        # Like save(), only re-index and rescore jobs whose skill or score fields changed
+        from jobmatcher.rescoring import JOB_SCORE_FIELDS
+        
+        reindex, rescore = list(to_create), list(to_create)
+        for key, job in to_update.items():
+            changed = job.changed_fields((JOB_SCORE_FIELDS | {'skill_version'}) & set(update_fields))
+            if changed & {'skill_ids', 'skill_version'}:
+                reindex.append(key)
+            if changed & JOB_SCORE_FIELDS:
+                rescore.append(key)
+        self._index_skills(reindex, rescore)
+        
         return results
     
+    def _index_duplicates(self, keys: List[Tuple[str, str]]) -> None:
+        """
+        Sign saved jobs and link near-duplicates to their canonical posting.
+        
+        Failures are logged rather than raised: the jobs are already saved
+        and are simply treated as canonical until indexed again.
+        
+        Args:
+            keys: (external_id, source) pairs of jobs created or updated
+        """
+        if not self.dedup or not keys:
+            return
+        
+        from .dedup import DuplicateIndex
+        
+        ids_by_source: Dict[str, set] = {}
+        for external_id, source in keys:
+            ids_by_source.setdefault(source, set()).add(external_id)
+        
+        try:
+            jobs = []
+            for source, external_ids in ids_by_source.items():
+                jobs.extend(JobPosting.objects.filter(
+                    source=source,
+                    external_id__in=external_ids
+                ).only('id', 'title', 'company', 'description', 'dedup_signature', 'canonical_job'))
+            DuplicateIndex().index_jobs(jobs)
+        except Exception as e:
+            logger.error(f"Near-duplicate indexing failed: {str(e)}")
+    
+    def _index_skills(self, keys: List[Tuple[str, str]], rescore_keys: List[Tuple[str, str]]) -> None:
+        """
+        Index the skills of bulk-written jobs for candidate generation
+        (jobmatcher.candidates) and queue their rescoring
+        (jobmatcher.rescoring); save() does both for jobs saved one at a time.
+        
+        Failures are logged rather than raised: the jobs are already saved
+        and are picked up by the next rebuild_skill_index run.
+        
+        Args:
+            keys: (external_id, source) pairs of jobs whose skills changed
+            rescore_keys: (external_id, source) pairs of jobs whose scoring fields changed
+        """
+        if not keys and not rescore_keys:
+            return
+        
+        from jobmatcher.candidates import index_jobs
+        from jobmatcher.rescoring import enqueue_jobs
+        
+        ids_by_source: Dict[str, set] = {}
+        for external_id, source in set(keys) | set(rescore_keys):
+            ids_by_source.setdefault(source, set()).add(external_id)
+        
+        try:
+            jobs = {}
+            for source, external_ids in ids_by_source.items():
+                for job in JobPosting.objects.filter(
+                    source=source,
+                    external_id__in=external_ids
+                ).only('id', 'external_id', 'source', 'skill_ids', 'skill_version'):
+                    jobs[(job.external_id, job.source)] = job
+            index_jobs(jobs[key] for key in set(keys) if key in jobs)
+            enqueue_jobs(jobs[key].id for key in set(rescore_keys) if key in jobs)
+        except Exception as e:
+            logger.error(f"Skill indexing failed: {str(e)}")
+    
+    def _jobs_for_keys(self, job_data_list: List[Dict[str, Any]]):
+        """
+        Queryset of the stored jobs with the (external_id, source) pairs of
+        job dictionaries, for tracking facet counts across a save.
+        """
+        ids_by_source: Dict[str, set] = {}
+        for job_data in job_data_list:
+            if job_data.get('external_id') and job_data.get('source'):
+                ids_by_source.setdefault(job_data['source'], set()).add(job_data['external_id'])
+        
+        condition = Q(pk__in=[])
+        for source, external_ids in ids_by_source.items():
+            condition |= Q(source=source, external_id__in=external_ids)
+        return JobPosting.objects.filter(condition)
+    
+    def _fetch_existing_jobs(
+        self,
+        job_data_list: List[Dict[str, Any]],
+        extra_fields: List[str] = None
+    ) -> Dict[Tuple[str, str], JobPosting]:
+        """
+        Load stored jobs matching the (external_id, source) pairs of a chunk.
+        
+        Issues one query per source present in the chunk, loading only the
+        columns needed for diffing.
+        
+        Args:
+            job_data_list: Validated job dictionaries
+            extra_fields: Additional columns to load (e.g. parsed fields to be written)
+            
+        Returns:
+            Dictionary mapping (external_id, source) to JobPosting
+        """
+        ids_by_source: Dict[str, set] = {}
+        for job_data in job_data_list:
+            ids_by_source.setdefault(job_data['source'], set()).add(job_data['external_id'])
+        
+        existing = {}
+        for source, external_ids in ids_by_source.items():
+            queryset = JobPosting.objects.filter(
+                source=source,
+                external_id__in=external_ids
+            ).only(*self.DIFF_FIELDS, *(extra_fields or []))
+            for job in queryset:
+                existing[(job.external_id, job.source)] = job
+        
+        return existing
+    
     def _save_single_job(self, job_data: Dict[str, Any]) -> str:
         """
         Save a single job to the database.
@@ -143,9 +463,13 @@ class JobScrapingService:
         if new_data.get('location') != existing_job.location:
             return True
         
+        # Update if the stored row was never enriched but this data was
+        if new_data.get('parse_confidence') and not existing_job.parse_confidence:
+            return True
+        
         # Update if it's been more than 7 days since last update
-        from django.utils import timezone
-        if existing_job.updated_at < timezone.now() - timezone.timedelta(days=7):
+        # (rows pending insertion in the bulk path have no updated_at yet)
+        if existing_job.updated_at and existing_job.updated_at < timezone.now() - timezone.timedelta(days=7):
             return True
         
         return False
@@ -160,6 +484,21 @@ class JobScrapingService:
         Returns:
             Created JobPosting instance
         """
+        job = self._build_job(job_data)
+        job.save()
+        logger.debug(f"Created new job: {job.title} at {job.company}")
+        return job
+    
+    def _build_job(self, job_data: Dict[str, Any]) -> JobPosting:
+        """
+        Build an unsaved JobPosting from job data.
+        
+        Args:
+            job_data: Normalized job dictionary
+            
+        Returns:
+            Unsaved JobPosting instance
+        """
         job = JobPosting(
             external_id=job_data.get('external_id'),
             title=job_data.get('title'),
@@ -170,10 +509,11 @@ class JobScrapingService:
             source=job_data.get('source'),
             date_posted=job_data.get('date_posted'),
             date_scraped=job_data.get('date_scraped'),
+            **{field: job_data[field] for field in PARSED_FIELDS if field in job_data},
         )
-        
-        job.save()
-        logger.debug(f"Created new job: {job.title} at {job.company}")
+        job.normalize_location()
+        job.derive_listing_fields()
+        job.derive_skill_vector()
         return job
     
     def _update_job(self, existing_job: JobPosting, job_data: Dict[str, Any]) -> JobPosting:
@@ -187,24 +527,87 @@ class JobScrapingService:
         Returns:
             Updated JobPosting instance
         """
+        self._apply_job_update(existing_job, job_data)
+        existing_job.save()
+        logger.debug(f"Updated job: {existing_job.title} at {existing_job.company}")
+        return existing_job
+    
+    def _apply_job_update(self, existing_job: JobPosting, job_data: Dict[str, Any]) -> None:
+        """
+        Copy changed fields from job data onto an existing JobPosting without saving.
+        
+        Args:
+            existing_job: Existing JobPosting instance
+            job_data: New job data dictionary
+        """
         # Update fields that might have changed
+        text_changed = (
+            job_data.get('title', existing_job.title) != existing_job.title
+            or job_data.get('description', existing_job.description) != existing_job.description
+        )
         existing_job.title = job_data.get('title', existing_job.title)
         existing_job.location = job_data.get('location', existing_job.location)
+        existing_job.normalize_location()
+        description_changed = job_data.get('description', existing_job.description) != existing_job.description
         existing_job.description = job_data.get('description', existing_job.description)
         existing_job.date_posted = job_data.get('date_posted', existing_job.date_posted)
         existing_job.date_scraped = job_data.get('date_scraped', existing_job.date_scraped)
         
+        # Parsed fields, when the job was enriched
+        for field in PARSED_FIELDS:
+            if field in job_data:
+                setattr(existing_job, field, job_data[field])
+        
+        # Listing fields derived from the old description are re-derived,
+        # unless the parser supplied them
+        if description_changed and not any(field in job_data for field in LISTING_FIELDS):
+            for field in LISTING_FIELDS:
+                setattr(existing_job, field, None)
+        existing_job.derive_listing_fields()
+        
+        # Skills are re-extracted only when the text they come from changed
+        if text_changed or not existing_job.skill_version:
+            existing_job.derive_skill_vector()
+        
         # Ensure job is marked as active (in case it was previously deactivated)
         existing_job.is_active = True
-        
-        existing_job.save()
-        logger.debug(f"Updated job: {existing_job.title} at {existing_job.company}")
-        return existing_job
     
+    def mark_jobs_seen(self, source: str, urls: List[str]) -> int:
+        """
+        Refresh date_scraped for jobs whose source content was unchanged.
+        
+        Jobs skipped via the HTTP cache are not re-saved, so this keeps them
+        from being treated as stale by deactivate_old_jobs.
+        
+        Args:
+            source: Source identifier to filter jobs
+            urls: Job URLs that were seen unchanged
+        
+        Returns:
+            Number of jobs refreshed
+        """
+        refreshed = 0
+        urls = list(set(urls))
+        now = timezone.now()
+        
+        for start in range(0, len(urls), self.batch_size):
+            seen_jobs = JobPosting.objects.filter(
+                source=source,
+                url__in=urls[start:start + self.batch_size]
+            )
+            # Previously deactivated jobs are listed again
+            with track_facets(seen_jobs):
+                refreshed += seen_jobs.update(date_scraped=now, is_active=True)
+        
+        logger.info(f"Marked {refreshed} unchanged jobs from {source} as seen")
+        return refreshed
+
     def deactivate_old_jobs(self, source: str, days_old: int = 30) -> int:
         """
         Deactivate jobs that haven't been seen in recent scrapes.
         
+        Jobs are deactivated in chunks of bounded id ranges (see jobscraper.expiry).
+        
         Args:
             source: Source identifier to filter jobs
             days_old: Number of days since last scrape to consider "old"
@@ -212,18 +615,8 @@ class JobScrapingService:
         Returns:
             Number of jobs deactivated
         """
-        from django.utils import timezone
-        
         cutoff_date = timezone.now() - timezone.timedelta(days=days_old)
-        
-        old_jobs = JobPosting.objects.filter(
-            source=source,
-            is_active=True,
-            date_scraped__lt=cutoff_date
-        )
-        
-        count = old_jobs.count()
-        old_jobs.update(is_active=False)
+        count = JobExpiry().deactivate(JobPosting.objects.filter(source=source), cutoff_date)
         
         logger.info(f"Deactivated {count} old jobs from {source}")
         return count
@@ -232,6 +625,9 @@ class JobScrapingService:
         """
         Get statistics about scraped jobs.
         
+        Totals come from the facet counters (see jobscraper.facets);
+        unique_companies counts companies with listed jobs.
+        
         Args:
             source: Optional source filter
             
@@ -243,15 +639,9 @@ class JobScrapingService:
         if source:
             queryset = queryset.filter(source=source)
         
-        stats = {
-            'total_jobs': queryset.count(),
-            'active_jobs': queryset.filter(is_active=True).count(),
-            'unique_companies': queryset.values('company').distinct().count(),
-            'sources': list(queryset.values_list('source', flat=True).distinct()),
-        }
+        stats = dict(source_stats(source))
         
         # Recent activity (last 7 days)
-        from django.utils import timezone
         recent_date = timezone.now() - timezone.timedelta(days=7)
         stats['recent_jobs'] = queryset.filter(date_scraped__gte=recent_date).count()
         
@@ -5,15 +5,21 @@ A lightweight version of the job parser that doesn't depend on NLTK
 but still provides comprehensive job field extraction using regex and pattern matching.
 """
 
-import re
 import json
 import logging
 from typing import Dict, List, Optional, Union
 from datetime import datetime, date
 from decimal import Decimal
 
+from . import parser_patterns
+from .keyword_matcher import KeywordMatch, KeywordMatcher, match_context
+from .skill_taxonomy import get_taxonomy
+
 logger = logging.getLogger(__name__)
 
+# Bump whenever parse output changes, so cached parse results are not reused
+PARSER_VERSION = '2'
+
 
 class SimpleJobParser:
     """
@@ -26,6 +32,7 @@ class SimpleJobParser:
         self._load_patterns()
         self._load_skill_databases()
         self._load_company_data()
+        self._build_keyword_matcher()
         
         # Basic stop words for keyword extraction
         self.stop_words = {
@@ -37,105 +44,28 @@ class SimpleJobParser:
         }
     
     def _load_patterns(self):
-        """Load regex patterns for various job attributes"""
-        
-        # Salary patterns
-        self.salary_patterns = [
-            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*-\s*\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',
-            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*to\s*\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',
-            r'(\d{1,3}(?:,\d{3})*)\s*-\s*(\d{1,3}(?:,\d{3})*)\s*(?:USD|dollars?|per\s+year)',
-            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*/\s*(?:hour|hr)',
-            r'(\d{1,2})\s*-\s*(\d{1,2})\s*(?:LPA|lakhs?)',
-        ]
-        
-        # Experience level patterns
-        self.experience_patterns = {
-            'entry': r'(?:entry|junior|graduate|fresher|0-2\s+years?|new\s+grad)',
-            'junior': r'(?:junior|1-3\s+years?|early\s+career)',
-            'mid': r'(?:mid|middle|3-5\s+years?|4-6\s+years?|intermediate)',
-            'senior': r'(?:senior|5\+\s+years?|6\+\s+years?|experienced|lead)',
-            'lead': r'(?:lead|principal|staff|architect|team\s+lead)',
-            'executive': r'(?:director|vp|vice\s+president|head\s+of|chief|executive)',
-        }
-        
-        # Job type patterns
-        self.job_type_patterns = {
-            'full-time': r'(?:full.?time|permanent|fte)',
-            'part-time': r'(?:part.?time|pte)',
-            'contract': r'(?:contract|contractor|freelance|consulting)',
-            'internship': r'(?:intern|internship|co.?op)',
-            'temporary': r'(?:temp|temporary|seasonal)',
-        }
-        
-        # Employment mode patterns
-        self.employment_mode_patterns = {
-            'remote': r'(?:remote|work\s+from\s+home|wfh|distributed)',
-            'hybrid': r'(?:hybrid|flexible|mix|combination)',
-            'on-site': r'(?:on.?site|office|in.?person|onsite)',
-        }
-        
-        # Education patterns
-        self.education_patterns = {
-            'high-school': r'(?:high\s+school|hs|secondary)',
-            'associate': r'(?:associate|aa|as)\s+degree',
-            'bachelor': r'(?:bachelor|ba|bs|btech|be)\s+degree',
-            'master': r'(?:master|ma|ms|mtech|mba|me)\s+degree',
-            'phd': r'(?:phd|doctorate|doctoral)',
-        }
-        
-        # Benefit patterns
-        self.benefit_patterns = [
-            r'health\s+insurance', r'medical\s+coverage', r'dental',
-            r'401\(k\)', r'retirement', r'pension',
-            r'paid\s+time\s+off', r'pto', r'vacation',
-            r'stock\s+options', r'equity', r'rsu',
-            r'life\s+insurance', r'disability',
-            r'parental\s+leave', r'maternity', r'paternity',
-            r'tuition\s+reimbursement', r'education',
-            r'gym\s+membership', r'wellness',
-            r'flexible\s+hours', r'work.life\s+balance',
-        ]
+        """Load regex patterns for various job attributes (compiled once in parser_patterns)"""
+        
+        self.salary_patterns = parser_patterns.SALARY_PATTERNS
+        self.experience_patterns = parser_patterns.EXPERIENCE_LEVELS
+        self.job_type_patterns = parser_patterns.JOB_TYPES
+        self.employment_mode_patterns = parser_patterns.EMPLOYMENT_MODES
+        self.education_patterns = parser_patterns.EDUCATION_LEVELS
+        self.benefit_patterns = parser_patterns.BENEFITS
     
     def _load_skill_databases(self):
-        """Load comprehensive skill databases"""
-        
-        # Programming languages
-        self.programming_languages = {
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php',
-            'ruby', 'go', 'rust', 'kotlin', 'swift', 'scala', 'r', 'matlab',
-            'sql', 'html', 'css', 'sass', 'less'
-        }
-        
-        # Frameworks and libraries
-        self.frameworks = {
-            'react', 'angular', 'vue', 'nodejs', 'express', 'django', 'flask',
-            'spring', 'hibernate', 'laravel', 'symfony', 'rails', 'gin',
-            'fastapi', 'pandas', 'numpy', 'tensorflow', 'pytorch', 'keras'
-        }
-        
-        # Cloud platforms
-        self.cloud_platforms = {
-            'aws', 'azure', 'gcp', 'google cloud', 'digitalocean', 'heroku',
-            'vercel', 'netlify', 'cloudflare'
-        }
-        
-        # Databases
-        self.databases = {
-            'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch',
-            'sqlite', 'oracle', 'sql server', 'cassandra', 'dynamodb'
-        }
-        
-        # Tools and technologies
-        self.tools = {
-            'docker', 'kubernetes', 'jenkins', 'github', 'gitlab', 'bitbucket',
-            'jira', 'confluence', 'slack', 'figma', 'git', 'webpack', 'jest'
-        }
-        
-        # Soft skills
-        self.soft_skills = {
-            'leadership', 'communication', 'teamwork', 'problem solving',
-            'analytical thinking', 'creativity', 'adaptability', 'time management'
-        }
+        """Load skill vocabularies from the shared skill taxonomy"""
+        
+        self.skill_taxonomy = get_taxonomy()
+        self.programming_languages = self.skill_taxonomy.terms('programming_languages')
+        self.frameworks = self.skill_taxonomy.terms('frameworks')
+        self.cloud_platforms = self.skill_taxonomy.terms('cloud_platforms')
+        self.databases = self.skill_taxonomy.terms('databases')
+        self.tools = self.skill_taxonomy.terms('tools')
+        self.soft_skills = self.skill_taxonomy.terms('soft_skills')
+        
+        # Every category but certifications, including ones added to the taxonomy
+        self.skills = self.skill_taxonomy.skill_terms()
     
     def _load_company_data(self):
         """Load company size and industry mappings"""
@@ -156,6 +86,43 @@ class SimpleJobParser:
             'large': ['fortune 500', 'enterprise', '1000+', 'multinational'],
             'enterprise': ['global', 'worldwide', '5000+', 'fortune 100'],
         }
+        
+        # Checked in order; the first category with a keyword hit wins
+        self.job_categories = {
+            'software-engineering': ['software', 'developer', 'engineer', 'programming'],
+            'data-science': ['data scientist', 'machine learning', 'ai', 'analytics'],
+            'product-management': ['product manager', 'product owner', 'pm'],
+            'design': ['designer', 'ux', 'ui', 'design'],
+            'marketing': ['marketing', 'growth', 'digital marketing'],
+            'sales': ['sales', 'business development', 'account manager'],
+        }
+    
+    def _build_keyword_matcher(self):
+        """Compile skill, tool and category vocabularies into one automaton"""
+        
+        self.keyword_matcher = KeywordMatcher()
+        self.keyword_matcher.add('skills', self.skills)
+        self.keyword_matcher.add('tools', self.tools)
+        
+        # Category keywords keep substring matching ('developer' in 'developers')
+        for category, keywords in self.job_categories.items():
+            self.keyword_matcher.add(f'category:{category}', keywords, whole_words=False)
+        
+        self._last_scan = (None, [])
+    
+    def _scan_keywords(self, text: str) -> List[KeywordMatch]:
+        """Match all vocabularies against text, reusing the last scan of the same text"""
+        
+        if get_taxonomy() is not self.skill_taxonomy:
+            # The taxonomy was reloaded
+            self._load_skill_databases()
+            self._build_keyword_matcher()
+        
+        last_text, matches = self._last_scan
+        if last_text != text:
+            matches = self.keyword_matcher.find_all(text.lower())
+            self._last_scan = (text, matches)
+        return matches
     
     def parse_job_posting(self, html_content: str, text_content: str, url: str) -> Dict:
         """
@@ -226,28 +193,24 @@ class SimpleJobParser:
         text_lower = text.lower()
         
         # Job type
-        for job_type, pattern in self.job_type_patterns.items():
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                result['job_type'] = job_type
-                break
+        job_type = self.job_type_patterns.classify(text_lower)
+        if job_type:
+            result['job_type'] = job_type
         
         # Employment mode
-        for mode, pattern in self.employment_mode_patterns.items():
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                result['employment_mode'] = mode
-                break
+        mode = self.employment_mode_patterns.classify(text_lower)
+        if mode:
+            result['employment_mode'] = mode
         
         # Experience level
-        for level, pattern in self.experience_patterns.items():
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                result['experience_level'] = level
-                break
+        level = self.experience_patterns.classify(text_lower)
+        if level:
+            result['experience_level'] = level
         
         # Education level
-        for edu, pattern in self.education_patterns.items():
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                result['education_level'] = edu
-                break
+        edu = self.education_patterns.classify(text_lower)
+        if edu:
+            result['education_level'] = edu
         
         return result
     
@@ -312,14 +275,8 @@ class SimpleJobParser:
         result = {}
         
         # Number of openings
-        opening_patterns = [
-            r'(\d+)\s+openings?',
-            r'(\d+)\s+positions?',
-            r'hiring\s+(\d+)',
-        ]
-        
-        for pattern in opening_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in parser_patterns.OPENINGS:
+            match = pattern.search(text)
             if match:
                 result['number_of_openings'] = int(match.group(1))
                 break
@@ -371,43 +328,29 @@ class SimpleJobParser:
         required_skills = set()
         preferred_skills = set()
         
-        # Check all skill databases
-        all_skills = (
-            self.programming_languages | self.frameworks | 
-            self.cloud_platforms | self.databases | 
-            self.tools | self.soft_skills
-        )
-        
-        for skill in all_skills:
-            if skill in text_lower:
-                # Determine if required or preferred based on context
-                skill_context = self._get_skill_context(text_lower, skill)
-                if 'preferred' in skill_context or 'nice' in skill_context:
-                    preferred_skills.add(skill)
-                else:
-                    required_skills.add(skill)
+        for match in self._scan_keywords(text):
+            if match.group != 'skills' or match.term in required_skills or match.term in preferred_skills:
+                continue
+            # Determine if required or preferred from the first mention's context
+            skill_context = match_context(text_lower, match)
+            if 'preferred' in skill_context or 'nice' in skill_context:
+                preferred_skills.add(match.term)
+            else:
+                required_skills.add(match.term)
         
         return {
             'required': list(required_skills),
             'preferred': list(preferred_skills)
         }
     
-    def _get_skill_context(self, text: str, skill: str) -> str:
-        """Get the context around a skill mention"""
-        
-        pattern = rf'.{{0,100}}{re.escape(skill)}.{{0,100}}'
-        match = re.search(pattern, text, re.IGNORECASE)
-        return match.group(0) if match else ""
-    
     def _extract_tools(self, text: str) -> List[str]:
         """Extract tools and technologies"""
         
-        text_lower = text.lower()
         found_tools = []
         
-        for tool in self.tools:
-            if tool in text_lower:
-                found_tools.append(tool)
+        for match in self._scan_keywords(text):
+            if match.group == 'tools' and match.term not in found_tools:
+                found_tools.append(match.term)
         
         return found_tools
     
@@ -417,7 +360,7 @@ class SimpleJobParser:
         result = {}
         
         for pattern in self.salary_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 try:
                     if len(match.groups()) >= 2:
@@ -455,10 +398,8 @@ class SimpleJobParser:
         found_benefits = []
         text_lower = text.lower()
         
-        for pattern in self.benefit_patterns:
-            if re.search(pattern, text_lower):
-                # Clean up the pattern for display
-                benefit = pattern.replace(r'\s+', ' ').replace(r'\(', '(').replace(r'\)', ')')
+        for pattern, benefit in self.benefit_patterns:
+            if pattern.search(text_lower):
                 found_benefits.append(benefit)
         
         return found_benefits
@@ -466,19 +407,10 @@ class SimpleJobParser:
     def _classify_job_category(self, text: str) -> Optional[str]:
         """Classify job into a category"""
         
-        text_lower = text.lower()
-        
-        categories = {
-            'software-engineering': ['software', 'developer', 'engineer', 'programming'],
-            'data-science': ['data scientist', 'machine learning', 'ai', 'analytics'],
-            'product-management': ['product manager', 'product owner', 'pm'],
-            'design': ['designer', 'ux', 'ui', 'design'],
-            'marketing': ['marketing', 'growth', 'digital marketing'],
-            'sales': ['sales', 'business development', 'account manager'],
-        }
+        found_groups = {match.group for match in self._scan_keywords(text)}
         
-        for category, keywords in categories.items():
-            if any(keyword in text_lower for keyword in keywords):
+        for category in self.job_categories:
+            if f'category:{category}' in found_groups:
                 return category
         
         return None
@@ -504,8 +436,7 @@ class SimpleJobParser:
                 break
         
         # Experience years
-        exp_pattern = r'(\d+)\+?\s*years?\s+(?:of\s+)?experience'
-        match = re.search(exp_pattern, text_lower)
+        match = parser_patterns.EXPERIENCE_YEARS.search(text_lower)
         if match:
             years = int(match.group(1))
             if years >= 8:
@@ -521,7 +452,7 @@ class SimpleJobParser:
         """Extract important keywords for searchability"""
         
         # Simple regex-based keyword extraction
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
+        words = parser_patterns.KEYWORD_WORDS.findall(text.lower())
         
         # Remove stop words
         filtered_words = [w for w in words if w not in self.stop_words and len(w) > 3]
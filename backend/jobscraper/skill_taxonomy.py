@@ -0,0 +1,378 @@
+"""
+Skill Taxonomy
+
+The one skill vocabulary shared by the job parsers and the matching engine:
+which terms are recognized in text (grouped by category) and which
+canonical skill each term or synonym stands for.
+
+- normalize() maps a term or synonym to its canonical skill with one dict
+  lookup ('postgres' -> 'postgresql', 'node.js' -> 'javascript'); unknown
+  terms are only lowercased.
+- extract() finds every skill term in a text in one pass (KeywordMatcher,
+  whole words only).
+- Canonical skills have integer ids (their position in sorted order), and
+  the taxonomy has a version, a checksum of its data, that changes whenever
+  terms or synonyms do.
+
+Synonyms only normalize: 'cache' in a description is not a Redis
+requirement, but a profile listing Postgres has PostgreSQL.
+
+The taxonomy is built from the tables below, then an optional JSON file
+(settings.JOBSCRAPER_SKILL_TAXONOMY_FILE) of the form
+
+    {"synonyms": {"postgresql": ["postgres"]}, "terms": {"databases": ["cockroachdb"]}}
+
+then, if settings.JOBSCRAPER_SKILL_TAXONOMY_USE_SKILL_TABLE is set, the
+active fyndr_auth.Skill rows. get_taxonomy() returns the process-wide
+taxonomy and rebuilds it when the JSON file changes or reload_taxonomy()
+was called in any process (checked every
+JOBSCRAPER_SKILL_TAXONOMY_CHECK_INTERVAL seconds).
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .keyword_matcher import KeywordMatch, KeywordMatcher
+
+
+logger = logging.getLogger(__name__)
+
+
+# Canonical skill -> synonyms, checked in order: a synonym listed under two
+# skills belongs to the first
+SKILL_SYNONYMS = {
+    # Programming Languages
+    'javascript': ['js', 'ecmascript', 'node.js', 'nodejs', 'typescript', 'ts'],
+    'python': ['py', 'python3', 'django', 'flask', 'fastapi', 'pandas', 'numpy'],
+    'java': ['jvm', 'spring', 'spring boot', 'kotlin', 'scala'],
+    'react': ['reactjs', 'react.js', 'next.js', 'gatsby'],
+    'angular': ['angularjs', 'angular.js', 'ng'],
+    'vue': ['vuejs', 'vue.js', 'nuxt.js'],
+
+    # Databases
+    'postgresql': ['postgres', 'psql', 'pg'],
+    'mysql': ['sql', 'mariadb'],
+    'mongodb': ['mongo', 'nosql', 'document db'],
+    'redis': ['in-memory', 'cache'],
+    'elasticsearch': ['elastic', 'search engine'],
+
+    # Cloud & DevOps
+    'aws': ['amazon web services', 'ec2', 's3', 'lambda', 'cloudfront', 'rds'],
+    'azure': ['microsoft azure', 'azure functions', 'cosmos db'],
+    'gcp': ['google cloud', 'google cloud platform', 'firebase'],
+    'docker': ['containerization', 'containers'],
+    'kubernetes': ['k8s', 'container orchestration', 'helm'],
+    'terraform': ['iac', 'infrastructure as code'],
+    'jenkins': ['ci/cd', 'continuous integration'],
+
+    # AI/ML
+    'machine learning': ['ml', 'artificial intelligence', 'ai', 'deep learning'],
+    'tensorflow': ['tf', 'keras'],
+    'pytorch': ['torch'],
+    'scikit-learn': ['sklearn'],
+
+    # Frontend
+    'css': ['scss', 'sass', 'less', 'tailwind'],
+    'html': ['html5', 'markup'],
+    'bootstrap': ['css framework'],
+
+    # Backend
+    'rest api': ['restful', 'api', 'microservices'],
+    'graphql': ['graph api'],
+    'websocket': ['real-time', 'socket.io'],
+
+    # Common synonyms
+    'data science': ['data analysis', 'analytics', 'data scientist'],
+    'frontend': ['front-end', 'ui', 'user interface'],
+    'backend': ['back-end', 'server-side'],
+    'fullstack': ['full-stack', 'full stack'],
+    'problem solving': ['problem-solving'],
+}
+
+# Category -> terms recognized in text
+SKILL_TERMS = {
+    'programming_languages': [
+        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php',
+        'ruby', 'go', 'rust', 'kotlin', 'swift', 'scala', 'r', 'matlab',
+        'sql', 'html', 'css', 'sass', 'less', 'coffeescript',
+    ],
+    'frameworks': [
+        'react', 'angular', 'vue', 'svelte', 'ember', 'node.js', 'nodejs',
+        'express', 'django', 'flask', 'spring', 'hibernate', 'laravel',
+        'symfony', 'rails', 'gin', 'fastapi', 'pandas', 'numpy', 'tensorflow',
+        'pytorch', 'keras', 'scikit-learn', 'opencv', 'matplotlib', 'seaborn',
+    ],
+    'cloud_platforms': [
+        'aws', 'azure', 'gcp', 'google cloud', 'digitalocean', 'heroku',
+        'vercel', 'netlify', 'cloudflare',
+    ],
+    'databases': [
+        'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch',
+        'sqlite', 'oracle', 'sql server', 'cassandra', 'dynamodb',
+        'firebase', 'supabase', 'nosql', 'database',
+    ],
+    'tools': [
+        'docker', 'kubernetes', 'terraform', 'jenkins', 'ci/cd',
+        'github actions', 'github', 'gitlab', 'bitbucket', 'jira',
+        'confluence', 'slack', 'figma', 'sketch', 'photoshop', 'illustrator',
+        'tableau', 'power bi', 'excel', 'git', 'svn', 'linux', 'unix',
+        'scrum', 'agile', 'webpack', 'vite', 'babel', 'eslint', 'jest', 'cypress',
+        'selenium', 'postman', 'insomnia',
+    ],
+    'domains': [
+        'machine learning', 'ai', 'data science', 'analytics',
+    ],
+    'soft_skills': [
+        'leadership', 'communication', 'teamwork', 'problem solving',
+        'problem-solving', 'analytical thinking', 'creativity', 'adaptability',
+        'time management', 'project management', 'mentoring', 'collaboration',
+        'initiative',
+    ],
+    'certifications': [
+        'aws certified', 'azure certified', 'gcp certified', 'pmp',
+        'scrum master', 'agile', 'cissp', 'cisa', 'comptia', 'cisco',
+        'oracle certified', 'microsoft certified', 'google certified',
+    ],
+}
+
+CERTIFICATIONS = 'certifications'
+
+# Process-wide cache key bumped by reload_taxonomy()
+GENERATION_KEY = 'jobscraper:skill_taxonomy:generation'
+
+
+class SkillTaxonomy:
+    """Skill terms by category and their canonical skills, with O(1) normalization."""
+
+    def __init__(self):
+        self._canonical: Dict[str, str] = {}
+        self._synonyms: Dict[str, List[str]] = {}
+        self._terms: Dict[str, Set[str]] = {}
+        self._built: Optional[Tuple[KeywordMatcher, Dict[str, int], List[str], int]] = None
+
+    @classmethod
+    def default(cls, path: Optional[str] = None, load_skills: Optional[bool] = None) -> 'SkillTaxonomy':
+        """
+        Taxonomy with the built-in tables and the configured data sources.
+
+        Args:
+            path: JSON file to add (defaults to settings.JOBSCRAPER_SKILL_TAXONOMY_FILE)
+            load_skills: Also add the fyndr_auth.Skill table
+                         (defaults to settings.JOBSCRAPER_SKILL_TAXONOMY_USE_SKILL_TABLE)
+        """
+        from django.conf import settings
+
+        taxonomy = cls()
+        for canonical, synonyms in SKILL_SYNONYMS.items():
+            taxonomy.add_synonyms(canonical, synonyms)
+        for category, terms in SKILL_TERMS.items():
+            taxonomy.add_terms(category, terms)
+
+        if path is None:
+            path = getattr(settings, 'JOBSCRAPER_SKILL_TAXONOMY_FILE', '')
+        if path:
+            taxonomy.load_json(path)
+        if load_skills is None:
+            load_skills = getattr(settings, 'JOBSCRAPER_SKILL_TAXONOMY_USE_SKILL_TABLE', False)
+        if load_skills:
+            taxonomy.load_skills()
+        return taxonomy
+
+    def add_synonyms(self, canonical: str, synonyms: Iterable[str] = ()) -> None:
+        """Map synonyms to a canonical skill; names already mapped keep their skill."""
+        canonical = canonical.lower().strip()
+        self._canonical.setdefault(canonical, canonical)
+        entry = self._synonyms.setdefault(canonical, [])
+        for synonym in synonyms:
+            synonym = synonym.lower().strip()
+            self._canonical.setdefault(synonym, canonical)
+            entry.append(synonym)
+        self._built = None
+
+    def add_terms(self, category: str, terms: Iterable[str]) -> None:
+        """Add terms recognized in text under a category."""
+        self._terms.setdefault(category, set()).update(term.lower().strip() for term in terms if term.strip())
+        self._built = None
+
+    def load_json(self, path: str) -> int:
+        """
+        Add synonyms and terms from a JSON file.
+
+        Returns:
+            Number of synonym entries and terms added
+        """
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Skill taxonomy file {path} not loaded: {e}")
+            return 0
+
+        added = 0
+        for canonical, synonyms in data.get('synonyms', {}).items():
+            self.add_synonyms(canonical, synonyms)
+            added += 1
+        for category, terms in data.get('terms', {}).items():
+            self.add_terms(category, terms)
+            added += len(terms)
+        return added
+
+    def load_skills(self) -> int:
+        """
+        Add the active fyndr_auth.Skill rows as terms, under their category.
+
+        Returns:
+            Number of rows added
+        """
+        from django.db import DatabaseError
+
+        try:
+            from fyndr_auth.models import Skill
+            rows = list(Skill.objects.filter(is_active=True).values_list('name', 'category'))
+        except (ImportError, DatabaseError) as e:
+            logger.debug(f"Skill table not available for the skill taxonomy: {e}")
+            return 0
+
+        for name, category in rows:
+            self.add_terms((category or 'skills').strip().lower(), [name])
+        return len(rows)
+
+    def _build(self) -> Tuple[KeywordMatcher, Dict[str, int], List[str], int]:
+        if self._built is None:
+            matcher = KeywordMatcher()
+            for category, terms in self._terms.items():
+                matcher.add(category, terms)
+
+            names = sorted(
+                {self.normalize(term) for terms in self._terms.values() for term in terms} | set(self._synonyms)
+            )
+            ids = {name: skill_id for skill_id, name in enumerate(names)}
+
+            data = json.dumps(
+                [list(self._synonyms.items()), sorted((category, sorted(terms)) for category, terms in self._terms.items())]
+            )
+            version = zlib.crc32(data.encode()) & 0x7fffffff or 1
+
+            self._built = (matcher, ids, names, version)
+        return self._built
+
+    @property
+    def version(self) -> int:
+        """Checksum of the taxonomy data, never 0."""
+        return self._build()[3]
+
+    @property
+    def categories(self) -> List[str]:
+        return list(self._terms)
+
+    def terms(self, *categories: str) -> Set[str]:
+        """Terms of the given categories (all categories if none given)."""
+        return set().union(*(self._terms.get(category, set()) for category in categories or self._terms))
+
+    def skill_terms(self) -> Set[str]:
+        """Terms of every category except certifications."""
+        return self.terms(*(category for category in self._terms if category != CERTIFICATIONS))
+
+    def normalize(self, skill: str) -> str:
+        """Canonical skill of a term or synonym; other names are lowercased."""
+        skill_lower = skill.lower().strip()
+        return self._canonical.get(skill_lower, skill_lower)
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """Every vocabulary term occurrence in text, grouped by category, in text order."""
+        return self._build()[0].find_all(text.lower())
+
+    def extract(self, text: str) -> List[str]:
+        """Distinct skill terms (not certifications) found in text, in order of first occurrence."""
+        if not text:
+            return []
+        return list(dict.fromkeys(match.term for match in self.find_all(text) if match.group != CERTIFICATIONS))
+
+    def id(self, skill: str) -> Optional[int]:
+        """Integer id of a skill's canonical form, None if it is not in the taxonomy."""
+        return self._build()[1].get(self.normalize(skill))
+
+    def name(self, skill_id: int) -> str:
+        """Canonical skill with an id."""
+        return self._build()[2][skill_id]
+
+    def __len__(self) -> int:
+        """Number of canonical skills."""
+        return len(self._build()[2])
+
+
+_taxonomy: Optional[SkillTaxonomy] = None
+_taxonomy_source = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+
+def _source_token():
+    """What the taxonomy was built from: the reload generation and the JSON file's mtime."""
+    from django.conf import settings
+    from django.core.cache import cache
+
+    try:
+        generation = cache.get(GENERATION_KEY, 0)
+    except Exception as e:
+        logger.debug(f"Skill taxonomy generation not readable: {e}")
+        generation = 0
+    path = getattr(settings, 'JOBSCRAPER_SKILL_TAXONOMY_FILE', '')
+    try:
+        mtime = os.path.getmtime(path) if path else None
+    except OSError:
+        mtime = None
+    return generation, mtime
+
+
+def get_taxonomy() -> SkillTaxonomy:
+    """Process-wide taxonomy, built on first use and rebuilt when its sources change."""
+    global _taxonomy, _taxonomy_source, _checked_at
+    from django.conf import settings
+
+    interval = getattr(settings, 'JOBSCRAPER_SKILL_TAXONOMY_CHECK_INTERVAL', 60)
+    if _taxonomy is not None and time.monotonic() - _checked_at < interval:
+        return _taxonomy
+
+    with _lock:
+        if _taxonomy is None or time.monotonic() - _checked_at >= interval:
+            source = _source_token()
+            if _taxonomy is None or source != _taxonomy_source:
+                _taxonomy = SkillTaxonomy.default()
+                _taxonomy_source = source
+            _checked_at = time.monotonic()
+    return _taxonomy
+
+
+def reload_taxonomy() -> SkillTaxonomy:
+    """
+    Rebuild the taxonomy now, and in other processes at their next check
+    (e.g. after editing the Skill table).
+    """
+    from django.core.cache import cache
+
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.set(GENERATION_KEY, 1, None)
+    except Exception as e:
+        logger.warning(f"Skill taxonomy reload not shared with other processes: {e}")
+    reset_taxonomy()
+    return get_taxonomy()
+
+
+def reset_taxonomy() -> None:
+    """Drop this process's taxonomy so the next get_taxonomy() rebuilds it."""
+    global _taxonomy
+    with _lock:
+        _taxonomy = None
+
+
+def normalize_skill(skill: str) -> str:
+    """Normalize a skill with the shared taxonomy."""
+    return get_taxonomy().normalize(skill)
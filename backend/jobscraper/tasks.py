@@ -42,6 +42,12 @@ def scrape_all_sources() -> Dict[str, Dict[str, int]]:
     }
     
     for source_name, scraper in scrapers.items():
+        # Scheduled runs mostly see unchanged boards and pages; conditional
+        # requests let those skip parsing and saving entirely, and watermarks
+        # skip the jobs earlier runs already saved
+        scraper.use_http_cache = True
+        scraper.incremental = True
+        
         try:
             logger.info(f"Scraping {source_name}")
             source_results = scraper.scrape_jobs()
@@ -98,6 +104,46 @@ def scrape_specific_source(source_name: str, **kwargs) -> Dict[str, int]:
         raise
 
 
+def enqueue_all_sources(sources: Optional[List[str]] = None) -> Dict[str, int]:
+    """
+    Split crawls into work units on the scrape queue.
+    
+    Schedule this instead of scrape_all_sources when scrape_worker processes
+    (on this or other hosts) drain the queue in parallel.
+    
+    Args:
+        sources: Sources to queue (default: greenhouse, greenhouse_india, weworkremotely)
+    
+    Returns:
+        Dictionary of units queued per source
+    """
+    from .work_queue import WorkQueue
+    
+    queue = WorkQueue()
+    results = {}
+    
+    for source in sources or ['greenhouse', 'greenhouse_india', 'weworkremotely']:
+        results[source] = queue.enqueue_crawl(source)
+    
+    logger.info(f"Queued scrape work units: {results}")
+    return results
+
+
+def run_scrape_worker(max_units: Optional[int] = None) -> Dict[str, int]:
+    """
+    Process scrape queue units until the queue is empty.
+    
+    Args:
+        max_units: Stop after this many units
+    
+    Returns:
+        Counts of completed and failed units
+    """
+    from .work_queue import ScrapeWorker
+    
+    return ScrapeWorker().run(max_units=max_units)
+
+
 def scrape_greenhouse_companies(company_names: List[str]) -> Dict[str, int]:
     """
     Scrape specific companies from Greenhouse.
@@ -121,13 +167,20 @@ def scrape_greenhouse_companies(company_names: List[str]) -> Dict[str, int]:
         raise
 
 
-def cleanup_old_jobs(days_old: int = 30, source: Optional[str] = None) -> Dict[str, int]:
+def cleanup_old_jobs(
+    days_old: int = 30,
+    source: Optional[str] = None,
+    archive_days: Optional[int] = None
+) -> Dict[str, int]:
     """
     Deactivate old job postings that haven't been seen in recent scrapes.
     
     Args:
         days_old: Number of days since last scrape to consider "old"
         source: Optional source filter. If None, cleans all sources.
+        archive_days: Also archive and delete inactive jobs without
+                      applications not scraped for this many days
+                      (None keeps them)
     
     Returns:
         Dictionary with cleanup results
@@ -156,10 +209,42 @@ def cleanup_old_jobs(days_old: int = 30, source: Optional[str] = None) -> Dict[s
     total_deactivated = sum(results.values())
     logger.info(f"Cleanup completed. Total deactivated: {total_deactivated}")
     
-    return {
+    cleanup = {
         'total_deactivated': total_deactivated,
         'by_source': results
     }
+    
+    if archive_days is not None:
+        from django.utils import timezone
+        from .expiry import JobExpiry
+        from .models import JobPosting
+        
+        cold_jobs = JobPosting.objects.filter(
+            is_active=False,
+            date_scraped__lt=timezone.now() - timezone.timedelta(days=archive_days)
+        )
+        if source:
+            cold_jobs = cold_jobs.filter(source=source)
+        archived = JobExpiry().archive(cold_jobs)
+        logger.info(f"Archived {archived['archived']} cold jobs")
+        cleanup['total_archived'] = archived['archived']
+    
+    return cleanup
+
+
+def reconcile_facet_counts() -> Dict[str, int]:
+    """
+    Recount the job facet counters behind the stats and filter endpoints.
+    
+    The counters are updated incrementally on ingest and deactivation;
+    run this periodically (e.g. nightly) to correct any drift.
+    
+    Returns:
+        Counts of counter rows created, updated and deleted
+    """
+    from .facets import reconcile_facets
+    
+    return reconcile_facets()
 
 
 def get_scraping_statistics() -> Dict[str, any]:
@@ -212,9 +297,24 @@ def get_scraping_statistics() -> Dict[str, any]:
 #     return scrape_specific_source(source_name, **kwargs)
 # 
 # @shared_task
+# def enqueue_all_sources_task():
+#     """Celery task to queue crawl work units."""
+#     return enqueue_all_sources()
+# 
+# @shared_task
+# def run_scrape_worker_task(max_units: int = 100):
+#     """Celery task to drain the scrape queue."""
+#     return run_scrape_worker(max_units)
+# 
+# @shared_task
 # def cleanup_old_jobs_task(days_old: int = 30):
 #     """Celery task to cleanup old jobs."""
 #     return cleanup_old_jobs(days_old)
+# 
+# @shared_task
+# def reconcile_facet_counts_task():
+#     """Celery task to recount job facet counters."""
+#     return reconcile_facet_counts()
 
 
 # Example cron job configurations:
@@ -226,5 +326,11 @@ def get_scraping_statistics() -> Dict[str, any]:
 # # Cleanup old jobs weekly on Sunday at 3 AM
 # 0 3 * * 0 cd /path/to/project && python manage.py scrape_jobs --deactivate-old
 #
+# # Archive jobs not seen for 90 days monthly (resumable if interrupted)
+# 0 3 1 * * cd /path/to/project && python manage.py clear_expired_jobs --days 90 --keep-applications --noinput
+#
+# # Recount job stats/filter facet counters nightly at 4 AM
+# 0 4 * * * cd /path/to/project && python manage.py reconcile_facets
+#
 # # Scrape only Greenhouse every 12 hours
 # 0 */12 * * * cd /path/to/project && python manage.py scrape_jobs --source greenhouse
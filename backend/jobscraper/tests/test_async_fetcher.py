@@ -0,0 +1,53 @@
+import time
+
+import httpx
+
+from jobscraper.fetcher import AsyncFetcher
+
+
+def _transport(requested):
+    def handler(request):
+        requested.append((time.monotonic(), request.url.host))
+        if request.url.path == '/missing':
+            return httpx.Response(404)
+        if request.url.path.endswith('.json'):
+            return httpx.Response(200, json={'path': request.url.path})
+        return httpx.Response(200, text='<html>ok</html>')
+
+    return httpx.MockTransport(handler)
+
+
+def test_fetch_many_keeps_order_and_returns_errors_in_place():
+    fetcher = AsyncFetcher(per_host_rate=0, transport=_transport([]))
+    try:
+        results = fetcher.fetch_many([
+            'https://a.example.com/jobs.json',
+            'https://a.example.com/missing',
+            'https://b.example.com/page',
+        ])
+    finally:
+        fetcher.close()
+
+    assert results[0] == {'path': '/jobs.json'}
+    assert isinstance(results[1], httpx.HTTPStatusError)
+    assert results[2].text == '<html>ok</html>'
+
+
+def test_rate_limit_applies_per_host():
+    requested = []
+    fetcher = AsyncFetcher(per_host_rate=10, transport=_transport(requested))
+    try:
+        fetcher.fetch_many([f'https://{host}.example.com/{i}' for i in range(3) for host in ('a', 'b')])
+    finally:
+        fetcher.close()
+
+    for host in ('a.example.com', 'b.example.com'):
+        times = [t for t, h in requested if h == host]
+        assert len(times) == 3
+        # 10 requests/second per host -> at least ~0.1s between requests to the same host
+        assert all(later - earlier >= 0.09 for earlier, later in zip(times, times[1:]))
+
+    # Different hosts are not paced against each other
+    first_a = min(t for t, h in requested if h == 'a.example.com')
+    first_b = min(t for t, h in requested if h == 'b.example.com')
+    assert abs(first_a - first_b) < 0.05
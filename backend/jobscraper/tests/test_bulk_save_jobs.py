@@ -0,0 +1,94 @@
+import pytest
+from django.utils import timezone
+
+from jobscraper.models import JobPosting, JobSkill, ScrapeWorkUnit
+from jobscraper.services import JobScrapingService
+
+
+def _job(i, **overrides):
+    data = {
+        'external_id': f'ext-{i}',
+        'title': f'Engineer {i}',
+        'company': 'Acme',
+        'location': 'Remote',
+        'description': 'Build things. ' * 10,
+        'url': f'https://example.com/jobs/{i}',
+        'source': 'greenhouse',
+        'date_posted': timezone.now().date(),
+        'date_scraped': timezone.now(),
+    }
+    data.update(overrides)
+    return data
+
+
+def _batch():
+    return [
+        _job(1),
+        _job(2),
+        _job(3, title='Engineer 3 (changed)'),   # existing row, title changed -> updated
+        _job(4),                                # existing row, unchanged -> skipped
+        _job(5, url='not-a-url'),               # invalid -> skipped
+        _job(6, external_id=''),                # missing id -> skipped
+        _job(1),                                # repeat of a new job -> skipped
+        _job(2, location='Pune, India'),        # repeat with change -> updated
+    ]
+
+
+def _seed():
+    for i in (3, 4):
+        JobPosting.objects.create(**_job(i))
+
+
+def _snapshot():
+    return sorted(JobPosting.objects.values_list('external_id', 'title', 'location', 'is_active'))
+
+
+@pytest.mark.django_db
+def test_bulk_save_matches_per_row_counts_and_rows():
+    _seed()
+    per_row = JobScrapingService().save_jobs(_batch())
+    per_row_rows = _snapshot()
+
+    JobPosting.objects.all().delete()
+    _seed()
+    bulk = JobScrapingService(batch_size=3).save_jobs(_batch(), bulk=True)
+
+    assert per_row == bulk
+    assert bulk == {'created': 2, 'updated': 2, 'skipped': 4, 'errors': 0, 'total': 8}
+    assert _snapshot() == per_row_rows
+
+
+@pytest.mark.django_db
+def test_bulk_save_reactivates_and_bumps_updated_at():
+    job = JobPosting.objects.create(**_job(1))
+    JobPosting.objects.filter(pk=job.pk).update(
+        is_active=False, updated_at=timezone.now() - timezone.timedelta(days=30)
+    )
+
+    results = JobScrapingService().save_jobs([_job(1)], bulk=True)
+
+    job.refresh_from_db()
+    assert results['updated'] == 1
+    assert job.is_active
+    assert job.updated_at > timezone.now() - timezone.timedelta(minutes=1)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('bulk', [False, True])
+def test_weekly_refresh_of_unchanged_jobs_does_not_reindex_or_rescore(bulk):
+    job = JobPosting.objects.create(**_job(1, description='Python and Kubernetes. ' * 10))
+    JobPosting.objects.filter(pk=job.pk).update(updated_at=timezone.now() - timezone.timedelta(days=8))
+    ScrapeWorkUnit.objects.all().delete()
+    entries = set(JobSkill.objects.values_list('id', flat=True))
+    assert entries
+
+    results = JobScrapingService().save_jobs([_job(1, description='Python and Kubernetes. ' * 10)], bulk=bulk)
+
+    assert results['updated'] == 1
+    assert not ScrapeWorkUnit.objects.filter(source='jobmatcher').exists()
+    assert set(JobSkill.objects.values_list('id', flat=True)) == entries
+
+    # A changed salary is rescored
+    JobPosting.objects.filter(pk=job.pk).update(updated_at=timezone.now() - timezone.timedelta(days=8))
+    JobScrapingService().save_jobs([_job(1, description='Python and Kubernetes. ' * 10, salary_min=90000)], bulk=bulk)
+    assert ScrapeWorkUnit.objects.filter(source='jobmatcher').count() == 1
@@ -0,0 +1,122 @@
+import pytest
+from django.utils import timezone
+
+from jobscraper.dedup import band_keys, job_signature, minhash, shingles, similarity
+from jobscraper.facets import reconcile_facets
+from jobscraper.models import JobPosting, JobSignatureBand
+from jobscraper.services import JobScrapingService
+
+
+DESCRIPTION = (
+    'We are hiring a backend engineer to build payment APIs in Python and Django. '
+    'You will own services end to end, work with PostgreSQL and Redis, review code, '
+    'mentor junior engineers and take part in an on-call rotation. 5+ years of '
+    'experience building web services is required; AWS and Docker are a plus.'
+)
+
+OTHER_DESCRIPTION = (
+    'Our design team is looking for a product designer to shape onboarding flows. '
+    'You will run user research, prototype in Figma and partner with marketing on '
+    'campaigns. A portfolio of shipped consumer work is required.'
+)
+
+
+def _job(external_id, source, description, title='Backend Engineer', company='Acme Pay'):
+    return {
+        'external_id': external_id,
+        'title': title,
+        'company': company,
+        'location': 'Remote',
+        'description': description,
+        'url': f'https://{source}.example.com/jobs/{external_id}',
+        'source': source,
+        'date_scraped': timezone.now(),
+    }
+
+
+def test_signature_similarity_tracks_content():
+    base = job_signature(JobPosting(title='Backend Engineer', company='Acme Pay', description=DESCRIPTION))
+    reformatted = job_signature(JobPosting(
+        title='BACKEND ENGINEER', company='Acme Pay', description=f'<p>{DESCRIPTION}</p>'
+    ))
+    other = job_signature(JobPosting(title='Product Designer', company='Acme Pay', description=OTHER_DESCRIPTION))
+
+    assert base == reformatted
+    assert similarity(base, other) < 0.2
+    assert len(band_keys(base)) == 16
+    assert minhash(shingles('', '', '')) == []
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('bulk', [False, True])
+def test_cross_source_duplicates_share_canonical_posting(bulk):
+    service = JobScrapingService(dedup=True)
+    service.save_jobs([_job('gh-1', 'greenhouse', DESCRIPTION)], bulk=bulk)
+    service.save_jobs([
+        _job('lv-9', 'lever', DESCRIPTION + ' Apply through our careers page.'),
+        _job('ww-3', 'weworkremotely', DESCRIPTION.replace('5+ years', 'Five years')),
+        _job('lv-10', 'lever', OTHER_DESCRIPTION, title='Product Designer'),
+    ], bulk=bulk)
+
+    original = JobPosting.objects.get(external_id='gh-1')
+    assert original.canonical_job is None
+    assert set(original.duplicates.values_list('external_id', flat=True)) == {'lv-9', 'ww-3'}
+    assert set(JobPosting.objects.canonical().values_list('external_id', flat=True)) == {'gh-1', 'lv-10'}
+    assert JobSignatureBand.objects.filter(job=original).count() == 16
+
+
+@pytest.mark.django_db
+def test_changed_posting_leaves_cluster():
+    service = JobScrapingService(dedup=True)
+    service.save_jobs([_job('gh-1', 'greenhouse', DESCRIPTION), _job('lv-9', 'lever', DESCRIPTION)], bulk=True)
+    assert JobPosting.objects.get(external_id='lv-9').canonical_job is not None
+
+    service.save_jobs([_job('lv-9', 'lever', OTHER_DESCRIPTION)])
+
+    assert JobPosting.objects.get(external_id='lv-9').canonical_job is None
+    assert JobPosting.objects.canonical().count() == 2
+
+
+@pytest.mark.django_db
+def test_canonical_posting_joining_another_cluster_hands_over_its_duplicates():
+    service = JobScrapingService(dedup=True)
+    service.save_jobs([_job('ln-5', 'linkedin', OTHER_DESCRIPTION)])
+    service.save_jobs([_job('gh-1', 'greenhouse', DESCRIPTION), _job('lv-9', 'lever', DESCRIPTION)])
+    reconcile_facets()
+
+    service.save_jobs([_job('gh-1', 'greenhouse', OTHER_DESCRIPTION)])
+
+    canonical = JobPosting.objects.get(external_id='ln-5')
+    assert JobPosting.objects.get(external_id='lv-9').canonical_job == canonical
+    assert list(JobPosting.objects.canonical()) == [canonical]
+    results = reconcile_facets()
+    assert (results['created'], results['updated']) == (0, 0)
+
+
+@pytest.mark.django_db
+def test_duplicate_of_inactive_posting_is_listed():
+    service = JobScrapingService(dedup=True)
+    service.save_jobs([_job('gh-1', 'greenhouse', DESCRIPTION)])
+    JobPosting.objects.filter(external_id='gh-1').update(is_active=False)
+
+    service.save_jobs([_job('lv-9', 'lever', DESCRIPTION)], bulk=True)
+
+    duplicate = JobPosting.objects.get(external_id='lv-9')
+    assert list(JobPosting.objects.canonical()) == [duplicate]
+    assert JobPosting.objects.get(external_id='gh-1').canonical_job == duplicate
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('bulk', [False, True])
+def test_promotion_at_ingest_keeps_facet_counters_exact(bulk):
+    service = JobScrapingService(dedup=True)
+    service.save_jobs([_job('gh-1', 'greenhouse', DESCRIPTION)], bulk=bulk)
+    JobPosting.objects.filter(external_id='gh-1').update(is_active=False)
+    reconcile_facets()
+
+    service.save_jobs([_job('lv-9', 'lever', DESCRIPTION)], bulk=bulk)
+
+    assert JobPosting.objects.get(external_id='gh-1').canonical_job.external_id == 'lv-9'
+    # Nothing to correct; only emptied counters are left to clean up
+    results = reconcile_facets()
+    assert (results['created'], results['updated']) == (0, 0)
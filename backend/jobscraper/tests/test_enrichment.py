@@ -0,0 +1,60 @@
+import pytest
+from django.utils import timezone
+
+from jobscraper.enrichment import JobEnricher, enrich_job
+from jobscraper.models import JobPosting
+from jobscraper.services import JobScrapingService
+
+
+DESCRIPTIONS = [
+    'Senior Python Engineer, full-time and remote. 5+ years with Django, AWS and Docker. Salary $120,000 - $150,000.',
+    'Junior frontend developer internship in Bengaluru. React and TypeScript a plus.',
+    'Contract data scientist, hybrid. Machine learning with PyTorch; visa sponsorship available.',
+]
+
+
+def _jobs():
+    return [
+        {
+            'external_id': f'enrich-{i}',
+            'title': f'Role {i}',
+            'company': 'Acme',
+            'location': 'Remote',
+            'description': description,
+            'url': f'https://example.com/jobs/{i}',
+            'source': 'greenhouse',
+            'date_scraped': timezone.now(),
+            'html_content': f'<div>{description}</div>',
+        }
+        for i, description in enumerate(DESCRIPTIONS * 4)
+    ]
+
+
+def _comparable(job):
+    # Parser lists built from sets have per-process ordering
+    return {key: sorted(value) if isinstance(value, list) else value for key, value in job.items()}
+
+
+def test_process_pool_matches_inline_enrichment_in_order():
+    jobs = _jobs()
+    enricher = JobEnricher(workers=2, chunksize=2)
+    try:
+        pooled = enricher.enrich(jobs)
+    finally:
+        enricher.close()
+
+    assert [_comparable(job) for job in pooled] == [_comparable(enrich_job(job)) for job in jobs]
+    assert [job['external_id'] for job in pooled] == [job['external_id'] for job in jobs]
+    assert all('html_content' not in job for job in pooled)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('bulk', [False, True])
+def test_parsed_fields_are_saved(bulk):
+    JobScrapingService().save_jobs([enrich_job(job) for job in _jobs()[:1]], bulk=bulk)
+
+    job = JobPosting.objects.get(external_id='enrich-0')
+    assert job.job_type == 'full-time'
+    assert job.experience_level == 'senior'
+    assert 'python' in job.skills_required
+    assert job.parse_confidence > 0
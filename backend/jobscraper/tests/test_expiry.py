@@ -0,0 +1,100 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+
+from jobapplier.models import JobApplication
+from jobscraper.expiry import JobExpiry
+from jobscraper.facets import tally
+from jobscraper.models import FacetCount, JobArchive, JobPosting, JobSignatureBand
+
+
+def _job(i, days_ago, **fields):
+    return JobPosting.objects.create(
+        external_id=str(i), title=f'Engineer {i}', company='Acme', location='Remote',
+        description=f'Build thing number {i}.', url=f'https://jobs.example.com/{i}', source='greenhouse',
+        date_scraped=timezone.now() - timedelta(days=days_ago), **fields,
+    )
+
+
+def _stored_counts():
+    return {(row.source, row.facet, row.value): row.count for row in FacetCount.objects.filter(count__gt=0)}
+
+
+@pytest.mark.django_db
+def test_old_jobs_are_deactivated_in_chunks():
+    for i in range(5):
+        _job(i, days_ago=40)
+    _job(5, days_ago=1)
+    call_command('reconcile_facets')
+
+    cutoff = timezone.now() - timedelta(days=30)
+    assert JobExpiry(chunk_size=2).deactivate(JobPosting.objects.all(), cutoff) == 5
+    assert list(JobPosting.objects.filter(is_active=True).values_list('external_id', flat=True)) == ['5']
+    assert _stored_counts() == tally(JobPosting.objects.all())
+
+    # Nothing is left to do on a second run
+    assert JobExpiry(chunk_size=2).deactivate(JobPosting.objects.all(), cutoff) == 0
+
+
+@pytest.mark.django_db
+def test_active_duplicate_takes_over_a_deactivated_canonical_posting():
+    canonical = _job(1, days_ago=40)
+    first = _job(2, days_ago=1, canonical_job=canonical)
+    second = _job(3, days_ago=1, canonical_job=canonical)
+    call_command('reconcile_facets')
+
+    assert JobExpiry().deactivate(JobPosting.objects.filter(id=canonical.id), timezone.now() - timedelta(days=30)) == 1
+
+    assert list(JobPosting.objects.canonical().filter(is_active=True)) == [first]
+    assert set(first.duplicates.values_list('id', flat=True)) == {canonical.id, second.id}
+    assert _stored_counts() == tally(JobPosting.objects.all())
+
+
+@pytest.mark.django_db
+def test_duplicates_of_an_archived_canonical_posting_are_listed_once():
+    canonical = _job(1, days_ago=100)
+    first = _job(2, days_ago=1, canonical_job=canonical)
+    second = _job(3, days_ago=1, canonical_job=canonical)
+    call_command('reconcile_facets')
+
+    JobExpiry().archive(JobPosting.objects.filter(id=canonical.id))
+
+    assert list(JobPosting.objects.canonical()) == [first]
+    second.refresh_from_db()
+    assert second.canonical_job == first
+    assert _stored_counts() == tally(JobPosting.objects.all())
+
+
+@pytest.mark.django_db
+def test_cold_jobs_are_archived_and_deleted():
+    canonical = _job(1, days_ago=100, is_active=False)
+    duplicate = _job(2, days_ago=1, canonical_job=canonical)
+    applied = _job(3, days_ago=100, is_active=False)
+    _job(4, days_ago=100, is_active=False)
+    JobSignatureBand.objects.create(job=canonical, bucket=7)
+    seeker = get_user_model().objects.create(username='seeker', email='seeker@example.com')
+    JobApplication.objects.create(user=seeker, job=applied)
+    call_command('reconcile_facets')
+
+    cold = JobPosting.objects.filter(is_active=False)
+    results = JobExpiry(chunk_size=1).archive(cold)
+    assert (results['archived'], results['deleted']) == (2, 2)
+    assert results['related'] == {'jobscraper.JobSignatureBand': 1}
+
+    # The application's job stays; the duplicate is now the canonical posting
+    assert sorted(JobPosting.objects.values_list('external_id', flat=True)) == ['2', '3']
+    duplicate.refresh_from_db()
+    assert duplicate.canonical_job_id is None
+    assert _stored_counts() == tally(JobPosting.objects.all())
+
+    archived = JobArchive.objects.get(job_id=canonical.id)
+    assert (archived.title, archived.source) == ('Engineer 1', 'greenhouse')
+    assert archived.posting_data()['description'] == 'Build thing number 1.'
+
+    # Resuming after a finished run finds nothing left to archive
+    call_command('clear_expired_jobs', '--inactive', '--keep-applications', '--noinput')
+    assert JobPosting.objects.filter(external_id='3').exists()
+    assert JobArchive.objects.count() == 2
@@ -0,0 +1,99 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from jobscraper.facets import reconcile_facets, tally
+from jobscraper.models import FacetCount, JobPosting
+from jobscraper.services import JobScrapingService
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _job(i, company='Acme', location='Bangalore, India', **fields):
+    return {
+        'external_id': str(i), 'title': f'Engineer {i}', 'company': company, 'location': location,
+        'description': f'Build thing number {i}.', 'url': f'https://jobs.example.com/{i}', 'source': 'greenhouse',
+        'date_scraped': timezone.now(), **fields,
+    }
+
+
+def _stored_counts():
+    return {
+        (row.source, row.facet, row.value): row.count
+        for row in FacetCount.objects.filter(count__gt=0)
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('bulk', [False, True])
+def test_counters_follow_ingest_and_deactivation(bulk):
+    service = JobScrapingService(dedup=False)
+    service.save_jobs([
+        _job(1),
+        _job(2, company='Globex', location='London, UK'),
+        _job(3, job_type='contract'),
+    ], bulk=bulk)
+    assert _stored_counts() == tally(JobPosting.objects.all())
+    assert _stored_counts()[('greenhouse', 'company', 'Acme')] == 2
+
+    # A job moving to another country
+    service.save_jobs([_job(1, location='London, UK', title='Staff Engineer')], bulk=bulk)
+    assert _stored_counts() == tally(JobPosting.objects.all())
+    assert _stored_counts()[('greenhouse', 'country', 'GB')] == 2
+
+    JobPosting.objects.filter(external_id='2').update(date_scraped=timezone.now() - timedelta(days=40))
+    assert service.deactivate_old_jobs('greenhouse') == 1
+    assert _stored_counts() == tally(JobPosting.objects.all())
+    assert _stored_counts()[('greenhouse', 'status', 'inactive')] == 1
+
+    assert service.mark_jobs_seen('greenhouse', ['https://jobs.example.com/2']) == 1
+    assert _stored_counts() == tally(JobPosting.objects.all())
+
+    # Only the emptied counters are left to clean up
+    assert reconcile_facets() == {'created': 0, 'updated': 0, 'deleted': 1}
+
+
+@pytest.mark.django_db
+def test_stats_endpoints_read_the_counters():
+    service = JobScrapingService(dedup=False)
+    service.save_jobs([_job(1), _job(2, company='Globex', location='London, UK'), _job(3)], bulk=True)
+    client = APIClient()
+
+    stats = client.get('/api/jobs/stats/').data
+    assert stats['total_jobs'] == 3
+    assert stats['companies'] == 2
+    assert stats['by_source'] == [{'source': 'greenhouse', 'count': 3}]
+    assert stats['by_company'] == [{'company': 'Acme', 'count': 2}, {'company': 'Globex', 'count': 1}]
+    assert client.get('/api/jobs/filters/').data == {
+        'companies': ['Acme', 'Globex'],
+        'locations': ['Bangalore, India', 'London, UK'],
+        'sources': ['greenhouse'],
+    }
+
+    # Counter changes invalidate the cached payloads
+    service.save_jobs([_job(4, company='Initech')], bulk=True)
+    assert client.get('/api/jobs/stats/').data['companies'] == 3
+    assert client.get('/api/jobs/filters/').data['companies'] == ['Acme', 'Globex', 'Initech']
+
+    # Filtered stats are aggregated from the jobs
+    assert client.get('/api/jobs/stats/', {'country': 'gb'}).data['total_jobs'] == 1
+
+    assert service.get_job_stats('greenhouse')['active_jobs'] == 4
+
+
+@pytest.mark.django_db
+def test_reconcile_corrects_untracked_writes():
+    JobScrapingService(dedup=False).save_jobs([_job(1), _job(2)], bulk=True)
+    JobPosting.objects.filter(external_id='1').update(company='Globex')
+    FacetCount.objects.create(source='greenhouse', facet='company', value='Gone', count=4)
+
+    assert reconcile_facets() == {'created': 1, 'updated': 1, 'deleted': 1}
+    assert _stored_counts() == tally(JobPosting.objects.all())
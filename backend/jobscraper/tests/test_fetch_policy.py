@@ -0,0 +1,124 @@
+import httpx
+import pytest
+
+from jobscraper.fetch_policy import FetchPolicy, HostUnavailable, parse_retry_after
+from jobscraper.fetcher import AsyncFetcher
+
+
+URL = 'https://boards.example.com/acme/jobs'
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_limit_halves_once_per_window_and_grows_on_success():
+    policy = FetchPolicy(initial_limit=2, clock=FakeClock())
+
+    first, _ = policy.try_acquire(URL)
+    second, _ = policy.try_acquire(URL)
+    assert policy.try_acquire(URL)[0] is None
+
+    policy.release(first, 503)
+    policy.release(second, 503)
+    assert policy.stats()['boards.example.com']['limit'] == 1
+
+    slot, _ = policy.try_acquire(URL)
+    policy.release(slot, 200)
+    assert policy.stats()['boards.example.com']['limit'] == 2
+
+
+def test_retry_after_blocks_the_host():
+    clock = FakeClock()
+    policy = FetchPolicy(clock=clock)
+
+    slot, _ = policy.try_acquire(URL)
+    policy.release(slot, 429, retry_after=30)
+
+    slot, wait = policy.try_acquire(URL)
+    assert slot is None and wait == 30
+    assert policy.try_acquire('https://other.example.com/')[0] is not None
+
+    clock.now += 30
+    assert policy.try_acquire(URL)[0] is not None
+
+
+def test_circuit_opens_then_probes():
+    clock = FakeClock()
+    policy = FetchPolicy(failure_threshold=3, cooldown=60, clock=clock)
+
+    for _ in range(3):
+        slot, _ = policy.try_acquire(URL)
+        policy.release(slot, None)
+
+    with pytest.raises(HostUnavailable):
+        policy.try_acquire(URL)
+
+    clock.now += 60
+    probe, _ = policy.try_acquire(URL)
+    with pytest.raises(HostUnavailable):
+        policy.try_acquire(URL)
+
+    policy.release(probe, 200)
+    stats = policy.stats()['boards.example.com']
+    assert stats['circuit'] == 'closed'
+    assert stats['outcomes'] == {'error': 3, 'skipped': 2, '2xx': 1}
+    assert sum(stats['latency'].values()) == stats['requests'] == 4
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('120') == 120
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0
+    assert parse_retry_after('soon') is None
+
+
+def test_fetcher_retries_after_server_errors_and_skips_dead_hosts():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.host)
+        if request.url.host == 'down.example.com':
+            return httpx.Response(500)
+        if calls.count('flaky.example.com') == 1:
+            return httpx.Response(503, headers={'Retry-After': '0'})
+        return httpx.Response(200, json={'ok': True})
+
+    policy = FetchPolicy(failure_threshold=2)
+    fetcher = AsyncFetcher(per_host_rate=0, transport=httpx.MockTransport(handler), policy=policy, max_retries=1)
+    try:
+        flaky = fetcher.fetch_many(['https://flaky.example.com/jobs'])
+        down = fetcher.fetch_many([f'https://down.example.com/{i}' for i in range(4)])
+    finally:
+        fetcher.close()
+
+    assert isinstance(flaky[0], httpx.HTTPStatusError)
+    assert [type(result) for result in down] == [httpx.HTTPStatusError] * 2 + [HostUnavailable] * 2
+    assert calls.count('down.example.com') == 2
+
+    stats = policy.stats()
+    assert stats['down.example.com']['circuit'] == 'open'
+    assert stats['flaky.example.com']['outcomes'] == {'5xx': 1}
+
+
+def test_fetcher_honors_retry_after_between_attempts():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={'Retry-After': '0'})
+        return httpx.Response(200, json={'ok': True})
+
+    policy = FetchPolicy()
+    fetcher = AsyncFetcher(per_host_rate=0, transport=httpx.MockTransport(handler), policy=policy, max_retries=3)
+    try:
+        assert fetcher.fetch_many([URL]) == [{'ok': True}]
+    finally:
+        fetcher.close()
+
+    assert len(calls) == 2
+    assert policy.stats()['boards.example.com']['outcomes'] == {'429': 1, '2xx': 1}
@@ -0,0 +1,168 @@
+import os
+import time
+from datetime import timedelta
+
+import httpx
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from jobscraper.fetcher import AsyncFetcher
+from jobscraper.http_cache import ResponseCache
+from jobscraper.models import JobPosting, ScrapingLog
+from jobscraper.scrapers.greenhouse_india import GreenhouseIndiaScraper
+
+
+def _board_transport(seen_headers, etag='"v1"'):
+    def handler(request):
+        seen_headers.append(dict(request.headers))
+        if etag and request.headers.get('If-None-Match') == etag:
+            return httpx.Response(304)
+        headers = {'ETag': etag} if etag else {}
+        return httpx.Response(200, json={'jobs': [{'id': 1, 'title': 'Engineer'}]}, headers=headers)
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.parametrize('etag', ['"v1"', None])
+def test_repeat_fetch_is_reported_unchanged(tmp_path, etag):
+    cache = ResponseCache(str(tmp_path))
+    seen_headers = []
+    url = 'https://boards.example.com/acme/jobs'
+
+    for _ in range(2):
+        fetcher = AsyncFetcher(per_host_rate=0, transport=_board_transport(seen_headers, etag), cache=cache)
+        try:
+            result = fetcher.fetch_many([url])[0]
+        finally:
+            fetcher.close()
+        assert result == {'jobs': [{'id': 1, 'title': 'Engineer'}]}
+        cache.commit()
+
+    # With an ETag the second request is conditional; without one the body hash matches
+    assert ('if-none-match' in seen_headers[1]) == bool(etag)
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.is_unchanged(url)
+
+
+@pytest.mark.django_db
+def test_unchanged_jobs_skip_save_and_are_marked_seen(tmp_path):
+    stale = timezone.now() - timedelta(days=20)
+    job = JobPosting.objects.create(
+        external_id='1', title='Engineer', company='Acme', url='https://boards.example.com/acme/jobs/1',
+        source='greenhouse_india', location='Bengaluru, India',
+    )
+    JobPosting.objects.filter(pk=job.pk).update(date_scraped=stale)
+
+    scraper = GreenhouseIndiaScraper()
+    scraper.company_names = ['acme']
+    scraper.use_http_cache = True
+    scraper.async_fetch = True
+
+    board = {'jobs': [{'id': 1, 'title': 'Engineer (renamed)', 'location': {'name': 'Bengaluru, India'},
+                       'absolute_url': 'https://boards.example.com/acme/jobs/1'}]}
+
+    def handler(request):
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=board, headers={'ETag': '"v1"'})
+
+    with override_settings(JOBSCRAPER_HTTP_CACHE_DIR=str(tmp_path)):
+        # Prime the cache as a previous run would have
+        scraper._fetcher = AsyncFetcher(per_host_rate=0, transport=httpx.MockTransport(handler),
+                                        cache=scraper.get_http_cache())
+        scraper.fetch_data_for_scraping()
+        scraper.close_fetcher()
+        scraper.get_http_cache().commit()
+
+        scraper._fetcher = AsyncFetcher(per_host_rate=0, transport=httpx.MockTransport(handler),
+                                        cache=scraper.get_http_cache())
+        results = scraper.scrape_jobs()
+
+    job.refresh_from_db()
+    assert results['unchanged'] == 1
+    assert results['total'] == 0
+    assert job.title == 'Engineer'
+    assert job.date_scraped > stale
+
+    log = ScrapingLog.objects.get(source='greenhouse_india')
+    assert log.status == 'completed'
+    assert (log.jobs_found, log.jobs_unchanged, log.cache_hits, log.cache_misses) == (1, 1, 1, 0)
+
+
+def test_entries_are_held_until_committed(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    url = 'https://boards.example.com/acme/jobs'
+    fetcher = AsyncFetcher(per_host_rate=0, transport=_board_transport([]), cache=cache)
+    try:
+        fetcher.fetch_many([url])
+    finally:
+        fetcher.close()
+
+    assert cache.get(url) is None
+    cache.commit()
+    assert cache.get(url)['etag'] == '"v1"'
+
+    cache.forget([url])
+    assert cache.get(url) is None
+
+
+@pytest.mark.django_db
+def test_jobs_that_failed_to_save_are_fetched_again(tmp_path, monkeypatch):
+    board = {'jobs': [{'id': 1, 'title': 'Engineer', 'location': {'name': 'Bengaluru, India'},
+                       'absolute_url': 'https://boards.example.com/acme/jobs/1'}]}
+
+    def handler(request):
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=board, headers={'ETag': '"v1"'})
+
+    def run():
+        scraper = GreenhouseIndiaScraper()
+        scraper.company_names = ['acme']
+        scraper.use_http_cache = True
+        scraper.async_fetch = True
+        scraper._fetcher = AsyncFetcher(per_host_rate=0, transport=httpx.MockTransport(handler),
+                                        cache=scraper.get_http_cache())
+        return scraper.scrape_jobs()
+
+    monkeypatch.setattr('jobscraper.scrapers.base.resolve_company_logos', lambda companies: {})
+    with override_settings(JOBSCRAPER_HTTP_CACHE_DIR=str(tmp_path)):
+        # A crash after the fetch caches nothing
+        with monkeypatch.context() as patched:
+            patched.setattr(GreenhouseIndiaScraper, 'save_jobs', lambda self, jobs: 1 / 0)
+            with pytest.raises(ZeroDivisionError):
+                run()
+
+        # Neither does a run whose jobs failed to save
+        with monkeypatch.context() as patched:
+            patched.setattr(GreenhouseIndiaScraper, 'save_jobs', lambda self, jobs: {'errors': len(jobs)})
+            assert run()['unchanged'] == 0
+
+        assert run()['created'] == 1
+        assert run()['unchanged'] == 1
+
+    assert JobPosting.objects.filter(external_id='1').exists()
+
+
+def test_prune_removes_old_and_excess_entries(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_age_days=30, max_entries=2)
+    now = time.time()
+    for i, days_ago in enumerate([40, 3, 2, 1]):
+        url = f'https://jobs.example.com/{i}'
+        cache._write(url, {'url': url, 'body': 'x'})
+        written = now - days_ago * 86400
+        os.utime(cache._path(url), (written, written))
+    (tmp_path / 'leftover.tmp').write_text('')
+    os.utime(tmp_path / 'leftover.tmp', (now - 7200, now - 7200))
+
+    # The 40-day-old entry is expired, the 3-day-old one over the limit
+    assert cache.prune() == 3
+    assert [cache.get(f'https://jobs.example.com/{i}') is not None for i in range(4)] == [False, False, True, True]
+
+    with override_settings(JOBSCRAPER_HTTP_CACHE_DIR=str(tmp_path)):
+        call_command('prune_http_cache', '--max-entries', '1')
+    assert cache.get('https://jobs.example.com/2') is None
+    assert cache.get('https://jobs.example.com/3') is not None
@@ -0,0 +1,50 @@
+from jobscraper.keyword_matcher import KeywordMatcher, match_context
+from jobscraper.simple_job_parser import SimpleJobParser
+
+
+def test_matches_whole_words_with_offsets():
+    matcher = KeywordMatcher()
+    matcher.add('skills', ['go', 'r', 'c++', 'sql', 'sql server', 'google cloud'])
+    text = 'go and c++ on google cloud, sql server for storage'
+
+    matches = matcher.find_all(text)
+
+    assert [(m.term, m.start, m.end) for m in matches] == [
+        ('go', 0, 2), ('c++', 7, 10), ('google cloud', 14, 26), ('sql', 28, 31), ('sql server', 28, 38),
+    ]
+    assert all(text[m.start:m.end] == m.term for m in matches)
+
+
+def test_substring_groups_keep_substring_semantics():
+    matcher = KeywordMatcher()
+    matcher.add('skills', ['ai'])
+    matcher.add('category', ['ai', 'developer'], whole_words=False)
+
+    matches = matcher.find_all('developers retain ai tooling')
+
+    assert [(m.term, m.group) for m in matches] == [
+        ('developer', 'category'), ('ai', 'category'), ('ai', 'skills'), ('ai', 'category'),
+    ]
+
+
+def test_context_stays_on_the_matched_line():
+    matcher = KeywordMatcher()
+    matcher.add('skills', ['react'])
+    text = 'must know python\nreact is nice to have'
+
+    assert match_context(text, matcher.find_all(text)[0]) == 'react is nice to have'
+
+
+def test_parser_splits_required_and_preferred_skills():
+    parser = SimpleJobParser()
+    description = (
+        'We need Python, Django and Docker experience.\n'
+        'Kubernetes is nice to have. Good engineering rigor.'
+    )
+
+    skills = parser._extract_skills(description)
+
+    assert sorted(skills['required']) == ['django', 'docker', 'python']
+    assert skills['preferred'] == ['kubernetes']
+    assert parser._extract_tools(description) == ['docker', 'kubernetes']
+    assert parser._classify_job_category(description) == 'software-engineering'
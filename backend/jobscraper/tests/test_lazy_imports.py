@@ -0,0 +1,33 @@
+import subprocess
+import sys
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def _imported_modules(statement):
+    code = f'import sys; {statement}; print(",".join(sys.modules))'
+    process = subprocess.run(
+        [sys.executable, '-c', code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+    return {name.split('.')[0] for name in process.stdout.strip().split(',')}
+
+
+def test_importing_parsers_and_scrapers_skips_heavy_dependencies():
+    modules = _imported_modules(
+        'import jobscraper.job_parser, jobscraper.scrapers.greenhouse, jobscraper.scrapers.greenhouse_india'
+    )
+
+    assert 'nltk' not in modules
+    assert 'bs4' not in modules
+
+
+def test_job_parser_is_built_on_first_use():
+    from jobscraper import job_parser as module
+
+    parser = module.job_parser
+
+    assert parser is module.get_job_parser()
+    assert 'the' in parser.stop_words
+    assert module.parse_job_content('', 'Senior Python engineer, full-time.', '')['job_type'] == 'full-time'
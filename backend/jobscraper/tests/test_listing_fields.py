@@ -0,0 +1,71 @@
+from decimal import Decimal
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from jobscraper.listing_fields import derive_listing_fields
+from jobscraper.models import JobPosting
+from jobscraper.services import JobScrapingService
+
+
+DESCRIPTION = """We are hiring a full-time backend engineer.
+Requirements:
+- 3+ years of Python
+- Experience with PostgreSQL
+
+Compensation: $120,000 - $150,000 per year.
+"""
+
+
+def test_listing_fields_are_derived_from_the_description():
+    assert derive_listing_fields(DESCRIPTION) == {
+        'job_type': 'full-time',
+        'requirements': '- 3+ years of Python\n- Experience with PostgreSQL',
+        'salary_min': Decimal('120000'),
+        'salary_max': Decimal('150000'),
+        'currency': 'USD',
+    }
+    assert derive_listing_fields('Paid internship, stipend 20k - 30k INR') == {
+        'job_type': 'internship', 'salary_min': Decimal('20000'), 'salary_max': Decimal('30000'), 'currency': 'INR',
+    }
+    assert derive_listing_fields('') == {}
+
+
+def _job(i, description, **fields):
+    return {
+        'external_id': str(i), 'title': f'Engineer {i}', 'company': 'Acme', 'location': 'Remote',
+        'description': description, 'url': f'https://jobs.example.com/{i}', 'source': 'greenhouse',
+        'date_scraped': timezone.now(), **fields,
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('bulk', [False, True])
+def test_api_reads_listing_fields_stored_at_ingest(bulk):
+    service = JobScrapingService(dedup=False)
+    service.save_jobs([
+        _job(1, DESCRIPTION),
+        _job(2, 'A six month contract role.'),
+        # Parsed values are kept over the heuristics
+        _job(3, 'Full time, or part time if you prefer.', job_type='part-time'),
+    ], bulk=bulk)
+
+    client = APIClient()
+    response = client.get('/api/jobs/', {'employment_type': 'Full-time'})
+    assert [job['title'] for job in response.data['results']] == ['Engineer 1']
+    assert response.data['results'][0]['employment_type'] == 'Full-time'
+    response = client.get('/api/jobs/', {'employment_type': 'part-time'})
+    assert [job['title'] for job in response.data['results']] == ['Engineer 3']
+
+    job = JobPosting.objects.get(external_id='1')
+    detail = client.get(f'/api/jobs/{job.id}/').data
+    assert detail['requirements'] == ['- 3+ years of Python', '- Experience with PostgreSQL']
+    assert detail['salary_range'] == 'USD 120,000 - 150,000'
+
+    # A new description is derived again
+    service.save_jobs([_job(1, 'Part-time support role, salary around $30,000 a year.')], bulk=bulk)
+    job.refresh_from_db()
+    assert (job.job_type, job.requirements, job.salary_min, job.salary_max) == (
+        'part-time', None, Decimal('30000'), None
+    )
@@ -0,0 +1,93 @@
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from fyndr_auth.models import Location
+from jobscraper.locations import Gazetteer, LocationInfo, normalize_location, reset_gazetteer
+from jobscraper.models import JobPosting
+from jobscraper.scrapers.greenhouse_india import GreenhouseIndiaScraper
+from jobscraper.services import JobScrapingService
+
+
+@pytest.fixture(autouse=True)
+def fresh_gazetteer():
+    reset_gazetteer()
+    yield
+    reset_gazetteer()
+
+
+def test_locations_normalize_to_country_region_city():
+    gazetteer = Gazetteer.default(load_locations=False)
+
+    assert gazetteer.normalize('Bangalore Urban, Karnataka') == LocationInfo('IN', 'Karnataka', 'Bengaluru', False)
+    assert gazetteer.normalize('Gurgaon, IN') == LocationInfo('IN', 'Haryana', 'Gurugram', False)
+    assert gazetteer.normalize('Remote - India') == LocationInfo('IN', '', '', True)
+    assert gazetteer.normalize('Navi Mumbai, Maharashtra') == LocationInfo('IN', 'Maharashtra', 'Navi Mumbai', False)
+    # An explicit country wins over a city of the same name elsewhere
+    assert gazetteer.normalize('Hyderabad, Pakistan') == LocationInfo('PK', '', '', False)
+    assert gazetteer.normalize('San Francisco, CA') == LocationInfo('US', '', 'San Francisco', False)
+    assert gazetteer.normalize('Work from home') == LocationInfo('', '', '', True)
+    assert gazetteer.normalize(None) == LocationInfo('', '', '', False)
+
+    assert gazetteer.country_code('India') == gazetteer.country_code('in') == 'IN'
+    assert gazetteer.city_name('bombay') == 'Mumbai'
+
+
+@pytest.mark.django_db
+def test_gazetteer_includes_the_location_table():
+    assert normalize_location('Kharadi') == LocationInfo('', '', '', False)
+
+    Location.objects.create(
+        city='Kharadi', state='Maharashtra', country='India', display_name='Kharadi, Maharashtra', slug='kharadi'
+    )
+    reset_gazetteer()
+
+    assert normalize_location('Kharadi') == LocationInfo('IN', 'Maharashtra', 'Kharadi', False)
+
+
+def _job(i, location):
+    return {
+        'external_id': str(i), 'title': f'Engineer {i}', 'company': 'Acme', 'location': location,
+        'description': 'Build things.', 'url': f'https://jobs.example.com/{i}', 'source': 'greenhouse',
+        'date_scraped': timezone.now(),
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('bulk', [False, True])
+def test_saved_jobs_are_filtered_by_structured_location(bulk):
+    JobScrapingService(dedup=False).save_jobs([
+        _job(1, 'Bangalore, India'),
+        _job(2, 'Remote (Pune)'),
+        _job(3, 'London, UK'),
+        _job(4, 'Remote'),
+    ], bulk=bulk)
+
+    def titles(**params):
+        response = APIClient().get('/api/jobs/', params)
+        assert response.status_code == 200
+        return sorted(job['title'] for job in response.data['results'])
+
+    assert titles(country='india') == titles(country='IN') == ['Engineer 1', 'Engineer 2']
+    assert titles(country='gb') == ['Engineer 3']
+    assert titles(country='atlantis') == []
+    assert titles(city='bengaluru') == titles(city='Bangalore') == ['Engineer 1']
+    assert titles(is_remote='true') == ['Engineer 2', 'Engineer 4']
+
+    job = JobPosting.objects.get(external_id='1')
+    job.location = 'Chennai'
+    job.save(update_fields=['location'])
+    job.refresh_from_db()
+    assert (job.country_code, job.region, job.city) == ('IN', 'Tamil Nadu', 'Chennai')
+
+
+@pytest.mark.django_db
+def test_greenhouse_india_filter_checks_each_office():
+    scraper = GreenhouseIndiaScraper()
+    jobs = [
+        {'location': {'name': 'San Francisco'}, 'offices': [{'name': 'Bengaluru'}]},
+        {'location': {'name': 'Berlin, Germany'}, 'offices': []},
+        {'location': {'name': 'Remote - IN'}},
+    ]
+
+    assert scraper.filter_india_jobs(jobs) == [jobs[0], jobs[2]]
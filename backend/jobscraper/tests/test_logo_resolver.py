@@ -0,0 +1,98 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from jobscraper.logo_resolver import LogoResolver, company_key
+from jobscraper.logo_scraper import LogoScraper
+from jobscraper.models import CompanyLogo, JobPosting
+
+
+class FakeLogoScraper(LogoScraper):
+    """Strategies answer from a table instead of the network and count their calls."""
+
+    def __init__(self, logos, delays=None):
+        super().__init__()
+        self.logos = logos
+        self.delays = delays or {}
+        self.calls = []
+        self._calls_lock = threading.Lock()
+
+    def strategies(self, company_name, job_url=None):
+        def lookup(name):
+            def strategy():
+                with self._calls_lock:
+                    self.calls.append((company_name, name))
+                time.sleep(self.delays.get(name, 0))
+                return self.logos.get((company_key(company_name), name))
+            return strategy
+
+        return [(name, lookup(name)) for name in ('clearbit', 'job_url', 'google_favicon', 'website')]
+
+
+def test_company_key_ignores_case_punctuation_and_legal_suffixes():
+    assert company_key('Acme, Inc.') == company_key('ACME') == 'acme'
+    assert company_key('Tata Consultancy Services Pvt Ltd') == 'tata consultancy services'
+    assert company_key('...') == ''
+
+
+def test_best_ranked_strategy_wins_even_when_slower():
+    scraper = FakeLogoScraper(
+        {('acme', 'clearbit'): 'https://logo.example.com/acme.png',
+         ('acme', 'google_favicon'): 'https://favicon.example.com/acme.png',
+         ('globex', 'website'): 'https://globex.example.com/logo.png'},
+        delays={'clearbit': 0.05},
+    )
+    resolver = LogoResolver(scraper=scraper)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        assert resolver._race('Acme', None, pool) == ('https://logo.example.com/acme.png', 'clearbit')
+        assert resolver._race('Globex', None, pool) == ('https://globex.example.com/logo.png', 'website')
+
+
+@pytest.mark.django_db
+def test_each_company_is_resolved_once_and_misses_are_cached():
+    scraper = FakeLogoScraper({('acme', 'clearbit'): 'https://logo.example.com/acme.png'})
+    resolver = LogoResolver(scraper=scraper)
+
+    logos = resolver.resolve_many({'Acme Inc': None, 'ACME': 'https://jobs.example.com/1', 'Initech': None})
+    assert logos == {'Acme Inc': 'https://logo.example.com/acme.png',
+                     'ACME': 'https://logo.example.com/acme.png',
+                     'Initech': None}
+    assert {company for company, _ in scraper.calls} == {'Acme Inc', 'Initech'}
+
+    scraper.calls.clear()
+    assert resolver.resolve_many({'Acme': None, 'Initech': None}) == {
+        'Acme': 'https://logo.example.com/acme.png', 'Initech': None,
+    }
+    assert scraper.calls == []
+
+    # An expired miss is looked up again
+    CompanyLogo.objects.filter(company_key='initech').update(expires_at=timezone.now() - timedelta(seconds=1))
+    resolver.resolve_many({'Initech': None})
+    assert {company for company, _ in scraper.calls} == {'Initech'}
+    assert CompanyLogo.objects.get(company_key='initech').expires_at > timezone.now() + timedelta(days=6)
+
+
+@pytest.mark.django_db
+def test_backfill_updates_postings_per_company():
+    for i in range(30):
+        company = ['Acme', 'Globex', 'Initech'][i % 3]
+        JobPosting.objects.create(
+            external_id=str(i), title=f'Engineer {i}', company=company,
+            url=f'https://jobs.example.com/{i}', source='greenhouse',
+        )
+    scraper = FakeLogoScraper({('acme', 'clearbit'): 'https://logo.example.com/acme.png',
+                               ('globex', 'website'): 'https://globex.example.com/logo.png'})
+
+    counts = LogoResolver(scraper=scraper).backfill()
+
+    assert counts == {'companies': 3, 'found': 2, 'updated': 20}
+    assert len({company for company, _ in scraper.calls}) == 3
+    assert set(JobPosting.objects.filter(company='Globex').values_list('company_logo', flat=True)) == {
+        'https://globex.example.com/logo.png'
+    }
+    assert not JobPosting.objects.filter(company='Initech', company_logo__isnull=False).exists()
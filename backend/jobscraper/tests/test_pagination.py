@@ -0,0 +1,79 @@
+from datetime import date, timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from jobscraper.models import JobPosting
+
+
+@pytest.fixture
+def jobs():
+    scraped = timezone.now()
+    postings = []
+    for i in range(25):
+        postings.append(JobPosting(
+            external_id=str(i), title=f'Engineer {i}', company='Acme', location='Remote',
+            description='Build things.', url=f'https://jobs.example.com/{i}', source='greenhouse',
+            # Ties on both timestamps, and some jobs without a posting date
+            date_posted=None if i % 5 == 0 else date(2024, 1, 1) + timedelta(days=i // 4),
+            date_scraped=scraped - timedelta(hours=i % 3),
+        ))
+    JobPosting.objects.bulk_create(postings)
+    return list(
+        JobPosting.objects.order_by('-date_posted', '-date_scraped', '-id').values_list('title', flat=True)
+    )
+
+
+def _walk(client, params):
+    titles = []
+    response = client.get('/api/jobs/', params)
+    while True:
+        assert response.status_code == 200
+        titles += [job['title'] for job in response.data['results']]
+        assert response.data['previous'] is None
+        if not response.data['next']:
+            return titles, response
+        response = client.get(response.data['next'])
+
+
+@pytest.mark.django_db
+def test_cursor_pages_walk_the_feed_in_order(jobs):
+    client = APIClient()
+
+    titles, last = _walk(client, {})
+    assert titles == jobs
+    assert last.data['count'] == 25
+
+    titles, last = _walk(client, {'count': 'none'})
+    assert titles == jobs
+    assert last.data['count'] is None
+
+    assert client.get('/api/jobs/', {'cursor': 'not-a-cursor'}).status_code == 404
+
+
+@pytest.mark.django_db
+def test_page_numbers_still_work(jobs):
+    client = APIClient()
+
+    response = client.get('/api/jobs/', {'page': 2})
+    assert response.data['count'] == 25
+    assert [job['title'] for job in response.data['results']] == jobs[20:]
+    assert response.data['next'] is None and response.data['previous']
+
+    response = client.get('/api/jobs/', {'page': 1, 'count': 'none'})
+    assert response.data['count'] is None
+    assert [job['title'] for job in response.data['results']] == jobs[:20]
+    assert 'page=2' in response.data['next']
+
+    response = client.get('/api/jobs/', {'ordering': 'title'})
+    assert 'page=2' in response.data['next']
+
+
+@pytest.mark.django_db
+def test_list_queries_skip_the_description(jobs):
+    with CaptureQueriesContext(connection) as queries:
+        APIClient().get('/api/jobs/')
+    assert not any('"description"' in query['sql'] for query in queries.captured_queries)
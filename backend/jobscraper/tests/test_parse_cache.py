@@ -0,0 +1,60 @@
+from jobscraper import enrichment
+from jobscraper.enrichment import JobEnricher
+from jobscraper.parse_cache import LocalParseCache, SQLiteParseCache
+
+
+def _jobs(descriptions):
+    return [
+        {'title': f'Role {i}', 'description': description, 'url': f'https://example.com/jobs/{i}'}
+        for i, description in enumerate(descriptions)
+    ]
+
+
+def test_local_cache_evicts_least_recently_used():
+    cache = LocalParseCache(max_entries=2)
+    cache.set('a', {'job_type': 'full-time'})
+    cache.set('b', {'job_type': 'contract'})
+    assert cache.get('a') == {'job_type': 'full-time'}
+
+    cache.set('c', {'job_type': 'internship'})
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_sqlite_cache_persists_across_instances_and_is_bounded(tmp_path, monkeypatch):
+    path = str(tmp_path / 'parse.sqlite3')
+    monkeypatch.setattr(SQLiteParseCache, 'EVICT_EVERY', 1)
+
+    cache = SQLiteParseCache(path, max_entries=3)
+    for i in range(5):
+        cache.set(f'description {i}', {'seniority_score': i})
+    cache.close()
+
+    reopened = SQLiteParseCache(path, max_entries=3)
+    assert reopened.get('description 4') == {'seniority_score': 4}
+    assert reopened.get('description 0') is None
+    (count,) = reopened._conn.execute('SELECT COUNT(*) FROM parse_cache').fetchone()
+    assert count == 3
+
+
+def test_enricher_parses_each_description_once(monkeypatch):
+    calls = []
+    parse_job = enrichment.parse_job
+
+    def counting_parse_job(job):
+        calls.append(job['description'])
+        return parse_job(job)
+
+    monkeypatch.setattr(enrichment, 'parse_job', counting_parse_job)
+    jobs = _jobs(['Senior Python engineer, full-time, remote.', 'Contract designer, hybrid.'] * 2)
+    enricher = JobEnricher(cache=LocalParseCache())
+
+    first = enricher.enrich(jobs[:2])
+    second = enricher.enrich(jobs)
+
+    assert len(calls) == 2
+    assert (enricher.cache_hits, enricher.cache_misses) == (4, 2)
+    assert [job['job_type'] for job in second] == ['full-time', 'contract', 'full-time', 'contract']
+    assert second[:2] == first
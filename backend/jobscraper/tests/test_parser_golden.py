@@ -0,0 +1,37 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from jobscraper.parser_patterns import JOB_TYPES
+from jobscraper.simple_job_parser import SimpleJobParser
+
+
+GOLDEN = json.loads((Path(__file__).parent / 'golden' / 'simple_job_parser.json').read_text())
+
+
+def _comparable(value):
+    # Parser lists are built from sets; Decimals are compared as strings
+    if isinstance(value, list):
+        return sorted(_comparable(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _comparable(item) for key, item in value.items()}
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+@pytest.mark.parametrize('case', GOLDEN, ids=[f'case-{i}' for i in range(len(GOLDEN))])
+def test_parser_output_matches_golden_file(case):
+    text = case['text']
+    index = GOLDEN.index(case)
+    parsed = SimpleJobParser().parse_job_posting(f'<p>{text}</p>', text, f'https://example.com/{index}')
+
+    assert _comparable(parsed) == case['expected']
+
+
+def test_category_scan_prefers_earlier_category_found_later_in_text():
+    # 'contract' appears first, but full-time has priority
+    assert JOB_TYPES.classify('contract role, converts to permanent') == 'full-time'
+    assert JOB_TYPES.classify('seasonal contract') == 'contract'
+    assert JOB_TYPES.classify('no match here') is None
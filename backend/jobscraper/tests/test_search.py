@@ -0,0 +1,82 @@
+import pytest
+from rest_framework.test import APIClient
+
+from jobscraper.models import JobPosting
+from jobscraper.search import drop_search_index, fts_query, install_search_index, search_jobs
+
+
+@pytest.fixture
+def search_index(db):
+    assert install_search_index() == 'sqlite'
+    yield
+    drop_search_index()
+
+
+def _job(i, title, description='', company='Acme', **fields):
+    return JobPosting(
+        external_id=str(i), title=title, company=company, description=description,
+        url=f'https://jobs.example.com/{i}', source='greenhouse', location='Remote', **fields
+    )
+
+
+def _titles(queryset):
+    return [job.title for job in queryset.order_by('-search_rank')]
+
+
+def test_fts_query_quotes_words_and_prefixes_the_last():
+    assert fts_query('python "django" OR-') == '"python" "django" "OR"*'
+    assert fts_query(' -* ') == ''
+
+
+@pytest.mark.django_db
+def test_title_matches_rank_above_description_matches(search_index):
+    JobPosting.objects.bulk_create([
+        _job(1, 'Sales Manager', 'Our sales team works with python engineers.'),
+        _job(2, 'Python Developer', 'Build backend services.'),
+        _job(3, 'Designer', 'Figma and prototyping.'),
+    ])
+
+    assert _titles(search_jobs(JobPosting.objects.all(), 'python')) == ['Python Developer', 'Sales Manager']
+    # Stemming and prefix matching
+    assert _titles(search_jobs(JobPosting.objects.all(), 'prototype')) == ['Designer']
+    assert _titles(search_jobs(JobPosting.objects.all(), 'develop')) == ['Python Developer']
+
+
+@pytest.mark.django_db
+def test_index_follows_saves_updates_and_deletes(search_index):
+    job = _job(1, 'Data Analyst')
+    job.save()
+    assert _titles(search_jobs(JobPosting.objects.all(), 'analyst')) == ['Data Analyst']
+
+    JobPosting.objects.filter(pk=job.pk).update(title='Data Scientist')
+    assert _titles(search_jobs(JobPosting.objects.all(), 'analyst')) == []
+    assert _titles(search_jobs(JobPosting.objects.all(), 'scientist')) == ['Data Scientist']
+
+    job.delete()
+    assert _titles(search_jobs(JobPosting.objects.all(), 'scientist')) == []
+
+
+@pytest.mark.django_db
+def test_list_api_q_orders_by_relevance(search_index):
+    JobPosting.objects.bulk_create([
+        _job(1, 'Account Executive', 'Sell to engineering teams using kubernetes.'),
+        _job(2, 'Kubernetes Platform Engineer', 'Run kubernetes clusters.'),
+    ])
+
+    response = APIClient().get('/api/jobs/', {'q': 'kubernetes'})
+    assert response.status_code == 200
+    assert [job['title'] for job in response.data['results']] == [
+        'Kubernetes Platform Engineer', 'Account Executive',
+    ]
+
+    response = APIClient().get('/api/jobs/', {'q': 'kubernetes', 'ordering': 'title'})
+    assert [job['title'] for job in response.data['results']] == [
+        'Account Executive', 'Kubernetes Platform Engineer',
+    ]
+
+
+@pytest.mark.django_db
+def test_search_without_index_falls_back_to_substring_matching():
+    JobPosting.objects.bulk_create([_job(1, 'Python Developer'), _job(2, 'Designer', company='Python Arts')])
+
+    assert sorted(job.title for job in search_jobs(JobPosting.objects.all(), 'python dev')) == ['Python Developer']
@@ -0,0 +1,87 @@
+import json
+import os
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from fyndr_auth.models import Skill
+from jobmatcher.engine import job_matching_engine
+from jobmatcher.skill_vectors import is_current, skill_names, skill_vector_version
+from jobscraper.models import JobPosting
+from jobscraper.simple_job_parser import SimpleJobParser
+from jobscraper.skill_taxonomy import SKILL_SYNONYMS, SkillTaxonomy, get_taxonomy, reset_taxonomy
+
+
+@pytest.fixture(autouse=True)
+def fresh_taxonomy(settings):
+    settings.JOBSCRAPER_SKILL_TAXONOMY_CHECK_INTERVAL = 0
+    reset_taxonomy()
+    yield
+    reset_taxonomy()
+
+
+def _linear_normalize(skill):
+    # Normalization before the taxonomy: first entry listing the skill wins
+    skill_lower = skill.lower().strip()
+    for main_skill, synonyms in SKILL_SYNONYMS.items():
+        if skill_lower == main_skill or skill_lower in synonyms:
+            return main_skill
+    return skill_lower
+
+
+def test_normalize_is_a_lookup_with_linear_scan_results():
+    taxonomy = SkillTaxonomy.default(load_skills=False)
+    names = set(SKILL_SYNONYMS).union(*SKILL_SYNONYMS.values()) | taxonomy.terms() | {'haskell'}
+
+    for name in names:
+        assert taxonomy.normalize(f' {name.upper()} ') == _linear_normalize(name)
+    assert taxonomy.normalize('Postgres') == 'postgresql'
+    assert taxonomy.id('Haskell') is None
+    assert taxonomy.name(taxonomy.id('psql')) == 'postgresql'
+
+    assert taxonomy.extract('Python, Go and SQL; AWS certified.') == ['python', 'go', 'sql', 'aws']
+    assert job_matching_engine.extract_skills_from_text('Python, Go and SQL') == ['python', 'sql']
+
+
+def test_taxonomy_file_is_picked_up_when_it_changes(settings, tmp_path):
+    path = tmp_path / 'skills.json'
+    path.write_text(json.dumps({'terms': {'databases': ['cockroachdb']}}))
+    settings.JOBSCRAPER_SKILL_TAXONOMY_FILE = str(path)
+
+    parser = SimpleJobParser()
+    text = 'CockroachDB and Svelte experience.'
+    assert sorted(parser._extract_skills(text)['required']) == ['cockroachdb', 'svelte']
+    version = get_taxonomy().version
+
+    path.write_text(json.dumps({
+        'synonyms': {'cockroachdb': ['crdb']},
+        'terms': {'databases': ['cockroachdb', 'crdb']},
+    }))
+    # Force a different mtime on filesystems with coarse timestamps
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 1))
+
+    assert get_taxonomy().version != version
+    assert get_taxonomy().normalize('CRDB') == 'cockroachdb'
+    assert 'crdb' in parser._extract_skills('crdb clusters')['required']
+
+
+@pytest.mark.django_db
+def test_skill_table_is_opt_in_and_reload_makes_vectors_stale(settings):
+    Skill.objects.create(name='Elixir', slug='elixir', category='Programming Language')
+    job = JobPosting.objects.create(
+        external_id='1', title='Backend Engineer', company='Acme', location='Remote',
+        description='Elixir and Python.', url='https://jobs.example.com/1', source='greenhouse',
+        date_scraped=timezone.now(),
+    )
+    assert skill_names(job.skill_ids) == ['python']
+
+    settings.JOBSCRAPER_SKILL_TAXONOMY_USE_SKILL_TABLE = True
+    call_command('reload_skill_taxonomy')
+    assert not is_current(job)
+
+    assert sorted(job_matching_engine.job_skill_requirements(job)) == ['elixir', 'python']
+    assert JobPosting.objects.get().skill_version != skill_vector_version()
+    call_command('refresh_skill_vectors')
+    assert JobPosting.objects.get().skill_version == skill_vector_version()
@@ -0,0 +1,97 @@
+import threading
+
+import httpx
+import pytest
+
+from jobscraper.fetcher import AsyncFetcher
+from jobscraper.models import JobPosting, ScrapingLog
+from jobscraper.scrapers.greenhouse_india import GreenhouseIndiaScraper
+
+
+def _scraper(companies):
+    def handler(request):
+        company = request.url.path.split('/')[-2]
+        jobs = [
+            {
+                'id': f'{company}-{i}',
+                'title': f'Engineer {i}',
+                'location': {'name': 'Bengaluru, India'},
+                'absolute_url': f'https://boards.example.com/{company}/jobs/{i}',
+                'content': 'Build things.',
+            }
+            for i in range(3)
+        ]
+        return httpx.Response(200, json={'jobs': jobs})
+
+    scraper = GreenhouseIndiaScraper()
+    scraper.company_names = companies
+    scraper.stream = True
+    scraper.stream_chunk_size = 2
+    scraper.fetch_concurrency = 1
+    scraper.async_fetch = True
+    scraper._fetcher = AsyncFetcher(per_host_rate=0, transport=httpx.MockTransport(handler))
+    return scraper
+
+
+@pytest.fixture(autouse=True)
+def no_logo_lookups(monkeypatch):
+    monkeypatch.setattr('jobscraper.scrapers.base.resolve_company_logos', lambda companies: {})
+
+
+@pytest.mark.django_db
+def test_streaming_scrape_saves_all_jobs_in_chunks():
+    results = _scraper(['acme', 'globex']).scrape_jobs()
+
+    assert results['created'] == 6
+    assert JobPosting.objects.filter(source='greenhouse_india').count() == 6
+    assert ScrapingLog.objects.get().jobs_created == 6
+
+
+@pytest.mark.django_db
+def test_streaming_scrape_keeps_chunks_saved_before_a_failure(monkeypatch):
+    scraper = _scraper(['acme', 'globex'])
+    fetch = scraper._fetch_india_jobs
+    calls = []
+
+    def fetch_then_crash(companies):
+        calls.append(companies)
+        if len(calls) > 1:
+            raise RuntimeError('crawler died')
+        return fetch(companies)
+
+    monkeypatch.setattr(scraper, '_fetch_india_jobs', fetch_then_crash)
+
+    with pytest.raises(RuntimeError):
+        scraper.scrape_jobs()
+
+    assert JobPosting.objects.filter(source='greenhouse_india').count() == 3
+    log = ScrapingLog.objects.get()
+    assert log.status == 'failed'
+    assert log.jobs_created == 3
+
+
+@pytest.mark.django_db
+def test_failed_save_stops_the_producer(monkeypatch):
+    scraper = _scraper(['acme'])
+    closed = []
+
+    def endless_jobs(**kwargs):
+        try:
+            i = 0
+            while True:
+                i += 1
+                yield {'id': i}
+        finally:
+            closed.append(True)
+
+    def failing_save(chunk, results, scraping_log):
+        raise RuntimeError('database went away')
+
+    monkeypatch.setattr(scraper, 'iter_parsed_jobs', endless_jobs)
+    monkeypatch.setattr(scraper, '_save_stream_chunk', failing_save)
+
+    with pytest.raises(RuntimeError):
+        scraper.scrape_jobs()
+
+    assert closed == [True]
+    assert not [thread for thread in threading.enumerate() if thread.name == 'jobscraper-stream']
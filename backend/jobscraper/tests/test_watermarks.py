@@ -0,0 +1,113 @@
+import httpx
+import pytest
+
+from jobscraper.fetcher import AsyncFetcher
+from jobscraper.models import JobPosting, ScrapeWatermark
+from jobscraper.scrapers.greenhouse_india import GreenhouseIndiaScraper
+from jobscraper.scrapers.naukri import NaukriScraper
+
+
+@pytest.fixture(autouse=True)
+def no_logo_lookups(monkeypatch):
+    monkeypatch.setattr('jobscraper.scrapers.base.resolve_company_logos', lambda companies: {})
+
+
+def _board_job(i, updated_at='2025-01-10T09:00:00Z'):
+    return {
+        'id': i,
+        'title': f'Engineer {i}',
+        'location': {'name': 'Bengaluru, India'},
+        'absolute_url': f'https://boards.example.com/acme/jobs/{i}',
+        'content': 'Build things.',
+        'updated_at': updated_at,
+    }
+
+
+def _run(board_jobs):
+    scraper = GreenhouseIndiaScraper()
+    scraper.company_names = ['acme']
+    scraper.async_fetch = True
+    scraper.incremental = True
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={'jobs': board_jobs}))
+    scraper._fetcher = AsyncFetcher(per_host_rate=0, transport=transport)
+    return scraper.scrape_jobs()
+
+
+@pytest.mark.django_db
+def test_incremental_run_only_saves_new_and_edited_jobs():
+    first = _run([_board_job(1), _board_job(2)])
+    assert first['created'] == 2
+
+    watermark = ScrapeWatermark.objects.get(source='greenhouse_india', scope='acme')
+    assert watermark.seen_ids == ['1', '2']
+
+    edited = _board_job(2, updated_at='2025-01-12T09:00:00Z')
+    edited['title'] = 'Senior Engineer 2'
+    second = _run([_board_job(1), edited, _board_job(3)])
+
+    assert (second['created'], second['updated'], second['unchanged']) == (1, 1, 1)
+    assert JobPosting.objects.get(external_id='2').title == 'Senior Engineer 2'
+    watermark.refresh_from_db()
+    assert watermark.seen_ids == ['1', '2', '3']
+    assert watermark.last_posted_at.day == 12
+
+
+@pytest.mark.django_db
+def test_failed_run_does_not_move_watermarks(monkeypatch):
+    monkeypatch.setattr(GreenhouseIndiaScraper, 'save_jobs', lambda self, jobs: 1 / 0)
+
+    with pytest.raises(ZeroDivisionError):
+        _run([_board_job(1)])
+
+    assert not ScrapeWatermark.objects.exists()
+
+
+@pytest.mark.django_db
+def test_jobs_that_were_not_saved_are_not_remembered(monkeypatch):
+    save_jobs = GreenhouseIndiaScraper.save_jobs
+    monkeypatch.setattr(GreenhouseIndiaScraper, 'save_jobs', lambda self, jobs: {'created': 0, 'errors': len(jobs)})
+
+    _run([_board_job(1)])
+    assert ScrapeWatermark.objects.get(source='greenhouse_india', scope='acme').seen_ids == []
+
+    monkeypatch.setattr(GreenhouseIndiaScraper, 'save_jobs', save_jobs)
+    assert _run([_board_job(1)])['created'] == 1
+
+    # A remembered job that is gone from the table is forgotten and fetched again
+    JobPosting.objects.all().delete()
+    assert _run([_board_job(1)])['unchanged'] == 1
+    assert ScrapeWatermark.objects.get(source='greenhouse_india', scope='acme').seen_ids == []
+    assert _run([_board_job(1)])['created'] == 1
+
+
+class _Page:
+    def __init__(self, urls):
+        self.text = ''.join(f'<a class="title" href="/job-listings/{url}">job</a>' for url in urls)
+
+
+@pytest.mark.django_db
+def test_naukri_stops_paginating_at_known_results(monkeypatch):
+    known = ['known-1', 'known-2']
+    ScrapeWatermark.objects.create(
+        source='naukri', scope='python developer|bangalore',
+        seen_ids=[f'https://www.naukri.com/job-listings/{job_id}' for job_id in known],
+    )
+
+    scraper = NaukriScraper()
+    scraper.search_keywords = ['python developer']
+    scraper.incremental = True
+    requested = []
+
+    def fetch_many(urls):
+        requested.extend(urls)
+        return [_Page(known if 'bangalore' in url else [f'{url.rsplit("/", 1)[-1]}-new']) for url in urls]
+
+    monkeypatch.setattr(scraper, 'fetch_many', fetch_many)
+    job_urls = scraper.fetch_data_for_scraping()
+
+    bangalore_pages = [url for url in requested if 'bangalore' in url]
+    assert bangalore_pages == ['https://www.naukri.com/jobs/python-developer-jobs-in-bangalore']
+    assert len([url for url in requested if 'mumbai' in url]) == 3
+    # New jobs first, known ones last and passed on without fetching
+    assert [scraper.is_known_url(url) for url in job_urls][-2:] == [True, True]
+    assert not any(scraper.is_known_url(url) for url in job_urls[:-2])
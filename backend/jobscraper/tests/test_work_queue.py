@@ -0,0 +1,158 @@
+from datetime import timedelta
+
+import httpx
+import pytest
+from django.utils import timezone
+
+from jobscraper.fetcher import AsyncFetcher
+from jobscraper.models import JobPosting, ScrapeWatermark, ScrapeWorkUnit
+from jobscraper.scrapers.greenhouse_india import GreenhouseIndiaScraper
+from jobscraper.scrapers.weworkremotely import WeWorkRemotelyScraper
+from jobscraper.work_queue import ScrapeWorker, WorkQueue
+
+
+@pytest.fixture(autouse=True)
+def no_logo_lookups(monkeypatch):
+    monkeypatch.setattr('jobscraper.scrapers.base.resolve_company_logos', lambda companies: {})
+
+
+def _expire_leases():
+    ScrapeWorkUnit.objects.update(lease_expires_at=timezone.now() - timedelta(seconds=1))
+
+
+@pytest.mark.django_db
+def test_enqueue_is_idempotent_and_reopens_finished_units():
+    queue = WorkQueue(worker_id='a')
+    assert queue.enqueue('greenhouse', 'board', [{'company': 'acme'}, {'company': 'globex'}]) == 2
+    assert queue.enqueue('greenhouse', 'board', [{'company': 'acme'}]) == 0
+
+    (unit,) = queue.lease(1)
+    assert queue.complete(unit, {'created': 1})
+    assert queue.enqueue('greenhouse', 'board', [{'company': 'acme'}, {'company': 'globex'}]) == 1
+
+    unit.refresh_from_db()
+    assert (unit.status, unit.attempts, unit.result) == (ScrapeWorkUnit.PENDING, 0, None)
+
+
+@pytest.mark.django_db
+def test_expired_lease_is_reclaimed_and_stale_worker_cannot_settle():
+    first, second = WorkQueue(worker_id='a'), WorkQueue(worker_id='b')
+    first.enqueue('greenhouse', 'board', [{'company': 'acme'}])
+
+    (unit,) = first.lease(5)
+    assert second.lease(5) == []
+
+    _expire_leases()
+    (reclaimed,) = second.lease(5)
+    assert reclaimed.id == unit.id and reclaimed.attempts == 2
+
+    assert not first.heartbeat(unit)
+    assert not first.complete(unit)
+    assert second.complete(reclaimed)
+    assert not second.complete(reclaimed)
+    assert ScrapeWorkUnit.objects.get().leased_by == 'b'
+
+
+@pytest.mark.django_db
+def test_failed_units_back_off_then_give_up():
+    queue = WorkQueue(worker_id='a', max_attempts=2, retry_delay=60)
+    queue.enqueue('naukri', 'search', [{'keyword': 'python', 'location': 'pune', 'pages': [1, 3]}])
+
+    (unit,) = queue.lease(1)
+    assert queue.fail(unit, 'timeout')
+    unit.refresh_from_db()
+    assert unit.status == ScrapeWorkUnit.PENDING
+    assert unit.available_at >= timezone.now() + timedelta(seconds=55)
+    assert queue.lease(1) == []
+
+    ScrapeWorkUnit.objects.update(available_at=timezone.now())
+    (unit,) = queue.lease(1)
+    assert not queue.fail(unit, 'timeout again')
+    unit.refresh_from_db()
+    assert (unit.status, unit.last_error) == (ScrapeWorkUnit.FAILED, 'timeout again')
+
+
+@pytest.mark.django_db
+def test_worker_that_dies_on_last_attempt_fails_the_unit():
+    queue = WorkQueue(worker_id='a', max_attempts=1)
+    queue.enqueue('greenhouse', 'board', [{'company': 'acme'}])
+    queue.lease(1)
+
+    _expire_leases()
+    assert queue.lease(1) == []
+    assert ScrapeWorkUnit.objects.get().status == ScrapeWorkUnit.FAILED
+
+
+@pytest.mark.django_db
+def test_worker_runs_board_units(monkeypatch):
+    def handler(request):
+        company = request.url.path.split('/')[3]
+        return httpx.Response(200, json={'jobs': [{
+            'id': f'{company}-1',
+            'title': f'Engineer at {company}',
+            'location': {'name': 'Bengaluru, India'},
+            'absolute_url': f'https://boards.example.com/{company}/jobs/1',
+            'content': 'Build things.',
+            'updated_at': '2025-01-10T09:00:00Z',
+        }]})
+
+    def make_scraper(source):
+        scraper = GreenhouseIndiaScraper()
+        scraper.async_fetch = True
+        scraper._fetcher = AsyncFetcher(per_host_rate=0, transport=httpx.MockTransport(handler))
+        return scraper
+
+    monkeypatch.setattr('jobscraper.work_queue.get_scraper', make_scraper)
+
+    queue = WorkQueue(worker_id='a')
+    queue.enqueue('greenhouse_india', 'board', [{'company': 'acme'}, {'company': 'globex'}])
+
+    assert ScrapeWorker(queue).run() == {'completed': 2, 'failed': 0}
+    assert set(JobPosting.objects.values_list('external_id', flat=True)) == {'acme-1', 'globex-1'}
+    assert set(
+        ScrapeWorkUnit.objects.filter(source='greenhouse_india').values_list('status', flat=True)
+    ) == {ScrapeWorkUnit.DONE}
+    # Saved jobs queue their rescoring, left to the rescore workers
+    assert set(ScrapeWorkUnit.objects.exclude(source='greenhouse_india').values_list('source', flat=True)) == {'jobmatcher'}
+
+
+@pytest.mark.django_db
+def test_detail_unit_that_saves_nothing_is_retried_and_only_then_remembered(monkeypatch):
+    listing = ''.join(f'<a class="browse_job_link" href="/remote-jobs/{slug}">job</a>' for slug in ('a', 'b'))
+    broken = {'b'}
+
+    def handler(request):
+        slug = request.url.path.rsplit('/', 1)[1]
+        if slug == 'programming':
+            return httpx.Response(200, text=listing)
+        if slug in broken:
+            return httpx.Response(404)
+        return httpx.Response(200, text=f'<h1>Engineer {slug}</h1><h2>Acme</h2>')
+
+    def make_scraper(source):
+        scraper = WeWorkRemotelyScraper()
+        scraper.async_fetch = True
+        scraper.incremental = True
+        scraper._fetcher = AsyncFetcher(per_host_rate=0, transport=httpx.MockTransport(handler))
+        return scraper
+
+    monkeypatch.setattr('jobscraper.work_queue.get_scraper', make_scraper)
+    monkeypatch.setattr(WeWorkRemotelyScraper, '_extract_external_id', lambda self, job: job['url'].rsplit('/', 1)[1])
+
+    queue = WorkQueue(worker_id='a', retry_delay=0)
+    queue.enqueue('weworkremotely', 'search', [{'category': 'programming'}])
+    worker = ScrapeWorker(queue, sources=['weworkremotely'])
+    assert worker.run(max_units=3) == {'completed': 2, 'failed': 1}
+
+    watermark = ScrapeWatermark.objects.get(source='weworkremotely', scope='programming')
+    assert watermark.seen_ids == ['https://weworkremotely.com/remote-jobs/a']
+    failed = ScrapeWorkUnit.objects.get(kind='detail', status=ScrapeWorkUnit.PENDING)
+    assert failed.payload == {'url': 'https://weworkremotely.com/remote-jobs/b', 'scope': 'programming'}
+
+    broken.clear()
+    assert worker.run() == {'completed': 1, 'failed': 0}
+    assert JobPosting.objects.filter(source='weworkremotely').count() == 2
+    watermark.refresh_from_db()
+    assert sorted(watermark.seen_ids) == [
+        'https://weworkremotely.com/remote-jobs/a', 'https://weworkremotely.com/remote-jobs/b',
+    ]
@@ -2,7 +2,12 @@ from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q, Count
+from django.db.models import Count
+from .dedup import promote_duplicates
+from .facets import count_new_jobs, filter_options, listing_stats, track_facets
+from .filters import FullTextSearchFilter
+from .locations import get_gazetteer
+from .pagination import JobFeedPagination
 from .models import JobPosting
 from .serializers import JobPostingSerializer, JobPostingListSerializer, RecruiterJobSerializer
 from .permissions import IsRecruiter
@@ -12,10 +17,26 @@ class JobPostingViewSet(viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for JobPosting model providing read-only access to job data.
     Supports filtering, searching, and pagination.
+    
+    ?q= runs an indexed full-text search ordered by relevance; ?search=
+    keeps the substring matching of SearchFilter. ?country= (name or ISO
+    code), ?city= (any known spelling) and ?is_remote= filter on the
+    structured location fields.
+    
+    The default newest-first listing is paged with ?cursor= (see
+    jobscraper.pagination); ?page= and other orderings use page numbers.
     """
     queryset = JobPosting.objects.filter(is_active=True).order_by('-date_posted', '-date_scraped')
     serializer_class = JobPostingListSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter, FullTextSearchFilter]
+    pagination_class = JobFeedPagination
+    
+    # Columns JobPostingListSerializer reads; list queries skip the heavy
+    # TEXT/JSON columns (description, raw_data, parsed fields)
+    list_fields = [
+        'id', 'title', 'company', 'location', 'country_code', 'city', 'is_remote', 'job_type',
+        'url', 'apply_url', 'application_mode', 'source_type', 'source', 'date_posted', 'date_scraped',
+    ]
     
     # Filtering options
     filterset_fields = {
@@ -25,6 +46,9 @@ class JobPostingViewSet(viewsets.ReadOnlyModelViewSet):
         'recruiter_owner': ['exact'],
         'is_active': ['exact'],
         'location': ['icontains', 'exact'],
+        'country_code': ['exact', 'in'],
+        'region': ['exact'],
+        'is_remote': ['exact'],
         'company': ['icontains', 'exact'],
         'date_posted': ['gte', 'lte', 'exact'],
         'date_scraped': ['gte', 'lte', 'exact'],
@@ -43,57 +67,35 @@ class JobPostingViewSet(viewsets.ReadOnlyModelViewSet):
             return JobPostingSerializer
         return JobPostingListSerializer
     
+    # Query parameters get_queryset filters on
+    queryset_params = [
+        'country', 'city', 'employment_type', 'date_from', 'date_to',
+        'recruiter_owner', 'source_type', 'application_mode', 'is_active',
+    ]
+    
     def get_queryset(self):
         """Custom queryset with additional filtering options."""
         queryset = super().get_queryset()
         
-        # Filter by country (for India-specific jobs)
+        # Near-duplicates stay reachable by id but are left out of listings
+        if self.action != 'retrieve':
+            queryset = queryset.canonical().only(*self.list_fields)
+        
+        # Location filters use the fields normalized at ingest (see jobscraper.locations)
         country = self.request.query_params.get('country', None)
         if country:
-            if country.lower() == 'india':
-                # Filter for India locations
-                india_keywords = [
-                    'india', 'mumbai', 'delhi', 'bangalore', 'hyderabad', 'chennai',
-                    'kolkata', 'pune', 'ahmedabad', 'jaipur', 'lucknow', 'kanpur',
-                    'nagpur', 'indore', 'thane', 'bhopal', 'visakhapatnam', 'pimpri',
-                    'patna', 'vadodara', 'ghaziabad', 'ludhiana', 'agra', 'nashik',
-                    'faridabad', 'meerut', 'rajkot', 'kalyan', 'vasai', 'varanasi',
-                    'srinagar', 'aurangabad', 'dhanbad', 'amritsar', 'navi mumbai',
-                    'allahabad', 'ranchi', 'howrah', 'coimbatore', 'jabalpur',
-                    'gwalior', 'vijayawada', 'jodhpur', 'madurai', 'raipur',
-                    'kota', 'gurgaon', 'chandigarh', 'solapur', 'hubli', 'tiruchirappalli',
-                    'bareilly', 'mysore', 'tiruppur', 'guwahati', 'salem', 'mira',
-                    'bhiwandi', 'saharanpur', 'gorakhpur', 'bikaner', 'amravati',
-                    'noida', 'jamshedpur', 'bhilai', 'warangal', 'cuttack', 'firozabad',
-                    'kochi', 'bhavnagar', 'dehradun', 'durgapur', 'asansol', 'rourkela',
-                    'nanded', 'kolhapur', 'ajmer', 'akola', 'gulbarga', 'jamnagar',
-                    'ujjain', 'loni', 'siliguri', 'jhansi', 'ulhasnagar', 'nellore',
-                    'jammu', 'sangli', 'belgaum', 'mangalore', 'ambattur', 'tirunelveli',
-                    'malegaon', 'gaya', 'jalgaon', 'udaipur', 'maheshtala'
-                ]
-                
-                # Create Q objects for each keyword
-                location_q = Q()
-                for keyword in india_keywords:
-                    location_q |= Q(location__icontains=keyword)
-                
-                queryset = queryset.filter(location_q)
+            country_code = get_gazetteer().country_code(country)
+            queryset = queryset.filter(country_code=country_code) if country_code else queryset.none()
         
-        # Filter by employment type (extracted from description)
+        city = self.request.query_params.get('city', None)
+        if city:
+            canonical_city = get_gazetteer().city_name(city)
+            queryset = queryset.filter(city=canonical_city) if canonical_city else queryset.filter(city__iexact=city.strip())
+        
+        # Filter by employment type (stored in job_type at ingest)
         employment_type = self.request.query_params.get('employment_type', None)
-        if employment_type:
-            if employment_type.lower() == 'full-time':
-                queryset = queryset.filter(
-                    Q(description__icontains='full-time') | Q(description__icontains='full time')
-                )
-            elif employment_type.lower() == 'part-time':
-                queryset = queryset.filter(
-                    Q(description__icontains='part-time') | Q(description__icontains='part time')
-                )
-            elif employment_type.lower() == 'contract':
-                queryset = queryset.filter(description__icontains='contract')
-            elif employment_type.lower() == 'internship':
-                queryset = queryset.filter(description__icontains='intern')
+        if employment_type and employment_type.lower() in dict(JobPosting.JOB_TYPE_CHOICES):
+            queryset = queryset.filter(job_type=employment_type.lower())
         
         # Filter by date range
         date_from = self.request.query_params.get('date_from', None)
@@ -129,6 +131,10 @@ class JobPostingViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """Get statistics about available jobs."""
+        # Unfiltered stats come from the facet counters (see jobscraper.facets)
+        if not self._is_filtered(request):
+            return Response(listing_stats())
+        
         queryset = self.get_queryset()
         
         stats = {
@@ -146,6 +152,9 @@ class JobPostingViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['get'])
     def filters(self, request):
         """Get available filter options."""
+        if not self._is_filtered(request):
+            return Response(filter_options())
+        
         queryset = self.get_queryset()
         
         filters_data = {
@@ -156,6 +165,9 @@ class JobPostingViewSet(viewsets.ReadOnlyModelViewSet):
         
         return Response(filters_data)
     
+    def _is_filtered(self, request):
+        return any(request.query_params.get(param) for param in self.queryset_params)
+    
     @action(detail=False, methods=['get'])
     def india_jobs(self, request):
         """Get jobs specifically for India."""
@@ -179,6 +191,7 @@ class RecruiterJobViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         instance = serializer.save()
+        count_new_jobs(JobPosting.objects.filter(pk=instance.pk))
         # Emit WS events
         try:
             from channels.layers import get_channel_layer
@@ -201,7 +214,8 @@ class RecruiterJobViewSet(viewsets.ModelViewSet):
             pass
 
     def perform_update(self, serializer):
-        instance = serializer.save()
+        with track_facets(JobPosting.objects.filter(pk=serializer.instance.pk)):
+            instance = serializer.save()
         try:
             from channels.layers import get_channel_layer
             from asgiref.sync import async_to_sync
@@ -224,4 +238,6 @@ class RecruiterJobViewSet(viewsets.ModelViewSet):
 
     def perform_destroy(self, instance):
         instance.is_active = False
-        instance.save(update_fields=['is_active', 'updated_at'])
+        with track_facets(JobPosting.objects.filter(pk=instance.pk)):
+            instance.save(update_fields=['is_active', 'updated_at'])
+        promote_duplicates([instance.pk])
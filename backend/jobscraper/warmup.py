@@ -0,0 +1,39 @@
+"""
+Worker Warm-up
+
+Job scraper modules defer their expensive setup -- parser singletons, the
+compiled keyword matcher, BeautifulSoup/lxml, NLTK corpora -- until first
+use, so management commands, tests and web workers that merely import them
+start quickly. Long-lived workers that will parse jobs can call warm_up()
+from their startup hook (e.g. Celery's worker_process_init or gunicorn's
+post_fork) to pay that cost before the first job instead of during it.
+"""
+
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+def warm_up(scrapers: bool = True, nltk: bool = False) -> None:
+    """
+    Initialize lazily loaded parsing and scraping dependencies.
+
+    Args:
+        scrapers: Also import the HTML scraping stack (BeautifulSoup, lxml)
+        nltk: Also load the NLTK-based JobParser, its corpora and tokenizer
+    """
+    from .simple_job_parser import simple_job_parser
+
+    if scrapers:
+        from . import logo_scraper  # noqa: F401
+
+    # Compiles the keyword matcher, which otherwise happens on the first job
+    simple_job_parser.keyword_matcher.find_all('')
+
+    if nltk:
+        try:
+            from .job_parser import warm_up as warm_up_job_parser
+            warm_up_job_parser()
+        except Exception as e:
+            logger.warning(f"NLTK job parser warm-up failed: {str(e)}")
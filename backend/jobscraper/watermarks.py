@@ -0,0 +1,199 @@
+"""
+Scrape Watermarks
+
+Per-source state that lets scheduled runs crawl incrementally. A watermark
+covers one scope within a source -- a company board, a search, a category --
+and remembers the newest posting timestamp seen, the most recent job ids
+and the cursor the last successful run reached.
+
+Scrapers ask is_known() before fetching detail pages or the next results
+page: known jobs are passed on as unchanged (marked seen, never re-parsed or
+saved) and pagination stops at the first page with nothing new. Jobs are
+observed once they are stored, and forgotten when a known job turns out not
+to be, so a job that failed to save is fetched again rather than skipped.
+Observations are only persisted by save(), which scrape_jobs calls after a
+successful run, so a failed run is simply repeated in full territory next
+time.
+"""
+
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Union
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+
+logger = logging.getLogger(__name__)
+
+
+def _as_datetime(value: Union[str, date, datetime, None]) -> Optional[datetime]:
+    """Coerce an ISO string, date or datetime to an aware datetime (None if unparseable)."""
+    if isinstance(value, str):
+        try:
+            value = parse_datetime(value) or parse_date(value)
+        except ValueError:
+            return None
+    if isinstance(value, datetime):
+        return value if timezone.is_aware(value) else timezone.make_aware(value)
+    if isinstance(value, date):
+        return timezone.make_aware(datetime(value.year, value.month, value.day))
+    return None
+
+
+class WatermarkTracker:
+    """
+    Watermarks for one run of one source.
+
+    Stored watermarks are loaded with a single query on first use; ids,
+    timestamps and cursors observed during the run are buffered and written
+    back by save().
+    """
+
+    def __init__(self, source: str, max_ids: Optional[int] = None):
+        """
+        Initialize the tracker.
+
+        Args:
+            source: Source identifier (e.g. 'greenhouse')
+            max_ids: Most recent ids remembered per scope
+                     (defaults to settings.JOBSCRAPER_WATERMARK_MAX_IDS)
+        """
+        self.source = source
+        self.max_ids = max_ids or getattr(settings, 'JOBSCRAPER_WATERMARK_MAX_IDS', 5000)
+        self._stored = None
+        self._known_ids: Dict[str, set] = {}
+        # scope -> ids observed this run, in observation order
+        self._observed: Dict[str, Dict[str, None]] = {}
+        self._latest: Dict[str, datetime] = {}
+        self._cursors: Dict[str, Any] = {}
+        self._forgotten: Dict[str, set] = {}
+
+    def _load(self) -> None:
+        from .models import ScrapeWatermark
+
+        self._stored = {
+            watermark.scope: watermark
+            for watermark in ScrapeWatermark.objects.filter(source=self.source)
+        }
+        self._known_ids = {scope: set(watermark.seen_ids) for scope, watermark in self._stored.items()}
+
+    def get(self, scope: str = ''):
+        """Stored ScrapeWatermark for a scope, or None before its first successful run."""
+        if self._stored is None:
+            self._load()
+        return self._stored.get(scope)
+
+    def is_known(self, scope: str, external_id: str, posted_at: Union[str, date, datetime, None] = None) -> bool:
+        """
+        Check whether a job was seen by an earlier successful run.
+
+        A job is known when its id is remembered for the scope and, if a
+        timestamp is given, it is not newer than the scope's watermark (so
+        edited postings with a fresh updated_at are fetched again).
+
+        Args:
+            scope: Board, search or category the job was listed under
+            external_id: Job id (or URL) within the source
+            posted_at: Posting or last-update timestamp, if the listing has one
+
+        Returns:
+            True if the job can be skipped
+        """
+        watermark = self.get(scope)
+        if watermark is None or str(external_id) not in self._known_ids[scope]:
+            return False
+
+        posted_at = _as_datetime(posted_at)
+        if posted_at is not None and watermark.last_posted_at is not None and posted_at > watermark.last_posted_at:
+            return False
+
+        return True
+
+    def observe(self, scope: str, external_id: str, posted_at: Union[str, date, datetime, None] = None) -> None:
+        """
+        Record a job listed under a scope this run.
+
+        Args:
+            scope: Board, search or category the job was listed under
+            external_id: Job id (or URL) within the source
+            posted_at: Posting or last-update timestamp, if the listing has one
+        """
+        observed = self._observed.setdefault(scope, {})
+        observed.pop(str(external_id), None)
+        observed[str(external_id)] = None
+
+        posted_at = _as_datetime(posted_at)
+        if posted_at is not None and (scope not in self._latest or posted_at > self._latest[scope]):
+            self._latest[scope] = posted_at
+
+    def forget(self, scope: str, external_id: str) -> None:
+        """Drop a job from a scope's remembered ids on save(), so it is fetched again."""
+        self._forgotten.setdefault(scope, set()).add(str(external_id))
+        self._observed.get(scope, {}).pop(str(external_id), None)
+
+    def set_cursor(self, scope: str, cursor: Any) -> None:
+        """Record the furthest position (page, offset, ...) reached in a scope this run."""
+        self._cursors[scope] = cursor
+
+    def save(self) -> int:
+        """
+        Persist this run's observations.
+
+        Returns:
+            Number of scopes written
+        """
+        from .models import ScrapeWatermark
+
+        scopes = set(self._observed) | set(self._cursors) | set(self._forgotten)
+        if not scopes:
+            return 0
+        if self._stored is None:
+            self._load()
+
+        now = timezone.now()
+        to_create, to_update = [], []
+
+        for scope in scopes:
+            watermark = self._stored.get(scope)
+            if watermark is None:
+                watermark = ScrapeWatermark(source=self.source, scope=scope)
+                to_create.append(watermark)
+            else:
+                to_update.append(watermark)
+
+            observed = self._observed.get(scope, {})
+            dropped = self._forgotten.get(scope, set())
+            seen_ids = [
+                job_id for job_id in watermark.seen_ids if job_id not in observed and job_id not in dropped
+            ] + list(observed)
+            watermark.seen_ids = seen_ids[-self.max_ids:]
+
+            latest = self._latest.get(scope)
+            if latest is not None and (watermark.last_posted_at is None or latest > watermark.last_posted_at):
+                watermark.last_posted_at = latest
+            if scope in self._cursors:
+                watermark.cursor = self._cursors[scope]
+            watermark.last_success_at = now
+            watermark.updated_at = now
+
+        if to_create:
+            ScrapeWatermark.objects.bulk_create(to_create)
+        if to_update:
+            ScrapeWatermark.objects.bulk_update(
+                to_update,
+                ['seen_ids', 'last_posted_at', 'cursor', 'last_success_at', 'updated_at']
+            )
+
+        for watermark in to_create:
+            self._stored[watermark.scope] = watermark
+        for scope in scopes:
+            self._known_ids[scope] = set(self._stored[scope].seen_ids)
+        self._observed.clear()
+        self._latest.clear()
+        self._cursors.clear()
+        self._forgotten.clear()
+
+        logger.info(f"Saved {len(scopes)} watermarks for {self.source}")
+        return len(scopes)
@@ -0,0 +1,420 @@
+"""
+Scrape Work Queue
+
+Durable, database-backed queue of crawl work units (ScrapeWorkUnit) so a
+crawl can be drained by any number of worker processes or hosts. Scrapers
+split a crawl into units with plan_work_units() -- one company board, one
+keyword x location page range, one job detail URL -- and execute them with
+run_work_unit().
+
+Units are claimed with SELECT ... FOR UPDATE SKIP LOCKED where the database
+supports it, and always through a conditional UPDATE, so two workers never
+hold the same unit. A claim is a time-limited lease identified by a token:
+workers heartbeat while a unit runs, and a crashed worker's units become
+claimable again once the lease expires. Failures are retried with
+exponential backoff up to max_attempts; completion only applies to the
+current lease, so completing twice (or after losing the lease) is a no-op.
+
+Other work shares the queue under its own source and runs on its own
+workers (e.g. jobmatcher.rescoring); ScrapeWorker only leases scraper
+sources.
+"""
+
+import hashlib
+import importlib
+import json
+import logging
+import os
+import random
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+
+# Source identifier -> scraper class, imported when a unit needs it
+SCRAPER_CLASSES = {
+    'greenhouse': 'jobscraper.scrapers.greenhouse.GreenhouseScraper',
+    'greenhouse_india': 'jobscraper.scrapers.greenhouse_india.GreenhouseIndiaScraper',
+    'weworkremotely': 'jobscraper.scrapers.weworkremotely.WeWorkRemotelyScraper',
+    'naukri': 'jobscraper.scrapers.naukri.NaukriScraper',
+}
+
+
+def get_scraper(source: str):
+    """
+    Instantiate the scraper for a source.
+
+    Args:
+        source: Source identifier (a key of SCRAPER_CLASSES)
+
+    Returns:
+        New scraper instance
+    """
+    if source not in SCRAPER_CLASSES:
+        raise ValueError(f"Unknown source: {source}")
+    module_name, class_name = SCRAPER_CLASSES[source].rsplit('.', 1)
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+def unit_key(kind: str, payload: Dict[str, Any]) -> str:
+    """Stable identity of a unit within its source, so enqueueing is idempotent."""
+    canonical = json.dumps([kind, payload], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class WorkQueue:
+    """Enqueue, lease, heartbeat and settle ScrapeWorkUnits."""
+
+    def __init__(
+        self,
+        worker_id: Optional[str] = None,
+        lease_seconds: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        retry_delay: Optional[float] = None,
+    ):
+        """
+        Initialize the queue client.
+
+        Args:
+            worker_id: Name recorded on leased units (default: host:pid)
+            lease_seconds: Lease length (default: JOBSCRAPER_QUEUE_LEASE_SECONDS)
+            max_attempts: Attempts before a unit is marked failed for new units
+                          (default: JOBSCRAPER_QUEUE_MAX_ATTEMPTS)
+            retry_delay: Backoff before the first retry, doubled per attempt
+                         (default: JOBSCRAPER_QUEUE_RETRY_DELAY)
+        """
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = lease_seconds or getattr(settings, 'JOBSCRAPER_QUEUE_LEASE_SECONDS', 300)
+        self.max_attempts = max_attempts or getattr(settings, 'JOBSCRAPER_QUEUE_MAX_ATTEMPTS', 5)
+        self.retry_delay = retry_delay if retry_delay is not None else getattr(settings, 'JOBSCRAPER_QUEUE_RETRY_DELAY', 30)
+
+    def enqueue(self, source: str, kind: str, payloads: List[Dict[str, Any]], rerun_leased: bool = False) -> int:
+        """
+        Add units, or re-open finished ones with the same identity.
+
+        Units that are already pending are left alone, so planning the same
+        crawl twice does not duplicate work. Leased units are left alone
+        too, unless rerun_leased is set: they are then re-opened when their
+        current run completes, for work that must see changes made while
+        it ran.
+
+        Args:
+            source: Source identifier
+            kind: Unit kind ('board', 'search', 'detail', ...)
+            payloads: One payload per unit
+            rerun_leased: Run leased units again once they complete
+
+        Returns:
+            Number of units created, re-opened or marked to run again
+        """
+        from .models import ScrapeWorkUnit
+
+        by_key = {unit_key(kind, payload): payload for payload in payloads}
+        if not by_key:
+            return 0
+
+        now = timezone.now()
+        keys = list(by_key)
+        existing = set()
+        reopened = 0
+        for start in range(0, len(keys), 500):
+            batch = keys[start:start + 500]
+            existing.update(ScrapeWorkUnit.objects.filter(
+                source=source, kind=kind, key__in=batch
+            ).values_list('key', flat=True))
+            reopened += ScrapeWorkUnit.objects.filter(
+                source=source, kind=kind, key__in=batch,
+                status__in=[ScrapeWorkUnit.DONE, ScrapeWorkUnit.FAILED],
+            ).update(
+                status=ScrapeWorkUnit.PENDING, attempts=0, available_at=now, rerun=False,
+                last_error='', result=None, completed_at=None, updated_at=now,
+            )
+            if rerun_leased:
+                reopened += ScrapeWorkUnit.objects.filter(
+                    source=source, kind=kind, key__in=batch,
+                    status=ScrapeWorkUnit.LEASED, rerun=False,
+                ).update(rerun=True, updated_at=now)
+
+        new_units = [
+            ScrapeWorkUnit(
+                source=source, kind=kind, key=key, payload=payload,
+                max_attempts=self.max_attempts, available_at=now,
+            )
+            for key, payload in by_key.items() if key not in existing
+        ]
+        # Another planner may insert the same units concurrently
+        ScrapeWorkUnit.objects.bulk_create(new_units, batch_size=500, ignore_conflicts=True)
+
+        logger.info(f"Enqueued {len(new_units)} new and {reopened} re-opened {kind} units for {source}")
+        return len(new_units) + reopened
+
+    def enqueue_crawl(self, source: str) -> int:
+        """
+        Queue a crawl of source, split into units by its scraper's plan_work_units().
+
+        Returns:
+            Number of units created or re-opened
+        """
+        by_kind: Dict[str, List[Dict[str, Any]]] = {}
+        for kind, payload in get_scraper(source).plan_work_units():
+            by_kind.setdefault(kind, []).append(payload)
+        return sum(self.enqueue(source, kind, payloads) for kind, payloads in by_kind.items())
+
+    def lease(self, limit: int = 1, sources: Optional[List[str]] = None) -> List:
+        """
+        Claim up to limit runnable units.
+
+        Runnable units are pending ones whose backoff has elapsed and leased
+        ones whose lease expired (their worker died or stalled).
+
+        Args:
+            limit: Maximum units to claim
+            sources: Only claim units of these sources
+
+        Returns:
+            Claimed ScrapeWorkUnits, each carrying this lease's token
+        """
+        from .models import ScrapeWorkUnit
+
+        now = timezone.now()
+        runnable = (
+            Q(status=ScrapeWorkUnit.PENDING, available_at__lte=now)
+            | Q(status=ScrapeWorkUnit.LEASED, lease_expires_at__lt=now)
+        )
+        queryset = ScrapeWorkUnit.objects.filter(runnable)
+        if sources:
+            queryset = queryset.filter(source__in=sources)
+
+        # A unit whose worker died on its last attempt is not retried again
+        ScrapeWorkUnit.objects.filter(
+            status=ScrapeWorkUnit.LEASED, lease_expires_at__lt=now, attempts__gte=F('max_attempts')
+        ).update(status=ScrapeWorkUnit.FAILED, last_error='Lease expired on final attempt', completed_at=now, updated_at=now)
+
+        token = uuid.uuid4().hex
+        with transaction.atomic():
+            if connection.features.has_select_for_update_skip_locked:
+                queryset = queryset.select_for_update(skip_locked=True)
+            candidates = list(queryset.order_by('available_at', 'id').values_list('id', flat=True)[:limit])
+            if not candidates:
+                return []
+
+            # Re-checking runnable makes the claim safe without row locks too
+            ScrapeWorkUnit.objects.filter(runnable, id__in=candidates).update(
+                status=ScrapeWorkUnit.LEASED,
+                leased_by=self.worker_id,
+                lease_token=token,
+                lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+                heartbeat_at=now,
+                attempts=F('attempts') + 1,
+                updated_at=now,
+            )
+
+        return list(ScrapeWorkUnit.objects.filter(id__in=candidates, lease_token=token).order_by('available_at', 'id'))
+
+    def _current_lease(self, unit):
+        from .models import ScrapeWorkUnit
+
+        return ScrapeWorkUnit.objects.filter(id=unit.id, status=ScrapeWorkUnit.LEASED, lease_token=unit.lease_token)
+
+    def heartbeat(self, unit) -> bool:
+        """
+        Extend a unit's lease.
+
+        Returns:
+            False if the lease was lost (expired and claimed by another worker)
+        """
+        now = timezone.now()
+        return bool(self._current_lease(unit).update(
+            lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+            heartbeat_at=now,
+        ))
+
+    @contextmanager
+    def keep_alive(self, unit, interval: Optional[float] = None) -> Iterator[None]:
+        """
+        Heartbeat a unit from a background thread while the block runs.
+
+        Args:
+            unit: Leased unit
+            interval: Seconds between heartbeats (default: a third of the lease)
+        """
+        stop = threading.Event()
+        interval = interval or self.lease_seconds / 3
+
+        def beat():
+            try:
+                while not stop.wait(interval):
+                    if not self.heartbeat(unit):
+                        logger.warning(f"Lost lease on work unit {unit.id}")
+                        return
+            except Exception as e:
+                logger.warning(f"Heartbeat failed for work unit {unit.id}: {str(e)}")
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=beat, name=f'jobscraper-heartbeat-{unit.id}', daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def complete(self, unit, result: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Mark a unit done, or pending again if it was enqueued again while leased.
+
+        Idempotent: only the current lease can complete a unit, so a repeat
+        call, or one from a worker whose lease expired, changes nothing.
+
+        Returns:
+            True if this call completed the unit
+        """
+        from django.db.models import Case, PositiveIntegerField, Value, When
+
+        from .models import ScrapeWorkUnit
+
+        now = timezone.now()
+        rerun = Q(rerun=True)
+        completed = bool(self._current_lease(unit).update(
+            status=Case(When(rerun, then=Value(ScrapeWorkUnit.PENDING)), default=Value(ScrapeWorkUnit.DONE)),
+            attempts=Case(When(rerun, then=Value(0)), default=F('attempts'), output_field=PositiveIntegerField()),
+            available_at=now,
+            rerun=False,
+            result=result,
+            completed_at=now,
+            lease_expires_at=None,
+            updated_at=now,
+        ))
+        if not completed:
+            logger.info(f"Work unit {unit.id} was already settled; ignoring completion")
+        return completed
+
+    def fail(self, unit, error: str) -> bool:
+        """
+        Record a failed attempt: retry after a backoff, or give up.
+
+        The delay is retry_delay * 2 ** (attempts - 1), capped at an hour,
+        with up to 10% jitter so units that failed together spread out.
+
+        Returns:
+            True if the unit will be retried
+        """
+        from .models import ScrapeWorkUnit
+
+        now = timezone.now()
+        retry = unit.attempts < unit.max_attempts
+        if retry:
+            delay = min(self.retry_delay * 2 ** max(unit.attempts - 1, 0), 3600)
+            delay *= 1 + random.random() * 0.1
+            self._current_lease(unit).update(
+                status=ScrapeWorkUnit.PENDING,
+                available_at=now + timedelta(seconds=delay),
+                lease_expires_at=None,
+                last_error=error,
+                updated_at=now,
+            )
+            logger.warning(f"Work unit {unit.id} failed (attempt {unit.attempts}), retrying in {delay:.0f}s: {error}")
+        else:
+            self._current_lease(unit).update(
+                status=ScrapeWorkUnit.FAILED,
+                lease_expires_at=None,
+                last_error=error,
+                completed_at=now,
+                updated_at=now,
+            )
+            logger.error(f"Work unit {unit.id} failed permanently after {unit.attempts} attempts: {error}")
+        return retry
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Unit counts by source and status."""
+        from django.db.models import Count
+
+        from .models import ScrapeWorkUnit
+
+        counts: Dict[str, Dict[str, int]] = {}
+        for row in ScrapeWorkUnit.objects.values('source', 'status').annotate(count=Count('id')):
+            counts.setdefault(row['source'], {})[row['status']] = row['count']
+        return counts
+
+
+class ScrapeWorker:
+    """Drains the work queue: lease a unit, run it on its scraper, settle it."""
+
+    def __init__(self, queue: Optional[WorkQueue] = None, sources: Optional[List[str]] = None):
+        """
+        Initialize the worker.
+
+        Args:
+            queue: WorkQueue client (default: one named after this process)
+            sources: Only run units of these sources (default: every scraper
+                     source; other sources share the queue with their own workers)
+        """
+        self.queue = queue or WorkQueue()
+        self.sources = sources or sorted(SCRAPER_CLASSES)
+
+    def run_unit(self, unit) -> Optional[Dict[str, Any]]:
+        """Run a leased unit's work, returning its result."""
+        scraper = get_scraper(unit.source)
+        return scraper.run_work_unit(unit.kind, unit.payload, self.queue)
+
+    def process(self, unit) -> bool:
+        """
+        Run one leased unit.
+
+        Returns:
+            True if the unit completed
+        """
+        logger.info(f"Running {unit.source} {unit.kind} unit {unit.id}: {unit.payload}")
+        try:
+            with self.queue.keep_alive(unit):
+                result = self.run_unit(unit)
+        except Exception as e:
+            logger.exception(f"Work unit {unit.id} raised")
+            self.queue.fail(unit, str(e))
+            return False
+
+        return self.queue.complete(unit, result)
+
+    def run(self, max_units: Optional[int] = None, idle_timeout: float = 0, poll_interval: float = 5) -> Dict[str, int]:
+        """
+        Process units until the queue stays empty or max_units were run.
+
+        Args:
+            max_units: Stop after this many units (None: no limit)
+            idle_timeout: Keep polling an empty queue this many seconds
+                          before returning (0 returns as soon as it is empty)
+            poll_interval: Seconds between polls of an empty queue
+
+        Returns:
+            Counts of 'completed' and 'failed' units
+        """
+        counts = {'completed': 0, 'failed': 0}
+        idle_since = None
+
+        while max_units is None or counts['completed'] + counts['failed'] < max_units:
+            units = self.queue.lease(1, sources=self.sources)
+            if not units:
+                idle_since = idle_since or time.monotonic()
+                if time.monotonic() - idle_since >= idle_timeout:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            idle_since = None
+            counts['completed' if self.process(units[0]) else 'failed'] += 1
+
+        logger.info(f"Worker {self.queue.worker_id} finished: {counts}")
+        return counts